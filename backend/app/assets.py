@@ -0,0 +1,222 @@
+"""
+Static asset paths and serving index for X-UAV backend.
+
+Catalog records refer to artwork by URL (/assets/...), relative to the
+frontend's public directory. These helpers map between the two safely,
+and AssetIndex keeps the stat results, media types and ETags of the whole
+asset tree in memory. Content-hashed files are served straight from the
+index; files under plain names can change in place, so they are re-stat'ed
+on every lookup.
+"""
+
+import mimetypes
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .config import settings
+
+# Content-hashed names like mq-9-side-320w.9c2d5f227f62.webp or mq-9-low.3f9c0e1a2b4d.glb
+HASHED_NAME = re.compile(r"\.([0-9a-f]{8,64})\.[A-Za-z0-9]+$")
+CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+CACHE_REVALIDATE = "public, no-cache"
+MANIFESTS = ("assets/images/derivatives.json", "assets/models/manifest.json")
+
+mimetypes.add_type("model/gltf-binary", ".glb")
+mimetypes.add_type("model/gltf+json", ".gltf")
+mimetypes.add_type("image/avif", ".avif")
+mimetypes.add_type("image/webp", ".webp")
+
+
+def resolve_asset(url: Optional[str], assets_root: Optional[Path] = None) -> Optional[Path]:
+    """
+    Map an /assets/... URL to an existing file under the assets root.
+
+    Args:
+        url (Optional[str]): Asset URL from a catalog record
+        assets_root (Optional[Path]): Directory URLs resolve against (default: settings)
+
+    Returns:
+        Optional[Path]: File path, or None if missing or outside the assets root
+    """
+    if not url:
+        return None
+    root = (assets_root or settings.assets_path_absolute).resolve()
+    path = (root / url.split("?", 1)[0].lstrip("/")).resolve()
+    if root not in path.parents or not path.is_file():
+        return None
+    return path
+
+
+def asset_url(path: Path, assets_root: Optional[Path] = None) -> str:
+    """
+    Get the URL of a file under the assets root.
+
+    Args:
+        path (Path): File path under the assets root
+        assets_root (Optional[Path]): Directory URLs resolve against (default: settings)
+
+    Returns:
+        str: URL like /assets/images/...
+    """
+    root = (assets_root or settings.assets_path_absolute).resolve()
+    return "/" + path.resolve().relative_to(root).as_posix()
+
+
+class AssetEntry:
+    """
+    What the asset route needs to serve one file.
+
+    Attributes:
+        path: File path
+        stat: os.stat_result captured when indexed
+        media_type: MIME type
+        hashed: Whether the name carries a content hash (the file never changes)
+        etag: Content hash for hashed names, else mtime/size based
+        cache_control: Immutable for hashed names, revalidate otherwise
+    """
+
+    __slots__ = ("path", "stat", "media_type", "hashed", "etag", "cache_control")
+
+    def __init__(self, path: Path, stat: os.stat_result):
+        self.path = path
+        self.stat = stat
+        self.media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        match = HASHED_NAME.search(path.name)
+        self.hashed = match is not None
+        if match:
+            self.etag = f'"{match.group(1)}"'
+            self.cache_control = CACHE_IMMUTABLE
+        else:
+            self.etag = f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+            self.cache_control = CACHE_REVALIDATE
+
+
+class AssetIndex:
+    """
+    In-memory index of every file under <root>/assets, keyed by URL path.
+
+    The tree is scanned once; afterwards it is rescanned only when one of
+    the build manifests changes (checked at most every check_interval
+    seconds). A file missing from the index (e.g. a derivative just built
+    on demand) is stat'ed once and added. Entries without a content hash
+    are re-stat'ed on each lookup, so a file rewritten in place gets a
+    fresh size and ETag and a deleted one is dropped.
+    """
+
+    def __init__(self, root: Optional[Path] = None, check_interval: float = 30.0):
+        """
+        Initialize index.
+
+        Args:
+            root (Optional[Path]): Directory /assets URLs resolve against
+            check_interval (float): Minimum seconds between manifest checks
+        """
+        self.root = (root or settings.assets_path_absolute).resolve()
+        self.check_interval = check_interval
+        self._entries: Optional[Dict[str, AssetEntry]] = None
+        self._fingerprint: Tuple = ()
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def _manifest_fingerprint(self) -> Tuple:
+        result = []
+        for name in MANIFESTS:
+            try:
+                stat = os.stat(self.root / name)
+                result.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                result.append(None)
+        return tuple(result)
+
+    def _scan(self) -> Dict[str, AssetEntry]:
+        entries: Dict[str, AssetEntry] = {}
+        stack = [self.root / "assets"]
+        while stack:
+            try:
+                listing = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with listing:
+                for item in listing:
+                    # Reason: Skip hidden and in-progress (.tmp) files
+                    if item.name.startswith("."):
+                        continue
+                    if item.is_dir(follow_symlinks=False):
+                        stack.append(Path(item.path))
+                    elif item.is_file(follow_symlinks=False):
+                        path = Path(item.path)
+                        key = path.relative_to(self.root).as_posix()
+                        entries[key] = AssetEntry(path, item.stat(follow_symlinks=False))
+        return entries
+
+    def refresh(self) -> None:
+        """Rescan the asset tree now."""
+        fingerprint = self._manifest_fingerprint()
+        entries = self._scan()
+        with self._lock:
+            self._entries = entries
+            self._fingerprint = fingerprint
+            self._next_check = time.monotonic() + self.check_interval
+
+    def __len__(self) -> int:
+        return len(self._entries or {})
+
+    def lookup(self, url: str) -> Optional[AssetEntry]:
+        """
+        Find the entry for an asset URL.
+
+        Args:
+            url (str): URL path like /assets/models/mq-9/mq-9-low.<hash>.glb
+
+        Returns:
+            Optional[AssetEntry]: Entry, or None if no such file exists
+        """
+        now = time.monotonic()
+        if self._entries is None or (
+            now >= self._next_check and self._manifest_fingerprint() != self._fingerprint
+        ):
+            self.refresh()
+        elif now >= self._next_check:
+            self._next_check = now + self.check_interval
+
+        key = url.lstrip("/")
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry if entry.hashed else self._restat(key, entry)
+
+        path = resolve_asset(key, self.root)
+        if path is None:
+            return None
+        parts = path.relative_to(self.root).parts
+        # Reason: Only the assets/ subtree is served, never the rest of the public dir
+        if parts[0] != "assets" or any(part.startswith(".") for part in parts):
+            return None
+        entry = AssetEntry(path, path.stat())
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def _restat(self, key: str, entry: AssetEntry) -> Optional[AssetEntry]:
+        """Refresh an entry whose file may have changed in place; None if it's gone."""
+        try:
+            stat = os.stat(entry.path)
+        except FileNotFoundError:
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+        if (stat.st_ino, stat.st_mtime_ns, stat.st_size) == (
+            entry.stat.st_ino, entry.stat.st_mtime_ns, entry.stat.st_size
+        ):
+            return entry
+        entry = AssetEntry(entry.path, stat)
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+
+# Global asset index
+asset_index = AssetIndex(settings.assets_path_absolute, settings.ASSET_INDEX_CHECK_INTERVAL)
@@ -0,0 +1,109 @@
+"""
+In-process sub-request dispatch for the X-UAV batch endpoint.
+
+Each sub-request is sent straight into the ASGI app (routing, validation
+and error handling exactly as over HTTP) without a network round trip.
+The caller pins the catalog snapshot around the whole batch, so every
+sub-request sees the same data.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class BatchError(ValueError):
+    """Raised when a sub-request can't be dispatched (bad path or method)."""
+
+
+def validate_path(path: str, prefix: str, forbidden: str) -> Tuple[str, str]:
+    """
+    Check a sub-request path and split off its query string.
+
+    Args:
+        path (str): Path with optional query string, e.g. "/api/uavs/MQ-9?units=metric"
+        prefix (str): Required API prefix
+        forbidden (str): Path that may not be called (the batch endpoint itself)
+
+    Returns:
+        Tuple[str, str]: (path, query string)
+
+    Raises:
+        BatchError: If the path is outside the API or is the batch endpoint
+    """
+    parts = urlsplit(path)
+    if parts.scheme or parts.netloc or not parts.path.startswith(prefix + "/"):
+        raise BatchError(f"Sub-request path must start with {prefix}/: {path!r}")
+    if parts.path.rstrip("/") == forbidden:
+        raise BatchError("Batch requests cannot be nested")
+    return parts.path, parts.query
+
+
+async def dispatch(
+    app: Any,
+    method: str,
+    path: str,
+    query: str = "",
+    body: Optional[Any] = None,
+    headers: Optional[List[Tuple[bytes, bytes]]] = None,
+) -> Tuple[int, Any]:
+    """
+    Run one request through an ASGI app in-process.
+
+    Args:
+        app (Any): ASGI application
+        method (str): HTTP method
+        path (str): URL path
+        query (str): Query string (without "?")
+        body (Optional[Any]): JSON body
+        headers (Optional[List[Tuple[bytes, bytes]]]): Extra request headers
+
+    Returns:
+        Tuple[int, Any]: Status code and parsed JSON body (text if not JSON)
+    """
+    payload = b"" if body is None else json.dumps(body).encode()
+    request_headers = [(b"host", b"batch"), (b"content-length", str(len(payload)).encode())]
+    if body is not None:
+        request_headers.append((b"content-type", b"application/json"))
+    request_headers.extend(headers or [])
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": request_headers,
+        "client": ("127.0.0.1", 0),
+        "server": ("batch", 80),
+    }
+    sent = False
+    status = 500
+    chunks: List[bytes] = []
+    content_type = ""
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal sent
+        if sent:
+            return {"type": "http.disconnect"}
+        sent = True
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status, content_type
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            for name, value in message.get("headers", []):
+                if name.lower() == b"content-type":
+                    content_type = value.decode("latin-1")
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    raw = b"".join(chunks)
+    if "json" in content_type:
+        return status, json.loads(raw) if raw else None
+    return status, raw.decode("utf-8", errors="replace")
@@ -0,0 +1,196 @@
+"""
+Bounded result caches for X-UAV backend.
+
+Derived results (renders, computed views, query results) are keyed on
+their inputs plus the catalog snapshot generation, so a reloaded catalog
+never serves stale entries and old generations simply age out of the LRU.
+An optional TTL bounds how long any entry is served.
+"""
+
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from .metrics import record_cache_lookup
+from .singleflight import freeze
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache with hit/miss/eviction counters
+    and an optional time-to-live.
+
+    Example:
+        renders = LRUCache("silhouettes", max_size=256)
+        svg = renders.get_or_compute((("MQ-9", "RQ-4"), generation), build)
+    """
+
+    def __init__(self, name: str, max_size: int = 256, ttl: Optional[float] = None):
+        """
+        Initialize cache.
+
+        Args:
+            name (str): Cache name used in metrics labels
+            max_size (int): Maximum number of entries
+            ttl (Optional[float]): Seconds an entry is served for (None: until evicted)
+        """
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        # Values are stored as (value, monotonic time stored)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up an entry, marking it most recently used.
+
+        Args:
+            key (Hashable): Cache key
+
+        Returns:
+            Optional[Any]: Cached value, or None on a miss (or an expired entry)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            value = None
+            expired = (
+                entry is not None
+                and self.ttl is not None
+                and time.monotonic() - entry[1] > self.ttl
+            )
+            if expired:
+                del self._entries[key]
+                self.expirations += 1
+            elif entry is not None:
+                value = entry[0]
+                self._entries.move_to_end(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        record_cache_lookup(self.name, value is not None)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store an entry, evicting the least recently used ones over max_size.
+
+        Args:
+            key (Hashable): Cache key
+            value (Any): Value to store (must not be None)
+        """
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Get an entry, computing and storing it on a miss.
+
+        Args:
+            key (Hashable): Cache key
+            compute (Callable[[], Any]): Called without the lock held on a miss
+
+        Returns:
+            Any: Cached or freshly computed value
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> int:
+        """
+        Drop all entries.
+
+        Returns:
+            int: Number of entries dropped
+        """
+        with self._lock:
+            dropped = len(self._entries)
+            self._entries.clear()
+        return dropped
+
+    def entries(self, limit: Optional[int] = None) -> List[Tuple[Hashable, float]]:
+        """
+        List keys with their age, most recently used first.
+
+        Args:
+            limit (Optional[int]): Maximum number of keys
+
+        Returns:
+            List[Tuple[Hashable, float]]: (key, seconds since stored)
+        """
+        now = time.monotonic()
+        with self._lock:
+            items = list(reversed(self._entries.items()))
+        return [(key, now - stored) for key, (_, stored) in items[:limit]]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, Any]: Size, capacity, TTL and hit/miss/eviction/expiration counts
+        """
+        with self._lock:
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def cached_result(method: Callable) -> Callable:
+    """
+    Decorate a Database method to serve repeated calls from its result cache.
+
+    The key is the method name, its arguments normalized by the signature
+    (positional or keyword, defaults filled in, empty strings as None since
+    empty filters are ignored) and the catalog generation reported by
+    self.result_generation(). Results are shared between callers; treat
+    them as read-only. Disabled when self.results is None.
+
+    Args:
+        method (Callable): Database method
+
+    Returns:
+        Callable: Wrapped method
+    """
+    signature = inspect.signature(method)
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.results is None:
+            return method(self, *args, **kwargs)
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        params = tuple(
+            (param, None if value == "" else freeze(value))
+            for param, value in list(bound.arguments.items())[1:]
+        )
+        key = (name, params, self.result_generation())
+        return self.results.get_or_compute(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
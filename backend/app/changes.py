@@ -0,0 +1,63 @@
+"""
+Server-sent event stream of catalog generation bumps for X-UAV backend.
+
+Clients keep a local replica by listening here and, on each new
+generation, fetching GET /api/changes?since=<their generation>. Every
+connection starts with the current generation, so a client that
+reconnects after missing a bump catches up immediately.
+"""
+
+import asyncio
+import json
+from typing import AsyncIterator, Awaitable, Callable
+
+from fastapi.concurrency import run_in_threadpool
+
+
+def generation_event(generation: int) -> str:
+    """
+    Format one SSE message announcing a generation.
+
+    Args:
+        generation (int): Catalog generation
+
+    Returns:
+        str: "id/event/data" message; the id lets EventSource send Last-Event-ID
+    """
+    data = json.dumps({"generation": generation})
+    return f"id: {generation}\nevent: generation\ndata: {data}\n\n"
+
+
+async def generation_events(
+    current_generation: Callable[[], int],
+    is_disconnected: Callable[[], Awaitable[bool]],
+    poll_interval: float = 2.0,
+    keepalive: float = 15.0,
+) -> AsyncIterator[str]:
+    """
+    Yield an event for the current generation, then one per change.
+
+    Args:
+        current_generation (Callable[[], int]): Reads the generation (blocking; run in
+            the threadpool)
+        is_disconnected (Callable[[], Awaitable[bool]]): Request.is_disconnected
+        poll_interval (float): Seconds between generation checks
+        keepalive (float): Seconds of silence before a comment line keeps proxies
+            from closing the stream
+
+    Yields:
+        str: SSE messages
+    """
+    last = None
+    quiet = 0.0
+    while not await is_disconnected():
+        generation = await run_in_threadpool(current_generation)
+        if generation != last:
+            last = generation
+            quiet = 0.0
+            yield generation_event(generation)
+        elif quiet >= keepalive:
+            quiet = 0.0
+            yield ": keepalive\n\n"
+        await asyncio.sleep(poll_interval)
+        quiet += poll_interval
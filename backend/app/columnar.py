@@ -0,0 +1,455 @@
+"""
+Columnar in-memory table for X-UAV backend.
+
+Holds a query result column-by-column instead of as one dict per row:
+numeric, boolean and temporal columns are NumPy arrays with a validity
+mask, low-cardinality strings are dictionary-encoded (integer codes into a
+tuple of interned categories) and other strings are interned. JSON columns
+keep their text and are only parsed when a row view asks for them.
+
+Rows are exposed as RowView mappings with __slots__, so code written
+against dicts keeps working, and list responses are serialized straight
+from the columns without building a dict or model per row.
+"""
+
+import json
+import sys
+from collections.abc import Mapping
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+Rows = Union[np.ndarray, slice]
+
+ALL_ROWS = slice(None)
+
+NUMERIC_TYPES = (
+    "TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT",
+    "UTINYINT", "USMALLINT", "UINTEGER", "UBIGINT",
+    "FLOAT", "DOUBLE", "REAL", "DECIMAL",
+)
+
+# Strings with at most this share of distinct values are dictionary-encoded
+CATEGORICAL_MAX_RATIO = 0.5
+
+
+def _split_masked(array: Any) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Split a (possibly masked) array into data and a validity mask (None if no nulls)."""
+    if isinstance(array, np.ma.MaskedArray):
+        mask = np.ma.getmaskarray(array)
+        if mask.any():
+            return np.ma.getdata(array), ~mask
+        return np.ma.getdata(array), None
+    return np.asarray(array), None
+
+
+def _patch_nulls(encoded: List[str], valid: Optional[np.ndarray], rows: Rows) -> List[str]:
+    """Replace encoded values of NULL cells with the JSON literal null."""
+    if valid is not None:
+        for position in np.flatnonzero(~valid[rows]):
+            encoded[position] = "null"
+    return encoded
+
+
+def _encode_text(value: Optional[str]) -> str:
+    return "null" if value is None else encode_basestring_ascii(value)
+
+
+class NumericColumn:
+    """Integer or floating-point column."""
+
+    __slots__ = ("values", "valid")
+
+    def __init__(self, values: np.ndarray, valid: Optional[np.ndarray]):
+        dtype = np.int64 if values.dtype.kind in "iu" else np.float64
+        self.values = values.astype(dtype, copy=False)
+        self.valid = valid
+
+    def value(self, row: int) -> Optional[Union[int, float]]:
+        if self.valid is not None and not self.valid[row]:
+            return None
+        return self.values[row].item()
+
+    def encode(self, rows: Rows) -> List[str]:
+        return _patch_nulls(list(map(repr, self.values[rows].tolist())), self.valid, rows)
+
+
+class BoolColumn:
+    """Boolean column."""
+
+    __slots__ = ("values", "valid")
+
+    LITERALS = np.array(["false", "true"], dtype=object)
+
+    def __init__(self, values: np.ndarray, valid: Optional[np.ndarray]):
+        self.values = values.astype(bool, copy=False)
+        self.valid = valid
+
+    def value(self, row: int) -> Optional[bool]:
+        if self.valid is not None and not self.valid[row]:
+            return None
+        return bool(self.values[row])
+
+    def encode(self, rows: Rows) -> List[str]:
+        encoded = self.LITERALS[self.values[rows].astype(np.intp)].tolist()
+        return _patch_nulls(encoded, self.valid, rows)
+
+
+class TemporalColumn:
+    """DATE or TIMESTAMP column stored as datetime64."""
+
+    __slots__ = ("values", "valid", "is_date")
+
+    def __init__(self, values: np.ndarray, valid: Optional[np.ndarray], is_date: bool):
+        self.values = values.astype("datetime64[D]" if is_date else "datetime64[us]", copy=False)
+        self.valid = valid
+        self.is_date = is_date
+
+    def value(self, row: int) -> Any:
+        if self.valid is not None and not self.valid[row]:
+            return None
+        return self.values[row].item()
+
+    def encode(self, rows: Rows) -> List[str]:
+        text = np.datetime_as_string(self.values[rows], unit="D" if self.is_date else "us")
+        return _patch_nulls([f'"{s}"' for s in text.tolist()], self.valid, rows)
+
+
+class CategoricalColumn:
+    """
+    Dictionary-encoded string column.
+
+    Codes index into categories; -1 is NULL. Each category is encoded to
+    JSON once, so serializing is a single fancy-index.
+    """
+
+    __slots__ = ("codes", "categories", "is_json", "_encoded", "_lookup")
+
+    def __init__(self, codes: np.ndarray, categories: Sequence[str], is_json: bool = False):
+        self.codes = codes
+        self.categories = tuple(categories)
+        self.is_json = is_json
+        # Reason: Code -1 (NULL) indexes the trailing "null"
+        encoded = list(self.categories) if is_json else [_encode_text(c) for c in self.categories]
+        self._encoded = np.array(encoded + ["null"], dtype=object)
+        self._lookup = {c: i for i, c in enumerate(self.categories)}
+
+    @classmethod
+    def from_values(
+        cls, values: Sequence[Optional[str]], is_json: bool = False
+    ) -> "CategoricalColumn":
+        lookup: Dict[str, int] = {}
+        codes = np.fromiter(
+            (-1 if v is None else lookup.setdefault(sys.intern(v), len(lookup)) for v in values),
+            dtype=np.int32,
+            count=len(values),
+        )
+        dtype = np.int16 if len(lookup) < np.iinfo(np.int16).max else np.int32
+        return cls(codes.astype(dtype), list(lookup), is_json)
+
+    def value(self, row: int) -> Any:
+        code = self.codes[row]
+        if code < 0:
+            return None
+        text = self.categories[code]
+        return json.loads(text) if self.is_json else text
+
+    def encode(self, rows: Rows) -> List[str]:
+        return self._encoded[self.codes[rows]].tolist()
+
+    def code_of(self, text: str) -> Optional[int]:
+        """Code of a category, or None if it never occurs."""
+        return self._lookup.get(text)
+
+    def codes_matching(self, predicate) -> np.ndarray:
+        """Codes of the categories a predicate accepts."""
+        matching = [i for i, c in enumerate(self.categories) if predicate(c)]
+        return np.array(matching, dtype=self.codes.dtype)
+
+
+class TextColumn:
+    """High-cardinality string column of interned strings (None is NULL)."""
+
+    __slots__ = ("values", "is_json")
+
+    def __init__(self, values: Sequence[Optional[str]], is_json: bool = False):
+        self.values = np.array(
+            [None if v is None else sys.intern(v) for v in values], dtype=object
+        )
+        self.is_json = is_json
+
+    def value(self, row: int) -> Any:
+        text = self.values[row]
+        if text is None or not self.is_json:
+            return text
+        return json.loads(text)
+
+    def encode(self, rows: Rows) -> List[str]:
+        values = self.values[rows].tolist()
+        if self.is_json:
+            return ["null" if v is None else v for v in values]
+        return list(map(_encode_text, values))
+
+
+Column = Union[NumericColumn, BoolColumn, TemporalColumn, CategoricalColumn, TextColumn]
+
+
+def build_column(array: Any, type_name: str) -> Column:
+    """
+    Build the column representation for one result column.
+
+    Args:
+        array (Any): Column from DuckDB's fetchnumpy() (masked where NULLs occur)
+        type_name (str): DuckDB type, e.g. "DECIMAL(6,2)", "VARCHAR", "JSON"
+
+    Returns:
+        Column: Typed column
+    """
+    base = type_name.split("(")[0].upper()
+    if base in NUMERIC_TYPES:
+        return NumericColumn(*_split_masked(array))
+    if base == "BOOLEAN":
+        return BoolColumn(*_split_masked(array))
+    if base == "DATE" or base.startswith("TIMESTAMP"):
+        return TemporalColumn(*_split_masked(array), is_date=base == "DATE")
+
+    values = array.tolist()
+    is_json = base == "JSON"
+    distinct = len(set(values))
+    if distinct <= max(1, int(len(values) * CATEGORICAL_MAX_RATIO)):
+        return CategoricalColumn.from_values(values, is_json)
+    return TextColumn(values, is_json)
+
+
+class RowView(Mapping):
+    """Read-only mapping over one row of a ColumnarTable."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: "ColumnarTable", row: int):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, key: str) -> Any:
+        return self._table.columns[key].value(self._row)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.columns)
+
+    def __len__(self) -> int:
+        return len(self._table.columns)
+
+    def __repr__(self) -> str:
+        return f"RowView({dict(self)!r})"
+
+
+class RowLookup(Mapping):
+    """Mapping from key column value to RowView."""
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table: "ColumnarTable"):
+        self._table = table
+
+    def __getitem__(self, key: str) -> RowView:
+        return RowView(self._table, self._table.row_index[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.row_index)
+
+    def __len__(self) -> int:
+        return len(self._table.row_index)
+
+
+class ColumnarTable:
+    """
+    Immutable column-oriented table with row views.
+
+    Behaves as a sequence of RowView; row order is the query's order.
+
+    Attributes:
+        columns: Column by name, in result order
+        key: Unique key column (row_index maps its values to rows)
+        row_index: Key value -> row number
+    """
+
+    def __init__(self, columns: Dict[str, Column], length: int, key: str):
+        """
+        Initialize table.
+
+        Args:
+            columns (Dict[str, Column]): Columns in result order
+            length (int): Number of rows
+            key (str): Unique key column
+        """
+        self.columns = columns
+        self.key = key
+        self._length = length
+        self.row_index: Dict[str, int] = {
+            self.columns[key].value(row): row for row in range(length)
+        }
+        self._templates: Dict[FrozenSet[str], Tuple[List[str], str]] = {}
+        self._elements: Dict[str, Dict[Any, np.ndarray]] = {}
+
+    @classmethod
+    def from_numpy(cls, arrays: Dict[str, Any], types: Dict[str, str], key: str) -> "ColumnarTable":
+        """
+        Build a table from DuckDB's fetchnumpy() output.
+
+        Args:
+            arrays (Dict[str, Any]): Column arrays by name
+            types (Dict[str, str]): DuckDB type name by column
+            key (str): Unique key column
+
+        Returns:
+            ColumnarTable: Table
+        """
+        length = len(next(iter(arrays.values()))) if arrays else 0
+        columns = {name: build_column(array, types[name]) for name, array in arrays.items()}
+        return cls(columns, length, key)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, row: int) -> RowView:
+        if row < 0:
+            row += self._length
+        if not 0 <= row < self._length:
+            raise IndexError(row)
+        return RowView(self, row)
+
+    def __iter__(self) -> Iterator[RowView]:
+        return (RowView(self, row) for row in range(self._length))
+
+    @property
+    def by_key(self) -> RowLookup:
+        """Rows by key column value."""
+        return RowLookup(self)
+
+    def rows_for_keys(self, keys: Sequence[str]) -> np.ndarray:
+        """Row numbers of the given keys that exist, in table order."""
+        found = {self.row_index[k] for k in keys if k in self.row_index}
+        return np.array(sorted(found), dtype=np.int64)
+
+    def equals(self, name: str, value: str) -> np.ndarray:
+        """Boolean mask of rows whose categorical/text column equals value."""
+        column = self.columns[name]
+        if isinstance(column, CategoricalColumn):
+            code = column.code_of(value)
+            if code is None:
+                return np.zeros(self._length, dtype=bool)
+            return column.codes == code
+        return column.values == value
+
+    def contains(self, name: str, substring: str) -> np.ndarray:
+        """Mask of rows whose string column contains substring (case-sensitive, like SQL LIKE)."""
+        column = self.columns[name]
+        if isinstance(column, CategoricalColumn):
+            return np.isin(column.codes, column.codes_matching(lambda c: substring in c))
+        matches = (v is not None and substring in v for v in column.values)
+        return np.fromiter(matches, dtype=bool, count=self._length)
+
+    def contains_element(self, name: str, element: Any) -> np.ndarray:
+        """
+        Boolean mask of rows whose JSON list column contains element (like SQL list_contains).
+
+        The column is decoded once into an element -> rows index, kept for
+        later calls.
+        """
+        index = self._elements.get(name)
+        if index is None:
+            index = self._elements[name] = self._element_index(name)
+        mask = np.zeros(self._length, dtype=bool)
+        mask[index.get(element, np.empty(0, dtype=np.int64))] = True
+        return mask
+
+    def _element_index(self, name: str) -> Dict[Any, np.ndarray]:
+        """Rows containing each element of a JSON list column."""
+        column = self.columns[name]
+        rows_by_element: Dict[Any, List[int]] = {}
+        for row in range(self._length):
+            for element in column.value(row) or ():
+                rows_by_element.setdefault(element, []).append(row)
+        return {e: np.array(rows, dtype=np.int64) for e, rows in rows_by_element.items()}
+
+    def rank(
+        self,
+        name: str,
+        descending: bool = True,
+        limit: Optional[int] = None,
+        rows: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Order rows by a numeric column, skipping NULLs.
+
+        Ties keep table order.
+
+        Args:
+            name (str): Numeric column
+            descending (bool): Largest first
+            limit (Optional[int]): Keep at most this many rows
+            rows (Optional[np.ndarray]): Only rank these rows (default: all)
+
+        Returns:
+            np.ndarray: Row numbers, best first
+
+        Raises:
+            KeyError: If the column doesn't exist
+            ValueError: If the column isn't numeric
+        """
+        column = self.columns[name]
+        if not isinstance(column, NumericColumn):
+            raise ValueError(f"Column '{name}' is not numeric")
+        candidates = np.arange(self._length) if rows is None else np.asarray(rows, dtype=np.int64)
+        if column.valid is not None:
+            candidates = candidates[column.valid[candidates]]
+        values = column.values[candidates]
+        order = np.argsort(-values if descending else values, kind="stable")
+        if limit is not None:
+            order = order[:limit]
+        return candidates[order]
+
+    def numeric_columns(self) -> List[str]:
+        """Names of the numeric columns."""
+        return [name for name, column in self.columns.items() if isinstance(column, NumericColumn)]
+
+    def to_json(self, rows: Optional[Rows] = None, exclude: FrozenSet[str] = frozenset()) -> str:
+        """
+        Serialize rows as a JSON array of objects, column-at-a-time.
+
+        Args:
+            rows (Optional[Rows]): Row numbers (or a slice) to include, in output
+                order (default: all)
+            exclude (FrozenSet[str]): Columns to leave out
+
+        Returns:
+            str: JSON text
+        """
+        rows = ALL_ROWS if rows is None else rows
+        names, template = self._template(exclude)
+        encoded = [self.columns[name].encode(rows) for name in names]
+        return "[" + ",".join(template % values for values in zip(*encoded)) + "]"
+
+    def _template(self, exclude: FrozenSet[str]) -> Tuple[List[str], str]:
+        """Column names and %-template of a JSON object for an exclusion set."""
+        cached = self._templates.get(exclude)
+        if cached is None:
+            names = [name for name in self.columns if name not in exclude]
+            template = "{" + ",".join(f"{encode_basestring_ascii(n)}:%s" for n in names) + "}"
+            cached = self._templates[exclude] = (names, template)
+        return cached
+
+    def memory_bytes(self) -> int:
+        """Approximate bytes held by the column arrays and category tuples."""
+        total = 0
+        for column in self.columns.values():
+            for attr in ("values", "valid", "codes"):
+                array = getattr(column, attr, None)
+                if isinstance(array, np.ndarray):
+                    total += array.nbytes
+                    if array.dtype == object:
+                        total += sum(sys.getsizeof(v) for v in set(array.tolist()) if v is not None)
+            if isinstance(column, CategoricalColumn):
+                total += sum(sys.getsizeof(c) for c in column.categories)
+        return total
@@ -4,9 +4,11 @@ Configuration management for X-UAV backend.
 Loads configuration from environment variables and .env file.
 """
 
+import os
 from pathlib import Path
 from typing import List
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -19,11 +21,45 @@ class Settings(BaseSettings):
         PORT: Server port number
         DEBUG: Debug mode flag
         RELOAD: Auto-reload flag for development
+        ENVIRONMENT: "development" or "production" (production disables DEBUG/RELOAD)
+        WORKERS: Worker processes in production; 0 means one per available core
         DATABASE_PATH: Path to DuckDB database file
+        STATEMENT_CACHE_SIZE: Maximum number of parsed query shapes kept
+        DB_SINGLE_FLIGHT_ENABLED: Run identical concurrent database calls once and share the result
+        RESULT_CACHE_SIZE: Maximum cached search/link query results (0 disables the cache)
+        RESULT_CACHE_TTL: Seconds a cached query result is served (0 means until evicted)
+        ADMIN_TOKEN: Token required in X-Admin-Token by /api/admin endpoints (empty: no check)
+        SNAPSHOT_CACHE_ENABLED: Serve catalog reads from an in-memory snapshot
+        SNAPSHOT_CHECK_INTERVAL: Seconds between checks for a replaced database file
+        WARMUP_ON_STARTUP: Open the DB handle and load the snapshot before serving (off:
+            ready at once, loaded by the first request)
+        CHANGES_POLL_INTERVAL: Seconds between generation checks of each
+            /api/changes/stream connection
         ALLOWED_ORIGINS: List of allowed CORS origins
         API_V1_PREFIX: API version 1 prefix
         PROJECT_NAME: Project name for API documentation
         VERSION: API version
+        BATCH_MAX_REQUESTS: Maximum sub-requests in one POST /api/batch
+        LOADOUT_CACHE_SIZE: Maximum number of planned UAV loadouts kept
+        REACH_MAX_TARGETS: Maximum targets in one reach analysis
+        METRICS_ENABLED: Expose Prometheus metrics and record request metrics
+        METRICS_PATH: Path of the Prometheus scrape endpoint
+        METRICS_MULTIPROCESS_DIR: Directory where each worker writes its metrics so a scrape
+            merges all workers (empty: this process only; gunicorn.conf.py sets one)
+        METRICS_WRITE_INTERVAL: Seconds between a worker's writes of its metrics file
+        ASSETS_PATH: Directory served as /assets by the frontend (silhouettes, images, models)
+        ASSETS_ENABLED: Serve /assets/... from the backend (ranges, ETags, immutable caching)
+        ASSET_INDEX_CHECK_INTERVAL: Seconds between checks for rebuilt asset manifests
+        SILHOUETTE_CACHE_SIZE: Maximum number of composited silhouette renders kept
+        SILHOUETTE_MAX_DESIGNATIONS: Maximum UAVs in one silhouette comparison
+        SILHOUETTE_MAX_WIDTH: Target width in pixels of a composited comparison
+        IMAGE_WIDTHS: Comma-separated responsive widths for image derivatives
+        IMAGE_THUMBNAIL_WIDTH: Thumbnail width for image derivatives
+        IMAGE_FORMATS: Comma-separated modern formats (avif, webp) besides the JPEG/PNG fallback
+        IMAGE_DERIVATIVES_ON_DEMAND: Build missing derivatives when the API is asked for them
+        OPENAPI_CACHE_ENABLED: Load the OpenAPI document from disk instead of rebuilding it
+            per process
+        OPENAPI_CACHE_DIR: Directory for the cached OpenAPI document
     """
 
     # Server Configuration
@@ -31,9 +67,25 @@ class Settings(BaseSettings):
     PORT: int = 7676
     DEBUG: bool = True
     RELOAD: bool = True
+    ENVIRONMENT: str = "development"
+    WORKERS: int = 0
 
     # Database Configuration
     DATABASE_PATH: str = "./data_db/uavs.duckdb"
+    STATEMENT_CACHE_SIZE: int = 128
+    DB_SINGLE_FLIGHT_ENABLED: bool = True
+    RESULT_CACHE_SIZE: int = 1024
+    RESULT_CACHE_TTL: float = 300.0
+
+    # Snapshot Cache Configuration
+    SNAPSHOT_CACHE_ENABLED: bool = True
+    SNAPSHOT_CHECK_INTERVAL: float = 5.0
+    WARMUP_ON_STARTUP: bool = True
+    CHANGES_POLL_INTERVAL: float = 2.0
+
+    # Startup Configuration
+    OPENAPI_CACHE_ENABLED: bool = True
+    OPENAPI_CACHE_DIR: str = "./.cache"
 
     # CORS Configuration
     ALLOWED_ORIGINS: str = "http://localhost:7676,http://127.0.0.1:7676"
@@ -42,6 +94,28 @@ class Settings(BaseSettings):
     API_V1_PREFIX: str = "/api"
     PROJECT_NAME: str = "X-UAV API"
     VERSION: str = "0.1.0"
+    BATCH_MAX_REQUESTS: int = 20
+    ADMIN_TOKEN: str = ""
+    LOADOUT_CACHE_SIZE: int = 512
+    REACH_MAX_TARGETS: int = 1000
+
+    # Metrics Configuration
+    METRICS_ENABLED: bool = True
+    METRICS_PATH: str = "/metrics"
+    METRICS_MULTIPROCESS_DIR: str = ""
+    METRICS_WRITE_INTERVAL: float = 1.0
+
+    # Asset Configuration
+    ASSETS_PATH: str = "../frontend/public"
+    ASSETS_ENABLED: bool = True
+    ASSET_INDEX_CHECK_INTERVAL: float = 30.0
+    SILHOUETTE_CACHE_SIZE: int = 256
+    SILHOUETTE_MAX_DESIGNATIONS: int = 12
+    SILHOUETTE_MAX_WIDTH: int = 1600
+    IMAGE_WIDTHS: str = "320,640,1280"
+    IMAGE_THUMBNAIL_WIDTH: int = 160
+    IMAGE_FORMATS: str = "avif,webp"
+    IMAGE_DERIVATIVES_ON_DEMAND: bool = True
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -49,6 +123,44 @@ class Settings(BaseSettings):
         case_sensitive=True,
     )
 
+    @model_validator(mode="after")
+    def _production_defaults(self) -> "Settings":
+        """
+        Force development-only flags off in production.
+
+        Returns:
+            Settings: Validated settings
+        """
+        if self.is_production:
+            self.DEBUG = False
+            self.RELOAD = False
+        return self
+
+    @property
+    def is_production(self) -> bool:
+        """
+        Whether the service runs in production mode.
+
+        Returns:
+            bool: True if ENVIRONMENT is "production"
+        """
+        return self.ENVIRONMENT.lower() == "production"
+
+    @property
+    def worker_count(self) -> int:
+        """
+        Get the number of worker processes to run.
+
+        Returns:
+            int: WORKERS if set, otherwise the number of cores this process may run on
+        """
+        if self.WORKERS > 0:
+            return self.WORKERS
+        # Reason: Respect CPU affinity / container cpusets, not just the host core count
+        if hasattr(os, "sched_getaffinity"):
+            return max(1, len(os.sched_getaffinity(0)))
+        return max(1, os.cpu_count() or 1)
+
     @property
     def allowed_origins_list(self) -> List[str]:
         """
@@ -59,6 +171,26 @@ class Settings(BaseSettings):
         """
         return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
 
+    @property
+    def image_widths_list(self) -> List[int]:
+        """
+        Get responsive image widths as a list.
+
+        Returns:
+            List[int]: Widths in pixels, ascending
+        """
+        return sorted(int(w) for w in self.IMAGE_WIDTHS.split(",") if w.strip())
+
+    @property
+    def image_formats_list(self) -> List[str]:
+        """
+        Get modern image formats as a list.
+
+        Returns:
+            List[str]: Format names in order of preference
+        """
+        return [f.strip().lower() for f in self.IMAGE_FORMATS.split(",") if f.strip()]
+
     @property
     def database_path_absolute(self) -> Path:
         """
@@ -71,6 +203,28 @@ class Settings(BaseSettings):
         base_path = Path(__file__).parent.parent
         return (base_path / self.DATABASE_PATH).resolve()
 
+    @property
+    def assets_path_absolute(self) -> Path:
+        """
+        Get absolute path to the static assets directory.
+
+        Returns:
+            Path: Absolute path that asset URLs like /assets/... are relative to
+        """
+        base_path = Path(__file__).parent.parent
+        return (base_path / self.ASSETS_PATH).resolve()
+
+    @property
+    def openapi_cache_dir_absolute(self) -> Path:
+        """
+        Get absolute path to the OpenAPI cache directory.
+
+        Returns:
+            Path: Absolute cache directory
+        """
+        base_path = Path(__file__).parent.parent
+        return (base_path / self.OPENAPI_CACHE_DIR).resolve()
+
 
 # Global settings instance
 settings = Settings()
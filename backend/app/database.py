@@ -4,21 +4,131 @@ Database connection and query utilities for X-UAV backend.
 Provides DuckDB connection management and query methods.
 """
 
-import json
+import os
+import threading
 from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional
-
-import duckdb
-
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .cache import LRUCache, cached_result
 from .config import settings
+from .metrics import DB_CONNECTIONS_IN_USE, DB_CONNECTIONS_OPENED, timed_query
+from .predicates import compile_predicates
+from .singleflight import SingleFlight, coalesced
+from .statements import StatementCache
+from .units import uav_select_list
+
+if TYPE_CHECKING:
+    import duckdb
+
+# Full UAV rows, with imperial/nautical fields derived from SI when not stored
+UAV_COLUMNS = uav_select_list()
+
+# LIST/MAP/STRUCT columns of uavs; the columnar store keeps them as JSON text
+UAV_NESTED_COLUMNS = (
+    "mission_types", "armament", "sensor_suite", "operators", "export_countries",
+    "imagery_urls", "model_urls", "image_derivatives", "notable_features", "variants",
+)
+
+# Numeric UAV fields accepted by the analytics endpoints (SI and derived units)
+NUMERIC_UAV_FIELDS = (
+    "total_units_produced",
+    "wingspan_meters", "wingspan_feet", "length_meters", "length_feet",
+    "height_meters", "height_feet", "empty_weight_kg", "empty_weight_lbs",
+    "max_takeoff_weight_kg", "max_takeoff_weight_lbs", "payload_capacity_kg",
+    "payload_capacity_lbs", "fuel_capacity_kg", "fuel_capacity_gallons",
+    "thrust_hp", "thrust_lbs", "number_of_engines",
+    "cruise_speed_kmh", "cruise_speed_mph", "cruise_speed_knots",
+    "max_speed_kmh", "max_speed_mph", "max_speed_mach",
+    "service_ceiling_meters", "service_ceiling_feet",
+    "range_km", "range_miles", "range_nm", "endurance_hours",
+    "combat_radius_km", "combat_radius_nm",
+    "max_weapons_load_kg", "max_weapons_load_lbs", "hardpoints", "crew_size_remote",
+    "unit_cost_usd", "program_cost_usd", "fiscal_year",
+)
+
+# Categorical UAV fields a distribution can be grouped by
+DISTRIBUTION_GROUPS = (
+    "type", "country_of_origin", "manufacturer", "nato_class", "operational_status",
+    "airframe_type", "engine_type", "autonomy_level", "launch_method",
+)
+
+# Quantiles reported by get_distribution, keyed p5, p25, ...
+DISTRIBUTION_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+# Fields a capability search can filter on, by kind (see predicates.py)
+UAV_CAPABILITY_FIELDS: Dict[str, str] = {
+    **{field: "number" for field in NUMERIC_UAV_FIELDS},
+    **{field: "text" for field in ("designation", "name") + DISTRIBUTION_GROUPS},
+    **{
+        field: "list"
+        for field in ("mission_types", "sensor_suite", "operators", "export_countries")
+    },
+}
+ARMAMENT_CAPABILITY_FIELDS: Dict[str, str] = {
+    **{
+        field: "number"
+        for field in (
+            "length_meters", "diameter_mm", "wingspan_meters", "weight_kg", "warhead_weight_kg",
+            "range_km", "range_miles", "range_nm", "max_speed_mach", "max_speed_kmh",
+            "min_altitude_meters", "max_altitude_meters", "cep_meters", "launch_weight_kg",
+            "unit_cost_usd", "year_introduced",
+        )
+    },
+    **{
+        field: "text"
+        for field in (
+            "designation", "name", "manufacturer", "country_of_origin", "weapon_type",
+            "weapon_class", "guidance_type", "warhead_type", "propulsion_type",
+            "operational_status",
+        )
+    },
+    "launch_platform_types": "list",
+}
+
+# Columns always returned by search_capabilities (predicate fields are added)
+CAPABILITY_UAV_COLUMNS = (
+    "designation", "name", "type", "country_of_origin", "operational_status"
+)
+CAPABILITY_ARMAMENT_COLUMNS = (
+    "designation", "name", "weapon_type", "weapon_class", "guidance_type"
+)
+
+
+def _connect(path: Path) -> "duckdb.DuckDBPyConnection":
+    """Open a read-only connection; DuckDB is imported on first use to keep app import fast."""
+    import duckdb
+
+    return duckdb.connect(str(path), read_only=True)
 
 
 class Database:
     """
     Database connection manager for DuckDB.
 
-    Handles connection pooling and query execution.
+    Handles connection pooling and query execution. Queries are parsed once
+    per shape and reused through a StatementCache. Identical concurrent
+    read calls (same method and arguments) share one execution, and the
+    parameterized search/link queries are served from a result cache keyed
+    on their arguments and the catalog generation.
+
+    By default every call opens its own read-only connection. After open(),
+    calls instead get cheap cursors on one persistent read-only handle owned
+    by the current process (each forked worker opens its own). Inside
+    session(), every call in the same context shares one connection.
     """
 
     def __init__(self, db_path: Optional[Path] = None):
@@ -29,10 +139,94 @@ class Database:
             db_path (Optional[Path]): Path to database file. Uses settings if not provided.
         """
         self.db_path = db_path or settings.database_path_absolute
-        self._conn: Optional[duckdb.DuckDBPyConnection] = None
+        self._conn: Optional["duckdb.DuckDBPyConnection"] = None
+        self._conn_pid: Optional[int] = None
+        self._conn_lock = threading.Condition()
+        self._cursors_out = 0
+        self._session: ContextVar[Optional["duckdb.DuckDBPyConnection"]] = ContextVar(
+            "db_session", default=None
+        )
+        self.statements = StatementCache(settings.STATEMENT_CACHE_SIZE)
+        self.flights = SingleFlight()
+        self.coalesce = settings.DB_SINGLE_FLIGHT_ENABLED
+        self.results: Optional[LRUCache] = (
+            LRUCache("db_results", settings.RESULT_CACHE_SIZE, settings.RESULT_CACHE_TTL or None)
+            if settings.RESULT_CACHE_SIZE > 0
+            else None
+        )
+        # Reason: The file fingerprint changes when the file is replaced; the
+        # snapshot cache swaps in its generation number (see snapshot.py)
+        self.result_generation: Callable[[], Hashable] = self.file_fingerprint
+
+    def open(self) -> None:
+        """
+        Open the persistent read-only handle for this process.
+
+        Safe to call repeatedly. A handle inherited across fork() is never
+        reused; the child opens its own.
+        """
+        with self._conn_lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                return
+            self._conn = _connect(self.db_path)
+            self._conn_pid = os.getpid()
+            DB_CONNECTIONS_OPENED.inc()
+
+    def close(self) -> None:
+        """Close the persistent handle, falling back to per-call connections."""
+        with self._conn_lock:
+            conn, owner = self._conn, self._conn_pid
+            self._conn = None
+            self._conn_pid = None
+        # Reason: Closing a handle inherited from the parent would affect the parent's file state
+        if conn is not None and owner == os.getpid():
+            conn.close()
+
+    def reopen(self) -> None:
+        """
+        Swap in a fresh persistent handle (e.g. after the database file was replaced).
+
+        DuckDB keeps one instance per path per process and closing a handle
+        closes its cursors, so the swap waits for cursors already handed out
+        to be returned, then closes the old handle before opening the new one.
+        New queries wait for the swap.
+        """
+        with self._conn_lock:
+            if self._conn is None or self._conn_pid != os.getpid():
+                return
+            old, self._conn = self._conn, None
+            self._conn_lock.wait_for(lambda: self._cursors_out == 0)
+            old.close()
+            try:
+                self._conn = _connect(self.db_path)
+            except Exception:
+                # Reason: Fall back to per-call connections rather than block waiters
+                self._conn_pid = None
+                raise
+            finally:
+                self._conn_lock.notify_all()
+            DB_CONNECTIONS_OPENED.inc()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether this process holds a persistent handle."""
+        return self._conn is not None and self._conn_pid == os.getpid()
+
+    def file_fingerprint(self) -> Optional[tuple]:
+        """
+        Identify the current database file contents.
+
+        Returns:
+            Optional[tuple]: (inode, mtime_ns, size), or None if the file is missing
+        """
+        try:
+            stat = os.stat(self.db_path)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
 
     @contextmanager
-    def get_connection(self) -> Generator[duckdb.DuckDBPyConnection, None, None]:
+    def get_connection(self) -> Generator["duckdb.DuckDBPyConnection", None, None]:
         """
         Get database connection as context manager.
 
@@ -43,12 +237,86 @@ class Database:
             with db.get_connection() as conn:
                 result = conn.execute("SELECT * FROM uavs").fetchall()
         """
-        conn = duckdb.connect(str(self.db_path), read_only=True)
+        session = self._session.get()
+        if session is not None:
+            yield session
+            return
+
+        conn = None
+        with self._conn_lock:
+            # Reason: _conn is None only briefly while reopen() swaps handles
+            self._conn_lock.wait_for(
+                lambda: self._conn is not None or self._conn_pid != os.getpid()
+            )
+            if self._conn is not None and self._conn_pid == os.getpid():
+                conn = self._conn.cursor()
+                self._cursors_out += 1
+        pooled = conn is not None
+        if conn is None:
+            conn = _connect(self.db_path)
+            DB_CONNECTIONS_OPENED.inc()
+        DB_CONNECTIONS_IN_USE.inc()
         try:
             yield conn
         finally:
+            DB_CONNECTIONS_IN_USE.dec()
             conn.close()
+            if pooled:
+                with self._conn_lock:
+                    self._cursors_out -= 1
+                    self._conn_lock.notify_all()
 
+    @contextmanager
+    def session(self) -> Generator["duckdb.DuckDBPyConnection", None, None]:
+        """
+        Share one connection between all calls made in this context.
+
+        Used to answer several queries (e.g. a bundle or batch request) in
+        one round trip against the same database state. The context is
+        inherited by threadpool calls, so sync endpoints join the session.
+        Nested sessions reuse the outer connection.
+
+        Yields:
+            duckdb.DuckDBPyConnection: Shared connection
+        """
+        if self._session.get() is not None:
+            yield self._session.get()
+            return
+        with self.get_connection() as conn:
+            token = self._session.set(conn)
+            try:
+                yield conn
+            finally:
+                self._session.reset(token)
+
+    def _execute(
+        self,
+        conn: "duckdb.DuckDBPyConnection",
+        name: str,
+        sql: Union[str, Callable[[], str]],
+        params: Optional[List[Any]] = None,
+        shape: Hashable = (),
+    ) -> "duckdb.DuckDBPyConnection":
+        """
+        Execute a query through the statement cache.
+
+        Args:
+            conn (duckdb.DuckDBPyConnection): Open connection
+            name (str): Statement name (used in the cache key and metrics)
+            sql (Union[str, Callable[[], str]]): SQL text, or builder called on cache miss
+            params (Optional[List[Any]]): Query parameters
+            shape (Hashable): Distinguishes variants of a dynamically built query
+
+        Returns:
+            duckdb.DuckDBPyConnection: Connection with the pending result
+        """
+        statement = self.statements.get((name, shape), sql)
+        if params:
+            return conn.execute(statement, params)
+        return conn.execute(statement)
+
+    @coalesced
+    @timed_query
     def get_all_uavs(self) -> List[Dict[str, Any]]:
         """
         Retrieve all UAVs from database.
@@ -57,8 +325,8 @@ class Database:
             List[Dict[str, Any]]: List of UAV records
         """
         with self.get_connection() as conn:
-            result = conn.execute(
-                "SELECT * FROM uavs ORDER BY designation"
+            result = self._execute(
+                conn, "get_all_uavs", f"SELECT {UAV_COLUMNS} FROM uavs ORDER BY designation"
             ).fetchall()
 
             # Get column names
@@ -67,6 +335,30 @@ class Database:
             # Convert to list of dicts
             return [self._row_to_dict(row, columns) for row in result]
 
+    @timed_query
+    def get_uav_columns(self) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Retrieve all UAVs column-by-column, for building a ColumnarTable.
+
+        Nested columns are converted to JSON by DuckDB, so list responses
+        can be serialized from their text without touching Python objects.
+
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, str]]: NumPy arrays by column
+                (masked where NULLs occur) and DuckDB type names by column
+        """
+        as_json = ", ".join(f"to_json({name}) AS {name}" for name in UAV_NESTED_COLUMNS)
+        sql = (
+            f"SELECT * REPLACE ({as_json}) FROM (SELECT {UAV_COLUMNS} FROM uavs) "
+            "ORDER BY designation"
+        )
+        with self.get_connection() as conn:
+            result = self._execute(conn, "get_uav_columns", sql)
+            types = {desc[0]: str(desc[1]) for desc in conn.description}
+            return result.fetchnumpy(), types
+
+    @coalesced
+    @timed_query
     def get_uav_by_designation(self, designation: str) -> Optional[Dict[str, Any]]:
         """
         Get specific UAV by designation.
@@ -78,9 +370,11 @@ class Database:
             Optional[Dict[str, Any]]: UAV record or None if not found
         """
         with self.get_connection() as conn:
-            result = conn.execute(
-                "SELECT * FROM uavs WHERE designation = ?",
-                [designation]
+            result = self._execute(
+                conn,
+                "get_uav_by_designation",
+                f"SELECT {UAV_COLUMNS} FROM uavs WHERE designation = ?",
+                [designation],
             ).fetchone()
 
             if result is None:
@@ -89,6 +383,8 @@ class Database:
             columns = [desc[0] for desc in conn.description]
             return self._row_to_dict(result, columns)
 
+    @coalesced
+    @timed_query
     def compare_uavs(self, designations: List[str]) -> List[Dict[str, Any]]:
         """
         Compare multiple UAVs.
@@ -102,20 +398,25 @@ class Database:
         if not designations:
             return []
 
-        placeholders = ','.join(['?' for _ in designations])
-        query = f"SELECT * FROM uavs WHERE designation IN ({placeholders}) ORDER BY designation"
+        # Reason: One list parameter keeps a single statement for any number of designations
+        query = f"SELECT {UAV_COLUMNS} FROM uavs WHERE designation = ANY(?) ORDER BY designation"
 
         with self.get_connection() as conn:
-            result = conn.execute(query, designations).fetchall()
+            result = self._execute(conn, "compare_uavs", query, [list(designations)]).fetchall()
             columns = [desc[0] for desc in conn.description]
             return [self._row_to_dict(row, columns) for row in result]
 
+    @cached_result
+    @coalesced
+    @timed_query
     def search_uavs(
         self,
         country: Optional[str] = None,
         uav_type: Optional[str] = None,
         status: Optional[str] = None,
         nato_class: Optional[str] = None,
+        mission_type: Optional[str] = None,
+        operator: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search UAVs with filters.
@@ -125,37 +426,214 @@ class Database:
             uav_type (Optional[str]): Filter by UAV type
             status (Optional[str]): Filter by operational status
             nato_class (Optional[str]): Filter by NATO class
+            mission_type (Optional[str]): Filter by an entry of mission_types
+            operator (Optional[str]): Filter by operating country (uav_operators index)
 
         Returns:
             List[Dict[str, Any]]: Matching UAVs
         """
-        # Build dynamic query
-        query = "SELECT * FROM uavs WHERE 1=1"
+        # Build dynamic query; the set of active clauses is the cache shape
+        clauses = []
         params = []
 
         if country:
-            query += " AND country_of_origin = ?"
+            clauses.append("country_of_origin = ?")
             params.append(country)
 
         if uav_type:
-            query += " AND type LIKE ?"
+            clauses.append("type LIKE ?")
             params.append(f"%{uav_type}%")
 
         if status:
-            query += " AND operational_status = ?"
+            clauses.append("operational_status = ?")
             params.append(status)
 
         if nato_class:
-            query += " AND nato_class = ?"
+            clauses.append("nato_class = ?")
             params.append(nato_class)
 
-        query += " ORDER BY designation"
+        if mission_type:
+            clauses.append("list_contains(mission_types, ?)")
+            params.append(mission_type)
+
+        if operator:
+            clauses.append(
+                "designation IN (SELECT uav_designation FROM uav_operators "
+                "WHERE country = ? AND relation = 'operator')"
+            )
+            params.append(operator)
+
+        shape = tuple(clauses)
+
+        def build() -> str:
+            where = "".join(f" AND {clause}" for clause in shape)
+            return f"SELECT {UAV_COLUMNS} FROM uavs WHERE 1=1{where} ORDER BY designation"
+
+        with self.get_connection() as conn:
+            result = self._execute(conn, "search_uavs", build, params, shape).fetchall()
+            columns = [desc[0] for desc in conn.description]
+            return [self._row_to_dict(row, columns) for row in result]
+
+    @cached_result
+    @coalesced
+    @timed_query
+    def search_variants(
+        self,
+        uav: Optional[str] = None,
+        country: Optional[str] = None,
+        uav_type: Optional[str] = None,
+        query: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search UAV variants.
+
+        Args:
+            uav (Optional[str]): Airframe designation
+            country (Optional[str]): Airframe country of origin
+            uav_type (Optional[str]): Substring of the airframe type
+            query (Optional[str]): Case-insensitive substring of the variant designation or name
+
+        Returns:
+            List[Dict[str, Any]]: Variants with their airframe's name, country and
+                type, ordered by airframe and variant designation
+        """
+        clauses = []
+        params = []
+
+        if uav:
+            clauses.append("v.uav_designation = ?")
+            params.append(uav)
+
+        if country:
+            clauses.append("u.country_of_origin = ?")
+            params.append(country)
+
+        if uav_type:
+            clauses.append("u.type LIKE ?")
+            params.append(f"%{uav_type}%")
+
+        if query:
+            clauses.append("(v.designation ILIKE ? OR v.name ILIKE ?)")
+            params.extend([f"%{query}%"] * 2)
+
+        shape = tuple(clauses)
+
+        def build() -> str:
+            where = "".join(f" AND {clause}" for clause in shape)
+            return f"""
+                SELECT v.*, u.name AS uav_name, u.country_of_origin, u.type AS uav_type
+                FROM uav_variants v
+                JOIN uavs u ON u.designation = v.uav_designation
+                WHERE 1=1{where}
+                ORDER BY v.uav_designation, v.designation
+            """
+
+        with self.get_connection() as conn:
+            result = self._execute(conn, "search_variants", build, params, shape).fetchall()
+            columns = [desc[0] for desc in conn.description]
+            return [self._row_to_dict(row, columns) for row in result]
+
+    @coalesced
+    @timed_query
+    def compare_variants(self, designations: List[str]) -> List[Dict[str, Any]]:
+        """
+        Compare UAV variants side by side.
+
+        Args:
+            designations (List[str]): Variant designations
+
+        Returns:
+            List[Dict[str, Any]]: Matching variants (any airframe), in the order requested
+        """
+        if not designations:
+            return []
+
+        with self.get_connection() as conn:
+            result = self._execute(
+                conn,
+                "compare_variants",
+                """
+                SELECT v.*, u.name AS uav_name, u.country_of_origin, u.type AS uav_type
+                FROM uav_variants v
+                JOIN uavs u ON u.designation = v.uav_designation
+                WHERE v.designation = ANY(?)
+                ORDER BY list_position(?, v.designation), v.uav_designation
+                """,
+                [list(designations), list(designations)],
+            ).fetchall()
+            columns = [desc[0] for desc in conn.description]
+            return [self._row_to_dict(row, columns) for row in result]
+
+    @coalesced
+    @timed_query
+    def get_country_fleets(self) -> List[Dict[str, Any]]:
+        """
+        Get the precomputed fleet summary of every country.
 
+        Returns:
+            List[Dict[str, Any]]: Fleet size, domestic/imported split, suppliers,
+                exports and customers per country, largest fleets first
+        """
         with self.get_connection() as conn:
-            result = conn.execute(query, params).fetchall()
+            result = self._execute(
+                conn,
+                "get_country_fleets",
+                """
+                SELECT * EXCLUDE (designations) FROM country_fleets
+                ORDER BY uav_count DESC, country
+                """,
+            ).fetchall()
             columns = [desc[0] for desc in conn.description]
             return [self._row_to_dict(row, columns) for row in result]
 
+    @cached_result
+    @coalesced
+    @timed_query
+    def get_operator_fleet(self, country: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a country's fleet summary and the UAVs it operates or received.
+
+        Args:
+            country (str): Country name (e.g., "Poland")
+
+        Returns:
+            Optional[Dict[str, Any]]: country_fleets row plus "uavs" (each with
+                its relations: operator and/or export), or None if the country
+                fields no UAVs and exports none
+        """
+        with self.get_connection() as conn:
+            summary = self._execute(
+                conn,
+                "get_operator_fleet",
+                "SELECT * EXCLUDE (designations) FROM country_fleets WHERE country = ?",
+                [country],
+                shape="summary",
+            ).fetchone()
+            if summary is None:
+                return None
+            fleet = self._row_to_dict(summary, [desc[0] for desc in conn.description])
+
+            result = self._execute(
+                conn,
+                "get_operator_fleet",
+                """
+                SELECT u.designation, u.name, u.type, u.country_of_origin, u.operational_status,
+                       list_sort(list(o.relation)) AS relations
+                FROM uav_operators o
+                JOIN uavs u ON u.designation = o.uav_designation
+                WHERE o.country = ?
+                GROUP BY ALL
+                ORDER BY u.designation
+                """,
+                [country],
+                shape="uavs",
+            ).fetchall()
+            columns = [desc[0] for desc in conn.description]
+            fleet["uavs"] = [self._row_to_dict(row, columns) for row in result]
+            return fleet
+
+    @coalesced
+    @timed_query
     def get_countries(self) -> List[str]:
         """
         Get list of all countries in database.
@@ -164,7 +642,9 @@ class Database:
             List[str]: List of country names
         """
         with self.get_connection() as conn:
-            result = conn.execute(
+            result = self._execute(
+                conn,
+                "get_countries",
                 """
                 SELECT DISTINCT country_of_origin
                 FROM uavs
@@ -174,6 +654,8 @@ class Database:
             ).fetchall()
             return [row[0] for row in result]
 
+    @coalesced
+    @timed_query
     def get_types(self) -> List[str]:
         """
         Get list of all UAV types in database.
@@ -182,7 +664,9 @@ class Database:
             List[str]: List of UAV types
         """
         with self.get_connection() as conn:
-            result = conn.execute(
+            result = self._execute(
+                conn,
+                "get_types",
                 """
                 SELECT DISTINCT type
                 FROM uavs
@@ -192,6 +676,8 @@ class Database:
             ).fetchall()
             return [row[0] for row in result]
 
+    @coalesced
+    @timed_query
     def get_stats(self) -> Dict[str, Any]:
         """
         Get database statistics.
@@ -201,10 +687,12 @@ class Database:
         """
         with self.get_connection() as conn:
             # Total count
-            total = conn.execute("SELECT COUNT(*) FROM uavs").fetchone()[0]
+            total = self._execute(conn, "stats_total", "SELECT COUNT(*) FROM uavs").fetchone()[0]
 
             # By country
-            by_country = conn.execute(
+            by_country = self._execute(
+                conn,
+                "stats_by_country",
                 """
                 SELECT country_of_origin, COUNT(*) as count
                 FROM uavs
@@ -214,7 +702,9 @@ class Database:
             ).fetchall()
 
             # By type
-            by_type = conn.execute(
+            by_type = self._execute(
+                conn,
+                "stats_by_type",
                 """
                 SELECT type, COUNT(*) as count
                 FROM uavs
@@ -225,7 +715,9 @@ class Database:
             ).fetchall()
 
             # By status
-            by_status = conn.execute(
+            by_status = self._execute(
+                conn,
+                "stats_by_status",
                 """
                 SELECT operational_status, COUNT(*) as count
                 FROM uavs
@@ -242,37 +734,122 @@ class Database:
                 "by_status": [{"status": row[0], "count": row[1]} for row in by_status],
             }
 
+    @cached_result
+    @coalesced
+    @timed_query
+    def get_distribution(
+        self, field: str, group_by: Optional[str] = None, bins: int = 20
+    ) -> Dict[str, Any]:
+        """
+        Histogram, quantiles and summary statistics of a numeric UAV field.
+
+        Computed in one query: window functions find the overall range, so
+        every group's histogram shares the same bin edges, and GROUPING SETS
+        add the all-UAVs row alongside the groups.
+
+        Args:
+            field (str): One of NUMERIC_UAV_FIELDS
+            group_by (Optional[str]): One of DISTRIBUTION_GROUPS, or None for all UAVs only
+            bins (int): Number of equal-width histogram bins
+
+        Returns:
+            Dict[str, Any]: field, group_by, bin edges, the "overall" summary and
+                per-group summaries (count, missing, min, max, mean, stddev,
+                quantiles, histogram), largest groups first
+
+        Raises:
+            ValueError: If field or group_by isn't accepted
+        """
+        if field not in NUMERIC_UAV_FIELDS:
+            raise ValueError(f"'{field}' is not a numeric UAV field")
+        if group_by is not None and group_by not in DISTRIBUTION_GROUPS:
+            raise ValueError(f"Can't group by '{group_by}'")
+
+        shape = (field, group_by)
+        quantiles = ", ".join(str(q) for q in DISTRIBUTION_QUANTILES)
+
+        def build() -> str:
+            group = group_by or "NULL"
+            return f"""
+                WITH v AS (
+                    SELECT {group} AS grp, {field}::DOUBLE AS x,
+                           min({field}::DOUBLE) OVER () AS lo, max({field}::DOUBLE) OVER () AS hi
+                    FROM (SELECT {UAV_COLUMNS} FROM uavs)
+                )
+                SELECT GROUPING(grp) AS overall, grp, count(x) AS count,
+                       count(*) - count(x) AS missing, min(x) AS min, max(x) AS max,
+                       avg(x) AS mean, stddev_samp(x) AS stddev,
+                       quantile_cont(x, [{quantiles}]) AS quantiles,
+                       histogram(
+                           CASE WHEN hi > lo
+                                THEN least(floor((x - lo) / (hi - lo) * ?)::INTEGER, ? - 1)
+                                ELSE 0 END
+                       ) FILTER (WHERE x IS NOT NULL) AS histogram,
+                       any_value(lo) AS lo, any_value(hi) AS hi
+                FROM v
+                GROUP BY GROUPING SETS ((grp), ())
+                ORDER BY overall DESC, count DESC, grp NULLS LAST
+            """
+
+        with self.get_connection() as conn:
+            result = self._execute(
+                conn, "get_distribution", build, [bins, bins], shape
+            ).fetchall()
+            columns = [desc[0] for desc in conn.description]
+
+        rows = [self._row_to_dict(row, columns) for row in result]
+        lo, hi = rows[0]["lo"], rows[0]["hi"]
+        edges = [] if lo is None else [lo + (hi - lo) * i / bins for i in range(bins + 1)]
+        summaries = []
+        for row in rows:
+            counts = row["histogram"] or {}
+            summaries.append({
+                "group": row["grp"],
+                "count": row["count"],
+                "missing": row["missing"],
+                "min": row["min"],
+                "max": row["max"],
+                "mean": row["mean"],
+                "stddev": row["stddev"],
+                "quantiles": dict(zip(
+                    (f"p{round(q * 100)}" for q in DISTRIBUTION_QUANTILES),
+                    row["quantiles"] or [None] * len(DISTRIBUTION_QUANTILES),
+                )),
+                "histogram": [counts.get(i, 0) for i in range(bins)] if edges else [],
+            })
+        overall = summaries.pop(0)
+        del overall["group"]
+        return {
+            "field": field,
+            "group_by": group_by,
+            "bins": bins,
+            "edges": edges,
+            "overall": overall,
+            "groups": summaries if group_by else [],
+        }
+
     def _row_to_dict(self, row: tuple, columns: List[str]) -> Dict[str, Any]:
         """
         Convert database row to dictionary.
 
+        LIST, MAP and STRUCT columns already come back as Python lists and
+        dicts, so nothing needs parsing.
+
         Args:
             row (tuple): Database row
             columns (List[str]): Column names
 
         Returns:
-            Dict[str, Any]: Row as dictionary with JSON fields parsed
-        """
-        json_fields = [
-            'mission_types', 'armament', 'sensor_suite', 'operators',
-            'export_countries', 'notable_features', 'imagery_urls',
-            'model_urls', 'variants', 'launch_platform_types'
-        ]
-        result = {}
-        for i, col in enumerate(columns):
-            value = row[i]
-            if value is not None and col in json_fields:
-                try:
-                    value = json.loads(value)
-                except (json.JSONDecodeError, TypeError):
-                    pass
-            result[col] = value
-        return result
+            Dict[str, Any]: Row as dictionary
+        """
+        return dict(zip(columns, row))
 
     # =====================================================
     # ARMAMENT METHODS
     # =====================================================
 
+    @coalesced
+    @timed_query
     def get_all_armaments(self) -> List[Dict[str, Any]]:
         """
         Retrieve all armaments from database.
@@ -281,12 +858,16 @@ class Database:
             List[Dict[str, Any]]: List of armament records
         """
         with self.get_connection() as conn:
-            result = conn.execute(
-                "SELECT * FROM armaments ORDER BY weapon_type, designation"
+            result = self._execute(
+                conn,
+                "get_all_armaments",
+                "SELECT * FROM armaments ORDER BY weapon_type, designation",
             ).fetchall()
             columns = [desc[0] for desc in conn.description]
             return [self._row_to_dict(row, columns) for row in result]
 
+    @coalesced
+    @timed_query
     def get_armament_by_designation(self, designation: str) -> Optional[Dict[str, Any]]:
         """
         Get specific armament by designation.
@@ -298,15 +879,20 @@ class Database:
             Optional[Dict[str, Any]]: Armament record or None
         """
         with self.get_connection() as conn:
-            result = conn.execute(
+            result = self._execute(
+                conn,
+                "get_armament_by_designation",
                 "SELECT * FROM armaments WHERE designation = ?",
-                [designation]
+                [designation],
             ).fetchone()
             if result is None:
                 return None
             columns = [desc[0] for desc in conn.description]
             return self._row_to_dict(result, columns)
 
+    @cached_result
+    @coalesced
+    @timed_query
     def search_armaments(
         self,
         weapon_type: Optional[str] = None,
@@ -326,29 +912,36 @@ class Database:
         Returns:
             List[Dict[str, Any]]: Matching armaments
         """
-        query = "SELECT * FROM armaments WHERE 1=1"
+        clauses = []
         params = []
 
         if weapon_type:
-            query += " AND weapon_type = ?"
+            clauses.append("weapon_type = ?")
             params.append(weapon_type)
         if weapon_class:
-            query += " AND weapon_class LIKE ?"
+            clauses.append("weapon_class LIKE ?")
             params.append(f"%{weapon_class}%")
         if country:
-            query += " AND country_of_origin = ?"
+            clauses.append("country_of_origin = ?")
             params.append(country)
         if guidance_type:
-            query += " AND guidance_type LIKE ?"
+            clauses.append("guidance_type LIKE ?")
             params.append(f"%{guidance_type}%")
 
-        query += " ORDER BY designation"
+        shape = tuple(clauses)
+
+        def build() -> str:
+            where = "".join(f" AND {clause}" for clause in shape)
+            return f"SELECT * FROM armaments WHERE 1=1{where} ORDER BY designation"
 
         with self.get_connection() as conn:
-            result = conn.execute(query, params).fetchall()
+            result = self._execute(conn, "search_armaments", build, params, shape).fetchall()
             columns = [desc[0] for desc in conn.description]
             return [self._row_to_dict(row, columns) for row in result]
 
+    @cached_result
+    @coalesced
+    @timed_query
     def get_armaments_for_uav(self, uav_designation: str) -> List[Dict[str, Any]]:
         """
         Get all armaments compatible with a specific UAV.
@@ -360,7 +953,9 @@ class Database:
             List[Dict[str, Any]]: List of armaments with integration details
         """
         with self.get_connection() as conn:
-            result = conn.execute(
+            result = self._execute(
+                conn,
+                "get_armaments_for_uav",
                 """
                 SELECT a.*, ua.max_quantity, ua.hardpoint_positions,
                        ua.integration_status, ua.notes as integration_notes
@@ -374,6 +969,9 @@ class Database:
             columns = [desc[0] for desc in conn.description]
             return [self._row_to_dict(row, columns) for row in result]
 
+    @cached_result
+    @coalesced
+    @timed_query
     def get_uavs_for_armament(self, armament_designation: str) -> List[Dict[str, Any]]:
         """
         Get all UAVs that can carry a specific armament.
@@ -385,7 +983,9 @@ class Database:
             List[Dict[str, Any]]: List of UAVs with integration details
         """
         with self.get_connection() as conn:
-            result = conn.execute(
+            result = self._execute(
+                conn,
+                "get_uavs_for_armament",
                 """
                 SELECT u.designation, u.name, u.type, u.country_of_origin,
                        ua.max_quantity, ua.hardpoint_positions, ua.integration_status
@@ -399,22 +999,215 @@ class Database:
             columns = [desc[0] for desc in conn.description]
             return [self._row_to_dict(row, columns) for row in result]
 
+    @cached_result
+    @coalesced
+    @timed_query
+    def search_capabilities(
+        self,
+        uav: Sequence[Tuple[str, str, Any]] = (),
+        armament: Sequence[Tuple[str, str, Any]] = (),
+        integration_status: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find UAVs by their own properties and those of the weapons integrated on them.
+
+        All conditions are compiled into one query: UAVs are joined to
+        uav_armaments and armaments, filtered on all three, and grouped back
+        to one row per UAV with the weapons that matched. Without armament
+        or integration conditions UAVs need no weapons and every linked one
+        is listed.
+
+        Args:
+            uav (Sequence[Tuple[str, str, Any]]): (field, op, value) conditions on
+                UAV_CAPABILITY_FIELDS
+            armament (Sequence[Tuple[str, str, Any]]): Conditions on
+                ARMAMENT_CAPABILITY_FIELDS
+            integration_status (Optional[Sequence[str]]): Accepted uav_armaments statuses
+
+        Returns:
+            List[Dict[str, Any]]: UAVs ordered by designation, with the fields
+                used in conditions and "armaments": the matching weapons with
+                max_quantity and integration_status
+
+        Raises:
+            PredicateError: If a field, operator or value isn't allowed
+        """
+        uav_clauses, params = compile_predicates("u", uav, UAV_CAPABILITY_FIELDS)
+        armament_clauses, armament_params = compile_predicates(
+            "a", armament, ARMAMENT_CAPABILITY_FIELDS
+        )
+        params.extend(armament_params)
+        clauses = uav_clauses + armament_clauses
+        if integration_status:
+            clauses.append("list_contains(?::VARCHAR[], ua.integration_status)")
+            params.append(list(integration_status))
+        weapons_required = bool(armament_clauses or integration_status)
+
+        uav_columns = list(dict.fromkeys(CAPABILITY_UAV_COLUMNS + tuple(f for f, _, _ in uav)))
+        armament_columns = list(dict.fromkeys(
+            CAPABILITY_ARMAMENT_COLUMNS + tuple(f for f, _, _ in armament)
+        ))
+        shape = (tuple(clauses), tuple(uav_columns), tuple(armament_columns), weapons_required)
+
+        def build() -> str:
+            where = "".join(f" AND {clause}" for clause in clauses)
+            join = "JOIN" if weapons_required else "LEFT JOIN"
+            weapon = ", ".join(
+                [f"'{c}': a.{c}" for c in armament_columns]
+                + ["'max_quantity': ua.max_quantity", "'integration_status': ua.integration_status"]
+            )
+            return f"""
+                SELECT {", ".join(f"u.{c}" for c in uav_columns)},
+                       coalesce(
+                           list({{{weapon}}} ORDER BY a.designation)
+                               FILTER (WHERE a.designation IS NOT NULL),
+                           []
+                       ) AS armaments
+                FROM (SELECT {UAV_COLUMNS} FROM uavs) u
+                {join} uav_armaments ua ON ua.uav_designation = u.designation
+                {join} armaments a ON a.designation = ua.armament_designation
+                WHERE 1=1{where}
+                GROUP BY ALL
+                ORDER BY u.designation
+            """
+
+        with self.get_connection() as conn:
+            result = self._execute(conn, "search_capabilities", build, params, shape).fetchall()
+            columns = [desc[0] for desc in conn.description]
+            return [self._row_to_dict(row, columns) for row in result]
+
+    @coalesced
+    @timed_query
     def get_weapon_types(self) -> List[str]:
         """Get list of all weapon types."""
         with self.get_connection() as conn:
-            result = conn.execute(
-                "SELECT DISTINCT weapon_type FROM armaments ORDER BY weapon_type"
+            result = self._execute(
+                conn,
+                "get_weapon_types",
+                "SELECT DISTINCT weapon_type FROM armaments ORDER BY weapon_type",
             ).fetchall()
             return [row[0] for row in result]
 
+    @coalesced
+    @timed_query
     def get_weapon_classes(self) -> List[str]:
         """Get list of all weapon classes."""
         with self.get_connection() as conn:
-            result = conn.execute(
-                "SELECT DISTINCT weapon_class FROM armaments WHERE weapon_class IS NOT NULL ORDER BY weapon_class"
+            result = self._execute(
+                conn,
+                "get_weapon_classes",
+                "SELECT DISTINCT weapon_class FROM armaments "
+                "WHERE weapon_class IS NOT NULL ORDER BY weapon_class",
             ).fetchall()
             return [row[0] for row in result]
 
+    # =====================================================
+    # CHANGE FEED METHODS
+    # =====================================================
+
+    @coalesced
+    @timed_query
+    def get_catalog_generation(self) -> int:
+        """
+        Get the catalog generation recorded by the loader.
+
+        Returns:
+            int: Latest generation (0 for databases without change tracking)
+        """
+        with self.get_connection() as conn:
+            return self._catalog_generation(conn)
+
+    def _catalog_generation(self, conn: "duckdb.DuckDBPyConnection") -> int:
+        """Latest catalog generation on an open connection (0 without change tracking)."""
+        tracked = self._execute(
+            conn,
+            "has_catalog_generations",
+            """
+            SELECT COUNT(*) FROM information_schema.tables
+            WHERE table_schema = 'main' AND table_name = 'catalog_generations'
+            """,
+        ).fetchone()[0]
+        if not tracked:
+            return 0
+        return self._execute(
+            conn,
+            "get_catalog_generation",
+            "SELECT COALESCE(MAX(generation), 0) FROM catalog_generations",
+        ).fetchone()[0]
+
+    @coalesced
+    @timed_query
+    def get_changes(self, since: int) -> Optional[Dict[str, Any]]:
+        """
+        Get rows inserted, updated or deleted after a catalog generation.
+
+        Rows count as changed when updated_at is later than the loaded_at of
+        generation `since`, and as inserted when created_at is too. Deleted
+        rows come from the loader's tombstones, except keys that were
+        inserted again since.
+
+        Args:
+            since (int): Generation the caller has (0 for everything)
+
+        Returns:
+            Optional[Dict[str, Any]]: since, generation and per table (uavs,
+                armaments, uav_armaments) inserted rows, updated rows and
+                deleted keys; None if `since` isn't a generation of this
+                database (rebuilt, or ahead of it), so the caller must resync
+        """
+        with self.get_connection() as conn:
+            generation = self._catalog_generation(conn)
+            if since < 0 or since > generation:
+                return None
+            since_at = None
+            if since:
+                row = self._execute(
+                    conn,
+                    "get_generation_loaded_at",
+                    "SELECT loaded_at FROM catalog_generations WHERE generation = ?",
+                    [since],
+                ).fetchone()
+                if row is None:
+                    return None
+                since_at = row[0]
+
+            changes: Dict[str, Any] = {"since": since, "generation": generation}
+            for table, select, key in (
+                ("uavs", UAV_COLUMNS, ("designation",)),
+                ("armaments", "*", ("designation",)),
+                ("uav_armaments", "*", ("uav_designation", "armament_designation")),
+            ):
+                where = "" if since_at is None else " WHERE updated_at > ?"
+                result = self._execute(
+                    conn,
+                    f"changes_{table}",
+                    f"SELECT {select} FROM {table}{where} ORDER BY {', '.join(key)}",
+                    [] if since_at is None else [since_at],
+                    shape=bool(where),
+                ).fetchall()
+                columns = [desc[0] for desc in conn.description]
+                rows = [self._row_to_dict(row, columns) for row in result]
+                inserted = [r for r in rows if since_at is None or r["created_at"] > since_at]
+                updated = [r for r in rows if since_at is not None and r["created_at"] <= since_at]
+                present = {"|".join(r[k] for k in key) for r in inserted}
+                deleted = []
+                if since_at is not None:
+                    deleted = [
+                        row[0] for row in self._execute(
+                            conn,
+                            "changes_tombstones",
+                            """
+                            SELECT DISTINCT key FROM catalog_tombstones
+                            WHERE entity = ? AND generation > ?
+                            ORDER BY key
+                            """,
+                            [table, since],
+                        ).fetchall()
+                        if row[0] not in present
+                    ]
+                changes[table] = {"inserted": inserted, "updated": updated, "deleted": deleted}
+            return changes
+
 
 # Global database instance
 db = Database()
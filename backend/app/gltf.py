@@ -0,0 +1,145 @@
+"""
+Binary glTF (.glb) inspection for X-UAV backend.
+
+Reads just the JSON chunk of a GLB to report what the model manifest
+needs: vertex/triangle counts and the world-space bounding box in meters.
+POSITION accessors are required by the glTF spec to carry min/max, so no
+vertex data is decoded.
+"""
+
+import itertools
+import json
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+GLB_MAGIC = b"glTF"
+CHUNK_JSON = 0x4E4F534A
+MODE_TRIANGLES = 4
+
+Matrix = List[float]  # 4x4, column-major like glTF
+
+
+class GLBError(ValueError):
+    """Raised when a file isn't a readable binary glTF 2.0 asset."""
+
+
+def read_glb_json(path: Path) -> Dict[str, Any]:
+    """
+    Read the JSON chunk of a .glb file.
+
+    Args:
+        path (Path): GLB file
+
+    Returns:
+        Dict[str, Any]: Parsed glTF JSON
+
+    Raises:
+        GLBError: If the header or first chunk is invalid
+    """
+    with open(path, "rb") as f:
+        header = f.read(12)
+        if len(header) < 12:
+            raise GLBError(f"{path}: too short for a GLB header")
+        magic, version, _ = struct.unpack("<4sII", header)
+        if magic != GLB_MAGIC or version != 2:
+            raise GLBError(f"{path}: not a glTF 2.0 binary file")
+        length, chunk_type = struct.unpack("<II", f.read(8))
+        if chunk_type != CHUNK_JSON:
+            raise GLBError(f"{path}: first chunk is not JSON")
+        return json.loads(f.read(length))
+
+
+def _identity() -> Matrix:
+    return [1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0]
+
+
+def _multiply(a: Matrix, b: Matrix) -> Matrix:
+    """Column-major 4x4 product a @ b."""
+    return [
+        sum(a[k * 4 + row] * b[col * 4 + k] for k in range(4))
+        for col in range(4)
+        for row in range(4)
+    ]
+
+
+def _node_matrix(node: Dict[str, Any]) -> Matrix:
+    """Local transform of a node from matrix or TRS properties."""
+    if "matrix" in node:
+        return [float(v) for v in node["matrix"]]
+    tx, ty, tz = node.get("translation", (0.0, 0.0, 0.0))
+    qx, qy, qz, qw = node.get("rotation", (0.0, 0.0, 0.0, 1.0))
+    sx, sy, sz = node.get("scale", (1.0, 1.0, 1.0))
+    xx, yy, zz = qx * qx, qy * qy, qz * qz
+    xy, xz, yz = qx * qy, qx * qz, qy * qz
+    wx, wy, wz = qw * qx, qw * qy, qw * qz
+    return [
+        (1 - 2 * (yy + zz)) * sx, 2 * (xy + wz) * sx, 2 * (xz - wy) * sx, 0.0,
+        2 * (xy - wz) * sy, (1 - 2 * (xx + zz)) * sy, 2 * (yz + wx) * sy, 0.0,
+        2 * (xz + wy) * sz, 2 * (yz - wx) * sz, (1 - 2 * (xx + yy)) * sz, 0.0,
+        tx, ty, tz, 1.0,
+    ]
+
+
+def _transform(m: Matrix, p: Sequence[float]) -> List[float]:
+    return [m[row] * p[0] + m[4 + row] * p[1] + m[8 + row] * p[2] + m[12 + row] for row in range(3)]
+
+
+def inspect_glb(path: Path) -> Dict[str, Any]:
+    """
+    Summarize a GLB for the model manifest.
+
+    Args:
+        path (Path): GLB file
+
+    Returns:
+        Dict[str, Any]: bytes, vertices, triangles and bounding_box
+            ({"min", "max", "size"} in scene units, or None if empty)
+    """
+    gltf = read_glb_json(path)
+    nodes = gltf.get("nodes", [])
+    meshes = gltf.get("meshes", [])
+    accessors = gltf.get("accessors", [])
+    scenes = gltf.get("scenes", [])
+    roots = scenes[gltf.get("scene", 0)]["nodes"] if scenes else range(len(nodes))
+
+    lo: Optional[List[float]] = None
+    hi: Optional[List[float]] = None
+    vertices = 0
+    triangles = 0
+    stack = [(index, _identity()) for index in roots]
+    while stack:
+        index, parent = stack.pop()
+        node = nodes[index]
+        world = _multiply(parent, _node_matrix(node))
+        stack.extend((child, world) for child in node.get("children", []))
+        if "mesh" not in node:
+            continue
+        for primitive in meshes[node["mesh"]].get("primitives", []):
+            position = accessors[primitive["attributes"]["POSITION"]]
+            vertices += position["count"]
+            if primitive.get("mode", MODE_TRIANGLES) == MODE_TRIANGLES:
+                indexed = primitive.get("indices")
+                counted = accessors[indexed] if indexed is not None else position
+                triangles += counted["count"] // 3
+            amin, amax = position.get("min"), position.get("max")
+            if amin is None or amax is None:
+                continue
+            for corner in itertools.product(*zip(amin, amax)):
+                point = _transform(world, corner)
+                lo = point if lo is None else [min(a, b) for a, b in zip(lo, point)]
+                hi = point if hi is None else [max(a, b) for a, b in zip(hi, point)]
+
+    bounding_box = None
+    if lo is not None and hi is not None:
+        bounding_box = {
+            "min": [round(v, 4) for v in lo],
+            "max": [round(v, 4) for v in hi],
+            "size": [round(b - a, 4) for a, b in zip(lo, hi)],
+        }
+    return {
+        "bytes": path.stat().st_size,
+        "vertices": vertices,
+        "triangles": triangles,
+        "bounding_box": bounding_box,
+    }
@@ -0,0 +1,467 @@
+"""
+Image derivative pipeline for X-UAV backend.
+
+Turns the full-size views in `imagery_urls` into a thumbnail plus responsive
+widths in modern formats (AVIF/WebP, with a JPEG/PNG fallback), written next
+to the source under derived/ with content-hashed filenames so they can be
+cached forever. Used offline by scripts/build_images.py (process pool across
+cores) and on demand by the API for UAVs that haven't been processed yet.
+
+Pillow is imported lazily; without it the API still serves recorded
+derivatives but can't build new ones.
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .assets import asset_url, resolve_asset
+from .cache import LRUCache
+from .config import settings
+from .singleflight import SingleFlight
+
+MANIFEST_VERSION = 1
+DERIVED_DIR = "derived"
+FORMAT_PREFERENCE = ("avif", "webp", "jpeg", "png")
+FORMAT_EXTENSIONS = {"avif": "avif", "webp": "webp", "jpeg": "jpg", "png": "png"}
+FORMAT_MEDIA_TYPES = {
+    "avif": "image/avif",
+    "webp": "image/webp",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+}
+SAVE_OPTIONS: Dict[str, Dict[str, Any]] = {
+    "avif": {"quality": 55, "speed": 6},
+    "webp": {"quality": 80, "method": 4},
+    "jpeg": {"quality": 82, "optimize": True, "progressive": True},
+    "png": {"optimize": True},
+}
+
+
+class ImagePipelineUnavailableError(RuntimeError):
+    """Raised when derivatives are requested but Pillow isn't installed."""
+
+
+def _pillow():
+    """Import Pillow, raising ImagePipelineUnavailableError if missing."""
+    try:
+        from PIL import Image, ImageOps, features
+    except ImportError as e:
+        raise ImagePipelineUnavailableError(
+            "Image derivatives require the 'images' extra (Pillow)"
+        ) from e
+    return Image, ImageOps, features
+
+
+def available_formats(requested: Iterable[str]) -> List[str]:
+    """
+    Filter formats down to those this Pillow build can encode.
+
+    Args:
+        requested (Iterable[str]): Format names (avif, webp, jpeg, png)
+
+    Returns:
+        List[str]: Supported formats, in the requested order
+    """
+    _, _, features = _pillow()
+    supported = []
+    for fmt in requested:
+        fmt = fmt.strip().lower()
+        if fmt not in FORMAT_EXTENSIONS or fmt in supported:
+            continue
+        if fmt in ("avif", "webp") and not features.check(fmt):
+            continue
+        supported.append(fmt)
+    return supported
+
+
+def content_hash(data: bytes, length: int = 16) -> str:
+    """
+    Hash file contents for names and change detection.
+
+    Args:
+        data (bytes): File contents
+        length (int): Hex digits to keep
+
+    Returns:
+        str: Truncated SHA-256 hex digest
+    """
+    return hashlib.sha256(data).hexdigest()[:length]
+
+
+def _target_widths(width: int, widths: Sequence[int], thumbnail: int) -> List[int]:
+    """Responsive widths no larger than the source (never upscale), plus the thumbnail."""
+    targets = {w for w in widths if w < width}
+    if not targets or max(widths) >= width:
+        targets.add(width)
+    targets.add(min(thumbnail, width))
+    return sorted(targets)
+
+
+def _write_once(path: Path, data: bytes) -> None:
+    """Write a content-addressed file unless it already exists."""
+    if path.exists():
+        return
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def render_derivatives(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Render every derivative of one source image.
+
+    Top-level so it can run in a worker process.
+
+    Args:
+        job (Dict[str, Any]): source_url, source_path, assets_root, widths,
+            thumbnail_width and formats
+
+    Returns:
+        Dict[str, Any]: Manifest entry with the source size/hash, the
+            thumbnail URLs per format and every variant
+    """
+    pil_image, pil_ops, _ = _pillow()
+    source_path = Path(job["source_path"])
+    assets_root = Path(job["assets_root"])
+    data = source_path.read_bytes()
+
+    with pil_image.open(io.BytesIO(data)) as opened:
+        image = pil_ops.exif_transpose(opened)
+        image.load()
+    has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+    image = image.convert("RGBA" if has_alpha else "RGB")
+
+    out_dir = source_path.parent / DERIVED_DIR
+    out_dir.mkdir(exist_ok=True)
+    fallback = "png" if has_alpha else "jpeg"
+    formats = list(dict.fromkeys(list(job["formats"]) + [fallback]))
+    thumbnail_width = min(job["thumbnail_width"], image.width)
+
+    variants = []
+    thumbnail = {}
+    for width in _target_widths(image.width, job["widths"], job["thumbnail_width"]):
+        height = max(1, round(image.height * width / image.width))
+        resized = (
+            image if width == image.width
+            else image.resize((width, height), pil_image.LANCZOS)
+        )
+        for fmt in formats:
+            frame = resized.convert("RGB") if fmt == "jpeg" else resized
+            buffer = io.BytesIO()
+            frame.save(buffer, format=fmt.upper(), **SAVE_OPTIONS[fmt])
+            encoded = buffer.getvalue()
+            digest = content_hash(encoded, 12)
+            name = f"{source_path.stem}-{width}w.{digest}.{FORMAT_EXTENSIONS[fmt]}"
+            path = out_dir / name
+            _write_once(path, encoded)
+            url = asset_url(path, assets_root)
+            variants.append(
+                {"width": width, "height": height, "format": fmt, "url": url, "bytes": len(encoded)}
+            )
+            if width == thumbnail_width:
+                thumbnail[fmt] = url
+
+    return {
+        "source": job["source_url"],
+        "source_hash": content_hash(data),
+        "width": image.width,
+        "height": image.height,
+        "thumbnail": thumbnail,
+        "variants": variants,
+    }
+
+
+def _is_current(entry: Optional[Dict[str, Any]], source_hash: str, assets_root: Path) -> bool:
+    """Whether a manifest entry was built from this exact source and its files still exist."""
+    if not entry or entry.get("source_hash") != source_hash:
+        return False
+    return all(resolve_asset(v["url"], assets_root) for v in entry.get("variants", []))
+
+
+def build_derivatives(
+    source_urls: Iterable[str],
+    previous: Optional[Dict[str, Dict[str, Any]]] = None,
+    workers: int = 1,
+    widths: Sequence[int] = (320, 640, 1280),
+    thumbnail_width: int = 160,
+    formats: Sequence[str] = ("avif", "webp"),
+    assets_root: Optional[Path] = None,
+    force: bool = False,
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[str]]]:
+    """
+    Build derivatives for many source images, skipping unchanged ones.
+
+    Sources whose content hash matches the previous manifest entry (and
+    whose derivative files are all present) are reused without decoding.
+    The rest are rendered in a process pool when workers > 1.
+
+    Args:
+        source_urls (Iterable[str]): /assets/... URLs of full-size images
+        previous (Optional[Dict[str, Dict[str, Any]]]): Earlier entries by source URL
+        workers (int): Worker processes (1 renders in this process)
+        widths (Sequence[int]): Responsive widths in pixels
+        thumbnail_width (int): Thumbnail width in pixels
+        formats (Sequence[str]): Modern formats to emit besides the fallback
+        assets_root (Optional[Path]): Directory URLs resolve against
+        force (bool): Re-render even unchanged sources
+
+    Returns:
+        Tuple: (entries by source URL, {"built": [...], "skipped": [...], "missing": [...]})
+    """
+    assets_root = (assets_root or settings.assets_path_absolute).resolve()
+    previous = previous or {}
+    formats = available_formats(formats)
+    entries: Dict[str, Dict[str, Any]] = {}
+    report: Dict[str, List[str]] = {"built": [], "skipped": [], "missing": []}
+
+    jobs = []
+    for url in dict.fromkeys(source_urls):
+        path = resolve_asset(url, assets_root)
+        if path is None:
+            report["missing"].append(url)
+            continue
+        if not force and _is_current(
+            previous.get(url), content_hash(path.read_bytes()), assets_root
+        ):
+            entries[url] = previous[url]
+            report["skipped"].append(url)
+            continue
+        jobs.append(
+            {
+                "source_url": url,
+                "source_path": str(path),
+                "assets_root": str(assets_root),
+                "widths": list(widths),
+                "thumbnail_width": thumbnail_width,
+                "formats": formats,
+            }
+        )
+
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(render_derivatives, jobs, chunksize=1))
+    else:
+        results = [render_derivatives(job) for job in jobs]
+
+    for entry in results:
+        entries[entry["source"]] = entry
+        report["built"].append(entry["source"])
+    return entries, report
+
+
+def manifest_path(assets_root: Optional[Path] = None) -> Path:
+    """
+    Get the location of the derivative manifest.
+
+    Args:
+        assets_root (Optional[Path]): Directory URLs resolve against
+
+    Returns:
+        Path: assets/images/derivatives.json under the assets root
+    """
+    root = (assets_root or settings.assets_path_absolute).resolve()
+    return root / "assets" / "images" / "derivatives.json"
+
+
+def load_manifest(path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Load manifest entries by source URL.
+
+    Args:
+        path (Path): Manifest file
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Entries, empty if the file doesn't exist
+    """
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    return manifest.get("images", {})
+
+
+def save_manifest(path: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Write manifest entries atomically.
+
+    Args:
+        path (Path): Manifest file
+        entries (Dict[str, Dict[str, Any]]): Entries by source URL
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(
+            {"version": MANIFEST_VERSION, "images": dict(sorted(entries.items()))},
+            f,
+            indent=2,
+        )
+    os.replace(tmp, path)
+
+
+def derivatives_for_uav(
+    uav: Dict[str, Any], entries: Dict[str, Dict[str, Any]]
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Map a UAV's imagery_urls views to their manifest entries.
+
+    Args:
+        uav (Dict[str, Any]): UAV record
+        entries (Dict[str, Dict[str, Any]]): Manifest entries by source URL
+
+    Returns:
+        Optional[Dict[str, Dict[str, Any]]]: Entry per view, or None if none are built
+    """
+    views = {
+        view: entries[url]
+        for view, url in (uav.get("imagery_urls") or {}).items()
+        if url in entries
+    }
+    return views or None
+
+
+def srcset(entry: Dict[str, Any], fmt: str) -> str:
+    """
+    Build an HTML srcset string for one format.
+
+    Args:
+        entry (Dict[str, Any]): Manifest entry
+        fmt (str): Format name
+
+    Returns:
+        str: "url 320w, url 640w, ..."
+    """
+    return ", ".join(
+        f"{v['url']} {v['width']}w" for v in entry["variants"] if v["format"] == fmt
+    )
+
+
+def select_variant(
+    entry: Dict[str, Any], width: int, accept: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Pick the best derivative for a display width and an Accept header.
+
+    Uses the most preferred format the client accepts (AVIF, then WebP,
+    then the fallback) and the smallest variant at least `width` wide,
+    or the largest one if none is wide enough.
+
+    Args:
+        entry (Dict[str, Any]): Manifest entry
+        width (int): Display width in CSS pixels
+        accept (Optional[str]): Request Accept header
+
+    Returns:
+        Dict[str, Any]: Chosen variant
+    """
+    accept = (accept or "").lower()
+    formats = {v["format"] for v in entry["variants"]}
+    chosen_format = next(
+        fmt
+        for fmt in FORMAT_PREFERENCE
+        if fmt in formats and (fmt in ("jpeg", "png") or FORMAT_MEDIA_TYPES[fmt] in accept)
+    )
+    candidates = sorted(
+        (v for v in entry["variants"] if v["format"] == chosen_format),
+        key=lambda v: v["width"],
+    )
+    for variant in candidates:
+        if variant["width"] >= width:
+            return variant
+    return candidates[-1]
+
+
+class OnDemandDerivatives:
+    """
+    Fills in derivatives the offline build hasn't recorded yet.
+
+    Results are cached per UAV and snapshot generation, and concurrent
+    requests for the same UAV share one build. Sources already rendered,
+    by the offline build (its manifest on disk, which may be ahead of the
+    catalog) or earlier by this process, are reused without decoding as
+    long as their content hash is unchanged. Files are content-addressed,
+    so building the same source twice (e.g. in two workers) writes
+    identical names.
+    """
+
+    def __init__(self, max_size: int = 256, assets_root: Optional[Path] = None):
+        """
+        Initialize on-demand builder.
+
+        Args:
+            max_size (int): Maximum number of UAVs whose results are cached
+            assets_root (Optional[Path]): Directory URLs resolve against (default: settings)
+        """
+        self.cache = LRUCache("image_derivatives", max_size)
+        self.flights = SingleFlight()
+        self.assets_root = assets_root
+        self._built: Dict[str, Dict[str, Any]] = {}
+        self._manifest: Dict[str, Dict[str, Any]] = {}
+        self._manifest_stamp: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+
+    def _previous(self) -> Dict[str, Dict[str, Any]]:
+        """Entries to reuse: the on-disk manifest (reloaded when it changes) and own builds."""
+        path = manifest_path(self.assets_root)
+        try:
+            stat = path.stat()
+            stamp: Optional[Tuple[int, int]] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        with self._lock:
+            if stamp != self._manifest_stamp:
+                self._manifest = load_manifest(path) if stamp else {}
+                self._manifest_stamp = stamp
+            return {**self._manifest, **self._built}
+
+    def for_uav(self, uav: Dict[str, Any], generation: int = 0) -> Dict[str, Dict[str, Any]]:
+        """
+        Get derivative entries per view, building any that are missing.
+
+        Args:
+            uav (Dict[str, Any]): UAV record
+            generation (int): Snapshot generation the record comes from
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Entry per view (views without a source file are omitted)
+        """
+        recorded = dict(uav.get("image_derivatives") or {})
+        missing = {
+            view: url
+            for view, url in (uav.get("imagery_urls") or {}).items()
+            if view not in recorded
+        }
+        if not missing or not settings.IMAGE_DERIVATIVES_ON_DEMAND:
+            return recorded
+
+        def build() -> Dict[str, Dict[str, Any]]:
+            entries, report = build_derivatives(
+                missing.values(),
+                previous=self._previous(),
+                widths=settings.image_widths_list,
+                thumbnail_width=settings.IMAGE_THUMBNAIL_WIDTH,
+                formats=settings.image_formats_list,
+                assets_root=self.assets_root,
+            )
+            with self._lock:
+                self._built.update((url, entries[url]) for url in report["built"])
+            return {view: entries[url] for view, url in missing.items() if url in entries}
+
+        key = (uav["designation"], generation)
+        built = self.cache.get(key)
+        if built is None:
+            built, shared = self.flights.do(key, build)
+            if not shared:
+                self.cache.put(key, built)
+        recorded.update(built)
+        return recorded
+
+
+# Global on-demand builder
+on_demand = OnDemandDerivatives()
@@ -0,0 +1,155 @@
+"""
+Process lifecycle for X-UAV backend.
+
+Tracks startup, warm-up and readiness separately from liveness, and
+provides the preload / post-fork hooks used by the multi-worker
+production launcher (gunicorn.conf.py).
+"""
+
+import gc
+import os
+import time
+from typing import Any, Dict, Optional
+
+from .assets import asset_index
+from .config import settings
+from .database import db
+from .metrics import registry
+from .snapshot import snapshots
+
+PHASE_STARTING = "starting"
+PHASE_WARMING = "warming"
+PHASE_READY = "ready"
+PHASE_FAILED = "failed"
+
+
+class ServiceState:
+    """
+    Startup and readiness state of the current process.
+
+    Attributes:
+        pid: Process id the state belongs to
+        started_at: Unix time the process (or forked worker) started
+        phase: One of starting, warming, ready, failed
+        preloaded: Whether the snapshot was loaded in the master before fork
+        db_open_seconds: Time to open the persistent DB handle
+        warmup_seconds: Time to load the catalog snapshot
+        ready_at: Unix time the process became ready
+        error: Last warm-up error, if any
+    """
+
+    def __init__(self):
+        """Initialize state for the current process."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset to a fresh, not-yet-ready process."""
+        self.pid = os.getpid()
+        self.started_at = time.time()
+        self.phase = PHASE_STARTING
+        self.preloaded = False
+        self.db_open_seconds: Optional[float] = None
+        self.warmup_seconds: Optional[float] = None
+        self.ready_at: Optional[float] = None
+        self.error: Optional[str] = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the process has finished warming up."""
+        return self.phase == PHASE_READY
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Build the startup report.
+
+        Returns:
+            Dict[str, Any]: Phase, timings and snapshot details
+        """
+        return {
+            "pid": self.pid,
+            "phase": self.phase,
+            "preloaded": self.preloaded,
+            "db_open_seconds": self.db_open_seconds,
+            "warmup_seconds": self.warmup_seconds,
+            "startup_seconds": (
+                round(self.ready_at - self.started_at, 4) if self.ready_at else None
+            ),
+            "uptime_seconds": round(time.time() - self.started_at, 3),
+            "snapshot_generation": snapshots.generation,
+            "db_handle_open": db.is_open,
+            "error": self.error,
+        }
+
+
+state = ServiceState()
+
+
+def warm_up(open_handle: bool = True, load_snapshot: bool = True) -> None:
+    """
+    Open the persistent DB handle, load the catalog snapshot and index assets.
+
+    Failures are recorded rather than raised, so the process stays live
+    (and reports not-ready) instead of crash-looping.
+
+    Args:
+        open_handle (bool): Open this process's persistent read-only handle
+        load_snapshot (bool): Load the in-memory catalog snapshot
+    """
+    state.phase = PHASE_WARMING
+    state.error = None
+    try:
+        if open_handle:
+            start = time.perf_counter()
+            db.open()
+            state.db_open_seconds = round(time.perf_counter() - start, 4)
+        if load_snapshot and not snapshots.is_warm:
+            start = time.perf_counter()
+            snapshots.warm()
+            state.warmup_seconds = round(time.perf_counter() - start, 4)
+        if settings.ASSETS_ENABLED:
+            asset_index.refresh()
+    except Exception as e:
+        state.phase = PHASE_FAILED
+        state.error = str(e)
+        return
+
+    state.phase = PHASE_READY
+    state.ready_at = time.time()
+
+
+def skip_warm_up() -> None:
+    """
+    Mark the process ready without warming up.
+
+    Used when WARMUP_ON_STARTUP is off: the DB handle and snapshot are then
+    opened lazily by the first request that needs them.
+    """
+    state.phase = PHASE_READY
+    state.error = None
+    state.ready_at = time.time()
+
+
+def preload() -> None:
+    """
+    Load the catalog in the master process before workers fork.
+
+    No DuckDB handle is kept open across fork. gc.freeze() moves the loaded
+    objects out of the collector's reach, so workers don't dirty the shared
+    copy-on-write pages while collecting garbage.
+    """
+    warm_up(open_handle=False, load_snapshot=True)
+    state.preloaded = state.phase == PHASE_READY
+    gc.freeze()
+
+
+def after_fork() -> None:
+    """Reset per-process state in a freshly forked worker."""
+    preloaded = state.preloaded
+    warmup_seconds = state.warmup_seconds
+    state.reset()
+    state.preloaded = preloaded
+    state.warmup_seconds = warmup_seconds
+    # Reason: Samples recorded in the master (preload) would otherwise be counted once per worker
+    registry.reset()
+    # Reason: An inherited handle belongs to the parent; the worker opens its own
+    db.close()
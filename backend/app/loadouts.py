@@ -0,0 +1,253 @@
+"""
+Payload loadout optimizer for X-UAV backend.
+
+Finds the best weapon mixes a UAV can carry within its weapons load and
+hardpoint count, from its uav_armaments links. Each munition occupies one
+hardpoint and at most max_quantity of each type is carried, so this is a
+bounded knapsack with two capacities. It is solved top-down over
+(armament index, hardpoints left, weight left) with memoized subproblems,
+each keeping its N best partial loadouts, so the N best full loadouts come
+out of one pass. Weights are exact hundredths of a kilogram (the catalog's
+DECIMAL(8,2) precision). The memo grows with the number of armaments and
+hardpoints, so at most MAX_CANDIDATES armaments are planned at once and no
+quantity exceeds the hardpoint count. Results are cached per UAV, query and
+snapshot.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .cache import LRUCache
+from .config import settings
+
+OBJECTIVES = ("warhead", "count", "weight")
+WEIGHT_SCALE = 100
+MAX_CANDIDATES = 16
+
+# (value, weight, quantity per item)
+Candidate = Tuple[float, int, Tuple[int, ...]]
+
+
+class LoadoutError(ValueError):
+    """Raised when loadouts can't be planned (missing limits, unknown required armament)."""
+
+
+def _score(armament: Dict[str, Any], objective: str) -> float:
+    """Per-munition value of an armament under an objective."""
+    if objective == "count":
+        return 1.0
+    if objective == "weight":
+        return float(armament["weight_kg"])
+    return float(armament.get("warhead_weight_kg") or 0.0)
+
+
+def best_loadouts(
+    weights: Sequence[int],
+    bounds: Sequence[int],
+    minimums: Sequence[int],
+    values: Sequence[float],
+    capacity: int,
+    hardpoints: int,
+    limit: int = 5,
+) -> List[Candidate]:
+    """
+    Solve the two-capacity bounded knapsack, keeping the best `limit` solutions.
+
+    Args:
+        weights (Sequence[int]): Weight of one unit of each item (integer units)
+        bounds (Sequence[int]): Maximum quantity of each item
+        minimums (Sequence[int]): Minimum quantity of each item (required items)
+        values (Sequence[float]): Value of one unit of each item
+        capacity (int): Weight capacity (same units as weights)
+        hardpoints (int): Maximum total quantity
+        limit (int): Number of solutions to keep
+
+    Returns:
+        List[Candidate]: (value, weight, quantities) best first; ties go to the lighter
+            loadout. Carrying nothing is not a loadout and is never returned.
+    """
+    n = len(weights)
+
+    @lru_cache(maxsize=None)
+    def solve(i: int, slots: int, room: int) -> Tuple[Candidate, ...]:
+        if i == n:
+            return ((0.0, 0, ()),)
+        found: List[Candidate] = []
+        most = min(bounds[i], slots, room // weights[i] if weights[i] else bounds[i])
+        for quantity in range(minimums[i], most + 1):
+            used = quantity * weights[i]
+            gained = quantity * values[i]
+            for value, weight, rest in solve(i + 1, slots - quantity, room - used):
+                found.append((value + gained, weight + used, (quantity,) + rest))
+        if i == 0:
+            # Reason: Drop the empty loadout before truncating, or it takes one of the places
+            found = [c for c in found if any(c[2])]
+        # Reason: Value descending, then lighter, then fixed order so results are stable
+        found.sort(key=lambda c: (-c[0], c[1], tuple(-q for q in c[2])))
+        return tuple(found[:limit])
+
+    try:
+        return list(solve(0, hardpoints, capacity))
+    finally:
+        solve.cache_clear()
+
+
+class LoadoutPlanner:
+    """
+    Plans UAV loadouts through an LRU cache.
+
+    Keys are (designation, query, snapshot generation), so repeated queries
+    while a planner explores options are served from memory and a reloaded
+    catalog never serves a stale plan.
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        Initialize planner.
+
+        Args:
+            max_size (int): Maximum number of cached plans
+        """
+        self.cache = LRUCache("loadouts", max_size)
+
+    def plan(
+        self,
+        uav: Dict[str, Any],
+        load_armaments: Callable[[], List[Dict[str, Any]]],
+        objective: str = "warhead",
+        limit: int = 5,
+        required: Sequence[str] = (),
+        excluded: Sequence[str] = (),
+        max_weight_kg: Optional[float] = None,
+        generation: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Plan (or fetch from cache) the best loadouts for a UAV.
+
+        Args:
+            uav (Dict[str, Any]): UAV record (hardpoints, max_weapons_load_kg)
+            load_armaments (Callable[[], List[Dict[str, Any]]]): Returns the compatible
+                armaments with max_quantity (Database.get_armaments_for_uav);
+                only called on a cache miss
+            objective (str): "warhead" (total warhead kg), "count" (munitions)
+                or "weight" (payload kg carried)
+            limit (int): Number of loadouts to return
+            required (Sequence[str]): Armaments every loadout must carry
+            excluded (Sequence[str]): Armaments to leave out
+            max_weight_kg (Optional[float]): Lower weight budget than the UAV's limit
+            generation (int): Snapshot generation the records come from
+
+        Returns:
+            Dict[str, Any]: Limits, candidate armaments and ranked loadouts
+
+        Raises:
+            LoadoutError: If the UAV has no load/hardpoint data, a required
+                armament isn't compatible (or has no weight), or more than
+                MAX_CANDIDATES armaments are left to plan
+        """
+        key = (
+            uav["designation"], objective, limit,
+            tuple(sorted(set(required))), tuple(sorted(set(excluded))),
+            max_weight_kg, generation,
+        )
+        return self.cache.get_or_compute(
+            key,
+            lambda: self._plan(
+                uav, load_armaments(), objective, limit, required, excluded, max_weight_kg
+            ),
+        )
+
+    def _plan(
+        self,
+        uav: Dict[str, Any],
+        armaments: List[Dict[str, Any]],
+        objective: str,
+        limit: int,
+        required: Sequence[str],
+        excluded: Sequence[str],
+        max_weight_kg: Optional[float],
+    ) -> Dict[str, Any]:
+        if uav.get("hardpoints") is None or uav.get("max_weapons_load_kg") is None:
+            raise LoadoutError(f"UAV '{uav['designation']}' has no weapons load or hardpoint data")
+        capacity_kg = float(uav["max_weapons_load_kg"])
+        if max_weight_kg is not None:
+            capacity_kg = min(capacity_kg, max_weight_kg)
+        hardpoints = int(uav["hardpoints"])
+
+        excluded = set(excluded)
+        candidates = [
+            a for a in armaments
+            if a["designation"] not in excluded and a.get("weight_kg") is not None
+        ]
+        skipped = sorted(
+            a["designation"] for a in armaments
+            if a["designation"] not in excluded and a.get("weight_kg") is None
+        )
+        known = {a["designation"] for a in candidates}
+        missing = sorted(set(required) - known)
+        if missing:
+            raise LoadoutError(
+                f"Required armaments not available for this UAV: {', '.join(missing)}"
+            )
+        if len(candidates) > MAX_CANDIDATES:
+            raise LoadoutError(
+                f"UAV '{uav['designation']}' has {len(candidates)} compatible armaments; "
+                f"at most {MAX_CANDIDATES} can be planned at once, exclude some with exclude="
+            )
+
+        required = set(required)
+        weights = [round(float(a["weight_kg"]) * WEIGHT_SCALE) for a in candidates]
+        solutions = best_loadouts(
+            weights=weights,
+            bounds=[min(int(a.get("max_quantity") or 0), hardpoints) for a in candidates],
+            minimums=[1 if a["designation"] in required else 0 for a in candidates],
+            values=[_score(a, objective) for a in candidates],
+            capacity=int(round(capacity_kg * WEIGHT_SCALE)),
+            hardpoints=hardpoints,
+            limit=limit,
+        )
+
+        loadouts = []
+        for rank, (score, weight, quantities) in enumerate(solutions, start=1):
+            chosen = [(a, q) for a, q in zip(candidates, quantities) if q]
+            munitions = sum(q for _, q in chosen)
+            loadouts.append({
+                "rank": rank,
+                "score": round(score, 2),
+                "items": [{"designation": a["designation"], "quantity": q} for a, q in chosen],
+                "munitions": munitions,
+                "total_weight_kg": round(weight / WEIGHT_SCALE, 2),
+                "total_warhead_kg": round(
+                    sum(float(a.get("warhead_weight_kg") or 0) * q for a, q in chosen), 2
+                ),
+                "remaining_weight_kg": round(capacity_kg - weight / WEIGHT_SCALE, 2),
+                "remaining_hardpoints": hardpoints - munitions,
+            })
+
+        return {
+            "uav_designation": uav["designation"],
+            "objective": objective,
+            "limits": {"max_weapons_load_kg": round(capacity_kg, 2), "hardpoints": hardpoints},
+            "candidates": [
+                {
+                    "designation": a["designation"],
+                    "name": a.get("name"),
+                    "weight_kg": float(a["weight_kg"]),
+                    "warhead_weight_kg": (
+                        float(a["warhead_weight_kg"])
+                        if a.get("warhead_weight_kg") is not None
+                        else None
+                    ),
+                    "max_quantity": a.get("max_quantity"),
+                    "integration_status": a.get("integration_status"),
+                }
+                for a in candidates
+            ],
+            "skipped": skipped,
+            "total": len(loadouts),
+            "loadouts": loadouts,
+        }
+
+
+# Global planner
+planner = LoadoutPlanner(settings.LOADOUT_CACHE_SIZE)
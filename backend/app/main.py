@@ -4,23 +4,116 @@ Main FastAPI application for X-UAV backend.
 Provides REST API endpoints for UAV data access and comparison.
 """
 
-from typing import List
-
-from fastapi import FastAPI, HTTPException, Path as FastAPIPath
+import secrets
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request
+from fastapi import Path as FastAPIPath
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    PlainTextResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 
+from . import lifecycle
+from .assets import asset_index
+from .batch import BatchError, dispatch, validate_path
+from .changes import generation_events
 from .config import settings
 from .database import db
+from .images import (
+    ImagePipelineUnavailableError,
+    on_demand,
+    select_variant,
+    srcset,
+)
+from .loadouts import OBJECTIVES, LoadoutError, planner
+from .metrics import CONTENT_TYPE_LATEST, MetricsMiddleware, MultiprocessCollector, registry
+from .openapi_cache import OpenAPICache, app_signature
+from .predicates import PredicateError
 from .schemas import (
+    UAV,
+    BatchRequest,
+    BatchResponse,
+    CapabilitySearchRequest,
     HealthResponse,
+    LivenessResponse,
+    ReachRequest,
+    ReadinessResponse,
+    StartupReport,
     StatsResponse,
-    UAV,
     UAVCompareRequest,
     UAVList,
     UAVSearchRequest,
+    VariantCompareRequest,
+)
+from .silhouettes import RenderUnavailableError, SilhouetteError, renderer
+from .snapshot import snapshots
+from .units import EXCLUDED_FIELDS, UnitSystem, apply_units
+
+if TYPE_CHECKING:
+    from .columnar import ColumnarTable
+
+UNITS_DESCRIPTION = (
+    "Unit fields to include: metric (SI only), imperial (SI + ft/lbs/mph/miles), "
+    "nautical (SI + knots/nm/ft) or all"
+)
+
+
+def _uav_list_response(
+    table: "ColumnarTable", rows: Optional[Sequence[int]], units: str
+) -> Response:
+    """
+    Serialize a UAVList straight from the columnar snapshot.
+
+    Skips building a dict and a UAV model per row; the shape matches
+    UAVList with the fields of the chosen unit system. rows=None means all.
+    """
+    total = len(table) if rows is None else len(rows)
+    body = table.to_json(rows, EXCLUDED_FIELDS[units])
+    return Response(f'{{"total":{total},"uavs":{body}}}', media_type="application/json")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm up on startup and release the DB handle on shutdown.
+
+    Args:
+        app: FastAPI application
+    """
+    if metrics_files is not None:
+        metrics_files.start()
+    if settings.WARMUP_ON_STARTUP:
+        await run_in_threadpool(
+            lifecycle.warm_up, True, settings.SNAPSHOT_CACHE_ENABLED
+        )
+    else:
+        lifecycle.skip_warm_up()
+    yield
+    if metrics_files is not None:
+        metrics_files.stop()
+    db.close()
+
+
+# Merge the metrics of all workers when they share a metrics directory
+metrics_files: Optional[MultiprocessCollector] = (
+    MultiprocessCollector(
+        registry, Path(settings.METRICS_MULTIPROCESS_DIR), settings.METRICS_WRITE_INTERVAL
+    )
+    if settings.METRICS_ENABLED and settings.METRICS_MULTIPROCESS_DIR
+    else None
 )
 
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -28,6 +121,8 @@ app = FastAPI(
     description="API for comparing military and government UAVs worldwide",
     docs_url="/docs",
     redoc_url="/redoc",
+    debug=settings.DEBUG,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -39,6 +134,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Record request count, latency and in-flight requests per route
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, exclude_paths=(settings.METRICS_PATH,))
+
+# Load /openapi.json from disk instead of rebuilding it in every process
+if settings.OPENAPI_CACHE_ENABLED:
+    app.openapi = OpenAPICache(
+        app.openapi,
+        settings.openapi_cache_dir_absolute,
+        settings.VERSION,
+        lambda: app_signature(app),
+    )
+
 
 @app.get("/", tags=["Root"])
 async def root():
@@ -66,7 +174,7 @@ async def health_check():
     """
     try:
         # Test database connection
-        stats = db.get_stats()
+        stats = await run_in_threadpool(db.get_stats)
         database_status = f"OK ({stats['total']} UAVs)"
     except Exception as e:
         database_status = f"ERROR: {str(e)}"
@@ -78,6 +186,86 @@ async def health_check():
     )
 
 
+@app.get(
+    f"{settings.API_V1_PREFIX}/health/live",
+    response_model=LivenessResponse,
+    tags=["Health"],
+)
+async def liveness():
+    """
+    Liveness probe.
+
+    Answers without touching the database, so a slow or missing catalog
+    never gets a healthy worker restarted.
+
+    Returns:
+        LivenessResponse: Process id and uptime
+    """
+    return LivenessResponse(
+        status="alive",
+        pid=lifecycle.state.pid,
+        uptime_seconds=round(time.time() - lifecycle.state.started_at, 3),
+    )
+
+
+@app.get(
+    f"{settings.API_V1_PREFIX}/health/ready",
+    response_model=ReadinessResponse,
+    tags=["Health"],
+    responses={503: {"model": ReadinessResponse}},
+)
+async def readiness():
+    """
+    Readiness probe.
+
+    Returns:
+        ReadinessResponse: 200 once warmed up; 503 while starting or after a failed warm-up
+    """
+    report = lifecycle.state.report()
+    body = ReadinessResponse(
+        status="ready" if lifecycle.state.is_ready else report["phase"],
+        pid=report["pid"],
+        snapshot_generation=report["snapshot_generation"],
+        db_handle_open=report["db_handle_open"],
+        error=report["error"],
+    )
+    if not lifecycle.state.is_ready:
+        return JSONResponse(status_code=503, content=body.model_dump())
+    return body
+
+
+@app.get(
+    f"{settings.API_V1_PREFIX}/health/startup",
+    response_model=StartupReport,
+    tags=["Health"],
+)
+async def startup_report():
+    """
+    Startup timing report.
+
+    Returns:
+        StartupReport: DB open and warm-up timings for this worker
+    """
+    return StartupReport(**lifecycle.state.report())
+
+
+@app.get(settings.METRICS_PATH, tags=["Health"], include_in_schema=False)
+async def metrics():
+    """
+    Prometheus scrape endpoint.
+
+    Returns:
+        PlainTextResponse: Metrics in text exposition format
+
+    Raises:
+        HTTPException: 404 if metrics are disabled
+    """
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    text = registry.render() if metrics_files is None else metrics_files.render()
+    return PlainTextResponse(text, media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get(f"{settings.API_V1_PREFIX}/stats", response_model=StatsResponse, tags=["Statistics"])
 async def get_statistics():
     """
@@ -87,40 +275,105 @@ async def get_statistics():
         StatsResponse: Statistics including counts by country, type, status
     """
     try:
-        stats = db.get_stats()
+        stats = await run_in_threadpool(db.get_stats)
         return StatsResponse(**stats)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching statistics: {str(e)}")
 
 
-@app.get(f"{settings.API_V1_PREFIX}/uavs", response_model=UAVList, tags=["UAVs"])
-async def list_uavs():
+@app.get(
+    f"{settings.API_V1_PREFIX}/uavs",
+    response_model=UAVList,
+    response_model_exclude_unset=True,
+    tags=["UAVs"]
+)
+def list_uavs(
+    units: UnitSystem = Query("all", description=UNITS_DESCRIPTION),
+    operator: Optional[str] = Query(
+        None, description="Only UAVs this country operates (e.g., Poland)"
+    ),
+):
     """
     List all UAVs.
 
+    Args:
+        units: Unit system of the measurement fields
+        operator: Only UAVs whose operators include this country
+
     Returns:
         UAVList: List of all UAV records
     """
     try:
+        if settings.SNAPSHOT_CACHE_ENABLED:
+            snapshot = snapshots.current()
+            rows = snapshot.search_uavs(operator=operator) if operator else None
+            return _uav_list_response(snapshot.uavs, rows, units)
+        if operator:
+            uavs = db.search_uavs(operator=operator)
+            return UAVList(total=len(uavs), uavs=apply_units(uavs, units))
         uavs = db.get_all_uavs()
-        return UAVList(total=len(uavs), uavs=uavs)
+        return UAVList(total=len(uavs), uavs=apply_units(uavs, units))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching UAVs: {str(e)}")
 
 
+@app.get(
+    f"{settings.API_V1_PREFIX}/uavs/rank",
+    response_model=UAVList,
+    response_model_exclude_unset=True,
+    tags=["UAVs"]
+)
+def rank_uavs(
+    by: str = Query(..., description="Numeric field to rank by (e.g., max_speed_kmh)"),
+    order: str = Query("desc", pattern="^(asc|desc)$", description="desc for largest first"),
+    limit: int = Query(10, ge=1, le=1000, description="Number of UAVs to return"),
+    units: UnitSystem = Query("all", description=UNITS_DESCRIPTION),
+):
+    """
+    Rank UAVs by a numeric field.
+
+    UAVs without a value for the field are left out; ties keep designation order.
+
+    Args:
+        by: Numeric field to rank by
+        order: asc or desc
+        limit: Number of UAVs to return
+        units: Unit system of the measurement fields
+
+    Returns:
+        UAVList: Top UAVs, best first
+
+    Raises:
+        HTTPException: 400 if the field isn't numeric
+    """
+    try:
+        table = snapshots.current().uavs
+        rows = table.rank(by, descending=order == "desc", limit=limit)
+    except (KeyError, ValueError):
+        raise HTTPException(
+            status_code=400, detail=f"Cannot rank by '{by}': not a numeric UAV field"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error ranking UAVs: {str(e)}")
+    return _uav_list_response(table, rows, units)
+
+
 @app.get(
     f"{settings.API_V1_PREFIX}/uavs/{{designation}}",
     response_model=UAV,
+    response_model_exclude_unset=True,
     tags=["UAVs"]
 )
-async def get_uav(
-    designation: str = FastAPIPath(..., description="UAV designation (e.g., MQ-9)")
+def get_uav(
+    designation: str = FastAPIPath(..., description="UAV designation (e.g., MQ-9)"),
+    units: UnitSystem = Query("all", description=UNITS_DESCRIPTION),
 ):
     """
     Get specific UAV by designation.
 
     Args:
         designation: UAV designation code
+        units: Unit system of the measurement fields
 
     Returns:
         UAV: UAV record
@@ -129,56 +382,244 @@ async def get_uav(
         HTTPException: 404 if UAV not found
     """
     try:
-        uav = db.get_uav_by_designation(designation)
+        if settings.SNAPSHOT_CACHE_ENABLED:
+            uav = snapshots.current().uavs_by_designation.get(designation)
+        else:
+            uav = db.get_uav_by_designation(designation)
         if uav is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"UAV with designation '{designation}' not found"
             )
-        return UAV(**uav)
+        return UAV(**apply_units([uav], units)[0])
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching UAV: {str(e)}")
 
 
-@app.post(f"{settings.API_V1_PREFIX}/uavs/compare", response_model=UAVList, tags=["UAVs"])
-async def compare_uavs(request: UAVCompareRequest):
+def _image_views(entries: dict, width: Optional[int] = None, accept: Optional[str] = None) -> dict:
+    """Per view: source size, thumbnail, srcset per format and the variant selected for width."""
+    views = {}
+    for name, entry in entries.items():
+        formats = list(dict.fromkeys(v["format"] for v in entry["variants"]))
+        views[name] = {
+            "source": entry["source"],
+            "width": entry["width"],
+            "height": entry["height"],
+            "thumbnail": entry["thumbnail"],
+            "srcset": {fmt: srcset(entry, fmt) for fmt in formats},
+            "selected": select_variant(entry, width, accept) if width else None,
+        }
+    return views
+
+
+@app.get(f"{settings.API_V1_PREFIX}/uavs/{{designation}}/images", tags=["UAVs"])
+def get_uav_images(
+    request: Request,
+    designation: str = FastAPIPath(..., description="UAV designation (e.g., MQ-9)"),
+    view: str = Query(None, description="Only this view (side, front, three_quarter)"),
+    width: int = Query(None, ge=1, le=8192, description="Display width in CSS pixels"),
+    redirect: bool = Query(
+        False, description="Redirect to the selected image (needs view and width)"
+    ),
+):
+    """
+    Get thumbnails and responsive image variants for a UAV.
+
+    Derivatives recorded by scripts/build_images.py are returned directly;
+    missing ones are built on demand when IMAGE_DERIVATIVES_ON_DEMAND is set.
+    With width, the best variant for the client's Accept header is selected.
+
+    Args:
+        request: Incoming request (for the Accept header)
+        designation: UAV designation code
+        view: Only return this view
+        width: Display width used to select a variant
+        redirect: Redirect to the selected variant instead of returning JSON
+
+    Returns:
+        dict: Per view: source size, thumbnail URLs, srcset per format and
+            the selected variant
+
+    Raises:
+        HTTPException: 404 if the UAV or view has no images; 400 if redirect
+            lacks view/width; 501 if derivatives can't be built here
+    """
+    if redirect and (view is None or width is None):
+        raise HTTPException(status_code=400, detail="redirect requires view and width")
+    try:
+        snapshot = snapshots.current()
+        uav = snapshot.uavs_by_designation.get(designation)
+        if uav is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"UAV with designation '{designation}' not found"
+            )
+        entries = on_demand.for_uav(uav, snapshot.generation)
+    except HTTPException:
+        raise
+    except ImagePipelineUnavailableError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching images: {str(e)}")
+
+    if view is not None:
+        entries = {view: entries[view]} if view in entries else {}
+    if not entries:
+        raise HTTPException(status_code=404, detail=f"No images for '{designation}'")
+
+    views = _image_views(entries, width, request.headers.get("accept"))
+    if redirect:
+        return RedirectResponse(views[view]["selected"]["url"], status_code=307)
+    return {"designation": designation, "views": views}
+
+
+BUNDLE_PARTS = ("armaments", "variants", "similar", "images")
+
+
+@app.get(f"{settings.API_V1_PREFIX}/uavs/{{designation}}/bundle", tags=["UAVs"])
+def get_uav_bundle(
+    designation: str = FastAPIPath(..., description="UAV designation (e.g., MQ-9)"),
+    include: str = Query(
+        "armaments,variants,similar",
+        description=f"Comma-separated parts to include: {', '.join(BUNDLE_PARTS)}",
+    ),
+    similar_limit: int = Query(5, ge=1, le=50, description="Number of similar airframes"),
+    units: UnitSystem = Query("all", description=UNITS_DESCRIPTION),
+):
+    """
+    Get everything a UAV detail view needs in one request.
+
+    All parts are read from one catalog snapshot and one database
+    connection, so they are consistent with each other.
+
+    Args:
+        designation: UAV designation code
+        include: Parts to include besides the UAV record
+        similar_limit: Number of similar airframes
+        units: Unit system of the measurement fields
+
+    Returns:
+        dict: uav, the requested parts and the snapshot generation
+
+    Raises:
+        HTTPException: 404 if UAV not found; 400 for an unknown part
+    """
+    parts = [p.strip() for p in include.split(",") if p.strip()]
+    unknown = sorted(set(parts) - set(BUNDLE_PARTS))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown bundle parts: {', '.join(unknown)}")
+    try:
+        with snapshots.pinned() as snapshot, db.session():
+            uav = snapshot.uavs_by_designation.get(designation)
+            if uav is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"UAV with designation '{designation}' not found"
+                )
+            bundle = {
+                "snapshot_generation": snapshot.generation,
+                "uav": apply_units([dict(uav)], units)[0],
+            }
+            if "armaments" in parts:
+                bundle["armaments"] = db.get_armaments_for_uav(designation)
+            if "variants" in parts:
+                bundle["variants"] = db.search_variants(uav=designation)
+            if "similar" in parts:
+                rows, distances = snapshot.similar_uavs(designation, similar_limit)
+                summary = ("designation", "name", "type", "country_of_origin")
+                bundle["similar"] = [
+                    {
+                        **{k: snapshot.uavs[row][k] for k in summary},
+                        "distance": round(float(distance), 4),
+                    }
+                    for row, distance in zip(rows.tolist(), distances.tolist())
+                ]
+            if "images" in parts:
+                try:
+                    bundle["images"] = _image_views(on_demand.for_uav(uav, snapshot.generation))
+                except ImagePipelineUnavailableError:
+                    bundle["images"] = None
+        return bundle
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching UAV bundle: {str(e)}")
+
+
+@app.post(
+    f"{settings.API_V1_PREFIX}/uavs/compare",
+    response_model=UAVList,
+    response_model_exclude_unset=True,
+    tags=["UAVs"]
+)
+def compare_uavs(
+    request: UAVCompareRequest,
+    units: UnitSystem = Query("all", description=UNITS_DESCRIPTION),
+):
     """
     Compare multiple UAVs.
 
     Args:
         request: Comparison request with list of designations
+        units: Unit system of the measurement fields
 
     Returns:
         UAVList: List of UAVs for comparison
     """
     try:
+        if settings.SNAPSHOT_CACHE_ENABLED:
+            snapshot = snapshots.current()
+            rows = snapshot.compare_uavs(request.designations)
+            return _uav_list_response(snapshot.uavs, rows, units)
         uavs = db.compare_uavs(request.designations)
-        return UAVList(total=len(uavs), uavs=uavs)
+        return UAVList(total=len(uavs), uavs=apply_units(uavs, units))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error comparing UAVs: {str(e)}")
 
 
-@app.post(f"{settings.API_V1_PREFIX}/uavs/search", response_model=UAVList, tags=["UAVs"])
-async def search_uavs(request: UAVSearchRequest):
+@app.post(
+    f"{settings.API_V1_PREFIX}/uavs/search",
+    response_model=UAVList,
+    response_model_exclude_unset=True,
+    tags=["UAVs"]
+)
+def search_uavs(
+    request: UAVSearchRequest,
+    units: UnitSystem = Query("all", description=UNITS_DESCRIPTION),
+):
     """
     Search UAVs with filters.
 
     Args:
         request: Search request with filter parameters
+        units: Unit system of the measurement fields
 
     Returns:
         UAVList: Filtered list of UAVs
     """
     try:
+        if settings.SNAPSHOT_CACHE_ENABLED:
+            snapshot = snapshots.current()
+            rows = snapshot.search_uavs(
+                country=request.country,
+                uav_type=request.type,
+                status=request.status,
+                nato_class=request.nato_class,
+                mission_type=request.mission_type,
+                operator=request.operator,
+            )
+            return _uav_list_response(snapshot.uavs, rows, units)
         uavs = db.search_uavs(
             country=request.country,
             uav_type=request.type,
             status=request.status,
             nato_class=request.nato_class,
+            mission_type=request.mission_type,
+            operator=request.operator,
         )
-        return UAVList(total=len(uavs), uavs=uavs)
+        return UAVList(total=len(uavs), uavs=apply_units(uavs, units))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching UAVs: {str(e)}")
 
@@ -196,7 +637,7 @@ async def get_countries():
         List[str]: List of country names
     """
     try:
-        return db.get_countries()
+        return await run_in_threadpool(db.get_countries)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching countries: {str(e)}")
 
@@ -214,17 +655,292 @@ async def get_types():
         List[str]: List of UAV types
     """
     try:
-        return db.get_types()
+        return await run_in_threadpool(db.get_types)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching types: {str(e)}")
 
 
+# =====================================================
+# VARIANT ENDPOINTS
+# =====================================================
+
+@app.get(f"{settings.API_V1_PREFIX}/variants", tags=["Variants"])
+def list_variants(
+    uav: Optional[str] = Query(None, description="Airframe designation (e.g., MQ-9)"),
+    country: Optional[str] = Query(None, description="Airframe country of origin"),
+    type: Optional[str] = Query(None, description="Airframe type (substring)"),
+    q: Optional[str] = Query(None, description="Substring of the variant designation or name"),
+):
+    """
+    List and search UAV variants.
+
+    Variants come from the indexed uav_variants table; performance fields a
+    variant doesn't specify are its airframe's (listed in "overrides" when
+    the variant does).
+
+    Args:
+        uav: Only variants of this airframe
+        country: Airframe country of origin
+        type: Airframe type
+        q: Variant designation or name
+
+    Returns:
+        dict: Matching variants
+    """
+    try:
+        variants = db.search_variants(uav=uav, country=country, uav_type=type, query=q)
+        return {"total": len(variants), "variants": variants}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching variants: {str(e)}")
+
+
+@app.post(f"{settings.API_V1_PREFIX}/variants/compare", tags=["Variants"])
+def compare_variants(request: VariantCompareRequest):
+    """
+    Compare UAV variants side by side.
+
+    Args:
+        request: Variant designations
+
+    Returns:
+        dict: The variants found, in the order requested
+    """
+    try:
+        variants = db.compare_variants(request.designations)
+        return {"total": len(variants), "variants": variants}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error comparing variants: {str(e)}")
+
+
+@app.get(f"{settings.API_V1_PREFIX}/uavs/{{designation}}/variants", tags=["Variants"])
+def get_uav_variants(
+    designation: str = FastAPIPath(..., description="UAV designation (e.g., MQ-9)")
+):
+    """
+    Get the variants of a UAV.
+
+    Args:
+        designation: UAV designation code
+
+    Returns:
+        dict: The airframe's variants
+    """
+    try:
+        variants = db.search_variants(uav=designation)
+        return {"uav_designation": designation, "total": len(variants), "variants": variants}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching UAV variants: {str(e)}")
+
+
+# =====================================================
+# OPERATOR ENDPOINTS
+# =====================================================
+
+@app.get(f"{settings.API_V1_PREFIX}/operators", tags=["Operators"])
+def list_operators():
+    """
+    Fleet summary of every country, for a proliferation map.
+
+    Precomputed by the loader from the operators and export_countries lists.
+
+    Returns:
+        dict: Per country: fleet size, domestic/imported split, suppliers,
+            number of its designs fielded abroad and the countries fielding them
+    """
+    try:
+        countries = db.get_country_fleets()
+        return {"total": len(countries), "countries": countries}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching operators: {str(e)}")
+
+
+@app.get(f"{settings.API_V1_PREFIX}/operators/{{country}}", tags=["Operators"])
+def get_operator(country: str = FastAPIPath(..., description="Country (e.g., Poland)")):
+    """
+    Get the UAVs a country operates or has received, with its fleet summary.
+
+    Args:
+        country: Country name
+
+    Returns:
+        dict: Fleet summary plus the UAVs, each with its relations
+            ("operator" and/or "export")
+
+    Raises:
+        HTTPException: 404 if the country neither fields nor exports UAVs
+    """
+    try:
+        fleet = db.get_operator_fleet(country)
+        if fleet is None:
+            raise HTTPException(status_code=404, detail=f"No UAV fleet found for '{country}'")
+        return fleet
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching operator: {str(e)}")
+
+
+# =====================================================
+# SILHOUETTE ENDPOINTS
+# =====================================================
+
+@app.get(
+    f"{settings.API_V1_PREFIX}/silhouettes/compare",
+    tags=["Silhouettes"],
+    response_class=Response,
+    responses={
+        200: {"content": {"image/svg+xml": {}, "image/png": {}}},
+        304: {"description": "Not modified"},
+    },
+)
+def compare_silhouettes(
+    request: Request,
+    designations: str = Query(
+        ..., description="Comma-separated UAV designations (e.g., MQ-9,RQ-4)"
+    ),
+    fmt: str = Query("svg", alias="format", pattern="^(svg|png)$", description="svg or png"),
+):
+    """
+    Composite overhead silhouettes at true relative scale with a scale bar.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        designations: Comma-separated UAV designations
+        fmt: Output format, svg or png
+
+    Returns:
+        Response: One SVG/PNG image
+
+    Raises:
+        HTTPException: 400 for an empty or oversized set, 404 for unknown
+            designations, 422 if a UAV has no dimensions, 501 if PNG
+            rendering is unavailable
+    """
+    wanted = list(dict.fromkeys(d.strip() for d in designations.split(",") if d.strip()))
+    if not wanted:
+        raise HTTPException(status_code=400, detail="At least one designation is required")
+    if len(wanted) > settings.SILHOUETTE_MAX_DESIGNATIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.SILHOUETTE_MAX_DESIGNATIONS} designations can be compared",
+        )
+
+    try:
+        snapshot = snapshots.current()
+        missing = [d for d in wanted if d not in snapshot.uavs_by_designation]
+        if missing:
+            raise HTTPException(
+                status_code=404,
+                detail=f"UAVs not found: {', '.join(missing)}"
+            )
+        render = renderer.render(
+            [snapshot.uavs_by_designation[d] for d in wanted], fmt, snapshot.generation
+        )
+    except HTTPException:
+        raise
+    except SilhouetteError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except RenderUnavailableError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error rendering silhouettes: {str(e)}")
+
+    headers = {"ETag": render.etag, "Cache-Control": "public, max-age=300"}
+    if request.headers.get("if-none-match") == render.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=render.content, media_type=render.media_type, headers=headers)
+
+
+# =====================================================
+# STATIC ASSETS
+# =====================================================
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in if_none_match.split(","))
+
+
+if settings.ASSETS_ENABLED:
+
+    @app.api_route("/assets/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+    async def serve_asset(request: Request, path: str):
+        """
+        Serve a file from the asset tree.
+
+        Supports Range/If-Range (partial content for large models), answers
+        If-None-Match with 304, and marks content-hashed names immutable.
+        The file is streamed with zero-copy pathsend when the server offers it.
+
+        Args:
+            request: Incoming request
+            path: Path below /assets/
+
+        Returns:
+            FileResponse: File (or 304/206)
+
+        Raises:
+            HTTPException: 404 if no such asset
+        """
+        entry = asset_index.lookup(f"/assets/{path}")
+        if entry is None:
+            raise HTTPException(status_code=404, detail="Asset not found")
+        headers = {"ETag": entry.etag, "Cache-Control": entry.cache_control}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, entry.etag):
+            return Response(status_code=304, headers=headers)
+        return FileResponse(
+            entry.path,
+            stat_result=entry.stat,
+            media_type=entry.media_type,
+            headers=headers,
+        )
+
+
+# =====================================================
+# CAPABILITY SEARCH ENDPOINTS
+# =====================================================
+
+@app.post(f"{settings.API_V1_PREFIX}/capabilities/search", tags=["Capabilities"])
+def search_capabilities(request: CapabilitySearchRequest):
+    """
+    Find UAVs by their own properties and those of their integrated weapons.
+
+    E.g. endurance over 20 hours with an operationally integrated
+    laser-guided missile of range over 8 km, in one query instead of
+    stitching UAV search, armament search and per-UAV armament calls.
+
+    Args:
+        request: Conditions on the UAV, on the weapon and on the integration status
+
+    Returns:
+        dict: Matching UAVs (with the fields used in conditions), each with
+            the weapons that matched
+
+    Raises:
+        HTTPException: 400 for an unknown field, an unsupported operator or a bad value
+    """
+    try:
+        uavs = db.search_capabilities(
+            uav=[(p.field, p.op, p.value) for p in request.uav],
+            armament=[(p.field, p.op, p.value) for p in request.armament],
+            integration_status=request.integration_status,
+        )
+        return {"total": len(uavs), "uavs": uavs}
+    except PredicateError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching capabilities: {str(e)}")
+
+
 # =====================================================
 # ARMAMENT ENDPOINTS
 # =====================================================
 
 @app.get(f"{settings.API_V1_PREFIX}/armaments", tags=["Armaments"])
-async def list_armaments():
+def list_armaments():
     """
     List all armaments.
 
@@ -232,7 +948,10 @@ async def list_armaments():
         dict: List of all armament records
     """
     try:
-        armaments = db.get_all_armaments()
+        if settings.SNAPSHOT_CACHE_ENABLED:
+            armaments = snapshots.current().armaments
+        else:
+            armaments = db.get_all_armaments()
         return {"total": len(armaments), "armaments": armaments}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching armaments: {str(e)}")
@@ -242,7 +961,7 @@ async def list_armaments():
     f"{settings.API_V1_PREFIX}/armaments/{{designation}}",
     tags=["Armaments"]
 )
-async def get_armament(
+def get_armament(
     designation: str = FastAPIPath(..., description="Armament designation (e.g., AGM-114)")
 ):
     """
@@ -258,7 +977,10 @@ async def get_armament(
         HTTPException: 404 if armament not found
     """
     try:
-        armament = db.get_armament_by_designation(designation)
+        if settings.SNAPSHOT_CACHE_ENABLED:
+            armament = snapshots.current().armaments_by_designation.get(designation)
+        else:
+            armament = db.get_armament_by_designation(designation)
         if armament is None:
             raise HTTPException(
                 status_code=404,
@@ -272,7 +994,7 @@ async def get_armament(
 
 
 @app.get(f"{settings.API_V1_PREFIX}/armaments/search", tags=["Armaments"])
-async def search_armaments(
+def search_armaments(
     weapon_type: str = None,
     weapon_class: str = None,
     country: str = None,
@@ -306,7 +1028,7 @@ async def search_armaments(
     f"{settings.API_V1_PREFIX}/uavs/{{designation}}/armaments",
     tags=["UAV Armaments"]
 )
-async def get_uav_armaments(
+def get_uav_armaments(
     designation: str = FastAPIPath(..., description="UAV designation (e.g., MQ-9)")
 ):
     """
@@ -325,11 +1047,83 @@ async def get_uav_armaments(
         raise HTTPException(status_code=500, detail=f"Error fetching UAV armaments: {str(e)}")
 
 
+@app.get(
+    f"{settings.API_V1_PREFIX}/uavs/{{designation}}/loadouts",
+    tags=["UAV Armaments"]
+)
+def get_uav_loadouts(
+    designation: str = FastAPIPath(..., description="UAV designation (e.g., MQ-9)"),
+    objective: str = Query(
+        "warhead",
+        pattern=f"^({'|'.join(OBJECTIVES)})$",
+        description=(
+            "Maximize total warhead kg (warhead), munitions carried (count) "
+            "or payload kg (weight)"
+        ),
+    ),
+    limit: int = Query(5, ge=1, le=50, description="Number of loadouts to return"),
+    require: str = Query(None, description="Comma-separated armaments every loadout must carry"),
+    exclude: str = Query(None, description="Comma-separated armaments to leave out"),
+    max_weight_kg: float = Query(
+        None, ge=0, description="Weight budget below the UAV's weapons load"
+    ),
+):
+    """
+    Get the best weapon mixes a UAV can carry.
+
+    Solves a bounded knapsack over the UAV's compatible armaments: one
+    hardpoint per munition, at most max_quantity of each, total weight
+    within max_weapons_load_kg. Plans are cached per query and snapshot.
+
+    Args:
+        designation: UAV designation code
+        objective: What to maximize
+        limit: Number of loadouts to return
+        require: Armaments every loadout must carry
+        exclude: Armaments to leave out
+        max_weight_kg: Lower weight budget
+
+    Returns:
+        dict: Limits, candidate armaments and ranked loadouts
+
+    Raises:
+        HTTPException: 404 if UAV not found; 400 if the UAV has no load or
+            hardpoint data or a required armament isn't compatible
+    """
+    required = [d.strip() for d in (require or "").split(",") if d.strip()]
+    excluded = [d.strip() for d in (exclude or "").split(",") if d.strip()]
+    try:
+        with snapshots.pinned() as snapshot:
+            uav = snapshot.uavs_by_designation.get(designation)
+            if uav is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"UAV with designation '{designation}' not found"
+                )
+            plan = planner.plan(
+                uav,
+                lambda: db.get_armaments_for_uav(designation),
+                objective=objective,
+                limit=limit,
+                required=required,
+                excluded=excluded,
+                max_weight_kg=max_weight_kg,
+                generation=snapshot.generation,
+            )
+        return {**plan, "snapshot_generation": snapshot.generation}
+    except HTTPException:
+        raise
+    except LoadoutError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error planning loadouts: {str(e)}")
+
+
 @app.get(
     f"{settings.API_V1_PREFIX}/armaments/{{designation}}/uavs",
     tags=["UAV Armaments"]
 )
-async def get_armament_uavs(
+def get_armament_uavs(
     designation: str = FastAPIPath(..., description="Armament designation (e.g., AGM-114)")
 ):
     """
@@ -356,7 +1150,7 @@ async def get_armament_uavs(
 async def get_weapon_types():
     """Get list of all weapon types."""
     try:
-        return db.get_weapon_types()
+        return await run_in_threadpool(db.get_weapon_types)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching weapon types: {str(e)}")
 
@@ -369,11 +1163,435 @@ async def get_weapon_types():
 async def get_weapon_classes():
     """Get list of all weapon classes."""
     try:
-        return db.get_weapon_classes()
+        return await run_in_threadpool(db.get_weapon_classes)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching weapon classes: {str(e)}")
 
 
+@app.post(f"{settings.API_V1_PREFIX}/batch", response_model=BatchResponse, tags=["Batch"])
+async def batch(request: BatchRequest):
+    """
+    Run several API requests in one round trip.
+
+    Sub-requests run in order through the normal routes against one pinned
+    catalog snapshot, so their results are consistent. No database cursor
+    is held across sub-requests; each route takes its own, so a handle swap
+    never waits on a batch. Each gets its own status; one failing doesn't
+    fail the batch.
+
+    Args:
+        request: Sub-requests (GET or POST on /api/... paths)
+
+    Returns:
+        BatchResponse: Status and body per sub-request
+
+    Raises:
+        HTTPException: 400 if there are too many sub-requests or a path is invalid
+    """
+    if len(request.requests) > settings.BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.BATCH_MAX_REQUESTS} sub-requests per batch",
+        )
+    batch_path = f"{settings.API_V1_PREFIX}/batch"
+    try:
+        targets = [
+            validate_path(sub.path, settings.API_V1_PREFIX, batch_path) for sub in request.requests
+        ]
+    except BatchError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    responses = []
+    with snapshots.pinned() as snapshot:
+        for sub, (path, query) in zip(request.requests, targets):
+            status, body = await dispatch(app, sub.method, path, query, sub.body)
+            responses.append({"id": sub.id, "status": status, "body": body})
+    return BatchResponse(snapshot_generation=snapshot.generation, responses=responses)
+
+
+def _reach_response(
+    ids: List[Optional[str]],
+    distances_km: List[float],
+    loiter_hours: float,
+    designations: Optional[List[str]] = None,
+    only_feasible: bool = True,
+) -> JSONResponse:
+    """
+    Evaluate the fleet against targets and serialize the feasibility matrix.
+
+    Matrices are row-per-UAV lists so a large fleet serializes without
+    building one object per cell.
+    """
+    import numpy as np
+
+    from .reach import reach_matrix
+
+    snapshot = snapshots.current()
+    radius, feasible, loiter = reach_matrix(snapshot, np.asarray(distances_km), loiter_hours)
+    if designations is None:
+        rows = np.arange(len(snapshot.uavs))
+    else:
+        rows = snapshot.compare_uavs(designations)
+    if only_feasible:
+        rows = rows[feasible[rows].any(axis=1)]
+
+    def nullable(values: "np.ndarray") -> list:
+        return np.where(np.isnan(values), None, np.round(values, 2)).tolist()
+
+    counts = feasible[rows].sum(axis=0).tolist()
+    designation_column = snapshot.uavs.columns["designation"]
+    return JSONResponse({
+        "snapshot_generation": snapshot.generation,
+        "loiter_hours": loiter_hours,
+        "targets": [
+            {"id": id_, "distance_km": round(float(d), 2), "feasible_count": count}
+            for id_, d, count in zip(ids, distances_km, counts)
+        ],
+        "total": len(rows),
+        "designations": [designation_column.value(row) for row in rows.tolist()],
+        "radius_km": nullable(radius[rows]),
+        "feasible": feasible[rows].tolist(),
+        "loiter_hours_available": nullable(loiter[rows]),
+    })
+
+
+@app.get(f"{settings.API_V1_PREFIX}/analysis/reach", tags=["Analysis"])
+def reach_single_target(
+    distance_km: float = Query(..., ge=0, description="Target distance from the base"),
+    loiter_hours: float = Query(0.0, ge=0, description="Required time on station"),
+    only_feasible: bool = Query(True, description="Leave out UAVs that can't reach the target"),
+):
+    """
+    Which UAVs can reach a target distance_km away and loiter there.
+
+    Args:
+        distance_km: Target distance from the base
+        loiter_hours: Required time on station
+        only_feasible: Leave out UAVs that can't do the mission
+
+    Returns:
+        JSONResponse: Feasibility matrix with one target column
+    """
+    try:
+        return _reach_response([None], [distance_km], loiter_hours, only_feasible=only_feasible)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error analysing reach: {str(e)}")
+
+
+@app.post(f"{settings.API_V1_PREFIX}/analysis/reach", tags=["Analysis"])
+def reach_targets(request: ReachRequest):
+    """
+    Evaluate reach/loiter feasibility of the fleet against many targets.
+
+    Targets are given as coordinates (great-circle distance from base,
+    computed for all targets at once) or directly as distance_km. The
+    model is documented in app/reach.py.
+
+    Args:
+        request: Base, targets, loiter requirement and optional UAV subset
+
+    Returns:
+        JSONResponse: Per target the feasible UAV count; per UAV the radius
+            and one feasible flag and available loiter hours per target
+
+    Raises:
+        HTTPException: 400 for too many targets, or coordinates without a base
+            or a target with neither coordinates nor distance
+    """
+    if len(request.targets) > settings.REACH_MAX_TARGETS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.REACH_MAX_TARGETS} targets per request"
+        )
+    located = [t for t in request.targets if t.distance_km is None]
+    if any(t.latitude is None or t.longitude is None for t in located):
+        raise HTTPException(
+            status_code=400, detail="Each target needs latitude/longitude or distance_km"
+        )
+    if located and request.base is None:
+        raise HTTPException(status_code=400, detail="Targets given as coordinates need a base")
+    try:
+        distances = [t.distance_km for t in request.targets]
+        if located:
+            from .reach import great_circle_km
+
+            computed = great_circle_km(
+                request.base.latitude,
+                request.base.longitude,
+                [t.latitude for t in located],
+                [t.longitude for t in located],
+            ).tolist()
+            positions = [i for i, t in enumerate(request.targets) if t.distance_km is None]
+            for position, distance in zip(positions, computed):
+                distances[position] = distance
+        return _reach_response(
+            [t.id for t in request.targets],
+            distances,
+            request.loiter_hours,
+            request.designations,
+            request.only_feasible,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error analysing reach: {str(e)}")
+
+
+@app.get(f"{settings.API_V1_PREFIX}/analytics/distribution", tags=["Analysis"])
+def get_distribution(
+    field: str = Query(..., description="Numeric UAV field (e.g., range_km)"),
+    group_by: Optional[str] = Query(
+        None, description="Categorical field (e.g., type, country_of_origin)"
+    ),
+    bins: int = Query(20, ge=1, le=200, description="Number of histogram bins"),
+):
+    """
+    Distribution of a numeric field, overall and per group, for comparison charts.
+
+    Histograms share bin edges across groups so they can be overlaid.
+    Results are computed in the database and cached per catalog snapshot.
+
+    Args:
+        field: Numeric UAV field
+        group_by: Optional categorical field
+        bins: Number of equal-width bins between the overall min and max
+
+    Returns:
+        dict: Bin edges, the overall summary and one summary per group
+            (count, missing, min, max, mean, stddev, quantiles p5-p95, histogram)
+
+    Raises:
+        HTTPException: 400 if the field isn't numeric or the grouping isn't supported
+    """
+    try:
+        return db.get_distribution(field, group_by, bins)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error computing distribution: {str(e)}")
+
+
+def _field_list(value: str) -> List[str]:
+    """Split a comma-separated query parameter, dropping blanks."""
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+@app.get(f"{settings.API_V1_PREFIX}/analysis/pareto", tags=["Analysis"])
+def get_pareto_front(
+    maximize: str = Query("", description="Comma-separated fields where higher is better"),
+    minimize: str = Query("", description="Comma-separated fields where lower is better"),
+    filters: UAVSearchRequest = Depends(),
+):
+    """
+    UAVs on the Pareto frontier of the chosen metrics (none is beaten on all of them).
+
+    Candidates are the UAVs matching the search filters; those missing
+    any of the metrics are left out and counted. The skyline algorithm is
+    documented in app/pareto.py.
+
+    Args:
+        maximize: Fields where higher is better (e.g., endurance_hours,payload_capacity_kg)
+        minimize: Fields where lower is better (e.g., unit_cost_usd)
+        filters: Same filters as POST /api/uavs/search
+
+    Returns:
+        dict: Candidate and incomplete counts plus the non-dominated UAVs with
+            their metric values, best first by the first metric
+
+    Raises:
+        HTTPException: 400 for no metrics, too many, repeats, or a non-numeric field
+    """
+    from .pareto import ParetoError, pareto_front
+
+    maximized, minimized = _field_list(maximize), _field_list(minimize)
+    try:
+        snapshot = snapshots.current()
+        rows = snapshot.search_uavs(
+            country=filters.country,
+            uav_type=filters.type,
+            status=filters.status,
+            nato_class=filters.nato_class,
+            mission_type=filters.mission_type,
+            operator=filters.operator,
+        )
+        result = pareto_front(snapshot, maximized, minimized, rows)
+    except ParetoError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except (KeyError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Unknown or non-numeric field: {e}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error computing Pareto front: {str(e)}")
+
+    front = result["front"]
+    metrics = {name: snapshot.numeric_array(name)[front].tolist() for name in maximized + minimized}
+    uavs = []
+    for position, row in enumerate(front.tolist()):
+        uav = snapshot.uavs[row]
+        uavs.append({
+            **{k: uav[k] for k in ("designation", "name", "type", "country_of_origin")},
+            **{name: values[position] for name, values in metrics.items()},
+        })
+    return {
+        "snapshot_generation": snapshot.generation,
+        "maximize": maximized,
+        "minimize": minimized,
+        "considered": len(rows),
+        "incomplete": len(result["incomplete"]),
+        "total": len(uavs),
+        "uavs": uavs,
+    }
+
+
+# =====================================================
+# CHANGE FEED ENDPOINTS
+# =====================================================
+
+def _catalog_generation() -> int:
+    """Catalog generation as served (snapshot) or read from the database."""
+    if settings.SNAPSHOT_CACHE_ENABLED:
+        return snapshots.current().catalog_generation
+    return db.get_catalog_generation()
+
+
+@app.get(f"{settings.API_V1_PREFIX}/changes", tags=["Changes"])
+def get_changes(
+    since: int = Query(0, ge=0, description="Catalog generation the client has (0 for everything)"),
+):
+    """
+    Get rows inserted, updated or deleted since a catalog generation.
+
+    Each database load is one generation. Apply deleted keys, then upsert
+    inserted and updated rows, then remember `generation` for the next call.
+
+    Args:
+        since: Generation the client's replica is at
+
+    Returns:
+        dict: since, generation and per table (uavs, armaments,
+            uav_armaments) inserted rows, updated rows and deleted keys
+            (designation, or "UAV|ARMAMENT" for links)
+
+    Raises:
+        HTTPException: 410 if `since` isn't in this catalog's history (the
+            database was rebuilt); resync with since=0
+    """
+    try:
+        changes = db.get_changes(since)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching changes: {str(e)}")
+    if changes is None:
+        raise HTTPException(
+            status_code=410,
+            detail=f"Generation {since} is not in this catalog's history; resync with since=0"
+        )
+    return changes
+
+
+@app.get(
+    f"{settings.API_V1_PREFIX}/changes/stream",
+    tags=["Changes"],
+    response_class=StreamingResponse,
+)
+async def stream_changes(request: Request):
+    """
+    Server-sent events announcing catalog generation bumps.
+
+    Sends the current generation on connect and a `generation` event
+    whenever it increases; follow each with GET /api/changes?since=.
+
+    Args:
+        request: Incoming request (for disconnect detection)
+
+    Returns:
+        StreamingResponse: text/event-stream
+    """
+    return StreamingResponse(
+        generation_events(
+            _catalog_generation, request.is_disconnected, settings.CHANGES_POLL_INTERVAL
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# =====================================================
+# ADMIN ENDPOINTS
+# =====================================================
+
+def _require_admin(token: Optional[str]) -> None:
+    """
+    Check the admin token.
+
+    Without ADMIN_TOKEN, admin endpoints are open in development and
+    disabled in production.
+
+    Raises:
+        HTTPException: 403 if the token is missing or wrong
+    """
+    if settings.ADMIN_TOKEN:
+        if not token or not secrets.compare_digest(token, settings.ADMIN_TOKEN):
+            raise HTTPException(status_code=403, detail="Invalid admin token")
+    elif settings.is_production:
+        raise HTTPException(
+            status_code=403, detail="Admin endpoints need ADMIN_TOKEN in production"
+        )
+
+
+@app.get(f"{settings.API_V1_PREFIX}/admin/cache/results", tags=["Admin"])
+def inspect_result_cache(
+    entries: int = Query(
+        20, ge=0, le=1000, description="Number of most recently used entries to list"
+    ),
+    x_admin_token: Optional[str] = Header(None),
+):
+    """
+    Inspect the database result cache.
+
+    Args:
+        entries: Number of entries to list, most recently used first
+        x_admin_token: Admin token (when ADMIN_TOKEN is set)
+
+    Returns:
+        dict: Size, capacity, TTL, hit/miss/eviction/expiration counts and
+            the cached calls with their age
+
+    Raises:
+        HTTPException: 403 without a valid admin token
+    """
+    _require_admin(x_admin_token)
+    if db.results is None:
+        return {"enabled": False}
+    return {
+        "enabled": True,
+        **db.results.stats(),
+        "entries": [
+            {
+                "method": method,
+                "params": dict(params),
+                "generation": generation,
+                "age_seconds": round(age, 3),
+            }
+            for (method, params, generation), age in db.results.entries(entries)
+        ],
+    }
+
+
+@app.delete(f"{settings.API_V1_PREFIX}/admin/cache/results", tags=["Admin"])
+def flush_result_cache(x_admin_token: Optional[str] = Header(None)):
+    """
+    Drop every cached database result.
+
+    Args:
+        x_admin_token: Admin token (when ADMIN_TOKEN is set)
+
+    Returns:
+        dict: Number of entries flushed
+
+    Raises:
+        HTTPException: 403 without a valid admin token
+    """
+    _require_admin(x_admin_token)
+    return {"flushed": db.results.clear() if db.results is not None else 0}
+
+
 # Error handlers
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
@@ -414,9 +1632,11 @@ async def internal_error_handler(request, exc):
 if __name__ == "__main__":
     import uvicorn
 
+    # Production with copy-on-write preload: gunicorn -c gunicorn.conf.py app.main:app
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.RELOAD,
+        workers=settings.worker_count if settings.is_production else None,
     )
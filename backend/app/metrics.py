@@ -0,0 +1,876 @@
+"""
+In-process metrics registry for X-UAV backend.
+
+Provides Prometheus-compatible counters, gauges and histograms, an ASGI
+middleware recording per-route request metrics, and a decorator timing
+Database methods. Rendered in text exposition format by GET /metrics.
+
+Metrics live in the memory of each process. Under the multi-worker launcher
+every worker also writes its raw samples to a file in a shared directory
+(MultiprocessCollector), and a scrape of any worker merges all of them.
+"""
+
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Default latency buckets in seconds (1ms .. 10s)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+# Label added to per-worker gauge series when workers are merged
+PID_LABEL = "pid"
+
+# (label values, raw slot values) of one series
+Series = Tuple[Tuple[str, ...], List[float]]
+
+
+class _ShardedCells:
+    """
+    Per-thread value cells for a single labelled metric child.
+
+    Each writer thread owns its own list of floats, so hot-path updates
+    never take a lock. Readers sum the cells of all threads at scrape time.
+    The lock is only taken when a thread writes for the first time.
+    """
+
+    def __init__(self, size: int):
+        """
+        Initialize sharded cells.
+
+        Args:
+            size (int): Number of float slots per thread
+        """
+        self._size = size
+        self._local = threading.local()
+        self._cells: List[List[float]] = []
+        self._lock = threading.Lock()
+
+    def cell(self) -> List[float]:
+        """
+        Get the calling thread's cell, creating it on first use.
+
+        Returns:
+            List[float]: Mutable per-thread slots
+        """
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = [0.0] * self._size
+            with self._lock:
+                self._cells.append(cell)
+            self._local.cell = cell
+            return cell
+
+    def totals(self) -> List[float]:
+        """
+        Sum all thread cells.
+
+        Returns:
+            List[float]: Slot-wise totals
+        """
+        with self._lock:
+            cells = list(self._cells)
+        totals = [0.0] * self._size
+        for cell in cells:
+            for i, value in enumerate(cell):
+                totals[i] += value
+        return totals
+
+    def reset(self) -> None:
+        """Zero every thread's cell in place (cells stay bound to their threads)."""
+        with self._lock:
+            for cell in self._cells:
+                cell[:] = [0.0] * self._size
+
+
+class _Metric(ABC):
+    """
+    Base class for labelled metric families.
+
+    Attributes:
+        name: Metric name
+        documentation: HELP text
+        labelnames: Label names, in order
+    """
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """
+        Initialize metric family.
+
+        Args:
+            name (str): Metric name
+            documentation (str): HELP text
+            labelnames (Sequence[str]): Label names
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: Any, **kwargs: Any) -> Any:
+        """
+        Get the child metric for a set of label values.
+
+        Args:
+            *values: Label values in labelnames order
+            **kwargs: Label values by name
+
+        Returns:
+            Child metric for the label set
+
+        Raises:
+            ValueError: If label values don't match labelnames
+        """
+        if kwargs:
+            values = tuple(kwargs[name] for name in self.labelnames)
+        key = tuple(str(v) for v in values)
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._children[key] = child
+        return child
+
+    def _default(self) -> Any:
+        """Get the unlabelled child."""
+        return self.labels()
+
+    @abstractmethod
+    def _new_child(self) -> Any:
+        """Create the child metric for a new label set."""
+
+    def _items(self) -> List[Tuple[Tuple[str, ...], Any]]:
+        with self._lock:
+            return list(self._children.items())
+
+    def _format_labels(self, key: Tuple[str, ...], extra: Iterable[Tuple[str, str]] = ()) -> str:
+        # Reason: Merged per-worker gauge series carry the worker pid as a last value
+        pairs = list(zip(self.labelnames + (PID_LABEL,), key)) + list(extra)
+        if not pairs:
+            return ""
+        body = ",".join(f'{name}="{_escape(value)}"' for name, value in pairs)
+        return "{" + body + "}"
+
+    def reset(self) -> None:
+        """Zero every series (callback gauges keep their callback)."""
+        for _, child in self._items():
+            child._cells.reset()
+
+    def state(self) -> List[Series]:
+        """
+        Get the raw slot values of every series.
+
+        Returns:
+            List[Series]: (label values, slots) per series
+        """
+        return [(key, child._cells.totals()) for key, child in self._items()]
+
+    def merge(self, processes: Sequence[Tuple[int, bool, List[Series]]]) -> List[Series]:
+        """
+        Merge the series of several processes by summing their slots.
+
+        Samples of exited workers are kept, so totals never go backwards.
+
+        Args:
+            processes (Sequence[Tuple[int, bool, List[Series]]]): (pid, alive, series)
+
+        Returns:
+            List[Series]: Summed series
+        """
+        merged: Dict[Tuple[str, ...], List[float]] = {}
+        for _, _, series in processes:
+            for key, slots in series:
+                current = merged.setdefault(tuple(key), [0.0] * len(slots))
+                if len(current) == len(slots):
+                    merged[tuple(key)] = [a + b for a, b in zip(current, slots)]
+        return list(merged.items())
+
+    @abstractmethod
+    def samples(self, series: Optional[List[Series]] = None) -> List[str]:
+        """
+        Render sample lines in text exposition format.
+
+        Args:
+            series (Optional[List[Series]]): Series to render (default: this process's)
+
+        Returns:
+            List[str]: Sample lines without HELP/TYPE headers
+        """
+
+    def render(self, series: Optional[List[Series]] = None) -> List[str]:
+        """
+        Render HELP/TYPE headers and samples.
+
+        Args:
+            series (Optional[List[Series]]): Series to render (default: this process's)
+
+        Returns:
+            List[str]: Exposition lines
+        """
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self.samples(series),
+        ]
+
+
+class _CounterChild:
+    """Single counter time series."""
+
+    def __init__(self):
+        self._cells = _ShardedCells(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increment counter.
+
+        Args:
+            amount (float): Non-negative increment
+        """
+        self._cells.cell()[0] += amount
+
+    def value(self) -> float:
+        """Get current total."""
+        return self._cells.totals()[0]
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the unlabelled counter."""
+        self._default().inc(amount)
+
+    def samples(self, series: Optional[List[Series]] = None) -> List[str]:
+        series = self.state() if series is None else series
+        return [f"{self.name}{self._format_labels(key)} {_fmt(slots[0])}" for key, slots in series]
+
+
+class _GaugeChild:
+    """Single gauge time series, either tracked or computed on scrape."""
+
+    def __init__(self):
+        self._cells = _ShardedCells(1)
+        self._function: Optional[Callable[[], float]] = None
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase gauge."""
+        self._cells.cell()[0] += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease gauge."""
+        self._cells.cell()[0] -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """
+        Compute gauge value at scrape time.
+
+        Args:
+            function (Callable[[], float]): Zero-argument value callback
+        """
+        self._function = function
+
+    def value(self) -> float:
+        """Get current value."""
+        if self._function is not None:
+            return float(self._function())
+        return self._cells.totals()[0]
+
+
+class Gauge(_Metric):
+    """
+    Value that can go up and down.
+
+    The merge mode says how the values of several workers are combined:
+    "sum" (e.g. requests in flight), "max", or "all" (one series per worker,
+    labelled with its pid). Only live workers count.
+    """
+
+    type_name = "gauge"
+    MERGE_MODES = ("sum", "max", "all")
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        merge_mode: str = "sum",
+    ):
+        """
+        Initialize gauge family.
+
+        Args:
+            name (str): Metric name
+            documentation (str): HELP text
+            labelnames (Sequence[str]): Label names
+            merge_mode (str): How worker values are combined (sum, max or all)
+
+        Raises:
+            ValueError: If merge_mode is unknown
+        """
+        if merge_mode not in self.MERGE_MODES:
+            raise ValueError(f"merge_mode must be one of {self.MERGE_MODES}, got {merge_mode!r}")
+        super().__init__(name, documentation, labelnames)
+        self.merge_mode = merge_mode
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the unlabelled gauge."""
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the unlabelled gauge."""
+        self._default().dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the unlabelled gauge at scrape time."""
+        self._default().set_function(function)
+
+    def state(self) -> List[Series]:
+        series = []
+        for key, child in self._items():
+            try:
+                value = child.value()
+            except Exception:
+                # Reason: A failing callback must not break the whole scrape
+                continue
+            series.append((key, [value]))
+        return series
+
+    def merge(self, processes: Sequence[Tuple[int, bool, List[Series]]]) -> List[Series]:
+        live = [(pid, series) for pid, alive, series in processes if alive]
+        if self.merge_mode == "all":
+            return [
+                (tuple(key) + (str(pid),), slots) for pid, series in live for key, slots in series
+            ]
+        merged: Dict[Tuple[str, ...], List[float]] = {}
+        for _, series in live:
+            for key, slots in series:
+                current = merged.get(tuple(key))
+                if current is None:
+                    merged[tuple(key)] = list(slots)
+                elif self.merge_mode == "max":
+                    current[0] = max(current[0], slots[0])
+                else:
+                    current[0] += slots[0]
+        return list(merged.items())
+
+    def samples(self, series: Optional[List[Series]] = None) -> List[str]:
+        series = self.state() if series is None else series
+        return [f"{self.name}{self._format_labels(key)} {_fmt(slots[0])}" for key, slots in series]
+
+
+class _HistogramChild:
+    """Single histogram time series."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self._buckets = buckets
+        # Slots: one per bucket, +Inf overflow, sum, count
+        self._cells = _ShardedCells(len(buckets) + 3)
+
+    def observe(self, value: float) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value (float): Observed value
+        """
+        cell = self._cells.cell()
+        cell[bisect_left(self._buckets, value)] += 1
+        cell[-2] += value
+        cell[-1] += 1
+
+    def snapshot(self) -> Tuple[List[float], float, float]:
+        """
+        Get cumulative bucket counts, sum and count.
+
+        Returns:
+            Tuple[List[float], float, float]: Cumulative counts (including +Inf), sum, count
+        """
+        return _cumulative(self._cells.totals())
+
+
+def _cumulative(totals: List[float]) -> Tuple[List[float], float, float]:
+    """Turn raw histogram slots into cumulative bucket counts, sum and count."""
+    cumulative = []
+    running = 0.0
+    for count in totals[:-2]:
+        running += count
+        cumulative.append(running)
+    return cumulative, totals[-2], totals[-1]
+
+
+class Histogram(_Metric):
+    """Distribution of observations in configurable buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Initialize histogram family.
+
+        Args:
+            name (str): Metric name
+            documentation (str): HELP text
+            labelnames (Sequence[str]): Label names
+            buckets (Sequence[float]): Upper bucket bounds, excluding +Inf
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record an observation on the unlabelled histogram."""
+        self._default().observe(value)
+
+    def samples(self, series: Optional[List[Series]] = None) -> List[str]:
+        series = self.state() if series is None else series
+        lines = []
+        bounds = [_fmt(b) for b in self.buckets] + ["+Inf"]
+        for key, slots in series:
+            cumulative, total, count = _cumulative(slots)
+            for bound, value in zip(bounds, cumulative):
+                labels = self._format_labels(key, [("le", bound)])
+                lines.append(f"{self.name}_bucket{labels} {_fmt(value)}")
+            labels = self._format_labels(key)
+            lines.append(f"{self.name}_sum{labels} {_fmt(total)}")
+            lines.append(f"{self.name}_count{labels} {_fmt(count)}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Collection of metric families rendered together.
+
+    Example:
+        registry = MetricsRegistry()
+        hits = registry.counter("hits_total", "Cache hits")
+        hits.inc()
+        text = registry.render()
+    """
+
+    def __init__(self):
+        """Initialize empty registry."""
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric {metric.name} already registered")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Register (or get) a counter."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        merge_mode: str = "sum",
+    ) -> Gauge:
+        """Register (or get) a gauge."""
+        return self._register(Gauge(name, documentation, labelnames, merge_mode))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Register (or get) a histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """
+        Look up a metric family by name.
+
+        Args:
+            name (str): Metric name
+
+        Returns:
+            Optional[_Metric]: Metric family or None
+        """
+        return self._metrics.get(name)
+
+    def _families(self) -> List[_Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def reset(self) -> None:
+        """
+        Zero all samples, e.g. those a forked worker inherited from the master.
+
+        Metric families, label sets and callback gauges are kept.
+        """
+        for metric in self._families():
+            metric.reset()
+
+    def state(self) -> Dict[str, List[Series]]:
+        """
+        Get the raw series of every metric family.
+
+        Returns:
+            Dict[str, List[Series]]: Series by metric name
+        """
+        return {metric.name: metric.state() for metric in self._families()}
+
+    def render(
+        self, processes: Optional[Sequence[Tuple[int, bool, Dict[str, List[Series]]]]] = None
+    ) -> str:
+        """
+        Render all metrics in Prometheus text exposition format.
+
+        Args:
+            processes (Optional[Sequence[Tuple[int, bool, Dict[str, List[Series]]]]]):
+                (pid, alive, state) of every worker to merge; default: this process only
+
+        Returns:
+            str: Exposition document
+        """
+        lines: List[str] = []
+        for metric in self._families():
+            if processes is None:
+                lines.extend(metric.render())
+            else:
+                merged = metric.merge(
+                    [(pid, alive, state.get(metric.name, [])) for pid, alive, state in processes]
+                )
+                lines.extend(metric.render(merged))
+        return "\n".join(lines) + "\n"
+
+
+class MultiprocessCollector:
+    """
+    Merge the metrics of forked workers through per-process files.
+
+    Each worker writes its raw series to <directory>/<pid>.json from a
+    daemon thread every `interval` seconds, and again whenever it is
+    scraped. A scrape of any worker then merges every file, so Prometheus
+    sees the totals of the whole server whichever worker answers.
+    Counters and histograms of exited workers stay in the totals; gauges
+    only count live workers.
+    """
+
+    def __init__(self, registry: MetricsRegistry, directory: Path, interval: float = 1.0):
+        """
+        Initialize collector.
+
+        Args:
+            registry (MetricsRegistry): This process's registry
+            directory (Path): Directory shared by all workers
+            interval (float): Seconds between background writes
+        """
+        self.registry = registry
+        self.directory = Path(directory)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_pid: Optional[int] = None
+
+    def write(self, pid: Optional[int] = None) -> None:
+        """
+        Write this process's series (atomically replacing its previous file).
+
+        Args:
+            pid (Optional[int]): Process id to write as (default: this process)
+        """
+        pid = pid or os.getpid()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{pid}.json"
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(self.registry.state()))
+        os.replace(tmp, path)
+
+    def read(self) -> List[Tuple[int, bool, Dict[str, List[Series]]]]:
+        """
+        Read every worker's file.
+
+        Returns:
+            List[Tuple[int, bool, Dict[str, List[Series]]]]: (pid, alive, state) per file
+        """
+        processes = []
+        for path in sorted(self.directory.glob("*.json")):
+            try:
+                pid = int(path.stem)
+                state = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            processes.append((pid, _pid_alive(pid), state))
+        return processes
+
+    def render(self) -> str:
+        """
+        Render the merged metrics of all workers.
+
+        Returns:
+            str: Exposition document
+        """
+        self.write()
+        return self.registry.render(self.read())
+
+    def start(self) -> None:
+        """Start the background writer in this process (no-op if already running)."""
+        if self._thread is not None and self._thread_pid == os.getpid():
+            return
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-writer", daemon=True)
+        self._thread_pid = os.getpid()
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background writer and write a final time."""
+        self._stop.set()
+        if self._thread is not None and self._thread_pid == os.getpid():
+            self._thread.join()
+        self._thread = None
+        self.write()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.write()
+            except OSError:
+                # Reason: A full or vanished directory must not kill the writer
+                continue
+
+    @staticmethod
+    def clear(directory: Path) -> None:
+        """
+        Remove the files of a previous server run.
+
+        Args:
+            directory (Path): Directory shared by all workers
+        """
+        for path in Path(directory).glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process with this id is running."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt(value: float) -> str:
+    """Format a sample value, dropping a redundant '.0'."""
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+# =====================================================
+# APPLICATION METRICS
+# =====================================================
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.counter(
+    "xuav_http_requests_total",
+    "HTTP requests by method, route template and status code",
+    ("method", "route", "status"),
+)
+HTTP_LATENCY = registry.histogram(
+    "xuav_http_request_duration_seconds",
+    "HTTP request latency by method and route template",
+    ("method", "route"),
+)
+HTTP_IN_FLIGHT = registry.gauge(
+    "xuav_http_requests_in_flight",
+    "HTTP requests currently being served",
+)
+DB_QUERY_LATENCY = registry.histogram(
+    "xuav_db_query_duration_seconds",
+    "Database method duration by method name",
+    ("method",),
+)
+DB_QUERY_ERRORS = registry.counter(
+    "xuav_db_query_errors_total",
+    "Database method calls that raised, by method name",
+    ("method",),
+)
+DB_STATEMENT_PARSE_LATENCY = registry.histogram(
+    "xuav_db_statement_parse_duration_seconds",
+    "Time spent parsing SQL on statement-cache misses, by statement name",
+    ("statement",),
+    buckets=(0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05),
+)
+DB_CONNECTIONS_IN_USE = registry.gauge(
+    "xuav_db_connections_in_use",
+    "DuckDB connections currently checked out",
+)
+DB_CONNECTIONS_OPENED = registry.counter(
+    "xuav_db_connections_opened_total",
+    "DuckDB connections opened since startup",
+)
+DB_COALESCED_CALLS = registry.counter(
+    "xuav_db_coalesced_calls_total",
+    "Database method calls answered by an identical call already in flight, by method name",
+    ("method",),
+)
+SNAPSHOT_LOAD_LATENCY = registry.histogram(
+    "xuav_snapshot_load_duration_seconds",
+    "Time to load the in-memory catalog snapshot",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+CATALOG_GENERATION = registry.gauge(
+    "xuav_catalog_generation",
+    "Generation of the catalog snapshot served by this process",
+    merge_mode="all",
+)
+CACHE_REQUESTS = registry.counter(
+    "xuav_cache_requests_total",
+    "Cache lookups by cache name and result (hit/miss)",
+    ("cache", "result"),
+)
+CACHE_HIT_RATIO = registry.gauge(
+    "xuav_cache_hit_ratio",
+    "Cache hits divided by lookups, by cache name",
+    ("cache",),
+    merge_mode="all",
+)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """
+    Record a cache lookup and keep its hit-ratio gauge registered.
+
+    Args:
+        cache (str): Cache name
+        hit (bool): Whether the lookup was a hit
+    """
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+    ratio = CACHE_HIT_RATIO.labels(cache)
+    if ratio._function is None:
+        hits = CACHE_REQUESTS.labels(cache, "hit")
+        misses = CACHE_REQUESTS.labels(cache, "miss")
+
+        def _ratio() -> float:
+            h, m = hits.value(), misses.value()
+            return h / (h + m) if h + m else 0.0
+
+        ratio.set_function(_ratio)
+
+
+def timed_query(func: Callable) -> Callable:
+    """
+    Decorate a Database method to record its duration and failures.
+
+    Args:
+        func (Callable): Database method
+
+    Returns:
+        Callable: Wrapped method
+    """
+    histogram = DB_QUERY_LATENCY.labels(func.__name__)
+    errors = DB_QUERY_ERRORS.labels(func.__name__)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            errors.inc()
+            raise
+        finally:
+            histogram.observe(time.perf_counter() - start)
+
+    return wrapper
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request count, latency and in-flight gauge.
+
+    Uses the matched route template (e.g. /api/uavs/{designation}) as the
+    route label so path parameters don't explode label cardinality.
+    """
+
+    def __init__(self, app: Callable, exclude_paths: Sequence[str] = ("/metrics",)):
+        """
+        Initialize middleware.
+
+        Args:
+            app (Callable): Wrapped ASGI application
+            exclude_paths (Sequence[str]): Paths not recorded (e.g. the scrape endpoint)
+        """
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or scope.get("path") in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_IN_FLIGHT.dec()
+            # Reason: The router stores the matched route in the shared scope
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope.get("method", "")
+            HTTP_REQUESTS.labels(method, route_path, str(status_code)).inc()
+            HTTP_LATENCY.labels(method, route_path).observe(elapsed)
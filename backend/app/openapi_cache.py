@@ -0,0 +1,141 @@
+"""
+On-disk OpenAPI schema cache for X-UAV backend.
+
+FastAPI builds the OpenAPI document on the first /openapi.json or /docs
+request by walking every route and model (~100 ms here, repeated in every
+worker). The document only changes when the code or the settings that
+shape it (API prefix, title, feature flags that register routes) do, so it
+is cached in a file named by a fingerprint of the application source, the
+FastAPI / Pydantic versions and the app's title, version and route table,
+and loaded from there on later starts.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+PACKAGE_ROOT = Path(__file__).parent
+
+
+def source_fingerprint(extra: str = "") -> str:
+    """
+    Fingerprint the app package sources and the libraries that shape the schema.
+
+    Uses file sizes and modification times, so no source is read.
+
+    Args:
+        extra (str): Additional input (e.g. the API version)
+
+    Returns:
+        str: 16-hex-digit fingerprint
+    """
+    import fastapi
+    import pydantic
+
+    digest = hashlib.sha256(f"{fastapi.__version__}|{pydantic.VERSION}|{extra}".encode())
+    for path in sorted(PACKAGE_ROOT.rglob("*.py")):
+        stat = path.stat()
+        digest.update(f"{path.relative_to(PACKAGE_ROOT)}|{stat.st_size}|{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()[:16]
+
+
+def app_signature(app: "FastAPI") -> str:
+    """
+    Describe what of the app's configuration ends up in its OpenAPI document.
+
+    Covers the title, version and every route's path, methods and schema
+    visibility, so a different API_V1_PREFIX, PROJECT_NAME or set of
+    enabled features gives a different signature.
+
+    Args:
+        app (FastAPI): Application with all routes registered
+
+    Returns:
+        str: Signature text
+    """
+    routes = sorted(
+        f"{route.path} {','.join(sorted(getattr(route, 'methods', None) or ()))} "
+        f"{getattr(route, 'include_in_schema', True)}"
+        for route in app.routes
+    )
+    return "\n".join([app.title, app.version, *routes])
+
+
+class OpenAPICache:
+    """
+    Loads the OpenAPI document from disk, generating and saving it on a miss.
+
+    Install with app.openapi = OpenAPICache(app.openapi, cache_dir, version,
+    lambda: app_signature(app)). Nothing is read or hashed until the document
+    is first requested, by which time every route is registered.
+    """
+
+    def __init__(
+        self,
+        generate: Callable[[], Dict[str, Any]],
+        cache_dir: Path,
+        version: str = "",
+        signature: Optional[Callable[[], str]] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            generate (Callable[[], Dict[str, Any]]): FastAPI's own app.openapi
+            cache_dir (Path): Directory for cached documents
+            version (str): API version, part of the fingerprint
+            signature (Optional[Callable[[], str]]): Describes the app's configuration
+                (see app_signature), part of the fingerprint
+        """
+        self.generate = generate
+        self.cache_dir = cache_dir
+        self.version = version
+        self.signature = signature
+        self._fingerprint: Optional[str] = None
+        self._schema: Optional[Dict[str, Any]] = None
+
+    @property
+    def path(self) -> Path:
+        """Cache file for the current code."""
+        if self._fingerprint is None:
+            signature = self.signature() if self.signature is not None else ""
+            self._fingerprint = source_fingerprint(f"{self.version}\n{signature}")
+        return self.cache_dir / f"openapi-{self._fingerprint}.json"
+
+    def __call__(self) -> Dict[str, Any]:
+        """
+        Get the OpenAPI document.
+
+        Returns:
+            Dict[str, Any]: OpenAPI document
+        """
+        if self._schema is None:
+            self._schema = self._load() or self._build()
+        return self._schema
+
+    def _load(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _build(self) -> Dict[str, Any]:
+        schema = self.generate()
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in self.cache_dir.glob("openapi-*.json"):
+                stale.unlink(missing_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(schema, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except OSError:
+            # Reason: A read-only deployment still serves the generated document
+            pass
+        return schema
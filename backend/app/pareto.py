@@ -0,0 +1,131 @@
+"""
+Pareto-frontier (skyline) analysis for X-UAV backend.
+
+Finds the airframes no other airframe beats on every chosen metric at
+once, e.g. the best endurance/payload/cost trade-offs. Runs over the
+snapshot's cached numeric columns. Points are sorted once so a dominating
+point always comes before the points it dominates: two objectives then need
+a single sweep (O(n log n)); with more, points are taken in order of their
+summed per-column ranks and checked block by block against the skyline
+found so far (sort-filter-skyline), never all pairs.
+"""
+
+from typing import TYPE_CHECKING, Dict, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .snapshot import CatalogSnapshot
+
+MAX_OBJECTIVES = 6
+SKYLINE_BLOCK = 1024
+
+
+class ParetoError(ValueError):
+    """Raised for an unusable set of objectives."""
+
+
+def skyline(values: np.ndarray) -> np.ndarray:
+    """
+    Rows not dominated by any other row, every column minimized.
+
+    A row dominates another if it is no worse in every column and better in
+    at least one; identical rows don't dominate each other.
+
+    Args:
+        values (np.ndarray): n x k matrix without NaN
+
+    Returns:
+        np.ndarray: Indices of the non-dominated rows, ascending
+    """
+    if len(values) == 0:
+        return np.empty(0, dtype=np.intp)
+    unique, inverse = np.unique(values, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    if unique.shape[1] == 1:
+        keep = np.zeros(len(unique), dtype=bool)
+        keep[0] = True
+    elif unique.shape[1] == 2:
+        # Reason: everything before a point is better on the first column (or equal
+        # and better on the second), so it survives only by beating all their seconds
+        best = np.minimum.accumulate(unique[:, 1])
+        keep = np.ones(len(unique), dtype=bool)
+        keep[1:] = unique[1:, 1] < best[:-1]
+    else:
+        keep = _sort_filter(unique)
+    return np.flatnonzero(keep[inverse])
+
+
+def _sort_filter(points: np.ndarray) -> np.ndarray:
+    """Skyline mask of unique points (three or more columns)."""
+    # Reason: a dominating point has a strictly smaller rank sum, so it is seen first
+    ranks = np.column_stack(
+        [np.unique(column, return_inverse=True)[1].reshape(-1) for column in points.T]
+    )
+    order = np.argsort(ranks.sum(axis=1), kind="stable")
+    ranks = ranks[order]
+
+    keep = np.zeros(len(points), dtype=bool)
+    window = ranks[:0]
+    for start in range(0, len(ranks), SKYLINE_BLOCK):
+        block = ranks[start:start + SKYLINE_BLOCK]
+        positions = start + np.arange(len(block))
+        # Earlier (stronger) skyline points knock out most of a block; check them first
+        for edge in range(0, len(window), SKYLINE_BLOCK // 4):
+            if not len(block):
+                break
+            chunk = window[edge:edge + SKYLINE_BLOCK // 4]
+            alive = ~(chunk[None, :, :] <= block[:, None, :]).all(axis=2).any(axis=1)
+            block, positions = block[alive], positions[alive]
+        # Points are unique, so only the diagonal compares equal everywhere
+        within = (block[None, :, :] <= block[:, None, :]).all(axis=2)
+        np.fill_diagonal(within, False)
+        survivors = ~within.any(axis=1)
+        keep[order[positions[survivors]]] = True
+        window = np.concatenate([window, block[survivors]])
+    return keep
+
+
+def pareto_front(
+    snapshot: "CatalogSnapshot",
+    maximize: Sequence[str],
+    minimize: Sequence[str],
+    rows: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Non-dominated UAVs among the given rows.
+
+    Args:
+        snapshot (CatalogSnapshot): Catalog snapshot
+        maximize (Sequence[str]): Numeric fields where higher is better
+        minimize (Sequence[str]): Numeric fields where lower is better
+        rows (np.ndarray): Candidate row numbers (e.g. a search result)
+
+    Returns:
+        Dict[str, np.ndarray]: "front" (row numbers on the frontier, best
+            first by the first objective) and "incomplete" (candidate rows
+            missing a metric, left out)
+
+    Raises:
+        ParetoError: If there are no objectives, too many, or a field repeats
+        KeyError: If a field doesn't exist
+        ValueError: If a field isn't numeric
+    """
+    objectives = list(maximize) + list(minimize)
+    if not objectives:
+        raise ParetoError("Give at least one field to maximize or minimize")
+    if len(objectives) > MAX_OBJECTIVES:
+        raise ParetoError(f"At most {MAX_OBJECTIVES} objectives")
+    if len(set(objectives)) < len(objectives):
+        raise ParetoError("Each field can appear only once")
+
+    signs = [-1.0] * len(maximize) + [1.0] * len(minimize)
+    matrix = np.column_stack(
+        [sign * snapshot.numeric_array(name)[rows] for sign, name in zip(signs, objectives)]
+    )
+    complete = ~np.isnan(matrix).any(axis=1)
+    candidates = rows[complete]
+    front = candidates[skyline(matrix[complete])]
+    order = np.argsort(signs[0] * snapshot.numeric_array(objectives[0])[front], kind="stable")
+    return {"front": front[order], "incomplete": rows[~complete]}
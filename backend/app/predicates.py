@@ -0,0 +1,95 @@
+"""
+Predicate compilation for X-UAV capability search.
+
+Turns client-supplied (field, op, value) conditions into parameterized SQL
+clauses. Fields come from a whitelist that also fixes their kind, so column
+names are never taken from the request and each operator is checked against
+the kind of column it's applied to:
+
+    number: eq, ne, gt, gte, lt, lte, in
+    text:   eq, ne, in, contains (case-insensitive substring)
+    list:   contains (has the element), in (has any of the elements)
+
+Values are always bound as parameters; "in" binds one list, so a query's
+shape depends only on the fields and operators used.
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+COMPARISONS = {"eq": "=", "ne": "<>", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+OPERATORS = {
+    "number": ("eq", "ne", "gt", "gte", "lt", "lte", "in"),
+    "text": ("eq", "ne", "in", "contains"),
+    "list": ("contains", "in"),
+}
+
+
+class PredicateError(ValueError):
+    """Raised for an unknown field, an operator it doesn't support, or a bad value."""
+
+
+def _is_number(value: Any) -> bool:
+    """True for int/float values (bool excluded)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _check_value(field: str, kind: str, op: str, value: Any) -> Any:
+    """Validate a value for its field kind and operator, returning what to bind."""
+    expected = _is_number if kind == "number" else (lambda v: isinstance(v, str))
+    if op == "in":
+        if not isinstance(value, (list, tuple)) or not value or not all(expected(v) for v in value):
+            raise PredicateError(f"'{field}' in needs a non-empty list of {kind} values")
+        return list(value)
+    if not expected(value):
+        noun = "a number" if kind == "number" else "a string"
+        raise PredicateError(f"'{field}' {op} needs {noun}")
+    return value
+
+
+def compile_predicates(
+    alias: str,
+    predicates: Sequence[Tuple[str, str, Any]],
+    fields: Dict[str, str],
+) -> Tuple[List[str], List[Any]]:
+    """
+    Compile conditions on one table into WHERE clauses.
+
+    Args:
+        alias (str): Table alias, e.g. "u"
+        predicates (Sequence[Tuple[str, str, Any]]): (field, op, value) conditions
+        fields (Dict[str, str]): Allowed field -> kind ("number", "text" or "list")
+
+    Returns:
+        Tuple[List[str], List[Any]]: Clauses (to be ANDed) and their parameters
+
+    Raises:
+        PredicateError: If a field, operator or value isn't allowed
+    """
+    clauses: List[str] = []
+    params: List[Any] = []
+    for field, op, value in predicates:
+        kind = fields.get(field)
+        if kind is None:
+            raise PredicateError(f"Unknown field '{field}'")
+        if op not in OPERATORS[kind]:
+            raise PredicateError(
+                f"'{field}' supports {', '.join(OPERATORS[kind])}, not '{op}'"
+            )
+        value = _check_value(field, kind, op, value)
+        column = f"{alias}.{field}"
+
+        if kind == "list":
+            if op == "in":
+                clauses.append(f"list_has_any({column}, ?::VARCHAR[])")
+            else:
+                clauses.append(f"list_contains({column}, ?)")
+        elif op == "in":
+            cast = "DOUBLE" if kind == "number" else "VARCHAR"
+            clauses.append(f"list_contains(?::{cast}[], {column}::{cast})")
+        elif op == "contains":
+            clauses.append(f"{column} ILIKE ?")
+            value = f"%{value}%"
+        else:
+            clauses.append(f"{column} {COMPARISONS[op]} ?")
+        params.append(value)
+    return clauses, params
@@ -0,0 +1,80 @@
+"""
+Vectorized mission-reach analysis for X-UAV backend.
+
+Answers "which airframes can fly D km from a base and loiter there for
+T hours" for the whole fleet and many targets at once, as NumPy
+broadcasting over the snapshot's cached columns (UAVs x targets), with
+great-circle distances computed the same way.
+
+Model, per UAV and target distance d:
+    radius  = combat_radius_km, or range_km / 2 (out and back) if unknown
+    loiter  = endurance_hours - 2 * d / cruise_speed_kmh (time on station)
+    feasible = d <= radius and loiter >= loiter_hours
+When endurance or cruise speed is unknown only the radius is checked, and
+any loiter requirement counts as not met.
+"""
+
+from typing import TYPE_CHECKING, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .snapshot import CatalogSnapshot
+
+EARTH_RADIUS_KM = 6371.0088
+REACH_FIELDS = ("combat_radius_km", "range_km", "endurance_hours", "cruise_speed_kmh")
+
+
+def great_circle_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Haversine distance between points, broadcasting over array inputs.
+
+    Args:
+        lat1, lon1: Origin latitude/longitude in degrees
+        lat2, lon2: Destination latitude/longitude in degrees
+
+    Returns:
+        np.ndarray: Distances in kilometers
+    """
+    lat1, lon1, lat2, lon2 = (
+        np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2)
+    )
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def reach_matrix(
+    snapshot: "CatalogSnapshot",
+    distances_km: np.ndarray,
+    loiter_hours: float = 0.0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluate reach/loiter feasibility for every UAV against every target.
+
+    Args:
+        snapshot (CatalogSnapshot): Catalog snapshot supplying the columns
+        distances_km (np.ndarray): Target distances from the base, shape (targets,)
+        loiter_hours (float): Required time on station
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (radius_km per UAV,
+            feasible bool matrix, available loiter hours matrix with NaN
+            where unknown or out of reach), matrices shaped (UAVs, targets)
+    """
+    combat_radius, range_km, endurance, cruise = (snapshot.numeric_array(f) for f in REACH_FIELDS)
+    radius = np.where(np.isnan(combat_radius), range_km / 2, combat_radius)
+    distance = np.asarray(distances_km, dtype=np.float64)[np.newaxis, :]
+
+    in_reach = distance <= radius[:, np.newaxis]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        transit = 2 * distance / np.where(cruise > 0, cruise, np.nan)[:, np.newaxis]
+    loiter = endurance[:, np.newaxis] - transit
+    loiter[~in_reach] = np.nan
+
+    known = ~np.isnan(loiter)
+    with np.errstate(invalid="ignore"):
+        feasible = in_reach & np.where(known, loiter >= loiter_hours, loiter_hours <= 0)
+    return radius, feasible, loiter
@@ -1,19 +1,48 @@
 """Pydantic schemas for X-UAV API."""
 
+from .armament import Armament, UAVArmament
 from .uav import (
     UAV,
-    UAVList,
-    UAVCompareRequest,
-    UAVSearchRequest,
+    BatchRequest,
+    BatchResponse,
+    BatchResult,
+    BatchSubRequest,
+    CapabilityPredicate,
+    CapabilitySearchRequest,
+    GeoPoint,
     HealthResponse,
+    LivenessResponse,
+    ReachRequest,
+    ReachTarget,
+    ReadinessResponse,
+    StartupReport,
     StatsResponse,
+    UAVCompareRequest,
+    UAVList,
+    UAVSearchRequest,
+    VariantCompareRequest,
 )
 
 __all__ = [
+    "Armament",
     "UAV",
+    "BatchRequest",
+    "BatchResponse",
+    "BatchResult",
+    "BatchSubRequest",
+    "CapabilityPredicate",
+    "CapabilitySearchRequest",
+    "GeoPoint",
+    "ReachRequest",
+    "ReachTarget",
     "UAVList",
     "UAVCompareRequest",
+    "UAVArmament",
     "UAVSearchRequest",
+    "VariantCompareRequest",
     "HealthResponse",
+    "LivenessResponse",
+    "ReadinessResponse",
+    "StartupReport",
     "StatsResponse",
 ]
@@ -0,0 +1,104 @@
+"""
+Pydantic schemas for armament data models.
+
+Mirror the armaments and uav_armaments tables; used to validate source
+data before it is loaded.
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class Armament(BaseModel):
+    """
+    Armament data model.
+
+    Represents one weapon system record.
+    """
+
+    # Primary Key
+    id: int
+
+    # Identification
+    designation: str = Field(..., description="Official designation (e.g., AGM-114)")
+    name: Optional[str] = Field(None, description="Common name")
+    manufacturer: Optional[str] = Field(None, description="Manufacturer")
+    country_of_origin: Optional[str] = Field(None, description="Nation of origin")
+
+    # Classification
+    weapon_type: str = Field(..., description="Missile, Bomb, Rocket, Gun Pod")
+    weapon_class: Optional[str] = Field(None, description="Air-to-Ground, Air-to-Air, etc.")
+    guidance_type: Optional[str] = Field(None, description="Guidance (Laser, GPS/INS, IR, ...)")
+
+    # Physical Characteristics
+    length_meters: Optional[float] = Field(None, description="Length in meters")
+    length_inches: Optional[float] = Field(None, description="Length in inches")
+    diameter_mm: Optional[float] = Field(None, description="Diameter in mm")
+    diameter_inches: Optional[float] = Field(None, description="Diameter in inches")
+    wingspan_meters: Optional[float] = Field(None, description="Wingspan in meters")
+    wingspan_inches: Optional[float] = Field(None, description="Wingspan in inches")
+    weight_kg: Optional[float] = Field(None, description="Weight in kg")
+    weight_lbs: Optional[float] = Field(None, description="Weight in lbs")
+
+    # Warhead
+    warhead_type: Optional[str] = Field(None, description="Warhead type")
+    warhead_weight_kg: Optional[float] = Field(None, description="Warhead weight in kg")
+    warhead_weight_lbs: Optional[float] = Field(None, description="Warhead weight in lbs")
+
+    # Performance
+    range_km: Optional[float] = Field(None, description="Range in kilometers")
+    range_miles: Optional[float] = Field(None, description="Range in miles")
+    range_nm: Optional[float] = Field(None, description="Range in nautical miles")
+    max_speed_mach: Optional[float] = Field(None, description="Max speed in Mach")
+    max_speed_kmh: Optional[float] = Field(None, description="Max speed in km/h")
+    min_altitude_meters: Optional[int] = Field(None, description="Minimum altitude in meters")
+    max_altitude_meters: Optional[int] = Field(None, description="Maximum altitude in meters")
+    cep_meters: Optional[float] = Field(None, description="Circular error probable in meters")
+
+    # Propulsion
+    propulsion_type: Optional[str] = Field(None, description="Propulsion type")
+    engine_model: Optional[str] = Field(None, description="Engine model")
+
+    # Launch Parameters
+    launch_platform_types: Optional[List[str]] = Field(None, description="Launch platforms")
+    min_launch_altitude_ft: Optional[int] = Field(None, description="Minimum launch altitude in ft")
+    max_launch_altitude_ft: Optional[int] = Field(None, description="Maximum launch altitude in ft")
+    launch_weight_kg: Optional[float] = Field(None, description="Launch weight in kg")
+
+    # Economics
+    unit_cost_usd: Optional[float] = Field(None, description="Unit cost in USD")
+    year_introduced: Optional[int] = Field(None, description="Year introduced")
+
+    # Status
+    operational_status: Optional[str] = Field(None, description="Current operational status")
+
+    # Additional Info
+    variants: Optional[List[Dict[str, Any]]] = Field(None, description="Variants")
+    notable_features: Optional[List[str]] = Field(None, description="Notable features")
+    combat_history: Optional[str] = Field(None, description="Combat history")
+    notes: Optional[str] = Field(None, description="Additional notes")
+
+    # Metadata
+    created_at: Optional[datetime] = Field(None, description="Creation timestamp")
+    updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
+
+
+class UAVArmament(BaseModel):
+    """
+    UAV-armament compatibility model.
+
+    Represents one row of the uav_armaments relation.
+    """
+
+    id: int
+    uav_designation: str = Field(..., description="UAV designation")
+    armament_designation: str = Field(..., description="Armament designation")
+    max_quantity: Optional[int] = Field(None, description="Max number carried")
+    hardpoint_positions: Optional[str] = Field(None, description="Wing pylons, internal bay, ...")
+    integration_status: Optional[str] = Field(None, description="Operational, Tested, Planned, ...")
+    integration_date: Optional[date] = Field(None, description="Integration date")
+    notes: Optional[str] = Field(None, description="Additional notes")
+    created_at: Optional[datetime] = Field(None, description="Creation timestamp")
+    updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
@@ -5,7 +5,7 @@ Defines request and response models for the API.
 """
 
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -108,11 +108,16 @@ class UAV(BaseModel):
     silhouette_url: Optional[str] = Field(None, description="Silhouette URL")
     model_urls: Optional[Dict[str, str]] = Field(None, description="3D model URLs")
     scale_factor: Optional[int] = Field(None, description="Scale factor for visualization")
+    image_derivatives: Optional[Dict[str, Any]] = Field(
+        None, description="Thumbnail and responsive image variants per view"
+    )
 
     # Additional Information
     notable_features: Optional[List[str]] = Field(None, description="Notable features")
     combat_history: Optional[str] = Field(None, description="Combat history")
-    variants: Optional[List[Any]] = Field(None, description="Variants")
+    variants: Optional[List[Dict[str, Any]]] = Field(
+        None, description="Variants (designation, name, description and performance overrides)"
+    )
     notes: Optional[str] = Field(None, description="Additional notes")
 
     # Metadata
@@ -163,6 +168,22 @@ class UAVCompareRequest(BaseModel):
     )
 
 
+class VariantCompareRequest(BaseModel):
+    """
+    Request model for comparing UAV variants.
+
+    Used for POST /api/variants/compare endpoint.
+    """
+
+    designations: List[str] = Field(
+        ...,
+        description="List of variant designations to compare",
+        min_length=1,
+        max_length=10,
+        example=["MQ-9A", "MQ-9B"]
+    )
+
+
 class UAVSearchRequest(BaseModel):
     """
     Request model for searching UAVs.
@@ -174,6 +195,8 @@ class UAVSearchRequest(BaseModel):
     type: Optional[str] = Field(None, description="Filter by UAV type")
     status: Optional[str] = Field(None, description="Filter by operational status")
     nato_class: Optional[str] = Field(None, description="Filter by NATO class")
+    mission_type: Optional[str] = Field(None, description="Filter by mission type (e.g., ISR)")
+    operator: Optional[str] = Field(None, description="Filter by operating country")
 
     class Config:
         """Pydantic configuration."""
@@ -186,6 +209,53 @@ class UAVSearchRequest(BaseModel):
         }
 
 
+class CapabilityPredicate(BaseModel):
+    """
+    One condition of a capability search.
+
+    Number fields take eq/ne/gt/gte/lt/lte/in, text fields eq/ne/in/contains
+    (case-insensitive substring), list fields contains/in (element match).
+    """
+
+    field: str = Field(..., description="Field name (e.g., endurance_hours, guidance_type)")
+    op: Literal["eq", "ne", "gt", "gte", "lt", "lte", "in", "contains"] = Field(
+        "eq", description="Operator"
+    )
+    value: Any = Field(..., description="Number, string, or a list of them for 'in'")
+
+
+class CapabilitySearchRequest(BaseModel):
+    """
+    Request model for searching UAVs by their own and their weapons' capabilities.
+
+    Used for POST /api/capabilities/search endpoint.
+    """
+
+    uav: List[CapabilityPredicate] = Field(
+        default_factory=list, max_length=20, description="Conditions on the UAV"
+    )
+    armament: List[CapabilityPredicate] = Field(
+        default_factory=list, max_length=20, description="Conditions on an integrated weapon"
+    )
+    integration_status: Optional[List[str]] = Field(
+        None, max_length=10, description="Accepted integration statuses (e.g., Operational)"
+    )
+
+    class Config:
+        """Pydantic configuration."""
+        json_schema_extra = {
+            "example": {
+                "uav": [{"field": "endurance_hours", "op": "gt", "value": 20}],
+                "armament": [
+                    {"field": "guidance_type", "op": "contains", "value": "Laser"},
+                    {"field": "weapon_type", "op": "eq", "value": "Missile"},
+                    {"field": "range_km", "op": "gt", "value": 8},
+                ],
+                "integration_status": ["Operational"],
+            }
+        }
+
+
 class HealthResponse(BaseModel):
     """
     Health check response model.
@@ -198,6 +268,51 @@ class HealthResponse(BaseModel):
     database: str = Field(..., description="Database status")
 
 
+class LivenessResponse(BaseModel):
+    """
+    Liveness probe response model.
+
+    Used for GET /api/health/live endpoint.
+    """
+
+    status: str = Field(..., description="Always 'alive' while the process serves requests")
+    pid: int = Field(..., description="Worker process id")
+    uptime_seconds: float = Field(..., description="Seconds since the worker started")
+
+
+class ReadinessResponse(BaseModel):
+    """
+    Readiness probe response model.
+
+    Used for GET /api/health/ready endpoint.
+    """
+
+    status: str = Field(..., description="'ready' or the current startup phase")
+    pid: int = Field(..., description="Worker process id")
+    snapshot_generation: int = Field(..., description="Loaded catalog snapshot generation")
+    db_handle_open: bool = Field(..., description="Whether the worker holds its DB handle")
+    error: Optional[str] = Field(None, description="Last warm-up error")
+
+
+class StartupReport(BaseModel):
+    """
+    Startup timing report model.
+
+    Used for GET /api/health/startup endpoint.
+    """
+
+    pid: int = Field(..., description="Worker process id")
+    phase: str = Field(..., description="starting, warming, ready or failed")
+    preloaded: bool = Field(..., description="Catalog loaded in the master before fork")
+    db_open_seconds: Optional[float] = Field(None, description="DB handle open time")
+    warmup_seconds: Optional[float] = Field(None, description="Snapshot load time")
+    startup_seconds: Optional[float] = Field(None, description="Process start to ready")
+    uptime_seconds: float = Field(..., description="Seconds since the worker started")
+    snapshot_generation: int = Field(..., description="Loaded catalog snapshot generation")
+    db_handle_open: bool = Field(..., description="Whether the worker holds its DB handle")
+    error: Optional[str] = Field(None, description="Last warm-up error")
+
+
 class StatsResponse(BaseModel):
     """
     Statistics response model.
@@ -209,3 +324,100 @@ class StatsResponse(BaseModel):
     by_country: List[Dict[str, Any]] = Field(..., description="Count by country")
     by_type: List[Dict[str, Any]] = Field(..., description="Count by type")
     by_status: List[Dict[str, Any]] = Field(..., description="Count by status")
+
+
+class BatchSubRequest(BaseModel):
+    """
+    One sub-request of a batch.
+
+    Used in POST /api/batch.
+    """
+
+    id: Optional[str] = Field(None, description="Caller's id, echoed in the result")
+    method: str = Field("GET", pattern="^(GET|POST)$", description="HTTP method")
+    path: str = Field(..., description="API path with optional query string")
+    body: Optional[Dict[str, Any]] = Field(None, description="JSON body for POST")
+
+
+class BatchRequest(BaseModel):
+    """
+    Batch request model.
+
+    Used for POST /api/batch endpoint.
+    """
+
+    requests: List[BatchSubRequest] = Field(
+        ..., min_length=1, description="Sub-requests, run in order"
+    )
+
+
+class BatchResult(BaseModel):
+    """Result of one sub-request."""
+
+    id: Optional[str] = Field(None, description="Id from the sub-request")
+    status: int = Field(..., description="HTTP status of the sub-request")
+    body: Any = Field(None, description="Response body (parsed JSON)")
+
+
+class BatchResponse(BaseModel):
+    """
+    Batch response model.
+
+    Used for POST /api/batch endpoint.
+    """
+
+    snapshot_generation: int = Field(..., description="Catalog snapshot every sub-request saw")
+    responses: List[BatchResult] = Field(..., description="One result per sub-request, in order")
+
+
+class GeoPoint(BaseModel):
+    """Latitude/longitude in decimal degrees."""
+
+    latitude: float = Field(..., ge=-90, le=90, description="Latitude in degrees")
+    longitude: float = Field(..., ge=-180, le=180, description="Longitude in degrees")
+
+
+class ReachTarget(BaseModel):
+    """
+    One target of a reach analysis: coordinates or a distance from the base.
+
+    Used in POST /api/analysis/reach.
+    """
+
+    id: Optional[str] = Field(None, description="Caller's id, echoed in the result")
+    latitude: Optional[float] = Field(None, ge=-90, le=90, description="Latitude in degrees")
+    longitude: Optional[float] = Field(None, ge=-180, le=180, description="Longitude in degrees")
+    distance_km: Optional[float] = Field(
+        None, ge=0, description="Distance from the base (instead of coordinates)"
+    )
+
+
+class ReachRequest(BaseModel):
+    """
+    Request model for a fleet reach analysis.
+
+    Used for POST /api/analysis/reach endpoint.
+    """
+
+    base: Optional[GeoPoint] = Field(
+        None, description="Base location (needed for targets given as coordinates)"
+    )
+    targets: List[ReachTarget] = Field(..., min_length=1, description="Targets to evaluate")
+    loiter_hours: float = Field(0.0, ge=0, description="Required time on station at each target")
+    designations: Optional[List[str]] = Field(
+        None, description="Only these UAVs (default: whole fleet)"
+    )
+    only_feasible: bool = Field(True, description="Leave out UAVs that reach no target")
+
+    class Config:
+        """Pydantic configuration."""
+        json_schema_extra = {
+            "example": {
+                "base": {"latitude": 36.23, "longitude": -115.03},
+                "targets": [
+                    {"id": "alpha", "latitude": 34.05, "longitude": -118.24},
+                    {"id": "bravo", "distance_km": 900},
+                ],
+                "loiter_hours": 4,
+            }
+        }
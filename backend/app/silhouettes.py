@@ -0,0 +1,388 @@
+"""
+Scaled silhouette compositing for X-UAV backend.
+
+Builds one SVG (or PNG) showing several overhead silhouettes side by side at
+true relative scale, with a scale bar, so comparison views need a single
+request. Renders are cached per designation set and catalog snapshot.
+"""
+
+import hashlib
+import math
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .assets import resolve_asset
+from .cache import LRUCache
+from .config import settings
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+ET.register_namespace("", SVG_NS)
+ET.register_namespace("xlink", XLINK_NS)
+
+MARGIN_PX = 40
+GAP_PX = 40
+LABEL_PX = 44
+SCALE_BAR_PX = 56
+FILL = "#1f2937"
+MEDIA_TYPES = {"svg": "image/svg+xml", "png": "image/png"}
+
+
+class SilhouetteError(ValueError):
+    """Raised when a comparison can't be rendered (e.g. no dimensions to scale by)."""
+
+
+class RenderUnavailableError(RuntimeError):
+    """Raised when an output format needs an optional dependency that isn't installed."""
+
+
+class Render:
+    """
+    A finished render.
+
+    Attributes:
+        content: Encoded image bytes
+        media_type: MIME type of content
+        etag: Strong ETag derived from content
+    """
+
+    __slots__ = ("content", "media_type", "etag")
+
+    def __init__(self, content: bytes, media_type: str):
+        self.content = content
+        self.media_type = media_type
+        self.etag = '"' + hashlib.sha256(content).hexdigest()[:32] + '"'
+
+
+def nice_length(max_meters: float) -> float:
+    """
+    Pick a round scale bar length (1, 2 or 5 x 10^n meters).
+
+    Args:
+        max_meters (float): Longest bar that fits
+
+    Returns:
+        float: Largest round length not exceeding max_meters
+    """
+    if max_meters <= 0:
+        return 1.0
+    exponent = math.floor(math.log10(max_meters))
+    for step in (5, 2, 1):
+        length = step * 10 ** exponent
+        if length <= max_meters:
+            return float(length)
+    return float(10 ** exponent)
+
+
+def _format_meters(value: float) -> str:
+    return f"{value:g} m"
+
+
+def _load_svg(path: Path) -> Optional[ET.Element]:
+    """
+    Parse a silhouette SVG, dropping scripts and event handlers.
+
+    Returns:
+        Optional[ET.Element]: Root <svg> element, or None if unreadable
+    """
+    try:
+        root = ET.parse(path).getroot()
+    except (ET.ParseError, OSError):
+        return None
+    if root.tag != f"{{{SVG_NS}}}svg":
+        return None
+    for parent in root.iter():
+        for child in list(parent):
+            if child.tag in (f"{{{SVG_NS}}}script", f"{{{SVG_NS}}}foreignObject"):
+                parent.remove(child)
+        for attr in [a for a in parent.attrib if a.lower().startswith("on")]:
+            del parent.attrib[attr]
+    return root
+
+
+def _view_box(svg: ET.Element) -> Optional[Tuple[float, float, float, float]]:
+    """Read the viewBox (falling back to width/height) of an SVG element."""
+    raw = svg.get("viewBox")
+    try:
+        if raw:
+            x, y, w, h = (float(v) for v in raw.replace(",", " ").split())
+        else:
+            x, y = 0.0, 0.0
+            w = float(svg.get("width", "").rstrip("px"))
+            h = float(svg.get("height", "").rstrip("px"))
+    except ValueError:
+        return None
+    if w <= 0 or h <= 0:
+        return None
+    return x, y, w, h
+
+
+def _placeholder(wingspan: float, length: float) -> ET.Element:
+    """
+    Generic fixed-wing planform drawn in meters, used when no silhouette file exists.
+
+    Args:
+        wingspan (float): Span in meters (x axis)
+        length (float): Length in meters (y axis, nose up)
+
+    Returns:
+        ET.Element: <svg> element with viewBox "0 0 wingspan length"
+    """
+    svg = ET.Element(f"{{{SVG_NS}}}svg", {"viewBox": f"0 0 {wingspan:g} {length:g}"})
+    cx = wingspan / 2
+    body = max(length * 0.08, wingspan * 0.03)
+    wing_chord = length * 0.14
+    tail_span = min(wingspan * 0.3, length * 0.5)
+    tail_chord = length * 0.08
+    tail_left, tail_right = cx - tail_span / 2, cx + tail_span / 2
+    tail_front, tail_back = length - tail_chord * 1.2, length - tail_chord * 0.2
+    shapes = [
+        # Fuselage
+        [(cx - body / 2, length * 0.02), (cx + body / 2, length * 0.02),
+         (cx + body / 2, length), (cx - body / 2, length)],
+        # Main wing (slight taper)
+        [(0, length * 0.40), (wingspan, length * 0.40),
+         (wingspan, length * 0.40 + wing_chord * 0.6),
+         (cx, length * 0.40 + wing_chord), (0, length * 0.40 + wing_chord * 0.6)],
+        # Tailplane
+        [(tail_left, tail_front), (tail_right, tail_front),
+         (tail_right, tail_back), (tail_left, tail_back)],
+    ]
+    for points in shapes:
+        ET.SubElement(
+            svg,
+            f"{{{SVG_NS}}}polygon",
+            {"points": " ".join(f"{x:.3f},{y:.3f}" for x, y in points)},
+        )
+    return svg
+
+
+def _dimensions(uav: Dict[str, Any]) -> Tuple[float, Optional[float]]:
+    """Get (span, length) in meters; span falls back to length for tailless designs."""
+    span = uav.get("wingspan_meters")
+    length = uav.get("length_meters")
+    span = float(span) if span else None
+    length = float(length) if length else None
+    if span is None and length is None:
+        raise SilhouetteError(
+            f"UAV '{uav['designation']}' has no wingspan or length to scale by"
+        )
+    return (span or length), length
+
+
+def compose_svg(
+    uavs: Sequence[Dict[str, Any]],
+    assets_root: Optional[Path] = None,
+    max_width: int = 1600,
+) -> str:
+    """
+    Composite overhead silhouettes side by side at a shared scale.
+
+    Each silhouette is drawn wingspan_meters wide at the same pixels-per-meter
+    ratio (the smallest scale_factor among the UAVs, reduced if needed to fit
+    max_width), in descending order of span, labelled with designation and
+    span, above a scale bar.
+
+    Args:
+        uavs (Sequence[Dict[str, Any]]): UAV records
+        assets_root (Optional[Path]): Directory /assets URLs resolve against
+        max_width (int): Target width of the whole image in pixels
+
+    Returns:
+        str: SVG document
+
+    Raises:
+        SilhouetteError: If a UAV has neither wingspan nor length
+    """
+    assets_root = (assets_root or settings.assets_path_absolute).resolve()
+    items = []
+    for uav in uavs:
+        span, length = _dimensions(uav)
+        items.append((uav, span, length))
+    items.sort(key=lambda item: (-item[1], item[0]["designation"]))
+
+    total_span = sum(span for _, span, _ in items)
+    reference = min((uav.get("scale_factor") or 100) for uav, _, _ in items)
+    usable = max_width - 2 * MARGIN_PX - GAP_PX * (len(items) - 1)
+    scale = min(float(reference), usable / total_span) if total_span else float(reference)
+
+    cells = []
+    for uav, span, length in items:
+        path = resolve_asset(uav.get("silhouette_url"), assets_root)
+        svg = _load_svg(path) if path else None
+        box = _view_box(svg) if svg is not None else None
+        if box is None:
+            # Reason: Keep comparisons usable before artwork exists for every UAV
+            depth = length or span * 0.6
+            svg = _placeholder(span, depth)
+            box = (0.0, 0.0, span, depth)
+        width = span * scale
+        height = width * box[3] / box[2]
+        cells.append((uav, span, svg, box, width, height))
+
+    row_height = max(height for *_, height in cells)
+    canvas_width = max(
+        2 * MARGIN_PX + sum(c[4] for c in cells) + GAP_PX * (len(cells) - 1),
+        2 * MARGIN_PX + 200,
+    )
+    canvas_height = MARGIN_PX + row_height + LABEL_PX + SCALE_BAR_PX + MARGIN_PX
+
+    doc = ET.Element(
+        f"{{{SVG_NS}}}svg",
+        {
+            "width": f"{canvas_width:.0f}",
+            "height": f"{canvas_height:.0f}",
+            "viewBox": f"0 0 {canvas_width:.2f} {canvas_height:.2f}",
+            "font-family": "sans-serif",
+            "data-pixels-per-meter": f"{scale:.4f}",
+        },
+    )
+    title = ET.SubElement(doc, f"{{{SVG_NS}}}title")
+    title.text = "Size comparison: " + ", ".join(c[0]["designation"] for c in cells)
+
+    x = float(MARGIN_PX)
+    for uav, span, svg, box, width, height in cells:
+        y = MARGIN_PX + (row_height - height) / 2
+        group = ET.SubElement(
+            doc,
+            f"{{{SVG_NS}}}g",
+            {"fill": FILL, "data-designation": uav["designation"]},
+        )
+        nested = ET.SubElement(
+            group,
+            f"{{{SVG_NS}}}svg",
+            {
+                "x": f"{x:.2f}",
+                "y": f"{y:.2f}",
+                "width": f"{width:.2f}",
+                "height": f"{height:.2f}",
+                "viewBox": " ".join(f"{v:g}" for v in box),
+                "preserveAspectRatio": "xMidYMid meet",
+            },
+        )
+        nested.extend(list(svg))
+        label = ET.SubElement(
+            group,
+            f"{{{SVG_NS}}}text",
+            {
+                "x": f"{x + width / 2:.2f}",
+                "y": f"{MARGIN_PX + row_height + 20:.2f}",
+                "text-anchor": "middle",
+                "font-size": "14",
+            },
+        )
+        label.text = uav["designation"]
+        span_label = ET.SubElement(
+            group,
+            f"{{{SVG_NS}}}text",
+            {
+                "x": f"{x + width / 2:.2f}",
+                "y": f"{MARGIN_PX + row_height + 38:.2f}",
+                "text-anchor": "middle",
+                "font-size": "12",
+                "fill": "#6b7280",
+            },
+        )
+        span_label.text = _format_meters(span)
+        x += width + GAP_PX
+
+    _scale_bar(doc, scale, items[0][1], MARGIN_PX + row_height + LABEL_PX + 16)
+    return ET.tostring(doc, encoding="unicode")
+
+
+def _scale_bar(doc: ET.Element, scale: float, largest_span: float, y: float) -> None:
+    """Append a round-length scale bar with end ticks and a label."""
+    meters = nice_length(largest_span / 2)
+    length = meters * scale
+    x0, x1 = float(MARGIN_PX), MARGIN_PX + length
+    bar = ET.SubElement(
+        doc,
+        f"{{{SVG_NS}}}g",
+        {"stroke": FILL, "stroke-width": "2", "data-scale-bar-meters": f"{meters:g}"},
+    )
+    ET.SubElement(
+        bar,
+        f"{{{SVG_NS}}}line",
+        {"x1": f"{x0:.2f}", "y1": f"{y:.2f}", "x2": f"{x1:.2f}", "y2": f"{y:.2f}"},
+    )
+    for tick in (x0, x1):
+        ET.SubElement(
+            bar,
+            f"{{{SVG_NS}}}line",
+            {"x1": f"{tick:.2f}", "y1": f"{y - 6:.2f}", "x2": f"{tick:.2f}", "y2": f"{y + 6:.2f}"},
+        )
+    text = ET.SubElement(
+        doc,
+        f"{{{SVG_NS}}}text",
+        {"x": f"{x1 + 10:.2f}", "y": f"{y + 5:.2f}", "font-size": "13", "fill": FILL},
+    )
+    text.text = _format_meters(meters)
+
+
+def svg_to_png(svg: str) -> bytes:
+    """
+    Rasterize an SVG document.
+
+    Raises:
+        RenderUnavailableError: If cairosvg isn't installed
+    """
+    try:
+        import cairosvg
+    except (ImportError, OSError) as e:
+        raise RenderUnavailableError(
+            "PNG output requires the 'render' extra (cairosvg and the cairo library)"
+        ) from e
+    return cairosvg.svg2png(bytestring=svg.encode("utf-8"))
+
+
+class SilhouetteRenderer:
+    """
+    Renders silhouette comparisons through an LRU cache.
+
+    Keys are (sorted designations, format, snapshot generation), so the
+    order designations are requested in doesn't matter and a reloaded
+    catalog never serves a stale render.
+    """
+
+    def __init__(self, max_size: int = 256, max_width: int = 1600):
+        """
+        Initialize renderer.
+
+        Args:
+            max_size (int): Maximum number of cached renders
+            max_width (int): Target width of composited images in pixels
+        """
+        self.cache = LRUCache("silhouettes", max_size)
+        self.max_width = max_width
+
+    def render(
+        self,
+        uavs: List[Dict[str, Any]],
+        fmt: str = "svg",
+        generation: int = 0,
+    ) -> Render:
+        """
+        Render (or fetch from cache) a comparison of the given UAVs.
+
+        Args:
+            uavs (List[Dict[str, Any]]): UAV records to compare
+            fmt (str): "svg" or "png"
+            generation (int): Snapshot generation the records come from
+
+        Returns:
+            Render: Encoded image with media type and ETag
+        """
+        key = (tuple(sorted(u["designation"] for u in uavs)), fmt, generation)
+
+        def build() -> Render:
+            svg = compose_svg(uavs, max_width=self.max_width)
+            if fmt == "png":
+                return Render(svg_to_png(svg), MEDIA_TYPES["png"])
+            return Render(svg.encode("utf-8"), MEDIA_TYPES["svg"])
+
+        return self.cache.get_or_compute(key, build)
+
+
+# Global renderer
+renderer = SilhouetteRenderer(settings.SILHOUETTE_CACHE_SIZE, settings.SILHOUETTE_MAX_WIDTH)
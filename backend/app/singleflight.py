@@ -0,0 +1,153 @@
+"""
+Single-flight call coalescing for X-UAV database queries.
+
+When many clients ask for the same thing at once (the UI's first load after
+a deploy or a cache invalidation), identical concurrent calls share one
+execution: the first caller runs the query, the rest wait for it and
+receive the same result (or exception). Nothing is cached; a call that
+starts after the leader finished runs again.
+"""
+
+import threading
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .metrics import DB_COALESCED_CALLS
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    Turn call arguments into a hashable key (lists become tuples, dicts sorted items).
+
+    Args:
+        value (Any): Argument value
+
+    Returns:
+        Hashable: Equivalent hashable value
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, set):
+        return frozenset(freeze(v) for v in value)
+    return value
+
+
+class _Call:
+    """One in-flight execution and its outcome."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time; concurrent callers share its outcome.
+
+    Example:
+        flights = SingleFlight()
+        stats, shared = flights.do(("get_stats",), load_stats)
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run fn, or wait for the identical call already running.
+
+        Args:
+            key (Hashable): Identifies identical calls
+            fn (Callable[[], Any]): The call
+
+        Returns:
+            Tuple[Any, bool]: fn's result (shared by every coalesced caller, so
+                treat it as read-only) and whether it came from another caller
+
+        Raises:
+            BaseException: Whatever fn raised, re-raised in every caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        """Number of calls currently running."""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dict[str, int]: Executions, calls that shared one, and calls in flight
+        """
+        with self._lock:
+            return {
+                "executions": self.executions,
+                "shared": self.shared,
+                "in_flight": len(self._calls),
+            }
+
+
+def coalesced(method: Callable) -> Callable:
+    """
+    Decorate a Database method so identical concurrent calls run once.
+
+    The key is the method name and its (frozen) arguments. Calls inside a
+    Database.session() are not coalesced, since they must read through the
+    session's own connection. Coalesced followers don't count as queries
+    in the timed_query metrics; apply this decorator outside timed_query.
+
+    Args:
+        method (Callable): Database method
+
+    Returns:
+        Callable: Wrapped method
+    """
+    name = method.__name__
+    shared = DB_COALESCED_CALLS.labels(name)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.coalesce or self._session.get() is not None:
+            return method(self, *args, **kwargs)
+        key = (name, freeze(args), freeze(kwargs))
+        result, was_shared = self.flights.do(key, lambda: method(self, *args, **kwargs))
+        if was_shared:
+            shared.inc()
+        return result
+
+    return wrapper
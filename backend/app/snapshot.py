@@ -0,0 +1,336 @@
+"""
+In-memory catalog snapshot for X-UAV backend.
+
+Loads the UAV and armament catalog once per process and serves reads from
+memory. UAVs are held in a ColumnarTable (NumPy columns, dictionary-encoded
+strings) rather than one dict per row. The snapshot is reloaded when the
+database file is replaced, and its generation number increases each time,
+so caches can key on it.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Sequence
+
+from .config import settings
+from .database import Database, db
+from .metrics import CATALOG_GENERATION, SNAPSHOT_LOAD_LATENCY, record_cache_lookup
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .columnar import ColumnarTable
+
+# Measurements compared (on a log scale) to find similar airframes
+SIMILARITY_FEATURES = (
+    "wingspan_meters",
+    "length_meters",
+    "max_takeoff_weight_kg",
+    "max_speed_kmh",
+    "range_km",
+    "endurance_hours",
+    "service_ceiling_meters",
+)
+SIMILARITY_MIN_SHARED = 3
+
+
+class CatalogSnapshot:
+    """
+    Immutable view of the catalog at one point in time.
+
+    Attributes:
+        generation: Process-local snapshot number (starts at 1)
+        catalog_generation: Generation recorded in the database by the loader
+            (same in every process; 0 without change tracking)
+        fingerprint: Database file fingerprint the snapshot was loaded from
+        loaded_at: Unix time the snapshot was loaded
+        uavs: All UAVs ordered by designation (rows are read-only mappings)
+        armaments: All armament records ordered by weapon type and designation
+    """
+
+    def __init__(
+        self,
+        generation: int,
+        fingerprint: Optional[tuple],
+        uavs: "ColumnarTable",
+        armaments: List[Dict[str, Any]],
+        catalog_generation: int = 0,
+    ):
+        """
+        Initialize snapshot.
+
+        Args:
+            generation (int): Snapshot number
+            fingerprint (Optional[tuple]): Database file fingerprint
+            uavs (ColumnarTable): UAV table keyed by designation
+            armaments (List[Dict[str, Any]]): Armament records
+            catalog_generation (int): Loader generation of the database
+        """
+        self.generation = generation
+        self.catalog_generation = catalog_generation
+        self.fingerprint = fingerprint
+        self.loaded_at = time.time()
+        self.uavs = uavs
+        self.armaments = armaments
+        self.uavs_by_designation = uavs.by_key
+        self.armaments_by_designation = {a["designation"]: a for a in armaments}
+        self._features: Optional["np.ndarray"] = None
+        self._numeric: Dict[str, "np.ndarray"] = {}
+
+    def search_uavs(
+        self,
+        country: Optional[str] = None,
+        uav_type: Optional[str] = None,
+        status: Optional[str] = None,
+        nato_class: Optional[str] = None,
+        mission_type: Optional[str] = None,
+        operator: Optional[str] = None,
+    ) -> "np.ndarray":
+        """
+        Filter UAVs like Database.search_uavs.
+
+        Args:
+            country (Optional[str]): Exact country of origin
+            uav_type (Optional[str]): Substring of the UAV type
+            status (Optional[str]): Exact operational status
+            nato_class (Optional[str]): Exact NATO class
+            mission_type (Optional[str]): Exact entry of mission_types
+            operator (Optional[str]): Exact entry of operators
+
+        Returns:
+            np.ndarray: Matching row numbers ordered by designation
+        """
+        import numpy as np
+
+        mask = np.ones(len(self.uavs), dtype=bool)
+        if country:
+            mask &= self.uavs.equals("country_of_origin", country)
+        if uav_type:
+            mask &= self.uavs.contains("type", uav_type)
+        if status:
+            mask &= self.uavs.equals("operational_status", status)
+        if nato_class:
+            mask &= self.uavs.equals("nato_class", nato_class)
+        if mission_type:
+            mask &= self.uavs.contains_element("mission_types", mission_type)
+        if operator:
+            mask &= self.uavs.contains_element("operators", operator)
+        return np.flatnonzero(mask)
+
+    def compare_uavs(self, designations: Sequence[str]) -> "np.ndarray":
+        """
+        Rows of the given UAVs, like Database.compare_uavs.
+
+        Args:
+            designations (Sequence[str]): UAV designations (unknown ones are skipped)
+
+        Returns:
+            np.ndarray: Row numbers ordered by designation
+        """
+        return self.uavs.rows_for_keys(designations)
+
+    def similar_uavs(self, designation: str, limit: int = 5) -> tuple:
+        """
+        Nearest airframes by size, weight and performance.
+
+        Distance is the RMS difference of standardized log measurements over
+        the features both UAVs have (at least SIMILARITY_MIN_SHARED).
+
+        Args:
+            designation (str): UAV to match
+            limit (int): Maximum number of results
+
+        Returns:
+            tuple: (row numbers, distances), closest first
+
+        Raises:
+            KeyError: If the UAV is not in the snapshot
+        """
+        import numpy as np
+
+        row = self.uavs.row_index[designation]
+        features = self._feature_matrix()
+        diff = features - features[row]
+        shared = np.count_nonzero(~np.isnan(diff), axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            distance = np.sqrt(np.nansum(diff * diff, axis=1) / shared)
+        distance[shared < SIMILARITY_MIN_SHARED] = np.inf
+        distance[row] = np.inf
+        order = np.argsort(distance, kind="stable")[:limit]
+        order = order[np.isfinite(distance[order])]
+        return order, distance[order]
+
+    def numeric_array(self, name: str) -> "np.ndarray":
+        """
+        A numeric UAV column as float64 with NaN for missing values.
+
+        Built once per snapshot and shared by the analysis endpoints; treat
+        the result as read-only.
+
+        Args:
+            name (str): Numeric column name
+
+        Returns:
+            np.ndarray: One value per UAV row
+
+        Raises:
+            KeyError: If the column doesn't exist
+            ValueError: If the column isn't numeric
+        """
+        import numpy as np
+
+        array = self._numeric.get(name)
+        if array is None:
+            column = self.uavs.columns[name]
+            if name not in self.uavs.numeric_columns():
+                raise ValueError(f"'{name}' is not a numeric UAV field")
+            array = column.values.astype(np.float64)
+            if column.valid is not None:
+                array[~column.valid] = np.nan
+            array.flags.writeable = False
+            self._numeric[name] = array
+        return array
+
+    def _feature_matrix(self) -> "np.ndarray":
+        """Standardized log1p(SIMILARITY_FEATURES), NaN where missing; built on first use."""
+        import numpy as np
+
+        if self._features is None:
+            columns = []
+            for name in SIMILARITY_FEATURES:
+                column = self.uavs.columns[name]
+                values = np.log1p(np.maximum(column.values.astype(np.float64), 0.0))
+                if column.valid is not None:
+                    values[~column.valid] = np.nan
+                present = values[~np.isnan(values)]
+                if present.size:
+                    spread = present.std() or 1.0
+                    values = (values - present.mean()) / spread
+                columns.append(values)
+            self._features = np.column_stack(columns)
+        return self._features
+
+
+class SnapshotCache:
+    """
+    Holds the current CatalogSnapshot and reloads it when the database changes.
+
+    The database file fingerprint is checked at most once per check_interval
+    seconds, so the hot path is a timestamp comparison.
+    """
+
+    def __init__(self, database: Database, check_interval: float = 5.0):
+        """
+        Initialize snapshot cache.
+
+        Args:
+            database (Database): Database to load from
+            check_interval (float): Minimum seconds between fingerprint checks
+        """
+        self.database = database
+        self.check_interval = check_interval
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._generation = 0
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        self._pinned: ContextVar[Optional[CatalogSnapshot]] = ContextVar(
+            "pinned_snapshot", default=None
+        )
+
+    @property
+    def generation(self) -> int:
+        """Current snapshot generation (0 before the first load)."""
+        return self._generation
+
+    @property
+    def is_warm(self) -> bool:
+        """Whether a snapshot has been loaded."""
+        return self._snapshot is not None
+
+    def current(self) -> CatalogSnapshot:
+        """
+        Get the current snapshot, loading or reloading it if needed.
+
+        Returns:
+            CatalogSnapshot: Current snapshot (the pinned one inside pinned())
+        """
+        pinned = self._pinned.get()
+        if pinned is not None:
+            return pinned
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is not None and now < self._next_check:
+            record_cache_lookup("snapshot", True)
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            fingerprint = self.database.file_fingerprint()
+            self._next_check = now + self.check_interval
+            if snapshot is not None and snapshot.fingerprint == fingerprint:
+                record_cache_lookup("snapshot", True)
+                return snapshot
+            if snapshot is not None:
+                # Reason: The file was replaced; the open handle still sees the old one
+                self.database.reopen()
+            record_cache_lookup("snapshot", False)
+            return self._load(fingerprint)
+
+    def warm(self) -> CatalogSnapshot:
+        """
+        Load the snapshot now if it isn't loaded yet.
+
+        Returns:
+            CatalogSnapshot: Current snapshot
+        """
+        return self.current()
+
+    @contextmanager
+    def pinned(self) -> Generator[CatalogSnapshot, None, None]:
+        """
+        Serve one snapshot to every current() call in this context.
+
+        Keeps the sub-queries of a bundle or batch request on the same
+        generation even if the database is replaced meanwhile.
+
+        Yields:
+            CatalogSnapshot: Pinned snapshot
+        """
+        snapshot = self.current()
+        token = self._pinned.set(snapshot)
+        try:
+            yield snapshot
+        finally:
+            self._pinned.reset(token)
+
+    def invalidate(self) -> None:
+        """Force a fingerprint check on the next access."""
+        self._next_check = 0.0
+
+    def _load(self, fingerprint: Optional[tuple]) -> CatalogSnapshot:
+        """Load a new snapshot; caller holds the lock."""
+        start = time.perf_counter()
+        # Reason: NumPy is imported with the first snapshot, not with the app
+        from .columnar import ColumnarTable
+
+        arrays, types = self.database.get_uav_columns()
+        uavs = ColumnarTable.from_numpy(arrays, types, key="designation")
+        armaments = self.database.get_all_armaments()
+        catalog_generation = self.database.get_catalog_generation()
+        self._generation += 1
+        snapshot = CatalogSnapshot(
+            self._generation, fingerprint, uavs, armaments, catalog_generation
+        )
+        self._snapshot = snapshot
+        SNAPSHOT_LOAD_LATENCY.observe(time.perf_counter() - start)
+        return snapshot
+
+
+# Global snapshot cache
+snapshots = SnapshotCache(db, settings.SNAPSHOT_CHECK_INTERVAL)
+if settings.SNAPSHOT_CACHE_ENABLED:
+    # Reason: Cached query results are valid for exactly one catalog generation
+    db.result_generation = lambda: snapshots.current().generation
+CATALOG_GENERATION.set_function(lambda: snapshots.generation)
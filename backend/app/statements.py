@@ -0,0 +1,92 @@
+"""
+Parsed-statement cache for X-UAV database queries.
+
+DuckDB parses the SQL text on every execute() call. Queries here come from
+a small set of shapes (one per filter combination), so each shape is parsed
+once into a duckdb.Statement and reused on every connection afterwards.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Hashable, Optional, Tuple, Union
+
+from .metrics import DB_STATEMENT_PARSE_LATENCY, record_cache_lookup
+
+if TYPE_CHECKING:
+    import duckdb
+
+
+class StatementCache:
+    """
+    Bounded LRU cache of parsed statements keyed by query shape.
+
+    Example:
+        cache = StatementCache(max_size=128)
+        stmt = cache.get(("search_uavs", ("country_of_origin = ?",)), build_sql)
+        conn.execute(stmt, params)
+    """
+
+    def __init__(self, max_size: int = 128):
+        """
+        Initialize statement cache.
+
+        Args:
+            max_size (int): Maximum number of cached shapes
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, duckdb.Statement]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._parser: Optional["duckdb.DuckDBPyConnection"] = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, key: Tuple[str, Hashable], sql: Union[str, Callable[[], str]]
+    ) -> "duckdb.Statement":
+        """
+        Get the parsed statement for a query shape, parsing it on first use.
+
+        Args:
+            key (Tuple[str, Hashable]): (statement name, shape) cache key
+            sql (Union[str, Callable[[], str]]): SQL text, or a builder called only on a miss
+
+        Returns:
+            duckdb.Statement: Parsed statement usable with any connection's execute()
+        """
+        with self._lock:
+            statement = self._entries.get(key)
+            if statement is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if statement is not None:
+            record_cache_lookup("statements", True)
+            return statement
+
+        text = sql() if callable(sql) else sql
+        start = time.perf_counter()
+        with self._lock:
+            if self._parser is None:
+                import duckdb
+
+                # Reason: Parsing needs no data; a private connection avoids the shared default one
+                self._parser = duckdb.connect(":memory:")
+            statement = self._parser.extract_statements(text)[0]
+        DB_STATEMENT_PARSE_LATENCY.labels(key[0]).observe(time.perf_counter() - start)
+        record_cache_lookup("statements", False)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = statement
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return statement
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached statements."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,105 @@
+"""
+Unit systems for X-UAV backend.
+
+SI fields (meters, kg, km, km/h) are canonical. Every imperial/nautical
+field is derived from one SI field by a constant factor, so a database can
+store SI only (see init_db.py --canonical-units) and the derived values are
+computed by DuckDB in the SELECT, column-at-a-time. Responses keep the
+existing field names; the `units` parameter decides which derived fields
+are included. max_speed_mach is not a unit conversion (it depends on the
+altitude it was measured at), so it is always stored and always returned.
+"""
+
+from typing import Any, Dict, FrozenSet, List, Literal, Tuple
+
+M_TO_FT = 3.28084
+KG_TO_LBS = 2.20462
+KG_JP8_TO_GALLONS = 0.3295
+KM_TO_MILES = 0.621371
+KM_TO_NM = 0.539957
+KMH_TO_MPH = 0.621371
+KMH_TO_KNOTS = 0.539957
+M_TO_IN = 39.3701
+MM_TO_IN = 0.0393701
+
+UnitSystem = Literal["metric", "imperial", "nautical", "all"]
+UNIT_SYSTEMS: Tuple[str, ...] = ("metric", "imperial", "nautical", "all")
+
+# derived field -> (SI field, factor, unit systems that include it)
+UAV_DERIVED_UNITS: Dict[str, Tuple[str, float, Tuple[str, ...]]] = {
+    "wingspan_feet": ("wingspan_meters", M_TO_FT, ("imperial",)),
+    "length_feet": ("length_meters", M_TO_FT, ("imperial",)),
+    "height_feet": ("height_meters", M_TO_FT, ("imperial",)),
+    "empty_weight_lbs": ("empty_weight_kg", KG_TO_LBS, ("imperial",)),
+    "max_takeoff_weight_lbs": ("max_takeoff_weight_kg", KG_TO_LBS, ("imperial",)),
+    "payload_capacity_lbs": ("payload_capacity_kg", KG_TO_LBS, ("imperial",)),
+    "fuel_capacity_gallons": ("fuel_capacity_kg", KG_JP8_TO_GALLONS, ("imperial",)),
+    "max_weapons_load_lbs": ("max_weapons_load_kg", KG_TO_LBS, ("imperial",)),
+    "cruise_speed_mph": ("cruise_speed_kmh", KMH_TO_MPH, ("imperial",)),
+    "cruise_speed_knots": ("cruise_speed_kmh", KMH_TO_KNOTS, ("nautical",)),
+    "max_speed_mph": ("max_speed_kmh", KMH_TO_MPH, ("imperial",)),
+    # Reason: Altitude is quoted in feet in aviation, including nautical-unit contexts
+    "service_ceiling_feet": ("service_ceiling_meters", M_TO_FT, ("imperial", "nautical")),
+    "range_miles": ("range_km", KM_TO_MILES, ("imperial",)),
+    "range_nm": ("range_km", KM_TO_NM, ("nautical",)),
+    "combat_radius_nm": ("combat_radius_km", KM_TO_NM, ("nautical",)),
+}
+
+# Armament derived field -> (SI field, factor); only checked on load, never derived
+ARMAMENT_UNIT_PAIRS: Dict[str, Tuple[str, float]] = {
+    "length_inches": ("length_meters", M_TO_IN),
+    "diameter_inches": ("diameter_mm", MM_TO_IN),
+    "wingspan_inches": ("wingspan_meters", M_TO_IN),
+    "weight_lbs": ("weight_kg", KG_TO_LBS),
+    "warhead_weight_lbs": ("warhead_weight_kg", KG_TO_LBS),
+    "range_miles": ("range_km", KM_TO_MILES),
+    "range_nm": ("range_km", KM_TO_NM),
+}
+
+# Fields to leave out of a response for each unit system
+EXCLUDED_FIELDS: Dict[str, FrozenSet[str]] = {
+    system: frozenset(
+        field for field, (_, _, systems) in UAV_DERIVED_UNITS.items() if system not in systems
+    )
+    for system in UNIT_SYSTEMS
+    if system != "all"
+}
+EXCLUDED_FIELDS["all"] = frozenset()
+
+
+def uav_select_list(alias: str = "") -> str:
+    """
+    Build the SELECT list for full UAV rows.
+
+    Stored derived values win (legacy databases return exactly what they
+    store); NULL derived values are computed from their SI field.
+
+    Args:
+        alias (str): Table alias, e.g. "u"
+
+    Returns:
+        str: "* REPLACE (...)" expression for DuckDB
+    """
+    prefix = f"{alias}." if alias else ""
+    replacements = ",\n        ".join(
+        f"CAST(COALESCE({prefix}{field}, ROUND({prefix}{si} * {factor!r}, 2)) AS DOUBLE) AS {field}"
+        for field, (si, factor, _) in UAV_DERIVED_UNITS.items()
+    )
+    return f"{prefix}* REPLACE (\n        {replacements}\n    )"
+
+
+def apply_units(records: List[Dict[str, Any]], units: str = "all") -> List[Dict[str, Any]]:
+    """
+    Drop the derived fields a unit system doesn't include.
+
+    Args:
+        records (List[Dict[str, Any]]): UAV records with every unit field
+        units (str): metric, imperial, nautical or all
+
+    Returns:
+        List[Dict[str, Any]]: Records unchanged for "all", else trimmed copies
+    """
+    excluded = EXCLUDED_FIELDS[units]
+    if not excluded:
+        return records
+    return [{k: v for k, v in record.items() if k not in excluded} for record in records]
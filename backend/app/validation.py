@@ -0,0 +1,265 @@
+"""
+Pre-load validation of X-UAV source data.
+
+Every UAV, armament and UAV-armament record is checked against its Pydantic
+schema, stored imperial/nautical values are checked against their SI field,
+and relationships are checked against the designations being loaded. Record
+checks are independent, so they run in a process pool across cores; the
+reference checks need the whole catalog and run afterwards in this process.
+init_db.py calls validate_catalog before it opens the database, so a bad
+import fails with one consolidated report and nothing written.
+"""
+
+import math
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, ValidationError
+
+from .schemas import UAV, Armament, UAVArmament
+from .units import ARMAMENT_UNIT_PAIRS, UAV_DERIVED_UNITS
+
+# Records per process-pool task, and the catalog size below which a pool costs more than it saves
+CHUNK_SIZE = 2000
+PARALLEL_MIN_RECORDS = 20000
+
+# Relative/absolute tolerance for derived units (source values are rounded, factors differ slightly)
+UNIT_REL_TOL = 0.02
+UNIT_ABS_TOL = 0.1
+
+ENTITY_SCHEMAS: Dict[str, type] = {
+    "uavs": UAV,
+    "armaments": Armament,
+    "uav_armaments": UAVArmament,
+}
+
+# entity -> derived field -> (SI field, factor)
+UNIT_PAIRS: Dict[str, Dict[str, Tuple[str, float]]] = {
+    "uavs": {field: (si, factor) for field, (si, factor, _) in UAV_DERIVED_UNITS.items()},
+    "armaments": ARMAMENT_UNIT_PAIRS,
+    "uav_armaments": {},
+}
+
+
+class DataValidationError(ValueError):
+    """Raised when source data fails validation; carries the full report."""
+
+    def __init__(self, report: "ValidationReport"):
+        super().__init__(report.summary())
+        self.report = report
+
+
+class ValidationReport:
+    """
+    Consolidated result of validating a catalog.
+
+    Issues are dicts with entity, record (designation or link key), field,
+    message and severity ("error" or "warning"). Only errors block a load.
+    """
+
+    def __init__(self, checked: Dict[str, int], issues: List[Dict[str, Any]]):
+        self.checked = checked
+        self.errors = [issue for issue in issues if issue["severity"] == "error"]
+        self.warnings = [issue for issue in issues if issue["severity"] == "warning"]
+
+    @property
+    def ok(self) -> bool:
+        """True if nothing blocks the load."""
+        return not self.errors
+
+    def summary(self, limit: int = 20) -> str:
+        """
+        Render the report for the console.
+
+        Args:
+            limit (int): Issues listed per severity before the rest are counted
+
+        Returns:
+            str: Multi-line summary
+        """
+        counts = ", ".join(f"{n} {entity}" for entity, n in self.checked.items())
+        lines = [
+            f"Validated {counts}: {len(self.errors)} errors, {len(self.warnings)} warnings"
+        ]
+        for label, issues in (("error", self.errors), ("warning", self.warnings)):
+            for issue in issues[:limit]:
+                field = f".{issue['field']}" if issue["field"] else ""
+                lines.append(
+                    f"  {label}: {issue['entity']}[{issue['record']}]{field}: {issue['message']}"
+                )
+            if len(issues) > limit:
+                lines.append(f"  ... {len(issues) - limit} more {label}s")
+        return "\n".join(lines)
+
+
+def _issue(
+    entity: str, record: str, field: Optional[str], message: str, severity: str = "error"
+) -> Dict[str, Any]:
+    """Build one report entry."""
+    return {
+        "entity": entity,
+        "record": record,
+        "field": field,
+        "message": message,
+        "severity": severity,
+    }
+
+
+def _record_key(entity: str, record: Dict[str, Any], index: int) -> str:
+    """Designation (or link key) identifying a record, falling back to its position."""
+    if entity == "uav_armaments":
+        return f"{record.get('uav_designation')}|{record.get('armament_designation')}"
+    return str(record.get("designation") or f"#{index}")
+
+
+def _rounding(value: float) -> float:
+    """Half a unit in the last decimal place written, e.g. 0.05 for 1.5."""
+    text = repr(float(value))
+    if "e" in text:
+        return 0.0
+    decimals = len(text.split(".")[1].rstrip("0"))
+    return 0.5 * 10 ** -decimals
+
+
+def _check_units(entity: str, key: str, record: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield a mismatch for each derived value that disagrees with its SI field."""
+    for field, (si_field, factor) in UNIT_PAIRS[entity].items():
+        derived, si = record.get(field), record.get(si_field)
+        if not isinstance(derived, (int, float)) or not isinstance(si, (int, float)):
+            continue
+        expected = si * factor
+        # Reason: both values are rounded (1.5 kg -> 3.3 lbs), each by up to half its last digit
+        slack = max(UNIT_ABS_TOL, _rounding(si) * factor + _rounding(derived))
+        if not math.isclose(derived, expected, rel_tol=UNIT_REL_TOL, abs_tol=slack):
+            yield _issue(
+                entity, key, field,
+                f"{derived} does not match {si_field}={si} (expected ~{expected:.4g})",
+            )
+
+
+def check_record(entity: str, record: Any, index: int = 0) -> List[Dict[str, Any]]:
+    """
+    Validate one record on its own.
+
+    Args:
+        entity (str): "uavs", "armaments" or "uav_armaments"
+        record (Any): Source record (nested fields already decoded)
+        index (int): Position in the source file, used when there's no designation
+
+    Returns:
+        List[Dict[str, Any]]: Issues found (empty if the record is clean)
+    """
+    if not isinstance(record, dict):
+        found = type(record).__name__
+        return [_issue(entity, f"#{index}", None, f"expected an object, got {found}")]
+
+    key = _record_key(entity, record, index)
+    schema: type[BaseModel] = ENTITY_SCHEMAS[entity]
+    issues: List[Dict[str, Any]] = []
+    try:
+        schema.model_validate(record)
+    except ValidationError as e:
+        for error in e.errors():
+            field = ".".join(str(part) for part in error["loc"]) or None
+            issues.append(_issue(entity, key, field, error["msg"]))
+
+    for field in sorted(set(record) - set(schema.model_fields)):
+        issues.append(_issue(entity, key, field, "unknown field, not loaded", "warning"))
+
+    issues.extend(_check_units(entity, key, record))
+    return issues
+
+
+def _check_chunk(job: Tuple[str, int, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Process-pool worker: validate a slice of one entity's records."""
+    entity, start, records = job
+    issues: List[Dict[str, Any]] = []
+    for offset, record in enumerate(records):
+        issues.extend(check_record(entity, record, start + offset))
+    return issues
+
+
+def check_references(
+    uavs: Sequence[Any], armaments: Sequence[Any], links: Sequence[Any]
+) -> List[Dict[str, Any]]:
+    """
+    Check uniqueness and UAV-armament references across the whole catalog.
+
+    Args:
+        uavs (Sequence[Any]): UAV records
+        armaments (Sequence[Any]): Armament records
+        links (Sequence[Any]): UAV-armament records
+
+    Returns:
+        List[Dict[str, Any]]: Duplicate keys and links to unknown designations
+    """
+    issues: List[Dict[str, Any]] = []
+    known: Dict[str, set] = {}
+    for entity, records in (("uavs", uavs), ("armaments", armaments), ("uav_armaments", links)):
+        records = [r for r in records if isinstance(r, dict)]
+        for field in ("id",) if entity == "uav_armaments" else ("id", "designation"):
+            counts = Counter(r.get(field) for r in records if r.get(field) is not None)
+            for value, n in counts.items():
+                if n > 1:
+                    message = f"duplicate {field} ({n} records)"
+                    issues.append(_issue(entity, str(value), field, message))
+        if entity != "uav_armaments":
+            known[entity] = {r.get("designation") for r in records}
+
+    pairs = Counter()
+    for link in links:
+        if not isinstance(link, dict):
+            continue
+        key = _record_key("uav_armaments", link, 0)
+        pairs[key] += 1
+        for field, entity in (("uav_designation", "uavs"), ("armament_designation", "armaments")):
+            value = link.get(field)
+            if value is not None and value not in known[entity]:
+                message = f"unknown {entity[:-1]} {value!r}"
+                issues.append(_issue("uav_armaments", key, field, message))
+    for key, n in pairs.items():
+        if n > 1:
+            issues.append(_issue("uav_armaments", key, None, f"duplicate link ({n} records)"))
+    return issues
+
+
+def validate_catalog(
+    uavs: Sequence[Any],
+    armaments: Sequence[Any],
+    links: Sequence[Any],
+    workers: int = 1,
+) -> ValidationReport:
+    """
+    Validate a whole catalog before it is loaded.
+
+    Records are checked in chunks of CHUNK_SIZE, in a process pool when
+    workers > 1 and there are at least PARALLEL_MIN_RECORDS of them; the
+    report is the same either way.
+
+    Args:
+        uavs (Sequence[Any]): UAV records
+        armaments (Sequence[Any]): Armament records
+        links (Sequence[Any]): UAV-armament records
+        workers (int): Worker processes (1 checks in this process)
+
+    Returns:
+        ValidationReport: Every issue found, in source order
+    """
+    entities = (("uavs", uavs), ("armaments", armaments), ("uav_armaments", links))
+    jobs = [
+        (entity, start, list(records[start:start + CHUNK_SIZE]))
+        for entity, records in entities
+        for start in range(0, len(records), CHUNK_SIZE)
+    ]
+    total = sum(len(records) for _, records in entities)
+
+    if workers > 1 and len(jobs) > 1 and total >= PARALLEL_MIN_RECORDS:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(_check_chunk, jobs, chunksize=1))
+    else:
+        results = [_check_chunk(job) for job in jobs]
+
+    issues = [issue for chunk in results for issue in chunk]
+    issues.extend(check_references(uavs, armaments, links))
+    return ValidationReport({entity: len(records) for entity, records in entities}, issues)
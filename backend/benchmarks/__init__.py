@@ -0,0 +1 @@
+"""X-UAV benchmark suite for the API and data layer."""
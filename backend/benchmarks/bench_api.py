@@ -0,0 +1,195 @@
+"""
+In-process load tests for each API route.
+
+Requests go through httpx's ASGI transport straight into the FastAPI app,
+so results measure routing, validation, serialization and the data layer
+without network noise.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import httpx
+
+from app.database import db
+from app.main import app
+from app.snapshot import snapshots
+
+from .catalog import catalog_probes
+from .harness import measure_concurrent
+
+# (name, method, path, json body)
+RouteCase = Tuple[str, str, str, Optional[Dict[str, Any]]]
+
+
+def route_cases(probes: Dict[str, Any]) -> List[RouteCase]:
+    """
+    Build one representative request per API route.
+
+    Args:
+        probes (Dict[str, Any]): Lookup values from catalog_probes()
+
+    Returns:
+        List[RouteCase]: Route cases against the synthetic catalog
+    """
+    uav = probes["uav"]
+    weapon = probes["armament"]
+    country = probes["country"]
+    return [
+        ("GET /api/health", "GET", "/api/health", None),
+        ("GET /api/stats", "GET", "/api/stats", None),
+        ("GET /api/uavs", "GET", "/api/uavs", None),
+        ("GET /api/uavs/{designation}", "GET", f"/api/uavs/{uav}", None),
+        (
+            "POST /api/uavs/compare",
+            "POST",
+            "/api/uavs/compare",
+            {"designations": probes["compare"]},
+        ),
+        ("POST /api/uavs/search", "POST", "/api/uavs/search", {"country": probes["country"]}),
+        ("GET /api/uavs/rank", "GET", "/api/uavs/rank?by=max_speed_kmh&limit=10", None),
+        (
+            "POST /api/analysis/reach",
+            "POST",
+            "/api/analysis/reach",
+            {"targets": [{"distance_km": d} for d in range(0, 2500, 50)], "loiter_hours": 2},
+        ),
+        ("GET /api/filters/countries", "GET", "/api/filters/countries", None),
+        ("GET /api/filters/types", "GET", "/api/filters/types", None),
+        ("GET /api/armaments", "GET", "/api/armaments", None),
+        ("GET /api/armaments/{designation}", "GET", f"/api/armaments/{weapon}", None),
+        (
+            "GET /api/uavs/{designation}/armaments",
+            "GET",
+            f"/api/uavs/{uav}/armaments",
+            None,
+        ),
+        (
+            "GET /api/armaments/{designation}/uavs",
+            "GET",
+            f"/api/armaments/{weapon}/uavs",
+            None,
+        ),
+        ("GET /api/filters/weapon-types", "GET", "/api/filters/weapon-types", None),
+        ("GET /api/filters/weapon-classes", "GET", "/api/filters/weapon-classes", None),
+        ("GET /api/uavs/{designation}/bundle", "GET", f"/api/uavs/{uav}/bundle", None),
+        (
+            "POST /api/batch",
+            "POST",
+            "/api/batch",
+            {
+                "requests": [
+                    {"path": f"/api/uavs/{uav}"},
+                    {"path": f"/api/uavs/{uav}/armaments"},
+                    {"method": "POST", "path": "/api/uavs/search", "body": {"country": country}},
+                ]
+            },
+        ),
+        ("GET /api/uavs/{designation}/loadouts", "GET", f"/api/uavs/{uav}/loadouts", None),
+        ("GET /api/operators", "GET", "/api/operators", None),
+        (
+            "GET /api/operators/{country}",
+            "GET",
+            f"/api/operators/{quote(probes['operator'])}",
+            None,
+        ),
+        ("GET /api/variants", "GET", "/api/variants", None),
+        ("GET /api/uavs/{designation}/variants", "GET", f"/api/uavs/{uav}/variants", None),
+        (
+            "POST /api/variants/compare",
+            "POST",
+            "/api/variants/compare",
+            {"designations": probes["variants"]},
+        ),
+        (
+            "GET /api/analytics/distribution",
+            "GET",
+            "/api/analytics/distribution?field=range_km&group_by=type",
+            None,
+        ),
+        (
+            "GET /api/analysis/pareto",
+            "GET",
+            "/api/analysis/pareto?maximize=endurance_hours,payload_capacity_kg"
+            "&minimize=unit_cost_usd",
+            None,
+        ),
+        (
+            "POST /api/capabilities/search",
+            "POST",
+            "/api/capabilities/search",
+            {
+                "uav": [{"field": "endurance_hours", "op": "gt", "value": 10}],
+                "armament": [{"field": "weapon_type", "op": "eq", "value": probes["weapon_type"]}],
+            },
+        ),
+        ("GET /api/changes", "GET", "/api/changes?since=0", None),
+        (
+            "GET /api/silhouettes/compare",
+            "GET",
+            f"/api/silhouettes/compare?designations={','.join(probes['compare'][:4])}",
+            None,
+        ),
+    ]
+
+
+def use_catalog(db_path: Path) -> None:
+    """
+    Point the app at another catalog file.
+
+    The snapshot is re-checked on the next request and cached query results
+    are dropped, so no request is served from the previous catalog.
+
+    Args:
+        db_path (Path): Catalog database to serve
+    """
+    db.db_path = db_path
+    db.reopen()
+    snapshots.invalidate()
+    if db.results is not None:
+        db.results.clear()
+
+
+async def run_api_benchmarks(
+    db_path: Path,
+    size: int,
+    requests: int = 200,
+    concurrency: int = 8,
+    max_seconds: float = 5.0,
+) -> List[Dict[str, Any]]:
+    """
+    Load-test every route against one catalog.
+
+    Args:
+        db_path (Path): Synthetic catalog database
+        size (int): Catalog size (number of UAVs), recorded in results
+        requests (int): Maximum requests per route
+        concurrency (int): Concurrent in-flight requests
+        max_seconds (float): Time budget per route
+
+    Returns:
+        List[Dict[str, Any]]: One result record per route
+
+    Raises:
+        RuntimeError: If a route does not return 200
+    """
+    original_path = db.db_path
+    use_catalog(db_path)
+    results = []
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for name, method, path, body in route_cases(catalog_probes(db_path)):
+
+                async def call(method=method, path=path, body=body, name=name):
+                    response = await client.request(method, path, json=body)
+                    if response.status_code != 200:
+                        raise RuntimeError(f"{name} returned {response.status_code}")
+
+                stats = await measure_concurrent(call, requests, concurrency, max_seconds)
+                results.append({"suite": "api", "size": size, "name": name, **stats})
+                print(f"   [api {size:>7}] {name:<36} p50={stats['p50_ms']:>10.3f}ms")
+    finally:
+        use_catalog(original_path)
+    return results
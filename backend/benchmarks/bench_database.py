@@ -0,0 +1,77 @@
+"""
+Micro-benchmarks for each Database method.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from app.database import Database
+
+from .catalog import catalog_probes
+from .harness import measure
+
+
+def database_cases(
+    database: Database, probes: Dict[str, Any]
+) -> List[Tuple[str, Callable[[], Any]]]:
+    """
+    Build one representative call per Database method.
+
+    Args:
+        database (Database): Database pointed at a synthetic catalog
+        probes (Dict[str, Any]): Lookup values from catalog_probes()
+
+    Returns:
+        List[Tuple[str, Callable[[], Any]]]: (name, zero-argument call) pairs
+    """
+    uav = probes["uav"]
+    weapon = probes["armament"]
+    compare_set = probes["compare"]
+    country = probes["country"]
+    uav_type = probes["uav_type"]
+    return [
+        ("get_all_uavs", database.get_all_uavs),
+        ("get_uav_by_designation", lambda: database.get_uav_by_designation(uav)),
+        ("compare_uavs", lambda: database.compare_uavs(compare_set)),
+        ("search_uavs[country]", lambda: database.search_uavs(country=country)),
+        (
+            "search_uavs[country,type,status]",
+            lambda: database.search_uavs(country=country, uav_type=uav_type, status="Active"),
+        ),
+        ("get_countries", database.get_countries),
+        ("get_types", database.get_types),
+        ("get_stats", database.get_stats),
+        ("get_all_armaments", database.get_all_armaments),
+        ("get_armament_by_designation", lambda: database.get_armament_by_designation(weapon)),
+        (
+            "search_armaments[weapon_type]",
+            lambda: database.search_armaments(weapon_type=probes["weapon_type"]),
+        ),
+        ("get_armaments_for_uav", lambda: database.get_armaments_for_uav(uav)),
+        ("get_uavs_for_armament", lambda: database.get_uavs_for_armament(weapon)),
+        ("get_weapon_types", database.get_weapon_types),
+        ("get_weapon_classes", database.get_weapon_classes),
+    ]
+
+
+def run_database_benchmarks(
+    db_path: Path, size: int, max_seconds: float = 2.0
+) -> List[Dict[str, Any]]:
+    """
+    Micro-benchmark every Database method against one catalog.
+
+    Args:
+        db_path (Path): Synthetic catalog database
+        size (int): Catalog size (number of UAVs), recorded in results
+        max_seconds (float): Time budget per method
+
+    Returns:
+        List[Dict[str, Any]]: One result record per method
+    """
+    database = Database(db_path)
+    results = []
+    for name, call in database_cases(database, catalog_probes(db_path)):
+        stats = measure(call, max_seconds=max_seconds)
+        results.append({"suite": "database", "size": size, "name": name, **stats})
+        print(f"   [db  {size:>7}] {name:<36} p50={stats['p50_ms']:>10.3f}ms")
+    return results
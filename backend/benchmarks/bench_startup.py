@@ -0,0 +1,148 @@
+"""
+Cold-start benchmarks for the API process.
+
+Each sample is a fresh interpreter that imports app.main and sends its
+first requests straight into the ASGI app, so results cover module import,
+first-request latency, the first catalog read (snapshot load) and the
+OpenAPI document as served from the on-disk cache.
+
+Import time is only measured here, from outside the app, so app.main
+keeps a plain import block; run `python -X importtime -c "import app.main"`
+for a per-module breakdown.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .catalog import BACKEND_ROOT, catalog_probes
+from .harness import summarize
+
+COLD_START = "cold start (import + first request)"
+
+# Runs in the child interpreter; argv[1] is a JSON list of [name, path]
+CHILD_SCRIPT = r"""
+import asyncio, json, sys, time
+started = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+
+
+async def get(path):
+    messages = []
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "query_string": b"", "root_path": "", "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 0), "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    t0 = time.perf_counter()
+    await app(scope, receive, send)
+    return messages[0]["status"], time.perf_counter() - t0
+
+
+async def main():
+    timings = {"import": imported - started}
+    for name, path in json.loads(sys.argv[1]):
+        status, seconds = await get(path)
+        if status != 200:
+            raise SystemExit(f"{path} returned {status}")
+        timings[name] = seconds
+    print(json.dumps(timings))
+
+
+asyncio.run(main())
+"""
+
+
+def startup_cases(probes: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    First requests sent by every cold process, in order.
+
+    Args:
+        probes (Dict[str, Any]): Lookup values from catalog_probes()
+
+    Returns:
+        List[Tuple[str, str]]: (name, path) pairs
+    """
+    return [
+        ("first request", "/api/health/live"),
+        ("first catalog request", f"/api/uavs/{probes['uav']}"),
+        ("openapi (cached)", "/openapi.json"),
+    ]
+
+
+def run_cold_process(
+    db_path: Path, cases: List[Tuple[str, str]], cache_dir: Path
+) -> Dict[str, float]:
+    """
+    Start one interpreter, import the app and time its first requests.
+
+    Args:
+        db_path (Path): Catalog database
+        cases (List[Tuple[str, str]]): (name, path) requests to send
+        cache_dir (Path): OpenAPI cache directory
+
+    Returns:
+        Dict[str, float]: Seconds per phase ("import" plus one per case)
+
+    Raises:
+        RuntimeError: If the child fails or a request isn't 200
+    """
+    env = dict(os.environ, DATABASE_PATH=str(db_path), OPENAPI_CACHE_DIR=str(cache_dir))
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT, json.dumps(cases)],
+        cwd=BACKEND_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Startup benchmark process failed: {result.stderr.strip()[-500:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run_startup_benchmarks(db_path: Path, size: int, runs: int = 5) -> List[Dict[str, Any]]:
+    """
+    Measure cold starts against one catalog.
+
+    Args:
+        db_path (Path): Synthetic catalog database
+        size (int): Catalog size (number of UAVs), recorded in results
+        runs (int): Cold processes to sample
+
+    Returns:
+        List[Dict[str, Any]]: One result record per phase, plus COLD_START
+    """
+    cases = startup_cases(catalog_probes(db_path))
+    samples: Dict[str, List[float]] = {}
+    with tempfile.TemporaryDirectory(prefix="xuav-openapi-") as cache_dir:
+        # Reason: The first process fills the OpenAPI cache, like a deploy's first worker
+        run_cold_process(db_path, cases, Path(cache_dir))
+        started = time.perf_counter()
+        for _ in range(max(1, runs)):
+            timings = run_cold_process(db_path, cases, Path(cache_dir))
+            timings[COLD_START] = timings["import"] + timings["first request"]
+            for name, seconds in timings.items():
+                samples.setdefault(name, []).append(seconds)
+        wall = time.perf_counter() - started
+
+    results = []
+    for name, values in samples.items():
+        stats = summarize(values, wall)
+        stats.pop("ops_per_sec")
+        results.append({"suite": "startup", "size": size, "name": name, **stats})
+        print(f"   [startup {size:>7}] {name:<36} p50={stats['p50_ms']:>10.3f}ms")
+    return results
@@ -0,0 +1,116 @@
+"""
+Synthetic catalog builder for benchmarks.
+
+Creates DuckDB files from the real db/schema.sql using the deterministic
+generator in scripts/generate_catalog.py, caches them per size, and picks
+representative probe values (designations, filter values) for the suites.
+"""
+
+import hashlib
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import duckdb
+
+BACKEND_ROOT = Path(__file__).parent.parent
+SCHEMA_PATH = BACKEND_ROOT / "db" / "schema.sql"
+GENERATOR_PATH = BACKEND_ROOT / "scripts" / "generate_catalog.py"
+
+# Reason: scripts/ is not a package; its modules import each other by name
+sys.path.insert(0, str(BACKEND_ROOT / "scripts"))
+
+from generate_catalog import CatalogSpec, populate_database  # noqa: E402
+
+
+def build_catalog(db_path: Path, n_uavs: int, n_armaments: int, seed: int = 42) -> Path:
+    """
+    Create a synthetic catalog database.
+
+    Args:
+        db_path (Path): Output DuckDB file (overwritten)
+        n_uavs (int): Number of UAV rows
+        n_armaments (int): Number of armament rows
+        seed (int): Generator seed
+
+    Returns:
+        Path: Path to the created database
+    """
+    spec = CatalogSpec(n_uavs=n_uavs, n_armaments=n_armaments, seed=seed)
+    return populate_database(db_path, spec, SCHEMA_PATH)
+
+
+def ensure_catalog(cache_dir: Path, n_uavs: int) -> Path:
+    """
+    Get a cached synthetic catalog, building it on first use.
+
+    Args:
+        cache_dir (Path): Directory holding generated catalogs
+        n_uavs (int): Number of UAVs (armaments scale as n_uavs / 10, minimum 20)
+
+    Returns:
+        Path: Path to the catalog database
+    """
+    # Reason: Key on schema and generator so changes never reuse stale catalogs
+    digest = hashlib.sha256(SCHEMA_PATH.read_bytes() + GENERATOR_PATH.read_bytes())
+    db_path = cache_dir / f"catalog-{n_uavs}-{digest.hexdigest()[:12]}.duckdb"
+    if not db_path.exists():
+        build_catalog(db_path, n_uavs, max(20, n_uavs // 10))
+    return db_path
+
+
+def catalog_probes(db_path: Path) -> Dict[str, Any]:
+    """
+    Pick representative lookup values from a catalog.
+
+    Args:
+        db_path (Path): Catalog database
+
+    Returns:
+        Dict[str, Any]: uav, compare (10 designations), armament, country,
+        uav_type, weapon_type, operator (country with the largest fleet) and
+        variants (up to 5 variant designations)
+    """
+    conn = duckdb.connect(str(db_path), read_only=True)
+    try:
+        compare = [row[0] for row in conn.execute(
+            "SELECT designation FROM uavs ORDER BY id LIMIT 10"
+        ).fetchall()]
+        # The armed UAV with the most integrations exercises the joins
+        uav, armament = conn.execute(
+            """
+            SELECT uav_designation, min(armament_designation)
+            FROM uav_armaments
+            GROUP BY uav_designation
+            ORDER BY count(*) DESC, uav_designation
+            LIMIT 1
+            """
+        ).fetchone() or (compare[0], None)
+        country = conn.execute(
+            "SELECT country_of_origin FROM uavs GROUP BY 1 ORDER BY count(*) DESC LIMIT 1"
+        ).fetchone()[0]
+        uav_type = conn.execute(
+            "SELECT type FROM uavs GROUP BY 1 ORDER BY count(*) DESC LIMIT 1"
+        ).fetchone()[0]
+        weapon_type = conn.execute(
+            "SELECT weapon_type FROM armaments GROUP BY 1 ORDER BY count(*) DESC LIMIT 1"
+        ).fetchone()[0]
+        operator = conn.execute(
+            "SELECT country FROM country_fleets ORDER BY uav_count DESC, country LIMIT 1"
+        ).fetchone()
+        variants = [row[0] for row in conn.execute(
+            "SELECT designation FROM uav_variants ORDER BY designation LIMIT 5"
+        ).fetchall()]
+    finally:
+        conn.close()
+
+    return {
+        "uav": uav,
+        "compare": compare,
+        "armament": armament,
+        "country": country,
+        "uav_type": uav_type,
+        "weapon_type": weapon_type,
+        "operator": operator[0] if operator else country,
+        "variants": variants,
+    }
@@ -0,0 +1,112 @@
+"""
+Timing helpers shared by the benchmark suites.
+"""
+
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+
+def summarize(samples: List[float], wall_seconds: float) -> Dict[str, Any]:
+    """
+    Summarize latency samples.
+
+    Args:
+        samples (List[float]): Per-operation latencies in seconds
+        wall_seconds (float): Wall-clock time spent producing the samples
+
+    Returns:
+        Dict[str, Any]: Iterations, throughput and latency percentiles in milliseconds
+    """
+    ordered = sorted(samples)
+    n = len(ordered)
+
+    def pct(p: float) -> float:
+        return ordered[min(n - 1, int(p * n))] * 1000
+
+    return {
+        "iterations": n,
+        "ops_per_sec": round(n / wall_seconds, 2) if wall_seconds > 0 else None,
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 4),
+        "min_ms": round(ordered[0] * 1000, 4),
+        "p50_ms": round(pct(0.50), 4),
+        "p95_ms": round(pct(0.95), 4),
+        "p99_ms": round(pct(0.99), 4),
+        "max_ms": round(ordered[-1] * 1000, 4),
+    }
+
+
+def measure(
+    fn: Callable[[], Any],
+    min_iterations: int = 5,
+    max_iterations: int = 200,
+    max_seconds: float = 2.0,
+    warmup: int = 1,
+) -> Dict[str, Any]:
+    """
+    Time a synchronous callable repeatedly.
+
+    Stops after max_iterations, or after max_seconds once min_iterations ran.
+
+    Args:
+        fn (Callable[[], Any]): Operation to time
+        min_iterations (int): Minimum timed runs
+        max_iterations (int): Maximum timed runs
+        max_seconds (float): Time budget for timed runs
+        warmup (int): Untimed runs before measuring
+
+    Returns:
+        Dict[str, Any]: Summary from summarize()
+    """
+    for _ in range(warmup):
+        fn()
+
+    samples: List[float] = []
+    started = time.perf_counter()
+    while len(samples) < max_iterations:
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+        if len(samples) >= min_iterations and time.perf_counter() - started > max_seconds:
+            break
+    return summarize(samples, time.perf_counter() - started)
+
+
+async def measure_concurrent(
+    fn: Callable[[], Awaitable[Any]],
+    total: int,
+    concurrency: int,
+    max_seconds: float = 5.0,
+) -> Dict[str, Any]:
+    """
+    Drive an async operation from several concurrent workers.
+
+    Args:
+        fn (Callable[[], Awaitable[Any]]): Operation to time (one request)
+        total (int): Maximum number of operations across all workers
+        concurrency (int): Number of concurrent workers
+        max_seconds (float): Time budget; workers stop issuing new operations after it
+
+    Returns:
+        Dict[str, Any]: Summary from summarize() plus the concurrency level
+    """
+    import asyncio
+
+    samples: List[float] = []
+    remaining = total
+    started = time.perf_counter()
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0 and time.perf_counter() - started < max_seconds:
+            remaining -= 1
+            t0 = time.perf_counter()
+            await fn()
+            samples.append(time.perf_counter() - t0)
+
+    await fn()  # warmup
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result = summarize(samples, time.perf_counter() - started)
+    result["concurrency"] = concurrency
+    return result
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Benchmark runner for X-UAV.
+
+Builds synthetic catalogs, runs the data-layer, API and cold-start suites,
+writes the results as JSON and optionally compares them with an earlier run.
+Cold starts over the startup budget fail the run even without a baseline.
+
+Usage (from backend/):
+    uv run python -m benchmarks.run --sizes 100,10000,100000
+    uv run python -m benchmarks.run --sizes 100 --compare benchmarks/results/old.json
+    uv run python -m benchmarks.run --sizes 1000 --suite startup --startup-budget-ms 1000
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import duckdb
+
+from .bench_api import run_api_benchmarks
+from .bench_database import run_database_benchmarks
+from .bench_startup import COLD_START, run_startup_benchmarks
+from .catalog import ensure_catalog
+
+BENCH_ROOT = Path(__file__).parent
+DEFAULT_CACHE_DIR = BENCH_ROOT / ".catalogs"
+DEFAULT_RESULTS_DIR = BENCH_ROOT / "results"
+
+
+def git_revision() -> str:
+    """
+    Get the current git commit, if available.
+
+    Returns:
+        str: Short commit hash, or "unknown"
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCH_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[Dict[str, Any]]:
+    """
+    Find benchmarks whose median latency regressed.
+
+    Args:
+        baseline (Dict[str, Any]): Earlier results document
+        current (Dict[str, Any]): New results document
+        threshold (float): Allowed relative slowdown (0.2 = 20%)
+
+    Returns:
+        List[Dict[str, Any]]: Regressions with baseline/current p50 and ratio
+    """
+    def key(r: Dict[str, Any]) -> tuple:
+        return (r["suite"], r["size"], r["name"])
+
+    before = {key(r): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in current.get("results", []):
+        old = before.get(key(result))
+        if old is None or not old.get("p50_ms"):
+            continue
+        ratio = result["p50_ms"] / old["p50_ms"]
+        if ratio > 1 + threshold:
+            regressions.append({
+                "suite": result["suite"],
+                "size": result["size"],
+                "name": result["name"],
+                "baseline_p50_ms": old["p50_ms"],
+                "current_p50_ms": result["p50_ms"],
+                "ratio": round(ratio, 3),
+            })
+    return regressions
+
+
+def over_startup_budget(results: List[Dict[str, Any]], budget_ms: float) -> List[Dict[str, Any]]:
+    """
+    Find cold starts whose median exceeds the startup budget.
+
+    Args:
+        results (List[Dict[str, Any]]): Result records
+        budget_ms (float): Allowed p50 of import + first request, in milliseconds
+
+    Returns:
+        List[Dict[str, Any]]: Offending startup records
+    """
+    return [
+        r for r in results
+        if r["suite"] == "startup" and r["name"] == COLD_START and r["p50_ms"] > budget_ms
+    ]
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Run X-UAV benchmarks")
+    parser.add_argument(
+        "--sizes", default="100,10000,100000",
+        help="Comma-separated catalog sizes (number of UAVs)",
+    )
+    parser.add_argument(
+        "--suite", choices=["all", "database", "api", "startup"], default="all",
+        help="Which suite to run",
+    )
+    parser.add_argument("--requests", type=int, default=200, help="Max requests per route")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent API requests")
+    parser.add_argument(
+        "--max-seconds", type=float, default=2.0, help="Time budget per benchmark"
+    )
+    parser.add_argument(
+        "--startup-runs", type=int, default=5, help="Cold processes per catalog size"
+    )
+    parser.add_argument(
+        "--startup-budget-ms", type=float, default=1500.0,
+        help="Maximum p50 of import + first request before failing",
+    )
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--output", type=Path, default=None, help="Results JSON path")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline results JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2,
+        help="Allowed p50 slowdown vs. baseline before failing (0.2 = 20%%)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Main entry point for the benchmark runner.
+
+    Returns:
+        int: Exit code (0 for success, 1 if regressions were found or startup is over budget)
+    """
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    revision = git_revision()
+
+    results: List[Dict[str, Any]] = []
+    for size in sizes:
+        print(f"\n📦 Catalog with {size} UAVs")
+        db_path = ensure_catalog(args.cache_dir, size)
+        if args.suite in ("all", "database"):
+            results.extend(run_database_benchmarks(db_path, size, args.max_seconds))
+        if args.suite in ("all", "api"):
+            results.extend(asyncio.run(run_api_benchmarks(
+                db_path, size, args.requests, args.concurrency, args.max_seconds
+            )))
+        if args.suite in ("all", "startup"):
+            results.extend(run_startup_benchmarks(db_path, size, args.startup_runs))
+
+    document = {
+        "meta": {
+            "git_revision": revision,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "duckdb": duckdb.__version__,
+            "platform": platform.platform(),
+            "sizes": sizes,
+        },
+        "results": results,
+    }
+
+    stamp = int(datetime.now().timestamp())
+    output = args.output or DEFAULT_RESULTS_DIR / f"bench-{revision}-{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    print(f"\n✅ Results written to {output}")
+
+    failed = False
+    for r in over_startup_budget(results, args.startup_budget_ms):
+        print(
+            f"\n❌ [startup {r['size']}] cold start p50 {r['p50_ms']}ms "
+            f"exceeds the {args.startup_budget_ms:g}ms budget"
+        )
+        failed = True
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare_results(baseline, document, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) vs {args.compare}:")
+            for r in regressions:
+                print(
+                    f"   [{r['suite']} {r['size']}] {r['name']}: "
+                    f"{r['baseline_p50_ms']}ms -> {r['current_p50_ms']}ms (x{r['ratio']})"
+                )
+            return 1
+        print(f"\n✅ No regressions vs {args.compare}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
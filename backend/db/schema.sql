@@ -2,8 +2,13 @@
 -- UAV Comparison Application
 -- Created: 2025-11-18
 -- Updated: 2025-11-20 - Added armaments database and UAV variants
+-- Lists, maps and records use native LIST/MAP/STRUCT types (not JSON text),
+-- so they can be filtered in SQL (list_contains) and read without parsing.
 
 -- Drop existing tables if they exist
+DROP TABLE IF EXISTS country_fleets;
+DROP TABLE IF EXISTS uav_operators;
+DROP TABLE IF EXISTS uav_variants;
 DROP TABLE IF EXISTS uav_armaments;
 DROP TABLE IF EXISTS armaments;
 DROP TABLE IF EXISTS uavs;
@@ -68,15 +73,15 @@ CREATE TABLE uavs (
 
     -- Mission Capabilities
     primary_function TEXT,
-    mission_types JSON,
-    armament JSON,
+    mission_types VARCHAR[],
+    armament VARCHAR[],                -- compatible armament designations
     max_weapons_load_kg DECIMAL(8,2),
     max_weapons_load_lbs DECIMAL(8,2),
     hardpoints INTEGER,
     internal_weapons_bays BOOLEAN DEFAULT false,
 
     -- Sensors & Avionics
-    sensor_suite JSON,
+    sensor_suite VARCHAR[],
     radar_type VARCHAR(100),
     communications VARCHAR(200),
     datalink_type VARCHAR(100),
@@ -84,8 +89,8 @@ CREATE TABLE uavs (
     autonomy_level VARCHAR(50),
 
     -- Operational Details
-    operators JSON,
-    export_countries JSON,
+    operators VARCHAR[],
+    export_countries VARCHAR[],
     crew_size_remote INTEGER,
     ground_control_station VARCHAR(200),
     launch_method VARCHAR(100),
@@ -97,15 +102,38 @@ CREATE TABLE uavs (
     fiscal_year INTEGER,
 
     -- Visual Assets
-    imagery_urls JSON,
+    imagery_urls MAP(VARCHAR, VARCHAR),        -- view -> URL
     silhouette_url VARCHAR(500),
-    model_urls JSON,
+    model_urls MAP(VARCHAR, VARCHAR),          -- LOD -> URL
     scale_factor INTEGER DEFAULT 100,
+    -- view -> derivatives manifest entry (scripts/build_images.py)
+    image_derivatives MAP(VARCHAR, STRUCT(
+        source VARCHAR,
+        source_hash VARCHAR,
+        width INTEGER,
+        height INTEGER,
+        thumbnail MAP(VARCHAR, VARCHAR),
+        variants STRUCT(width INTEGER, height INTEGER, format VARCHAR, url VARCHAR, bytes BIGINT)[]
+    )),
 
     -- Additional Information
-    notable_features JSON,
+    notable_features VARCHAR[],
     combat_history TEXT,
-    variants JSON,
+    -- Performance fields a variant leaves NULL are the airframe's (see uav_variants)
+    variants STRUCT(
+        designation VARCHAR,
+        name VARCHAR,
+        description VARCHAR,
+        max_takeoff_weight_kg DOUBLE,
+        max_speed_kmh DOUBLE,
+        cruise_speed_kmh DOUBLE,
+        service_ceiling_meters DOUBLE,
+        range_km DOUBLE,
+        combat_radius_km DOUBLE,
+        endurance_hours DOUBLE,
+        max_weapons_load_kg DOUBLE,
+        hardpoints INTEGER
+    )[],
     notes TEXT,
 
     -- Metadata
@@ -207,7 +235,7 @@ CREATE TABLE armaments (
     engine_model VARCHAR(100),
 
     -- Launch Parameters
-    launch_platform_types JSON,        -- ['Fixed-Wing', 'Rotary-Wing', 'Ground', 'Naval']
+    launch_platform_types VARCHAR[],   -- ['Fixed-Wing', 'Rotary-Wing', 'Ground', 'Naval']
     min_launch_altitude_ft INTEGER,
     max_launch_altitude_ft INTEGER,
     launch_weight_kg DECIMAL(8,2),
@@ -220,8 +248,8 @@ CREATE TABLE armaments (
     operational_status VARCHAR(50) DEFAULT 'Active',
 
     -- Additional Info
-    variants JSON,
-    notable_features JSON,
+    variants STRUCT(designation VARCHAR, name VARCHAR, description VARCHAR)[],
+    notable_features VARCHAR[],
     combat_history TEXT,
     notes TEXT,
 
@@ -240,6 +268,8 @@ CREATE TABLE uav_armaments (
     integration_status VARCHAR(50),    -- 'Operational', 'Tested', 'Planned', 'Experimental'
     integration_date DATE,
     notes TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     UNIQUE(uav_designation, armament_designation)
 );
 
@@ -253,6 +283,78 @@ CREATE INDEX idx_armaments_country ON armaments(country_of_origin);
 CREATE INDEX idx_uav_armaments_uav ON uav_armaments(uav_designation);
 CREATE INDEX idx_uav_armaments_armament ON uav_armaments(armament_designation);
 
+-- =====================================================
+-- VARIANTS
+-- =====================================================
+
+-- One row per entry of uavs.variants, built by the loader. Performance
+-- fields the variant doesn't give are copied from its airframe.
+CREATE TABLE uav_variants (
+    uav_designation VARCHAR(20) NOT NULL,
+    designation VARCHAR(50) NOT NULL,
+    name VARCHAR(100),
+    description TEXT,
+    max_takeoff_weight_kg DECIMAL(8,2),
+    max_speed_kmh DECIMAL(8,2),
+    cruise_speed_kmh DECIMAL(8,2),
+    service_ceiling_meters DECIMAL(8,2),
+    range_km DECIMAL(8,2),
+    combat_radius_km DECIMAL(8,2),
+    endurance_hours DECIMAL(5,2),
+    max_weapons_load_kg DECIMAL(8,2),
+    hardpoints INTEGER,
+    overrides VARCHAR[],               -- performance fields the variant itself specifies
+    PRIMARY KEY (uav_designation, designation)
+);
+
+CREATE INDEX idx_uav_variants_designation ON uav_variants(designation);
+
+-- =====================================================
+-- OPERATORS
+-- =====================================================
+
+-- Inverted index of uavs.operators / uavs.export_countries, built by the loader
+CREATE TABLE uav_operators (
+    country VARCHAR(100) NOT NULL,
+    uav_designation VARCHAR(20) NOT NULL,
+    relation VARCHAR(10) NOT NULL,     -- 'operator' or 'export'
+    PRIMARY KEY (country, uav_designation, relation)
+);
+
+CREATE INDEX idx_uav_operators_uav ON uav_operators(uav_designation);
+
+-- Fleet per country (operated or received, by either relation), built by the loader
+CREATE TABLE country_fleets (
+    country VARCHAR(100) PRIMARY KEY,
+    uav_count INTEGER NOT NULL,        -- distinct UAVs in the country's fleet
+    domestic INTEGER NOT NULL,         -- of those, designed in the country
+    imported INTEGER NOT NULL,         -- of those, designed elsewhere
+    suppliers VARCHAR[] NOT NULL,      -- origin countries of imported UAVs
+    exported INTEGER NOT NULL,         -- the country's own designs in other fleets
+    customers VARCHAR[] NOT NULL,      -- countries fielding its designs
+    designations VARCHAR[] NOT NULL
+);
+
+-- Change tracking, kept across reloads (not dropped above).
+-- Each load is one generation; the loader keeps created_at/updated_at of
+-- unchanged rows and records deleted rows as tombstones.
+CREATE TABLE IF NOT EXISTS catalog_generations (
+    generation INTEGER PRIMARY KEY,
+    loaded_at TIMESTAMP NOT NULL,      -- created_at/updated_at of rows changed by this load
+    inserted INTEGER,
+    updated INTEGER,
+    deleted INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS catalog_tombstones (
+    entity VARCHAR(20) NOT NULL,       -- 'uavs', 'armaments', 'uav_armaments'
+    key VARCHAR(100) NOT NULL,         -- designation, or 'UAV|ARMAMENT' for links
+    generation INTEGER NOT NULL,       -- generation that deleted the row
+    deleted_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_catalog_tombstones_generation ON catalog_tombstones(generation);
+
 -- Create armament summary view
 CREATE OR REPLACE VIEW armament_summary AS
 SELECT
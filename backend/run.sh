@@ -14,6 +14,12 @@ if [ ! -f "data_db/uavs.duckdb" ]; then
     echo ""
 fi
 
+# Production mode: preloaded multi-worker server
+if [ "$1" = "--prod" ]; then
+    echo "🌐 Starting production server (gunicorn, preloaded workers) on http://localhost:7676"
+    ENVIRONMENT=production exec uv run --extra prod gunicorn -c gunicorn.conf.py app.main:app
+fi
+
 # Start the server
 echo "🌐 Starting FastAPI server on http://localhost:7676"
 echo "📚 API Documentation: http://localhost:7676/docs"
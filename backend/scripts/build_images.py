@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Build image derivatives for every UAV's imagery_urls.
+
+Renders a thumbnail and responsive widths in AVIF/WebP (plus a JPEG/PNG
+fallback) with content-hashed filenames, in parallel across cores. Sources
+whose content hash is unchanged since the last run are skipped. Writes the
+manifest to frontend/public/assets/images/derivatives.json.
+
+The database is only read (read-only, so it is safe while the API is up).
+init_db.py records the derivative URLs in uavs.image_derivatives when it
+rebuilds the catalog, so the change gets a new catalog generation and shows
+up in /api/changes; --rebuild runs it right after the build.
+
+Usage (from backend/):
+    uv run --extra images python scripts/build_images.py
+    uv run --extra images python scripts/build_images.py --designation MQ-9 --force
+    uv run --extra images python scripts/build_images.py --rebuild
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import duckdb
+
+# Reason: scripts/ is not a package; the pipeline lives in the app package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config import settings  # noqa: E402
+from app.images import build_derivatives, load_manifest, manifest_path, save_manifest  # noqa: E402
+from init_db import main as rebuild_catalog  # noqa: E402
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Build X-UAV image derivatives")
+    parser.add_argument(
+        "--db", type=Path, default=settings.database_path_absolute, help="DuckDB file to read"
+    )
+    parser.add_argument(
+        "--assets", type=Path, default=settings.assets_path_absolute, help="Assets root directory"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Worker processes"
+    )
+    parser.add_argument(
+        "--widths", default=settings.IMAGE_WIDTHS, help="Comma-separated responsive widths"
+    )
+    parser.add_argument(
+        "--thumbnail-width",
+        type=int,
+        default=settings.IMAGE_THUMBNAIL_WIDTH,
+        help="Thumbnail width",
+    )
+    parser.add_argument(
+        "--formats", default=settings.IMAGE_FORMATS, help="Comma-separated modern formats"
+    )
+    parser.add_argument(
+        "--designation", action="append", help="Only this UAV (repeatable)"
+    )
+    parser.add_argument("--force", action="store_true", help="Rebuild unchanged images too")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Run init_db.py afterwards to apply the manifest"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entry point for the derivative build.
+
+    Returns:
+        int: Exit code (0 for success, 1 if the database is missing or the rebuild failed)
+    """
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if not args.db.exists():
+        print(f"❌ Database not found: {args.db}")
+        return 1
+
+    # Reason: Read-only, so a running API's handle doesn't block it (and isn't blocked)
+    conn = duckdb.connect(str(args.db), read_only=True)
+    try:
+        sql = "SELECT designation, imagery_urls FROM uavs WHERE imagery_urls IS NOT NULL"
+        params: list = []
+        if args.designation:
+            sql += " AND designation = ANY(?)"
+            params.append(args.designation)
+        rows = conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+    sources = [url for _, urls in rows for url in urls.values()]
+    print(f"🖼️  {len(sources)} source images across {len(rows)} UAVs")
+
+    path = manifest_path(args.assets)
+    manifest = load_manifest(path)
+    start = time.perf_counter()
+    entries, report = build_derivatives(
+        sources,
+        previous=manifest,
+        workers=args.workers,
+        widths=[int(w) for w in args.widths.split(",") if w.strip()],
+        thumbnail_width=args.thumbnail_width,
+        formats=args.formats.split(","),
+        assets_root=args.assets,
+        force=args.force,
+    )
+    elapsed = time.perf_counter() - start
+    print(
+        f"✅ Built {len(report['built'])}, skipped {len(report['skipped'])} unchanged, "
+        f"{len(report['missing'])} missing in {elapsed:.1f}s"
+    )
+
+    manifest.update(entries)
+    save_manifest(path, manifest)
+    print(f"📍 Manifest: {path}")
+    if args.rebuild:
+        print("\n🔁 Rebuilding the catalog to record the derivatives...")
+        return rebuild_catalog(["--workers", str(args.workers)])
+    print("💡 Run scripts/init_db.py (or pass --rebuild) to record them in the catalog")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
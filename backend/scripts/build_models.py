@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Build 3D model LODs for the catalog's model_urls.
+
+For every source model (frontend/models-src/{designation}.glb, lowercase),
+generates decimated levels of detail with geometry and texture compression
+using the glTF-Transform CLI, names them by content hash, writes
+frontend/public/assets/models/manifest.json (byte sizes, vertex/triangle
+counts and bounding boxes per LOD). init_db.py points model_urls at them
+when it rebuilds the catalog, so the change gets a new catalog generation
+and shows up in /api/changes; --rebuild runs it right after the build. The
+database is only read, so the script is safe while the API is up.
+
+Models are built in parallel (each LOD is a gltf-transform subprocess);
+models whose source and build options are unchanged since the last run
+are skipped.
+
+Requires Node.js and the glTF-Transform CLI: `npm install -g @gltf-transform/cli`,
+or set GLTF_TRANSFORM to the command to run (default falls back to npx).
+
+Usage (from backend/):
+    uv run python scripts/build_models.py
+    uv run python scripts/build_models.py --designation MQ-9 --force
+    uv run python scripts/build_models.py --rebuild
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import duckdb
+
+# Reason: scripts/ is not a package; GLB inspection lives in the app package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.assets import asset_url, resolve_asset  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.gltf import inspect_glb  # noqa: E402
+from init_db import get_project_root  # noqa: E402
+from init_db import main as rebuild_catalog  # noqa: E402
+
+MANIFEST_VERSION = 1
+
+# model_urls key -> (file suffix, fraction of triangles kept)
+LOD_LEVELS: Dict[str, tuple] = {
+    "high_poly": ("high", 1.0),
+    "medium_poly": ("medium", 0.5),
+    "low_poly": ("low", 0.15),
+}
+SIMPLIFY_ERROR = 0.001
+
+Transformer = Callable[[Path, Path, float], None]
+
+
+def gltf_transform_command() -> List[str]:
+    """
+    Find the glTF-Transform CLI.
+
+    Returns:
+        List[str]: Command prefix (GLTF_TRANSFORM, gltf-transform on PATH, or npx)
+    """
+    if os.environ.get("GLTF_TRANSFORM"):
+        return shlex.split(os.environ["GLTF_TRANSFORM"])
+    local = get_project_root() / "frontend" / "node_modules" / ".bin" / "gltf-transform"
+    for candidate in (shutil.which("gltf-transform"), local):
+        if candidate and Path(candidate).exists():
+            return [str(candidate)]
+    return ["npx", "--yes", "@gltf-transform/cli"]
+
+
+def cli_transformer(compress: str = "meshopt", texture_compress: str = "webp") -> Transformer:
+    """
+    Build a transformer that runs `gltf-transform optimize`.
+
+    Args:
+        compress (str): Geometry compression (meshopt, draco, quantize)
+        texture_compress (str): Texture compression (webp, avif, ktx2, false)
+
+    Returns:
+        Transformer: Callable(source, destination, ratio)
+    """
+    tool = gltf_transform_command()
+
+    def transform(source: Path, destination: Path, ratio: float) -> None:
+        command = tool + [
+            "optimize", str(source), str(destination),
+            "--compress", compress,
+            "--texture-compress", texture_compress,
+        ]
+        if ratio < 1.0:
+            command += [
+                "--simplify", "true",
+                "--simplify-ratio", str(ratio),
+                "--simplify-error", str(SIMPLIFY_ERROR),
+            ]
+        else:
+            command += ["--simplify", "false"]
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            output = result.stderr.strip() or result.stdout.strip()
+            raise RuntimeError(f"gltf-transform failed for {source.name}: {output}")
+
+    return transform
+
+
+def file_hash(path: Path, length: int = 16) -> str:
+    """Truncated SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()[:length]
+
+
+def build_model(
+    designation: str,
+    source: Path,
+    assets_root: Path,
+    transform: Transformer,
+    levels: Dict[str, tuple],
+) -> Dict[str, Any]:
+    """
+    Build every LOD of one model.
+
+    Args:
+        designation (str): UAV designation
+        source (Path): Source .glb
+        assets_root (Path): Directory asset URLs resolve against
+        transform (Transformer): Produces one LOD file
+        levels (Dict[str, tuple]): model_urls key -> (suffix, ratio)
+
+    Returns:
+        Dict[str, Any]: Manifest entry with per-LOD url, bytes, counts and bounding box
+    """
+    slug = designation.lower()
+    out_dir = assets_root / "assets" / "models" / slug
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    lods = {}
+    for key, (suffix, ratio) in levels.items():
+        tmp = out_dir / f".{slug}-{suffix}.{os.getpid()}.tmp.glb"
+        try:
+            transform(source, tmp, ratio)
+            final = out_dir / f"{slug}-{suffix}.{file_hash(tmp, 12)}.glb"
+            os.replace(tmp, final)
+        finally:
+            tmp.unlink(missing_ok=True)
+        lods[key] = {"url": asset_url(final, assets_root), "ratio": ratio, **inspect_glb(final)}
+    return {"source_hash": file_hash(source), "lods": lods}
+
+
+def _is_current(
+    entry: Optional[Dict[str, Any]], source_hash: str, options: str, assets_root: Path
+) -> bool:
+    """Whether an entry was built from this source with these options and its files exist."""
+    if not entry or entry.get("source_hash") != source_hash or entry.get("options") != options:
+        return False
+    return all(resolve_asset(lod["url"], assets_root) for lod in entry["lods"].values())
+
+
+def build_models(
+    sources: Dict[str, Path],
+    previous: Optional[Dict[str, Dict[str, Any]]] = None,
+    assets_root: Optional[Path] = None,
+    transform: Optional[Transformer] = None,
+    options: Sequence[Any] = ("meshopt", "webp"),
+    levels: Optional[Dict[str, tuple]] = None,
+    workers: int = 4,
+    force: bool = False,
+) -> tuple:
+    """
+    Build LODs for many models in parallel, skipping unchanged ones.
+
+    Args:
+        sources (Dict[str, Path]): Source .glb per designation
+        previous (Optional[Dict[str, Dict[str, Any]]]): Earlier manifest entries
+        assets_root (Optional[Path]): Directory asset URLs resolve against
+        transform (Optional[Transformer]): LOD producer (default: gltf-transform CLI)
+        options (Sequence[Any]): Build options that invalidate old outputs when changed
+        levels (Optional[Dict[str, tuple]]): model_urls key -> (suffix, ratio)
+        workers (int): Models built concurrently
+        force (bool): Rebuild unchanged models too
+
+    Returns:
+        tuple: (entries by designation, {"built": [...], "skipped": [...], "failed": {...}})
+    """
+    assets_root = (assets_root or settings.assets_path_absolute).resolve()
+    previous = previous or {}
+    levels = levels or LOD_LEVELS
+    transform = transform or cli_transformer(*options)
+    fingerprint = hashlib.sha256(
+        json.dumps([list(options), levels, SIMPLIFY_ERROR], sort_keys=True).encode()
+    ).hexdigest()[:16]
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    report: Dict[str, Any] = {"built": [], "skipped": [], "failed": {}}
+    pending = {}
+    for designation, source in sorted(sources.items()):
+        if not force and _is_current(
+            previous.get(designation), file_hash(source), fingerprint, assets_root
+        ):
+            entries[designation] = previous[designation]
+            report["skipped"].append(designation)
+        else:
+            pending[designation] = source
+
+    # Reason: Each LOD is a separate gltf-transform process, so threads give real parallelism
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            designation: pool.submit(
+                build_model, designation, source, assets_root, transform, levels
+            )
+            for designation, source in pending.items()
+        }
+        for designation, future in futures.items():
+            try:
+                entry = future.result()
+            except Exception as e:
+                report["failed"][designation] = str(e)
+                continue
+            entry["source"] = sources[designation].name
+            entry["options"] = fingerprint
+            entries[designation] = entry
+            report["built"].append(designation)
+    return entries, report
+
+
+def manifest_path(assets_root: Path) -> Path:
+    """Location of the model manifest under the assets root."""
+    return assets_root / "assets" / "models" / "manifest.json"
+
+
+def load_manifest(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Load manifest entries by designation (empty if missing)."""
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("models", {})
+
+
+def save_manifest(path: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+    """Write manifest entries atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        manifest = {"version": MANIFEST_VERSION, "models": dict(sorted(entries.items()))}
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, path)
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Build X-UAV 3D model LODs")
+    parser.add_argument(
+        "--db", type=Path, default=settings.database_path_absolute, help="DuckDB file to read"
+    )
+    parser.add_argument(
+        "--sources",
+        type=Path,
+        default=get_project_root() / "frontend" / "models-src",
+        help="Directory of source models named {designation}.glb (lowercase)",
+    )
+    parser.add_argument(
+        "--assets", type=Path, default=settings.assets_path_absolute, help="Assets root directory"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Models built at once"
+    )
+    parser.add_argument(
+        "--compress",
+        default="meshopt",
+        choices=["meshopt", "draco", "quantize"],
+        help="Geometry compression",
+    )
+    parser.add_argument(
+        "--texture-compress",
+        default="webp",
+        choices=["webp", "avif", "ktx2", "false"],
+        help="Texture compression",
+    )
+    parser.add_argument("--designation", action="append", help="Only this UAV (repeatable)")
+    parser.add_argument("--force", action="store_true", help="Rebuild unchanged models too")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Run init_db.py afterwards to apply the manifest"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entry point for the model build.
+
+    Returns:
+        int: Exit code (0 for success, 1 on a missing database, failed model or failed rebuild)
+    """
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if not args.db.exists():
+        print(f"❌ Database not found: {args.db}")
+        return 1
+
+    # Reason: Read-only, so a running API's handle doesn't block it (and isn't blocked)
+    conn = duckdb.connect(str(args.db), read_only=True)
+    try:
+        designations = [row[0] for row in conn.execute("SELECT designation FROM uavs").fetchall()]
+    finally:
+        conn.close()
+    if args.designation:
+        designations = [d for d in designations if d in set(args.designation)]
+    sources = {
+        d: args.sources / f"{d.lower()}.glb"
+        for d in designations
+        if (args.sources / f"{d.lower()}.glb").is_file()
+    }
+    print(f"🧊 {len(sources)} source models in {args.sources}")
+
+    path = manifest_path(args.assets.resolve())
+    manifest = load_manifest(path)
+    start = time.perf_counter()
+    entries, report = build_models(
+        sources,
+        previous=manifest,
+        assets_root=args.assets,
+        options=(args.compress, args.texture_compress),
+        workers=args.workers,
+        force=args.force,
+    )
+    print(
+        f"✅ Built {len(report['built'])}, skipped {len(report['skipped'])} unchanged "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+    for designation, error in report["failed"].items():
+        print(f"❌ {designation}: {error}")
+
+    manifest.update(entries)
+    save_manifest(path, manifest)
+    print(f"📍 Manifest: {path}")
+    if report["failed"]:
+        return 1
+    if args.rebuild:
+        print("\n🔁 Rebuilding the catalog to point model_urls at the LODs...")
+        return rebuild_catalog(["--workers", str(args.workers)])
+    print("💡 Run scripts/init_db.py (or pass --rebuild) to point model_urls at them")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,769 @@
+#!/usr/bin/env python3
+"""
+Synthetic catalog generator for X-UAV scale testing.
+
+Produces deterministic, realistic UAV, armament and UAV-armament records
+at arbitrary scale. Records use the same shape as data/*.json, so they can
+be written out as JSON files or bulk-loaded straight into a DuckDB file
+through init_db.py.
+
+Usage (from backend/):
+    uv run python scripts/generate_catalog.py --uavs 100000 --db data_db/synthetic.duckdb
+    uv run python scripts/generate_catalog.py --uavs 500 --json-dir /tmp/catalog
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import duckdb
+
+# Reason: scripts/ is not a package; unit definitions live in the app package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.units import (  # noqa: E402
+    KG_JP8_TO_GALLONS,
+    KG_TO_LBS,
+    KM_TO_MILES,
+    KM_TO_NM,
+    KMH_TO_KNOTS,
+    KMH_TO_MPH,
+    M_TO_FT,
+    UAV_DERIVED_UNITS,
+)
+from init_db import (  # noqa: E402
+    build_operator_index,
+    build_variant_index,
+    bulk_insert_json,
+    capture_row_state,
+    get_project_root,
+    load_schema,
+    record_changes,
+    remove_database,
+)
+
+# Reason: Mach depends on altitude, so it is not one of the app's unit factors
+KMH_TO_MACH = 1 / 1225.0
+
+# Ordered roughly by real catalog share; weighting favours the front
+COUNTRY_POOL = [
+    "United States",
+    "China",
+    "Israel",
+    "Turkey",
+    "Russia",
+    "Iran",
+    "United Kingdom",
+    "France",
+    "India",
+    "Germany",
+    "Italy",
+    "South Korea",
+    "Pakistan",
+    "United Arab Emirates",
+    "Australia",
+    "Japan",
+    "Ukraine",
+    "Spain",
+    "Sweden",
+    "Brazil",
+    "South Africa",
+    "Poland",
+    "Canada",
+    "Taiwan",
+    "Saudi Arabia",
+    "Indonesia",
+    "Egypt",
+    "Belarus",
+    "Serbia",
+    "Greece",
+]
+
+STATUS_POOL = [
+    "Active",
+    "In Development",
+    "Retired",
+    "Testing",
+    "Limited Production",
+    "Prototype",
+    "Experimental",
+    "Cancelled",
+]
+
+# Per-type size and performance envelopes: (low, high) ranges
+TYPE_PROFILES: Dict[str, Dict[str, Any]] = {
+    "MALE UCAV": {
+        "prefix": "MQ",
+        "wingspan": (12, 26),
+        "mtow": (1000, 6000),
+        "cruise": (180, 400),
+        "ceiling": (7000, 15000),
+        "endurance": (18, 42),
+        "range": (1500, 12000),
+        "engine": "Turboprop",
+        "hardpoints": (2, 9),
+        "airframe": "Fixed-wing",
+        "missions": ["ISR", "Strike", "CAS", "Target Acquisition"],
+    },
+    "MALE ISR": {
+        "prefix": "RQ",
+        "wingspan": (10, 20),
+        "mtow": (600, 4000),
+        "cruise": (150, 300),
+        "ceiling": (6000, 12000),
+        "endurance": (16, 40),
+        "range": (1000, 8000),
+        "engine": "Piston",
+        "hardpoints": (0, 2),
+        "airframe": "Fixed-wing",
+        "missions": ["ISR", "Surveillance", "Reconnaissance", "SIGINT"],
+    },
+    "HALE ISR": {
+        "prefix": "RQ",
+        "wingspan": (25, 45),
+        "mtow": (4000, 15000),
+        "cruise": (300, 650),
+        "ceiling": (15000, 20000),
+        "endurance": (24, 40),
+        "range": (10000, 25000),
+        "engine": "Turbofan",
+        "hardpoints": (0, 0),
+        "airframe": "Fixed-wing",
+        "missions": ["ISR", "Surveillance", "SIGINT", "Communications Relay"],
+    },
+    "UCAV": {
+        "prefix": "XQ",
+        "wingspan": (8, 20),
+        "mtow": (3000, 20000),
+        "cruise": (500, 950),
+        "ceiling": (10000, 15000),
+        "endurance": (4, 12),
+        "range": (1500, 6000),
+        "engine": "Turbofan",
+        "hardpoints": (2, 8),
+        "airframe": "Flying wing",
+        "missions": ["Strike", "SEAD", "Air Superiority", "ISR"],
+    },
+    "Tactical": {
+        "prefix": "TQ",
+        "wingspan": (3, 10),
+        "mtow": (50, 600),
+        "cruise": (90, 200),
+        "ceiling": (3000, 7000),
+        "endurance": (6, 20),
+        "range": (100, 1500),
+        "engine": "Piston",
+        "hardpoints": (0, 2),
+        "airframe": "Fixed-wing",
+        "missions": ["ISR", "Target Acquisition", "Artillery Spotting"],
+    },
+    "Loitering Munition": {
+        "prefix": "LM",
+        "wingspan": (1, 4),
+        "mtow": (3, 250),
+        "cruise": (80, 250),
+        "ceiling": (1500, 5000),
+        "endurance": (0.5, 9),
+        "range": (10, 2500),
+        "engine": "Electric",
+        "hardpoints": (0, 0),
+        "airframe": "Fixed-wing",
+        "missions": ["Strike", "SEAD", "Anti-Armor"],
+    },
+    "Mini UAV": {
+        "prefix": "SQ",
+        "wingspan": (0.8, 4),
+        "mtow": (1, 25),
+        "cruise": (40, 100),
+        "ceiling": (500, 4500),
+        "endurance": (0.5, 4),
+        "range": (5, 60),
+        "engine": "Electric",
+        "hardpoints": (0, 0),
+        "airframe": "Fixed-wing",
+        "missions": ["Reconnaissance", "Surveillance"],
+    },
+    "VTOL Tactical": {
+        "prefix": "VQ",
+        "wingspan": (2, 10),
+        "mtow": (20, 3000),
+        "cruise": (80, 220),
+        "ceiling": (2500, 6000),
+        "endurance": (2, 12),
+        "range": (50, 1000),
+        "engine": "Turboshaft",
+        "hardpoints": (0, 4),
+        "airframe": "Rotary-wing",
+        "missions": ["ISR", "Maritime Patrol", "Anti-Submarine Warfare"],
+    },
+    "Target Drone": {
+        "prefix": "BQ",
+        "wingspan": (1.5, 5),
+        "mtow": (50, 1000),
+        "cruise": (300, 900),
+        "ceiling": (5000, 15000),
+        "endurance": (0.5, 2),
+        "range": (100, 800),
+        "engine": "Turbojet",
+        "hardpoints": (0, 0),
+        "airframe": "Fixed-wing",
+        "missions": ["Target", "Training"],
+    },
+}
+
+SENSOR_POOL = [
+    "EO/IR Turret",
+    "Synthetic Aperture Radar",
+    "GMTI Radar",
+    "SIGINT Package",
+    "ELINT Suite",
+    "Laser Designator",
+    "Laser Rangefinder",
+    "Maritime Search Radar",
+    "LIDAR",
+    "Hyperspectral",
+]
+
+# Weapon families: (weapon_type, weapon_class, guidance, weight range kg, range range km)
+WEAPON_FAMILIES: List[Tuple[str, str, str, Tuple[float, float], Tuple[float, float]]] = [
+    ("Missile", "Air-to-Ground", "Semi-Active Laser", (20, 60), (5, 15)),
+    ("Missile", "Anti-Tank", "Semi-Active Laser", (15, 55), (4, 10)),
+    ("Missile", "Air-to-Ground", "IR", (30, 120), (8, 30)),
+    ("Missile", "Air-to-Air", "IR", (80, 120), (10, 40)),
+    ("Missile", "Air-to-Ground", "MMW Radar", (45, 60), (8, 20)),
+    ("Bomb", "Precision Guided", "GPS/INS", (100, 1000), (10, 30)),
+    ("Bomb", "Precision Guided", "Laser", (200, 1000), (8, 25)),
+    ("Bomb", "Air-to-Ground", "GPS/INS", (50, 130), (40, 110)),
+    ("Rocket", "Air-to-Ground", "Laser", (10, 20), (1, 11)),
+    ("Gun Pod", "Air-to-Ground", "Unguided", (100, 400), (1, 3)),
+]
+WEAPON_PREFIX = {"Missile": "AGM", "Bomb": "GBU", "Rocket": "APKWS", "Gun Pod": "GPU"}
+
+INTEGRATION_STATUSES = ["Operational", "Operational", "Operational", "Tested", "Planned"]
+
+# Fields that stay populated regardless of null density
+REQUIRED_UAV_FIELDS = {
+    "id",
+    "designation",
+    "name",
+    "country_of_origin",
+    "type",
+    "operational_status",
+}
+
+# Fields that go missing together with their base field (unit twins)
+UNIT_TWINS = {
+    "wingspan_meters": ("wingspan_feet",),
+    "length_meters": ("length_feet",),
+    "height_meters": ("height_feet",),
+    "empty_weight_kg": ("empty_weight_lbs",),
+    "max_takeoff_weight_kg": ("max_takeoff_weight_lbs",),
+    "payload_capacity_kg": ("payload_capacity_lbs",),
+    "fuel_capacity_kg": ("fuel_capacity_gallons",),
+    "cruise_speed_kmh": ("cruise_speed_mph", "cruise_speed_knots"),
+    "max_speed_kmh": ("max_speed_mph", "max_speed_mach"),
+    "service_ceiling_meters": ("service_ceiling_feet",),
+    "range_km": ("range_miles", "range_nm"),
+    "combat_radius_km": ("combat_radius_nm",),
+    "max_weapons_load_kg": ("max_weapons_load_lbs",),
+}
+
+# Fields that are missing more often than average in real source data
+SPARSE_UAV_FIELDS = {
+    "program_cost_usd",
+    "radar_type",
+    "combat_radius_km",
+    "thrust_hp",
+    "thrust_lbs",
+    "stealth_features",
+    "combat_history",
+}
+
+
+@dataclass
+class CatalogSpec:
+    """
+    Configuration for a synthetic catalog.
+
+    Attributes:
+        n_uavs: Number of UAV records
+        n_armaments: Number of armament records
+        countries: Number of distinct countries of origin
+        types: Number of distinct UAV types
+        statuses: Number of distinct operational statuses
+        null_density: Probability that an optional field is null
+        seed: Random seed; equal specs produce identical catalogs
+    """
+
+    n_uavs: int = 1000
+    n_armaments: int = 100
+    countries: int = 12
+    types: int = 6
+    statuses: int = 4
+    null_density: float = 0.15
+    seed: int = 42
+
+
+def _pool(base: Sequence[str], cardinality: int, label: str) -> List[str]:
+    """
+    Take `cardinality` values from a pool, synthesizing extras if needed.
+
+    Args:
+        base (Sequence[str]): Realistic values, most common first
+        cardinality (int): Number of distinct values wanted
+        label (str): Prefix for synthesized values
+
+    Returns:
+        List[str]: Distinct values
+    """
+    values = list(base[:cardinality])
+    for i in range(len(values), cardinality):
+        values.append(f"{label} {i + 1}")
+    return values
+
+
+def _zipf_weights(n: int, exponent: float = 1.1) -> List[float]:
+    """Weights making the first values of a pool the most common."""
+    return [1.0 / (rank**exponent) for rank in range(1, n + 1)]
+
+
+class CatalogGenerator:
+    """
+    Deterministic generator for synthetic catalog records.
+
+    Example:
+        generator = CatalogGenerator(CatalogSpec(n_uavs=10000, seed=7))
+        armaments = list(generator.armaments())
+        for uav, links in generator.uavs(armaments):
+            ...
+    """
+
+    def __init__(self, spec: CatalogSpec):
+        """
+        Initialize generator.
+
+        Args:
+            spec (CatalogSpec): Catalog configuration
+        """
+        self.spec = spec
+        self.countries = _pool(COUNTRY_POOL, spec.countries, "Country")
+        self.country_weights = _zipf_weights(len(self.countries))
+        type_names = list(TYPE_PROFILES)
+        self.types = _pool(type_names, spec.types, "Type")
+        self.statuses = _pool(STATUS_POOL, spec.statuses, "Status")
+        # Reason: Real catalogs are dominated by active airframes
+        self.status_weights = _zipf_weights(len(self.statuses), 1.6)
+
+    def _maybe(self, rng: random.Random, value: Any, weight: float = 1.0) -> Any:
+        """Return None with probability null_density * weight, else value."""
+        return None if rng.random() < self.spec.null_density * weight else value
+
+    def armaments(self) -> Iterator[Dict[str, Any]]:
+        """
+        Generate armament records.
+
+        Yields:
+            Dict[str, Any]: Armament record shaped like data/armaments.json
+        """
+        rng = random.Random(f"{self.spec.seed}-armaments")
+        for i in range(self.spec.n_armaments):
+            weapon_type, weapon_class, guidance, weight, reach = WEAPON_FAMILIES[
+                i % len(WEAPON_FAMILIES)
+            ]
+            weight_kg = round(rng.uniform(*weight), 1)
+            range_km = round(rng.uniform(*reach), 1)
+            record = {
+                "id": i + 1,
+                "designation": f"{WEAPON_PREFIX[weapon_type]}-{i + 1:05d}",
+                "name": f"Synthetic {weapon_class} {weapon_type} {i + 1}",
+                "manufacturer": f"Ordnance Works {rng.randint(1, 40)}",
+                "country_of_origin": rng.choices(self.countries, self.country_weights)[0],
+                "weapon_type": weapon_type,
+                "weapon_class": weapon_class,
+                "guidance_type": guidance,
+                "length_meters": round(0.8 + weight_kg / 250, 3),
+                "diameter_mm": round(70 + weight_kg / 4, 1),
+                "weight_kg": weight_kg,
+                "weight_lbs": round(weight_kg * KG_TO_LBS, 1),
+                "warhead_weight_kg": self._maybe(rng, round(weight_kg * rng.uniform(0.2, 0.5), 1)),
+                "range_km": self._maybe(rng, range_km),
+                "range_miles": round(range_km * KM_TO_MILES, 1),
+                "range_nm": round(range_km * KM_TO_NM, 1),
+                "max_speed_mach": self._maybe(rng, round(rng.uniform(0.7, 3.5), 2)),
+                "cep_meters": self._maybe(rng, round(rng.uniform(1, 15), 1)),
+                "launch_platform_types": ["Fixed-Wing", "Rotary-Wing"][: rng.randint(1, 2)],
+                "unit_cost_usd": self._maybe(rng, round(rng.uniform(2e4, 1.5e6), -3)),
+                "year_introduced": rng.randint(1975, 2024),
+                "operational_status": "Active",
+            }
+            if record["range_km"] is None:
+                record["range_miles"] = record["range_nm"] = None
+            yield record
+
+    def uavs(
+        self, armaments: Sequence[Dict[str, Any]] = ()
+    ) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Generate UAV records with their armament links.
+
+        Args:
+            armaments (Sequence[Dict[str, Any]]): Armaments available for links
+
+        Yields:
+            Tuple[Dict[str, Any], List[Dict[str, Any]]]: UAV record and its
+            uav_armaments records
+        """
+        rng = random.Random(f"{self.spec.seed}-uavs")
+        link_id = 0
+        for i in range(self.spec.n_uavs):
+            uav = self._uav(rng, i)
+            links = []
+            if armaments and uav["hardpoints"] and uav["max_weapons_load_kg"]:
+                for armament in self._loadout(rng, uav, armaments):
+                    link_id += 1
+                    links.append(
+                        {
+                            "id": link_id,
+                            "uav_designation": uav["designation"],
+                            "armament_designation": armament["designation"],
+                            "max_quantity": max(
+                                1,
+                                min(
+                                    uav["hardpoints"] * 2,
+                                    int(uav["max_weapons_load_kg"] // armament["weight_kg"]),
+                                ),
+                            ),
+                            "hardpoint_positions": rng.choice(
+                                ["Wing pylons", "Centerline", "Internal bay", "Wing pylons 1-4"]
+                            ),
+                            "integration_status": rng.choice(INTEGRATION_STATUSES),
+                        }
+                    )
+                uav["armament"] = [link["armament_designation"] for link in links] or None
+            yield uav, links
+
+    def _loadout(
+        self, rng: random.Random, uav: Dict[str, Any], armaments: Sequence[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Pick distinct armaments light enough for the UAV's weapons load."""
+        chosen: Dict[str, Dict[str, Any]] = {}
+        for _ in range(rng.randint(1, 6)):
+            candidate = armaments[rng.randrange(len(armaments))]
+            if candidate["weight_kg"] <= uav["max_weapons_load_kg"]:
+                chosen[candidate["designation"]] = candidate
+        return list(chosen.values())
+
+    def _uav(self, rng: random.Random, i: int) -> Dict[str, Any]:
+        """Generate one UAV record."""
+        uav_type = (
+            self.types[i % len(self.types)] if i < len(self.types) else rng.choice(self.types)
+        )
+        profile = TYPE_PROFILES.get(uav_type, TYPE_PROFILES["Tactical"])
+        country = rng.choices(self.countries, self.country_weights)[0]
+        status = rng.choices(self.statuses, self.status_weights)[0]
+        designation = f"{profile['prefix']}-{i + 1:06d}"
+
+        wingspan = rng.uniform(*profile["wingspan"])
+        length = wingspan * rng.uniform(0.45, 0.8)
+        height = length * rng.uniform(0.18, 0.3)
+        mtow = rng.uniform(*profile["mtow"])
+        empty = mtow * rng.uniform(0.45, 0.65)
+        payload = mtow * rng.uniform(0.1, 0.3)
+        fuel = mtow - empty - payload * rng.uniform(0.5, 1.0)
+        cruise = rng.uniform(*profile["cruise"])
+        max_speed = cruise * rng.uniform(1.2, 1.6)
+        ceiling = rng.uniform(*profile["ceiling"])
+        range_km = rng.uniform(*profile["range"])
+        combat_radius = range_km * rng.uniform(0.3, 0.45)
+        hardpoints = rng.randint(*profile["hardpoints"])
+        weapons_load = payload * rng.uniform(0.6, 1.0) if hardpoints else None
+        engines = 2 if mtow > 8000 and rng.random() < 0.5 else 1
+        ioc = date(1995, 1, 1) + timedelta(days=rng.randrange(30 * 365))
+        operators = [country] + rng.sample(
+            self.countries, k=min(len(self.countries), rng.randint(0, 4))
+        )
+        operators = list(dict.fromkeys(operators))
+        slug = designation.lower()
+
+        record = {
+            "id": i + 1,
+            "designation": designation,
+            "name": f"Synthetic {uav_type} {i + 1}",
+            "manufacturer": f"{country} Aerospace {rng.randint(1, 25)}",
+            "country_of_origin": country,
+            "nato_class": "Class I" if mtow < 150 else "Class II" if mtow < 600 else "Class III",
+            "type": uav_type,
+            "operational_status": status,
+            "initial_operating_capability": ioc.isoformat(),
+            "total_units_produced": rng.randint(1, 2000),
+            "wingspan_meters": round(wingspan, 2),
+            "wingspan_feet": round(wingspan * M_TO_FT, 2),
+            "length_meters": round(length, 2),
+            "length_feet": round(length * M_TO_FT, 2),
+            "height_meters": round(height, 2),
+            "height_feet": round(height * M_TO_FT, 2),
+            "empty_weight_kg": round(empty, 1),
+            "empty_weight_lbs": round(empty * KG_TO_LBS, 1),
+            "max_takeoff_weight_kg": round(mtow, 1),
+            "max_takeoff_weight_lbs": round(mtow * KG_TO_LBS, 1),
+            "payload_capacity_kg": round(payload, 1),
+            "payload_capacity_lbs": round(payload * KG_TO_LBS, 1),
+            "fuel_capacity_kg": round(fuel, 1),
+            "fuel_capacity_gallons": round(fuel * KG_JP8_TO_GALLONS, 1),
+            "airframe_type": profile["airframe"],
+            "engine_type": profile["engine"],
+            "engine_manufacturer": f"Engine Works {rng.randint(1, 15)}",
+            "engine_model": f"E-{rng.randint(100, 999)}",
+            "thrust_hp": (
+                int(mtow * rng.uniform(0.1, 0.25)) if profile["engine"] != "Turbofan" else None
+            ),
+            "thrust_lbs": (
+                int(mtow * rng.uniform(0.3, 0.6)) if profile["engine"] == "Turbofan" else None
+            ),
+            "number_of_engines": engines,
+            "propeller_configuration": (
+                "Pusher" if profile["engine"] in ("Piston", "Turboprop") else None
+            ),
+            "cruise_speed_kmh": round(cruise, 1),
+            "cruise_speed_mph": round(cruise * KMH_TO_MPH, 1),
+            "cruise_speed_knots": round(cruise * KMH_TO_KNOTS, 1),
+            "max_speed_kmh": round(max_speed, 1),
+            "max_speed_mph": round(max_speed * KMH_TO_MPH, 1),
+            "max_speed_mach": round(max_speed * KMH_TO_MACH, 2),
+            "service_ceiling_meters": round(ceiling, 0),
+            "service_ceiling_feet": round(ceiling * M_TO_FT, 0),
+            "range_km": round(range_km, 1),
+            "range_miles": round(range_km * KM_TO_MILES, 1),
+            "range_nm": round(range_km * KM_TO_NM, 1),
+            "endurance_hours": round(rng.uniform(*profile["endurance"]), 1),
+            "combat_radius_km": round(combat_radius, 1),
+            "combat_radius_nm": round(combat_radius * KM_TO_NM, 1),
+            "primary_function": profile["missions"][0],
+            "mission_types": rng.sample(
+                profile["missions"], k=rng.randint(1, len(profile["missions"]))
+            ),
+            "armament": None,
+            "max_weapons_load_kg": round(weapons_load, 1) if weapons_load else None,
+            "max_weapons_load_lbs": round(weapons_load * KG_TO_LBS, 1) if weapons_load else None,
+            "hardpoints": hardpoints,
+            "internal_weapons_bays": profile["airframe"] == "Flying wing",
+            "sensor_suite": rng.sample(SENSOR_POOL, k=rng.randint(1, 4)),
+            "radar_type": rng.choice(["Lynx SAR", "AESA", "Maritime Search", None]),
+            "communications": rng.choice(["LOS", "LOS, SATCOM", "BLOS SATCOM"]),
+            "datalink_type": rng.choice(["STANAG 7085", "Ku-band", "C-band", "Proprietary"]),
+            "stealth_features": (
+                "Low-observable shaping" if profile["airframe"] == "Flying wing" else None
+            ),
+            "autonomy_level": rng.choice(["Remotely piloted", "Semi-autonomous", "Autonomous"]),
+            "operators": operators,
+            "export_countries": [c for c in operators if c != country] or None,
+            "crew_size_remote": rng.randint(1, 4),
+            "ground_control_station": f"GCS-{rng.randint(1, 30)}",
+            "launch_method": (
+                "Runway" if mtow > 500 else rng.choice(["Catapult", "Hand", "Canister"])
+            ),
+            "recovery_method": (
+                "Runway" if mtow > 500 else rng.choice(["Parachute", "Net", "Belly landing"])
+            ),
+            "unit_cost_usd": round(mtow * rng.uniform(2000, 8000), -3),
+            "program_cost_usd": None,
+            "fiscal_year": rng.randint(2010, 2025),
+            "imagery_urls": {
+                view: f"/assets/images/uavs/{slug}/{slug}-{view}.png"
+                for view in ("side", "front", "three_quarter")
+            },
+            "silhouette_url": f"/assets/silhouettes/{slug}/{slug}-overhead.svg",
+            "model_urls": {
+                "low_poly": f"/assets/models/{slug}/{slug}-low.glb",
+                "high_poly": f"/assets/models/{slug}/{slug}-high.glb",
+            },
+            "scale_factor": 100,
+            "notable_features": [f"Synthetic feature {rng.randint(1, 200)}"],
+            "combat_history": None,
+            # Variant A is the baseline airframe; later ones are heavier and longer-ranged
+            "variants": [
+                {
+                    "designation": f"{designation}{suffix}",
+                    "name": f"Variant {suffix}",
+                    **(
+                        {
+                            "max_takeoff_weight_kg": round(mtow * (1 + 0.08 * n), 1),
+                            "range_km": round(range_km * (1 + 0.15 * n), 1),
+                        }
+                        if n
+                        else {}
+                    ),
+                }
+                for n, suffix in enumerate(("A", "B", "C")[: rng.randint(0, 3)])
+            ]
+            or None,
+            "notes": "Synthetic record for scale testing",
+        }
+
+        # Realistic sparsity: unit twins go missing together, rarer fields more often
+        twins = {twin for group in UNIT_TWINS.values() for twin in group}
+        for field in list(record):
+            if field in REQUIRED_UAV_FIELDS or field in twins or record[field] is None:
+                continue
+            weight = 2.0 if field in SPARSE_UAV_FIELDS else 1.0
+            if self._maybe(rng, True, weight) is None:
+                record[field] = None
+                for twin in UNIT_TWINS.get(field, ()):
+                    record[twin] = None
+        return record
+
+
+def write_catalog(spec: CatalogSpec, out_dir: Path, ndjson: bool = True) -> Dict[str, Path]:
+    """
+    Write a synthetic catalog as JSON files.
+
+    Args:
+        spec (CatalogSpec): Catalog configuration
+        out_dir (Path): Output directory
+        ndjson (bool): Write newline-delimited JSON (streams; used for bulk loads)
+            instead of JSON arrays matching data/*.json
+
+    Returns:
+        Dict[str, Path]: Paths keyed by table name (uavs, armaments, uav_armaments)
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    ext = "ndjson" if ndjson else "json"
+    paths = {
+        "uavs": out_dir / f"initial_uavs.{ext}",
+        "armaments": out_dir / f"armaments.{ext}",
+        "uav_armaments": out_dir / f"uav_armaments.{ext}",
+    }
+    generator = CatalogGenerator(spec)
+    armaments = list(generator.armaments())
+
+    if ndjson:
+        with open(paths["armaments"], "w", encoding="utf-8") as f:
+            for armament in armaments:
+                f.write(json.dumps(armament) + "\n")
+        with (
+            open(paths["uavs"], "w", encoding="utf-8") as uav_file,
+            open(paths["uav_armaments"], "w", encoding="utf-8") as link_file,
+        ):
+            for uav, links in generator.uavs(armaments):
+                uav_file.write(json.dumps(uav) + "\n")
+                for link in links:
+                    link_file.write(json.dumps(link) + "\n")
+    else:
+        uavs, links = [], []
+        for uav, uav_links in generator.uavs(armaments):
+            uavs.append(uav)
+            links.extend(uav_links)
+        for table, records in (("uavs", uavs), ("armaments", armaments), ("uav_armaments", links)):
+            with open(paths[table], "w", encoding="utf-8") as f:
+                json.dump(records, f, indent=2)
+
+    return paths
+
+
+def populate_database(
+    db_path: Path,
+    spec: CatalogSpec,
+    schema_path: Optional[Path] = None,
+    canonical_units: bool = False,
+) -> Path:
+    """
+    Create a DuckDB catalog filled with synthetic data.
+
+    Args:
+        db_path (Path): Output database file (overwritten)
+        spec (CatalogSpec): Catalog configuration
+        schema_path (Optional[Path]): Schema file; defaults to backend/db/schema.sql
+        canonical_units (bool): Store SI fields only (imperial/nautical derived on read)
+
+    Returns:
+        Path: Path to the created database
+    """
+    schema_path = schema_path or get_project_root() / "backend" / "db" / "schema.sql"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    remove_database(db_path)
+
+    with tempfile.TemporaryDirectory(prefix="xuav-catalog-") as tmp:
+        paths = write_catalog(spec, Path(tmp))
+        conn = duckdb.connect(str(db_path))
+        try:
+            capture_row_state(conn)
+            conn.execute(load_schema(schema_path))
+            for table in ("uavs", "armaments", "uav_armaments"):
+                # Reason: Empty NDJSON files can't be type-sniffed; nothing to load anyway
+                if paths[table].stat().st_size:
+                    skip = UAV_DERIVED_UNITS if canonical_units and table == "uavs" else ()
+                    bulk_insert_json(conn, table, paths[table], skip_columns=skip)
+            build_variant_index(conn)
+            build_operator_index(conn)
+            record_changes(conn)
+            conn.execute("CHECKPOINT")
+        finally:
+            conn.close()
+
+    return db_path
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic X-UAV catalog")
+    parser.add_argument("--uavs", type=int, default=1000, help="Number of UAVs")
+    parser.add_argument(
+        "--armaments",
+        type=int,
+        default=None,
+        help="Number of armaments (default: uavs / 10, minimum 20)",
+    )
+    parser.add_argument("--countries", type=int, default=12, help="Distinct countries")
+    parser.add_argument("--types", type=int, default=6, help="Distinct UAV types")
+    parser.add_argument("--statuses", type=int, default=4, help="Distinct statuses")
+    parser.add_argument(
+        "--null-density", type=float, default=0.15, help="Probability an optional field is null"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument(
+        "--canonical-units",
+        action="store_true",
+        help="Store SI fields only; imperial/nautical fields are derived when read",
+    )
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--db", type=Path, help="DuckDB file to create")
+    target.add_argument("--json-dir", type=Path, help="Directory for data/*.json-style files")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entry point for catalog generation.
+
+    Returns:
+        int: Exit code (0 for success)
+    """
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    spec = CatalogSpec(
+        n_uavs=args.uavs,
+        n_armaments=args.armaments if args.armaments is not None else max(20, args.uavs // 10),
+        countries=args.countries,
+        types=args.types,
+        statuses=args.statuses,
+        null_density=args.null_density,
+        seed=args.seed,
+    )
+    print(f"🧪 Generating synthetic catalog: {spec}")
+    if args.db:
+        populate_database(args.db, spec, canonical_units=args.canonical_units)
+        print(f"✅ Database written to {args.db}")
+    else:
+        paths = write_catalog(spec, args.json_dir, ndjson=False)
+        for table, path in paths.items():
+            print(f"✅ {table}: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,13 +5,22 @@ Database initialization script for X-UAV application.
 Creates DuckDB database with schema and loads initial UAV data.
 """
 
+import argparse
 import json
+import os
 import sys
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Any, Dict, List, Optional, Sequence
 
 import duckdb
 
+# Reason: scripts/ is not a package; unit definitions live in the app package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.units import UAV_DERIVED_UNITS  # noqa: E402
+from app.validation import DataValidationError, validate_catalog  # noqa: E402
+
 
 def get_project_root() -> Path:
     """
@@ -65,42 +74,60 @@ def load_initial_data(data_path: Path) -> List[Dict[str, Any]]:
         return json.load(f)
 
 
-def convert_json_fields(record: Dict[str, Any], json_fields: List[str]) -> Dict[str, Any]:
+def convert_nested_fields(record: Dict[str, Any], nested_fields: List[str]) -> Dict[str, Any]:
     """
-    Convert JSON array/object fields to JSON strings for DuckDB.
+    Prepare list/map/struct fields for DuckDB's native nested types.
+
+    Lists and dicts are bound as they are. Fields that hold JSON text (older
+    data files) are decoded, and variants given as plain strings become
+    records with just a designation.
 
     Args:
         record (Dict[str, Any]): Record to convert
-        json_fields (List[str]): List of field names that contain JSON
+        nested_fields (List[str]): Fields stored as LIST, MAP or STRUCT columns
 
     Returns:
-        Dict[str, Any]: Record with JSON fields converted
+        Dict[str, Any]: Record with nested fields converted
     """
     converted = record.copy()
-    for field in json_fields:
-        if field in converted and converted[field] is not None:
-            if isinstance(converted[field], (list, dict)):
-                converted[field] = json.dumps(converted[field])
+    for field in nested_fields:
+        if isinstance(converted.get(field), str):
+            converted[field] = json.loads(converted[field])
+
+    if isinstance(converted.get('variants'), list):
+        converted['variants'] = [
+            {'designation': variant} if isinstance(variant, str) else variant
+            for variant in converted['variants']
+        ]
 
     return converted
 
 
-UAV_JSON_FIELDS = [
+UAV_NESTED_FIELDS = [
     'mission_types', 'armament', 'sensor_suite', 'operators',
     'export_countries', 'notable_features', 'imagery_urls',
-    'model_urls', 'variants'
+    'model_urls', 'variants', 'image_derivatives'
 ]
 
-ARMAMENT_JSON_FIELDS = [
+ARMAMENT_NESTED_FIELDS = [
     'launch_platform_types', 'variants', 'notable_features'
 ]
 
+# Performance fields of a UAV variant; ones a variant leaves out are the airframe's
+VARIANT_PERFORMANCE_FIELDS = (
+    'max_takeoff_weight_kg', 'max_speed_kmh', 'cruise_speed_kmh', 'service_ceiling_meters',
+    'range_km', 'combat_radius_km', 'endurance_hours', 'max_weapons_load_kg', 'hardpoints',
+)
+
+# Fields of an image_derivatives entry (the STRUCT in schema.sql)
+DERIVATIVE_FIELDS = ('source', 'source_hash', 'width', 'height', 'thumbnail', 'variants')
+
 
 def insert_record(
     conn: duckdb.DuckDBPyConnection,
     table_name: str,
     record: Dict[str, Any],
-    json_fields: List[str],
+    nested_fields: List[str],
     id_field: str = 'designation'
 ) -> None:
     """
@@ -110,15 +137,15 @@ def insert_record(
         conn (duckdb.DuckDBPyConnection): Database connection
         table_name (str): Name of the table
         record (Dict[str, Any]): Record to insert
-        json_fields (List[str]): Fields containing JSON data
+        nested_fields (List[str]): Fields stored as LIST, MAP or STRUCT columns
         id_field (str): Field name to use for error messages
     """
     # Get valid column names from the table schema
     schema_result = conn.execute(f"PRAGMA table_info('{table_name}')").fetchall()
     valid_columns = {row[1] for row in schema_result}
 
-    # Convert JSON fields
-    record_data = convert_json_fields(record, json_fields)
+    # Convert nested fields
+    record_data = convert_nested_fields(record, nested_fields)
 
     # Filter to only include valid columns
     filtered_data = {k: v for k, v in record_data.items() if k in valid_columns}
@@ -141,15 +168,20 @@ def insert_record(
         raise
 
 
-def insert_uav(conn: duckdb.DuckDBPyConnection, uav: Dict[str, Any]) -> None:
+def insert_uav(
+    conn: duckdb.DuckDBPyConnection, uav: Dict[str, Any], canonical_units: bool = False
+) -> None:
     """
     Insert a single UAV record into the database.
 
     Args:
         conn (duckdb.DuckDBPyConnection): Database connection
         uav (Dict[str, Any]): UAV record to insert
+        canonical_units (bool): Store SI fields only; derived units are computed on read
     """
-    insert_record(conn, 'uavs', uav, UAV_JSON_FIELDS, 'designation')
+    if canonical_units:
+        uav = {k: v for k, v in uav.items() if k not in UAV_DERIVED_UNITS}
+    insert_record(conn, 'uavs', uav, UAV_NESTED_FIELDS, 'designation')
 
 
 def insert_armament(conn: duckdb.DuckDBPyConnection, armament: Dict[str, Any]) -> None:
@@ -160,7 +192,7 @@ def insert_armament(conn: duckdb.DuckDBPyConnection, armament: Dict[str, Any]) -
         conn (duckdb.DuckDBPyConnection): Database connection
         armament (Dict[str, Any]): Armament record to insert
     """
-    insert_record(conn, 'armaments', armament, ARMAMENT_JSON_FIELDS, 'designation')
+    insert_record(conn, 'armaments', armament, ARMAMENT_NESTED_FIELDS, 'designation')
 
 
 def insert_uav_armament(conn: duckdb.DuckDBPyConnection, ua: Dict[str, Any]) -> None:
@@ -174,57 +206,567 @@ def insert_uav_armament(conn: duckdb.DuckDBPyConnection, ua: Dict[str, Any]) ->
     insert_record(conn, 'uav_armaments', ua, [], 'uav_designation')
 
 
+def bulk_insert_json(
+    conn: duckdb.DuckDBPyConnection,
+    table_name: str,
+    data_path: Path,
+    skip_columns: Sequence[str] = (),
+) -> int:
+    """
+    Insert every record of a JSON file into a table with one statement.
+
+    Accepts either a JSON array (like data/*.json) or newline-delimited JSON.
+    Keys that aren't table columns are ignored; missing or null values of
+    columns that have a default fall back to that default. Much faster than
+    insert_record() for large files.
+
+    Args:
+        conn (duckdb.DuckDBPyConnection): Database connection
+        table_name (str): Name of the table
+        data_path (Path): JSON or NDJSON file
+        skip_columns (Sequence[str]): Columns to leave NULL whatever the file holds
+
+    Returns:
+        int: Number of rows inserted
+
+    Raises:
+        FileNotFoundError: If data file doesn't exist
+    """
+    if not data_path.exists():
+        raise FileNotFoundError(f"Data file not found: {data_path}")
+
+    # (name, type, default) for every column
+    schema_result = conn.execute(f"PRAGMA table_info('{table_name}')").fetchall()
+    columns = [(row[1], row[2], row[4]) for row in schema_result]
+
+    column_types = ", ".join(f"'{name}': '{col_type}'" for name, col_type, _ in columns)
+    # Reason: A missing key reads as NULL, which would override the column default
+    select_list = ", ".join(
+        "NULL" if name in skip_columns
+        else f"COALESCE({name}, {default})" if default is not None
+        else name
+        for name, _, default in columns
+    )
+    before = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+    conn.execute(
+        f"""
+        INSERT INTO {table_name} ({', '.join(name for name, _, _ in columns)})
+        SELECT {select_list}
+        FROM read_json(?, format = 'auto', columns = {{{column_types}}})
+        """,
+        [str(data_path)],
+    )
+    after = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+    return after - before
+
+
+def apply_image_manifest(conn: duckdb.DuckDBPyConnection, manifest_path: Path) -> int:
+    """
+    Record built image derivatives on the UAVs whose imagery they belong to.
+
+    Args:
+        conn (duckdb.DuckDBPyConnection): Database connection
+        manifest_path (Path): derivatives.json written by build_images.py
+
+    Returns:
+        int: Number of UAVs updated
+    """
+    if not manifest_path.exists():
+        return 0
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f).get('images', {})
+
+    designations, values = [], []
+    rows = conn.execute(
+        "SELECT designation, imagery_urls FROM uavs WHERE imagery_urls IS NOT NULL"
+    ).fetchall()
+    for designation, imagery_urls in rows:
+        # Reason: Casting JSON to a STRUCT needs every field; absent ones become NULL
+        views = {
+            view: {field: entries[url].get(field) for field in DERIVATIVE_FIELDS}
+            for view, url in imagery_urls.items()
+            if url in entries
+        }
+        if views:
+            designations.append(designation)
+            values.append(json.dumps(views))
+
+    # Reason: One UPDATE over unnested lists; executemany is very slow in DuckDB.
+    # The JSON text is cast to the column's MAP/STRUCT type on assignment.
+    conn.execute(
+        """
+        UPDATE uavs SET image_derivatives = d.value::JSON
+        FROM (SELECT unnest(?) AS designation, unnest(?) AS value) d
+        WHERE uavs.designation = d.designation
+        """,
+        [designations, values],
+    )
+    return len(designations)
+
+
+def apply_model_manifest(conn: duckdb.DuckDBPyConnection, manifest_path: Path) -> int:
+    """
+    Point model_urls at the LOD files built by build_models.py.
+
+    Existing model_urls keys that the manifest doesn't cover are kept.
+
+    Args:
+        conn (duckdb.DuckDBPyConnection): Database connection
+        manifest_path (Path): manifest.json written by build_models.py
+
+    Returns:
+        int: Number of UAVs updated
+    """
+    if not manifest_path.exists():
+        return 0
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        models = json.load(f).get('models', {})
+    if not models:
+        return 0
+
+    designations, values = [], []
+    rows = conn.execute(
+        "SELECT designation, model_urls FROM uavs WHERE designation = ANY(?)",
+        [list(models)],
+    ).fetchall()
+    for designation, model_urls in rows:
+        merged = dict(model_urls or {})
+        merged.update({lod: info['url'] for lod, info in models[designation]['lods'].items()})
+        designations.append(designation)
+        values.append(json.dumps(merged))
+
+    conn.execute(
+        """
+        UPDATE uavs SET model_urls = d.value::JSON
+        FROM (SELECT unnest(?) AS designation, unnest(?) AS value) d
+        WHERE uavs.designation = d.designation
+        """,
+        [designations, values],
+    )
+    return len(designations)
+
+
+def build_variant_index(conn: duckdb.DuckDBPyConnection) -> int:
+    """
+    Rebuild uav_variants from the loaded UAVs' variants lists.
+
+    Variants without a designation are skipped, as are repeats of a
+    designation within one UAV (the first wins).
+
+    Args:
+        conn (duckdb.DuckDBPyConnection): Database connection
+
+    Returns:
+        int: Number of variants indexed
+    """
+    inherited = ",\n            ".join(
+        f"COALESCE(v.{field}, u.{field}) AS {field}" for field in VARIANT_PERFORMANCE_FIELDS
+    )
+    overrides = ", ".join(
+        f"CASE WHEN v.{field} IS NOT NULL THEN '{field}' END"
+        for field in VARIANT_PERFORMANCE_FIELDS
+    )
+    conn.execute("DELETE FROM uav_variants")
+    conn.execute(
+        f"""
+        INSERT INTO uav_variants
+        SELECT DISTINCT ON (u.designation, v.designation)
+            u.designation,
+            v.designation,
+            v.name,
+            v.description,
+            {inherited},
+            list_filter([{overrides}], f -> f IS NOT NULL)
+        FROM uavs u, unnest(u.variants) AS t(v)
+        WHERE v.designation IS NOT NULL
+        ORDER BY u.designation, v.designation
+        """
+    )
+    return conn.execute("SELECT COUNT(*) FROM uav_variants").fetchone()[0]
+
+
+def build_operator_index(conn: duckdb.DuckDBPyConnection) -> int:
+    """
+    Rebuild uav_operators and country_fleets from the loaded UAVs.
+
+    Every entry of a UAV's operators list becomes an 'operator' row and
+    every entry of export_countries an 'export' row, so "which UAVs does a
+    country field" is an index lookup instead of a scan of every list.
+
+    Args:
+        conn (duckdb.DuckDBPyConnection): Database connection
+
+    Returns:
+        int: Number of countries in country_fleets
+    """
+    conn.execute("DELETE FROM country_fleets")
+    conn.execute("DELETE FROM uav_operators")
+    conn.execute(
+        """
+        INSERT INTO uav_operators
+        SELECT DISTINCT country, designation, relation
+        FROM (
+            SELECT unnest(operators) AS country, designation, 'operator' AS relation FROM uavs
+            UNION ALL
+            SELECT unnest(export_countries), designation, 'export' FROM uavs
+        )
+        WHERE country IS NOT NULL AND country <> ''
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO country_fleets
+        WITH held AS (
+            SELECT DISTINCT o.country,
+                   o.uav_designation AS designation,
+                   u.country_of_origin AS origin
+            FROM uav_operators o
+            JOIN uavs u ON u.designation = o.uav_designation
+        ),
+        fleets AS (
+            SELECT country,
+                   COUNT(*) AS uav_count,
+                   COUNT(*) FILTER (WHERE origin = country) AS domestic,
+                   COUNT(*) FILTER (WHERE origin IS DISTINCT FROM country) AS imported,
+                   list_sort(
+                       list_distinct(list(origin) FILTER (WHERE origin <> country))
+                   ) AS suppliers,
+                   list_sort(list(designation)) AS designations
+            FROM held
+            GROUP BY country
+        ),
+        exports AS (
+            SELECT origin AS country,
+                   COUNT(DISTINCT designation) AS exported,
+                   list_sort(list_distinct(list(country))) AS customers
+            FROM held
+            WHERE origin <> country
+            GROUP BY origin
+        )
+        SELECT COALESCE(f.country, e.country),
+               COALESCE(f.uav_count, 0),
+               COALESCE(f.domestic, 0),
+               COALESCE(f.imported, 0),
+               COALESCE(f.suppliers, []),
+               COALESCE(e.exported, 0),
+               COALESCE(e.customers, []),
+               COALESCE(f.designations, [])
+        FROM fleets f
+        FULL OUTER JOIN exports e ON f.country = e.country
+        """
+    )
+    return conn.execute("SELECT COUNT(*) FROM country_fleets").fetchone()[0]
+
+
+# Tables covered by the change feed and the columns making up their row key
+TRACKED_TABLES = {
+    "uavs": ("designation",),
+    "armaments": ("designation",),
+    "uav_armaments": ("uav_designation", "armament_designation"),
+}
+# Columns left out of the row content hash
+UNHASHED_COLUMNS = ("id", "created_at", "updated_at")
+# Change history carried from the live database into each rebuilt one
+HISTORY_TABLES = ("catalog_generations", "catalog_tombstones")
+# Name the live database is attached under while its replacement is built
+PREVIOUS_DATABASE = "previous"
+
+
+def _table_columns(
+    conn: duckdb.DuckDBPyConnection, table_name: str, database: Optional[str] = None
+) -> List[str]:
+    """Column names of a table (in the given attached database), empty if it doesn't exist."""
+    return [
+        row[0] for row in conn.execute(
+            """
+            SELECT column_name FROM information_schema.columns
+            WHERE table_catalog = COALESCE(?, current_database())
+              AND table_schema = 'main' AND table_name = ?
+            ORDER BY ordinal_position
+            """,
+            [database, table_name],
+        ).fetchall()
+    ]
+
+
+def _row_key(table_name: str, alias: str) -> str:
+    """SQL expression of a tracked row's key, e.g. 'MQ-9' or 'MQ-9|AGM-114'."""
+    return " || '|' || ".join(f"{alias}.{column}" for column in TRACKED_TABLES[table_name])
+
+
+def _row_hash(columns: Sequence[str], alias: str) -> str:
+    """SQL expression hashing a row's content (everything but id and timestamps)."""
+    fields = ", ".join(f"{c} := {alias}.{c}" for c in columns if c not in UNHASHED_COLUMNS)
+    return f"md5(CAST(struct_pack({fields}) AS VARCHAR))"
+
+
+def attach_previous(conn: duckdb.DuckDBPyConnection, db_path: Path) -> Optional[str]:
+    """
+    Attach the live database read-only, if there is one.
+
+    Read-only handles held by running servers don't block this, unlike
+    opening the file for writing.
+
+    Args:
+        conn (duckdb.DuckDBPyConnection): Connection to the database being built
+        db_path (Path): Live database file
+
+    Returns:
+        Optional[str]: Name it is attached under, or None if it doesn't exist
+    """
+    if not db_path.exists():
+        return None
+    path = str(db_path).replace("'", "''")
+    conn.execute(f"ATTACH '{path}' AS {PREVIOUS_DATABASE} (READ_ONLY)")
+    return PREVIOUS_DATABASE
+
+
+def capture_row_state(conn: duckdb.DuckDBPyConnection, source: Optional[str] = None) -> None:
+    """
+    Remember each tracked row's key, content hash and timestamps before a reload.
+
+    Kept in temp tables (prev_<table>), which survive the schema dropping
+    the real ones. Empty for a new database.
+
+    Args:
+        conn (duckdb.DuckDBPyConnection): Database connection
+        source (Optional[str]): Attached database holding the previous rows
+            (default: the connection's own database)
+    """
+    prefix = f"{source}." if source else ""
+    for table in TRACKED_TABLES:
+        columns = _table_columns(conn, table, source)
+        if not columns:
+            conn.execute(
+                f"""
+                CREATE OR REPLACE TEMP TABLE prev_{table}
+                (key VARCHAR, row_hash VARCHAR, created_at TIMESTAMP, updated_at TIMESTAMP)
+                """
+            )
+            continue
+        # Reason: Databases from before change tracking have no timestamps on links
+        created = "t.created_at" if "created_at" in columns else "NULL::TIMESTAMP"
+        updated = "t.updated_at" if "updated_at" in columns else "NULL::TIMESTAMP"
+        conn.execute(
+            f"""
+            CREATE OR REPLACE TEMP TABLE prev_{table} AS
+            SELECT {_row_key(table, "t")} AS key, {_row_hash(columns, "t")} AS row_hash,
+                   {created} AS created_at, {updated} AS updated_at
+            FROM {prefix}{table} t
+            """
+        )
+
+
+def copy_history(conn: duckdb.DuckDBPyConnection, source: Optional[str]) -> None:
+    """
+    Copy earlier generations and tombstones into the database being built.
+
+    Keeps GET /api/changes?since= working across rebuilds. Run after the
+    schema has created the (empty) history tables.
+
+    Args:
+        conn (duckdb.DuckDBPyConnection): Connection to the database being built
+        source (Optional[str]): Attached live database, or None for a first load
+    """
+    if source is None:
+        return
+    for table in HISTORY_TABLES:
+        if _table_columns(conn, table, source):
+            conn.execute(f"INSERT INTO {table} SELECT * FROM {source}.{table}")
+
+
+def remove_database(db_path: Path) -> None:
+    """Delete a database file and its write-ahead log, if present."""
+    for suffix in ("", ".wal"):
+        Path(str(db_path) + suffix).unlink(missing_ok=True)
+
+
+def record_changes(conn: duckdb.DuckDBPyConnection) -> Dict[str, int]:
+    """
+    Start a new catalog generation and stamp what this load changed.
+
+    Compares the freshly loaded rows with capture_row_state(): unchanged
+    rows keep their created_at/updated_at, changed rows keep created_at and
+    get the generation's loaded_at as updated_at, new rows get it as both,
+    and rows that disappeared become tombstones. Serves
+    GET /api/changes?since=<generation>.
+
+    Args:
+        conn (duckdb.DuckDBPyConnection): Database connection
+
+    Returns:
+        Dict[str, int]: generation plus inserted, updated and deleted row counts
+    """
+    generation, last_loaded = conn.execute(
+        "SELECT COALESCE(MAX(generation), 0) + 1, MAX(loaded_at) FROM catalog_generations"
+    ).fetchone()
+    loaded_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    if last_loaded is not None and loaded_at <= last_loaded:
+        # Reason: Generations are told apart by loaded_at, so it must strictly increase
+        loaded_at = last_loaded + timedelta(microseconds=1)
+
+    for table in TRACKED_TABLES:
+        columns = _table_columns(conn, table)
+        conn.execute(f"UPDATE {table} SET created_at = ?, updated_at = ?", [loaded_at, loaded_at])
+        conn.execute(
+            f"""
+            UPDATE {table} SET
+                created_at = COALESCE(m.created_at, {table}.created_at),
+                updated_at = m.updated_at
+            FROM (
+                SELECT p.key, p.created_at,
+                       CASE WHEN p.row_hash = c.row_hash THEN COALESCE(p.updated_at, ?) ELSE ? END
+                           AS updated_at
+                FROM prev_{table} p
+                JOIN (
+                    SELECT {_row_key(table, "t")} AS key, {_row_hash(columns, "t")} AS row_hash
+                    FROM {table} t
+                ) c ON c.key = p.key
+            ) m
+            WHERE {_row_key(table, table)} = m.key
+            """,
+            [loaded_at, loaded_at],
+        )
+        conn.execute(
+            f"""
+            INSERT INTO catalog_tombstones
+            SELECT ?, p.key, ?, ?
+            FROM prev_{table} p
+            WHERE NOT EXISTS (SELECT 1 FROM {table} t WHERE {_row_key(table, "t")} = p.key)
+            """,
+            [table, generation, loaded_at],
+        )
+
+    inserted = sum(
+        conn.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE created_at = ?", [loaded_at]
+        ).fetchone()[0]
+        for table in TRACKED_TABLES
+    )
+    updated = sum(
+        conn.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE updated_at = ? AND created_at < ?",
+            [loaded_at, loaded_at],
+        ).fetchone()[0]
+        for table in TRACKED_TABLES
+    )
+    deleted = conn.execute(
+        "SELECT COUNT(*) FROM catalog_tombstones WHERE generation = ?", [generation]
+    ).fetchone()[0]
+    conn.execute(
+        "INSERT INTO catalog_generations VALUES (?, ?, ?, ?, ?)",
+        [generation, loaded_at, inserted, updated, deleted],
+    )
+    return {"generation": generation, "inserted": inserted, "updated": updated, "deleted": deleted}
+
+
 def init_database(
     db_path: Path,
     schema_path: Path,
     uavs_path: Path,
     armaments_path: Path,
-    uav_armaments_path: Path
+    uav_armaments_path: Path,
+    canonical_units: bool = False,
+    validate: bool = True,
+    workers: int = 1
 ) -> None:
     """
     Initialize the UAV database with all data.
 
+    All three data files are read and validated before the database is
+    opened, so invalid data fails the load without writing anything. The
+    new database is built in a temporary file next to db_path, with the
+    change history carried over from the live one, then moved into place
+    with os.replace: running servers keep their read-only handle on the old
+    file until their snapshot check notices the swap and reopens.
+
     Args:
         db_path (Path): Path to database file
         schema_path (Path): Path to schema.sql file
         uavs_path (Path): Path to initial_uavs.json file
         armaments_path (Path): Path to armaments.json file
         uav_armaments_path (Path): Path to uav_armaments.json file
+        canonical_units (bool): Store SI fields only (imperial/nautical derived on read)
+        validate (bool): Check every record and reference before loading
+        workers (int): Processes used for validation
 
     Raises:
+        DataValidationError: If the data has validation errors (nothing is written)
         Exception: If database initialization fails
     """
     print("🚀 Initializing X-UAV database...")
 
+    print("\n📦 Reading data files...")
+    uavs_data = load_initial_data(uavs_path)
+    armaments_data = load_initial_data(armaments_path)
+    ua_data = load_initial_data(uav_armaments_path)
+
+    if validate:
+        print("🔎 Validating records...")
+        report = validate_catalog(
+            [convert_nested_fields(r, UAV_NESTED_FIELDS) if isinstance(r, dict) else r
+             for r in uavs_data],
+            [convert_nested_fields(r, ARMAMENT_NESTED_FIELDS) if isinstance(r, dict) else r
+             for r in armaments_data],
+            ua_data,
+            workers=workers,
+        )
+        print(report.summary())
+        if not report.ok:
+            raise DataValidationError(report)
+
     # Ensure database directory exists
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Connect to DuckDB
-    print(f"📂 Connecting to database: {db_path}")
-    conn = duckdb.connect(str(db_path))
+    # Build next to the live file so the final os.replace is atomic
+    build_path = db_path.with_name(f".{db_path.name}.{os.getpid()}.tmp")
+    remove_database(build_path)
+    print(f"📂 Building database: {build_path}")
+    conn = duckdb.connect(str(build_path))
 
     try:
+        # Remember the current rows so the change feed can tell what this load changed
+        previous = attach_previous(conn, db_path)
+        capture_row_state(conn, previous)
+
         # Load and execute schema
         print("📋 Loading schema...")
         schema_sql = load_schema(schema_path)
         conn.execute(schema_sql)
+        copy_history(conn, previous)
+        if previous:
+            conn.execute(f"DETACH {previous}")
         print("✅ Schema created successfully")
 
         # Load and insert UAVs
         print("\n📦 Loading UAV data...")
-        uavs_data = load_initial_data(uavs_path)
         print(f"   Found {len(uavs_data)} UAVs to load")
         print("💾 Inserting UAV records...")
         for i, uav in enumerate(uavs_data, 1):
             designation = uav.get('designation', 'UNKNOWN')
             print(f"   [{i}/{len(uavs_data)}] {designation}")
-            insert_uav(conn, uav)
+            insert_uav(conn, uav, canonical_units)
         result = conn.execute("SELECT COUNT(*) FROM uavs").fetchone()
         print(f"✅ Loaded {result[0] if result else 0} UAVs")
 
+        # Attach image derivatives built by scripts/build_images.py
+        manifest_path = (
+            get_project_root() / "frontend" / "public" / "assets" / "images" / "derivatives.json"
+        )
+        updated = apply_image_manifest(conn, manifest_path)
+        if updated:
+            print(f"🖼️  Attached image derivatives to {updated} UAVs")
+
+        # Point model_urls at LODs built by scripts/build_models.py
+        model_manifest = (
+            get_project_root() / "frontend" / "public" / "assets" / "models" / "manifest.json"
+        )
+        updated = apply_model_manifest(conn, model_manifest)
+        if updated:
+            print(f"🧊 Attached 3D model LODs to {updated} UAVs")
+
         # Load and insert armaments
         print("\n🔫 Loading armament data...")
-        armaments_data = load_initial_data(armaments_path)
         print(f"   Found {len(armaments_data)} armaments to load")
         print("💾 Inserting armament records...")
         for i, armament in enumerate(armaments_data, 1):
@@ -236,7 +778,6 @@ def init_database(
 
         # Load and insert UAV-armament relationships
         print("\n🔗 Loading UAV-armament relationships...")
-        ua_data = load_initial_data(uav_armaments_path)
         print(f"   Found {len(ua_data)} relationships to load")
         print("💾 Inserting relationship records...")
         for ua in ua_data:
@@ -244,6 +785,21 @@ def init_database(
         result = conn.execute("SELECT COUNT(*) FROM uav_armaments").fetchone()
         print(f"✅ Loaded {result[0] if result else 0} UAV-armament relationships")
 
+        # Explode variants for GET /api/variants
+        variants = build_variant_index(conn)
+        print(f"🧬 Indexed {variants} UAV variants")
+
+        # Index operators/export countries for GET /api/operators
+        countries = build_operator_index(conn)
+        print(f"🌍 Indexed operators for {countries} countries")
+
+        # Stamp created/updated rows and tombstones for GET /api/changes
+        changes = record_changes(conn)
+        print(
+            f"\n🕓 Catalog generation {changes['generation']}: {changes['inserted']} inserted, "
+            f"{changes['updated']} updated, {changes['deleted']} deleted"
+        )
+
         # Show UAV summary by country
         print("\n📊 UAV Summary by Country:")
         summary = conn.execute("""
@@ -278,23 +834,46 @@ def init_database(
         for weapon_type, count in armament_summary:
             print(f"   {weapon_type}: {count}")
 
+        conn.execute("CHECKPOINT")
+        conn.close()
+        os.replace(build_path, db_path)
+
     except Exception as e:
         print(f"❌ Error during database initialization: {e}")
-        raise
-    finally:
         conn.close()
+        remove_database(build_path)
+        raise
 
     print("\n✅ Database initialization complete!")
     print(f"📍 Database location: {db_path}")
 
 
-def main() -> int:
+def main(argv: List[str] = None) -> int:
     """
     Main entry point for database initialization.
 
     Returns:
         int: Exit code (0 for success, 1 for failure)
     """
+    parser = argparse.ArgumentParser(description="Initialize the X-UAV database")
+    parser.add_argument(
+        "--canonical-units",
+        action="store_true",
+        help="Store SI fields only; imperial/nautical fields are derived when read",
+    )
+    parser.add_argument(
+        "--skip-validation",
+        action="store_true",
+        help="Load without checking records and references first",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes used to validate records (default: all cores)",
+    )
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
     try:
         # Get project paths
         project_root = get_project_root()
@@ -305,7 +884,12 @@ def main() -> int:
         uav_armaments_path = project_root / "backend" / "data" / "uav_armaments.json"
 
         # Initialize database
-        init_database(db_path, schema_path, uavs_path, armaments_path, uav_armaments_path)
+        init_database(
+            db_path, schema_path, uavs_path, armaments_path, uav_armaments_path,
+            canonical_units=args.canonical_units,
+            validate=not args.skip_validation,
+            workers=args.workers
+        )
 
         return 0
 
@@ -315,6 +899,9 @@ def main() -> int:
     except json.JSONDecodeError as e:
         print(f"❌ Invalid JSON in data file: {e}")
         return 1
+    except DataValidationError as e:
+        print(f"❌ Data failed validation ({len(e.report.errors)} errors); nothing was loaded")
+        return 1
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         import traceback
@@ -0,0 +1,43 @@
+"""
+Shared fixtures for X-UAV tests.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).parent.parent
+
+# Reason: scripts/ is not a package; its modules import each other by name
+sys.path.insert(0, str(BACKEND_ROOT / "scripts"))
+
+from app.database import db  # noqa: E402
+from app.snapshot import snapshots  # noqa: E402
+from generate_catalog import CatalogSpec, populate_database  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def synthetic_db_path(tmp_path_factory) -> Path:
+    """
+    Small deterministic synthetic catalog built from db/schema.sql.
+
+    Returns:
+        Path: DuckDB file with 200 UAVs and 40 armaments
+    """
+    db_path = tmp_path_factory.mktemp("catalog") / "synthetic.duckdb"
+    return populate_database(db_path, CatalogSpec(n_uavs=200, n_armaments=40, seed=1))
+
+
+@pytest.fixture
+def synthetic_catalog(monkeypatch, synthetic_db_path):
+    """
+    Serve the synthetic catalog through the global snapshot.
+
+    Returns:
+        CatalogSnapshot: Snapshot of the synthetic catalog
+    """
+    monkeypatch.setattr(db, "db_path", synthetic_db_path)
+    snapshots.invalidate()
+    yield snapshots.current()
+    snapshots.invalidate()
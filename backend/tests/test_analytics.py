@@ -0,0 +1,78 @@
+"""
+Tests for the distribution analytics endpoint.
+"""
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import db
+from app.main import app
+
+client = TestClient(app)
+
+
+def _values(snapshot, field, rows=None):
+    """Non-missing values of a field, optionally for some rows."""
+    values = snapshot.numeric_array(field)
+    values = values if rows is None else values[rows]
+    return values[~np.isnan(values)]
+
+
+def test_distribution_overall(synthetic_catalog):
+    """
+    Test the ungrouped distribution against NumPy.
+
+    Expected: Matching count, min, max, median and a histogram over shared edges
+    """
+    body = client.get("/api/analytics/distribution", params={"field": "range_km", "bins": 8}).json()
+    values = _values(synthetic_catalog, "range_km")
+    overall = body["overall"]
+    assert body["groups"] == []
+    assert overall["count"] == len(values)
+    assert overall["missing"] == len(synthetic_catalog.uavs) - len(values)
+    assert overall["min"] == pytest.approx(values.min())
+    assert overall["max"] == pytest.approx(values.max())
+    assert overall["quantiles"]["p50"] == pytest.approx(np.median(values))
+    assert list(overall["quantiles"]) == ["p5", "p25", "p50", "p75", "p95"]
+
+    counts, edges = np.histogram(values, bins=8, range=(values.min(), values.max()))
+    assert body["edges"] == pytest.approx(edges.tolist())
+    assert overall["histogram"] == counts.tolist()
+
+
+def test_distribution_grouped(synthetic_catalog):
+    """
+    Test per-group summaries.
+
+    Expected: One summary per type, largest first, histograms summing to the overall
+    """
+    body = client.get(
+        "/api/analytics/distribution", params={"field": "endurance_hours", "group_by": "type"}
+    ).json()
+    groups = body["groups"]
+    assert [g["count"] for g in groups] == sorted((g["count"] for g in groups), reverse=True)
+    assert sum(g["count"] for g in groups) == body["overall"]["count"]
+    assert np.sum([g["histogram"] for g in groups], axis=0).tolist() == body["overall"]["histogram"]
+
+    group = groups[0]
+    rows = np.flatnonzero(synthetic_catalog.uavs.equals("type", group["group"]))
+    values = _values(synthetic_catalog, "endurance_hours", rows)
+    assert group["count"] == len(values)
+    assert group["mean"] == pytest.approx(values.mean())
+    assert group["quantiles"]["p75"] == pytest.approx(np.quantile(values, 0.75))
+
+
+def test_distribution_cached_and_validated(synthetic_catalog):
+    """
+    Test caching per snapshot and rejected parameters.
+
+    Expected: Repeat calls share one result; unknown fields/groups are 400
+    """
+    first = db.get_distribution("range_km", "country_of_origin", 10)
+    assert db.get_distribution("range_km", "country_of_origin", 10) is first
+
+    for params in ({"field": "name"}, {"field": "range_km", "group_by": "designation"}):
+        assert client.get("/api/analytics/distribution", params=params).status_code == 400
+    params = {"field": "range_km", "bins": 0}
+    assert client.get("/api/analytics/distribution", params=params).status_code == 422
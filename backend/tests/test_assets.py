@@ -0,0 +1,104 @@
+"""
+Tests for the static asset route.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.assets import CACHE_IMMUTABLE, AssetIndex
+
+client = TestClient(main.app)
+HASHED = "models/mq-9/mq-9-low.3f9c0e1a2b4d.glb"
+
+
+@pytest.fixture
+def assets(tmp_path, monkeypatch):
+    """Asset tree with one hashed model and one plain image."""
+    model = tmp_path / "assets" / HASHED
+    model.parent.mkdir(parents=True)
+    model.write_bytes(bytes(range(256)) * 4)
+    image = tmp_path / "assets" / "images" / "plain.png"
+    image.parent.mkdir(parents=True)
+    image.write_bytes(b"png")
+    (tmp_path / "secret.txt").write_text("outside the asset tree")
+    index = AssetIndex(tmp_path, check_interval=60)
+    monkeypatch.setattr(main, "asset_index", index)
+    return tmp_path
+
+
+def test_hashed_asset_is_immutable_and_revalidates(assets):
+    """
+    Test serving a content-hashed model.
+
+    Expected: Immutable caching, hash ETag, model media type; 304 on a match
+    """
+    response = client.get(f"/assets/{HASHED}")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == CACHE_IMMUTABLE
+    assert response.headers["etag"] == '"3f9c0e1a2b4d"'
+    assert response.headers["content-type"] == "model/gltf-binary"
+    assert len(response.content) == 1024
+
+    cached = client.get(f"/assets/{HASHED}", headers={"If-None-Match": '"3f9c0e1a2b4d"'})
+    assert cached.status_code == 304
+
+    plain = client.get("/assets/images/plain.png")
+    assert plain.headers["cache-control"] == "public, no-cache"
+    assert plain.headers["etag"].startswith('W/"')
+
+
+def test_range_requests(assets):
+    """
+    Test partial content.
+
+    Expected: 206 with the requested bytes; 416 past the end
+    """
+    response = client.get(f"/assets/{HASHED}", headers={"Range": "bytes=256-511"})
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 256-511/1024"
+    assert response.content == bytes(range(256))
+
+    assert client.get(f"/assets/{HASHED}", headers={"Range": "bytes=5000-"}).status_code == 416
+
+
+def test_index_lookup_and_late_files(assets):
+    """
+    Test files added after indexing and paths outside the tree.
+
+    Expected: A new file is found and indexed; traversal is refused
+    """
+    assert client.get("/assets/images/plain.png").status_code == 200
+    late = assets / "assets" / "images" / "derived" / "late.png"
+    late.parent.mkdir()
+    late.write_bytes(b"late")
+    assert client.get("/assets/images/derived/late.png").content == b"late"
+    assert "assets/images/derived/late.png" in main.asset_index._entries
+
+    assert client.get("/assets/../secret.txt").status_code == 404
+    assert client.get("/assets/%2E%2E/secret.txt").status_code == 404
+    assert client.get("/assets/images/missing.png").status_code == 404
+
+
+def test_plain_asset_rewritten_and_deleted(assets):
+    """
+    Test an unhashed file changed in place after it was indexed.
+
+    Expected: Length, body and ETag follow the new file; the old ETag no
+    longer gets a 304; a deleted file is 404 and leaves the index
+    """
+    first = client.get("/assets/images/plain.png")
+    assert first.content == b"png"
+
+    image = assets / "assets" / "images" / "plain.png"
+    image.write_bytes(b"a much longer png than before")
+    second = client.get("/assets/images/plain.png")
+    assert second.headers["content-length"] == str(len(b"a much longer png than before"))
+    assert second.content == b"a much longer png than before"
+    assert second.headers["etag"] != first.headers["etag"]
+    stale = client.get("/assets/images/plain.png", headers={"If-None-Match": first.headers["etag"]})
+    assert stale.status_code == 200
+
+    image.unlink()
+    assert client.get("/assets/images/plain.png").status_code == 404
+    assert "assets/images/plain.png" not in main.asset_index._entries
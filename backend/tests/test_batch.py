@@ -0,0 +1,170 @@
+"""
+Tests for the UAV bundle and batch endpoints.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import database, main
+from app.config import settings
+from app.database import db
+from app.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """Count new DuckDB connections."""
+    opened = []
+    connect = database._connect
+
+    def counting(path):
+        opened.append(path)
+        return connect(path)
+
+    monkeypatch.setattr(database, "_connect", counting)
+    return opened
+
+
+def _armed_uav() -> str:
+    with db.get_connection() as conn:
+        return conn.execute(
+            "SELECT uav_designation FROM uav_armaments ORDER BY uav_designation LIMIT 1"
+        ).fetchone()[0]
+
+
+def test_bundle(synthetic_catalog, connections):
+    """
+    Test the detail bundle against the individual endpoints.
+
+    Expected: Same UAV and armaments, similar airframes closest first, one connection
+    """
+    designation = _armed_uav()
+    connections.clear()
+    response = client.get(
+        f"/api/uavs/{designation}/bundle",
+        params={"include": "armaments,variants,similar", "similar_limit": 3, "units": "metric"},
+    )
+    assert response.status_code == 200
+    bundle = response.json()
+    assert len(connections) == 1
+
+    assert bundle["snapshot_generation"] == synthetic_catalog.generation
+    assert bundle["uav"]["designation"] == designation
+    assert "wingspan_feet" not in bundle["uav"]
+    armaments = client.get(f"/api/uavs/{designation}/armaments").json()["armaments"]
+    assert bundle["armaments"] == armaments
+    variants = client.get(f"/api/uavs/{designation}/variants").json()["variants"]
+    assert bundle["variants"] == variants
+
+    similar = bundle["similar"]
+    assert 0 < len(similar) <= 3 and designation not in [s["designation"] for s in similar]
+    assert [s["distance"] for s in similar] == sorted(s["distance"] for s in similar)
+
+
+def test_bundle_variants(synthetic_catalog):
+    """
+    Test that bundle variants come from the variants table.
+
+    Expected: Same rows as /uavs/{designation}/variants, with the airframe fields
+    """
+    with db.get_connection() as conn:
+        designation = conn.execute(
+            "SELECT uav_designation FROM uav_variants ORDER BY uav_designation LIMIT 1"
+        ).fetchone()[0]
+    bundle = client.get(
+        f"/api/uavs/{designation}/bundle", params={"include": "variants"}
+    ).json()
+    variants = client.get(f"/api/uavs/{designation}/variants").json()["variants"]
+    assert bundle["variants"] == variants and variants
+    assert all(v["uav_designation"] == designation for v in bundle["variants"])
+
+
+def test_bundle_errors(synthetic_catalog):
+    """
+    Test bundle error handling.
+
+    Expected: 400 for unknown parts, 404 for unknown UAVs
+    """
+    designation = synthetic_catalog.uavs[0]["designation"]
+    response = client.get(f"/api/uavs/{designation}/bundle", params={"include": "wings"})
+    assert response.status_code == 400
+    assert client.get("/api/uavs/NOPE/bundle").status_code == 404
+
+
+def test_batch(synthetic_catalog):
+    """
+    Test running several sub-requests in one batch.
+
+    Expected: Per-request status and body in order, one pinned snapshot
+    """
+    designation = _armed_uav()
+    response = client.post("/api/batch", json={"requests": [
+        {"id": "uav", "path": f"/api/uavs/{designation}?units=nautical"},
+        {"id": "arms", "path": f"/api/uavs/{designation}/armaments"},
+        {
+            "id": "cmp", "method": "POST", "path": "/api/uavs/compare",
+            "body": {"designations": [designation]},
+        },
+        {"id": "missing", "path": "/api/uavs/NOPE"},
+    ]})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["snapshot_generation"] == synthetic_catalog.generation
+
+    results = {r["id"]: r for r in body["responses"]}
+    assert [r["id"] for r in body["responses"]] == ["uav", "arms", "cmp", "missing"]
+    assert results["uav"]["status"] == 200 and "range_nm" in results["uav"]["body"]
+    assert "range_miles" not in results["uav"]["body"]
+    assert results["arms"]["body"]["total"] > 0
+    assert results["cmp"]["body"]["uavs"][0]["designation"] == designation
+    assert results["missing"]["status"] == 404
+
+
+def test_batch_holds_no_cursor(synthetic_catalog, monkeypatch):
+    """
+    Test that a batch doesn't keep a pooled cursor between sub-requests.
+
+    Expected: No cursor out while each sub-request is dispatched, so a handle
+    swap (Database.reopen) never waits on a running batch
+    """
+    outstanding = []
+    dispatch = main.dispatch
+
+    async def recording(*args, **kwargs):
+        outstanding.append(db._cursors_out)
+        return await dispatch(*args, **kwargs)
+
+    monkeypatch.setattr(main, "dispatch", recording)
+    designation = _armed_uav()
+    db.open()
+    try:
+        response = client.post("/api/batch", json={"requests": [
+            {"path": f"/api/uavs/{designation}/armaments"},
+            {"path": "/api/filters/weapon-types"},
+        ]})
+    finally:
+        db.close()
+    assert response.status_code == 200
+    assert [r["status"] for r in response.json()["responses"]] == [200, 200]
+    assert outstanding == [0, 0]
+
+
+def test_batch_rejects_bad_requests(synthetic_catalog, monkeypatch):
+    """
+    Test batch validation.
+
+    Expected: 400 for nested batches, non-API paths and too many sub-requests
+    """
+    def status(*requests):
+        return client.post("/api/batch", json={"requests": list(requests)}).status_code
+
+    assert status({"path": "/api/batch"}) == 400
+    assert status({"path": "/assets/x.png"}) == 400
+    assert status({"path": "http://evil/api/uavs"}) == 400
+    assert status({"path": "/api/uavs", "method": "DELETE"}) == 422
+
+    monkeypatch.setattr(settings, "BATCH_MAX_REQUESTS", 2)
+    many = {"requests": [{"path": "/api/health/live"}] * 3}
+    assert client.post("/api/batch", json=many).status_code == 400
@@ -0,0 +1,141 @@
+"""
+Tests for GLB inspection and the model LOD build.
+"""
+
+import json
+import shutil
+import struct
+
+import duckdb
+import pytest
+
+import build_models as build_script
+from app.database import Database
+from app.gltf import GLBError, inspect_glb
+from build_models import build_models, load_manifest, manifest_path, save_manifest
+from init_db import apply_model_manifest
+
+
+def _glb(path, gltf):
+    """Write a JSON-only GLB (no binary chunk; inspection never reads it)."""
+    body = json.dumps(gltf).encode()
+    body += b" " * (-len(body) % 4)
+    path.write_bytes(
+        struct.pack("<4sII", b"glTF", 2, 12 + 8 + len(body))
+        + struct.pack("<II", len(body), 0x4E4F534A)
+        + body
+    )
+    return path
+
+
+def _airframe(span=2.0):
+    return {
+        "asset": {"version": "2.0"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [
+            {"children": [1], "translation": [10.0, 0.0, 0.0]},
+            {"mesh": 0, "scale": [span / 2, 1.0, 1.0]},
+        ],
+        "meshes": [{"primitives": [{"attributes": {"POSITION": 0}, "indices": 1}]}],
+        "accessors": [
+            {"count": 8, "type": "VEC3", "min": [-1.0, -0.5, -3.0], "max": [1.0, 0.5, 3.0]},
+            {"count": 36, "type": "SCALAR"},
+        ],
+    }
+
+
+def test_inspect_glb_applies_node_transforms(tmp_path):
+    """
+    Test bounding box and counts of a transformed mesh.
+
+    Expected: Parent translation and child scale are applied
+    """
+    info = inspect_glb(_glb(tmp_path / "box.glb", _airframe(span=20.0)))
+    assert info["vertices"] == 8 and info["triangles"] == 12
+    assert info["bounding_box"]["min"] == [0.0, -0.5, -3.0]
+    assert info["bounding_box"]["size"] == [20.0, 1.0, 6.0]
+
+    (tmp_path / "bad.glb").write_bytes(b"not a glb at all")
+    with pytest.raises(GLBError):
+        inspect_glb(tmp_path / "bad.glb")
+
+
+def test_build_models_skips_unchanged(tmp_path, synthetic_db_path):
+    """
+    Test building LODs twice, then recording them on the catalog.
+
+    Expected: Hashed LOD files and a manifest; the second run skips;
+    model_urls point at the built LODs
+    """
+    calls = []
+
+    def copy_transform(source, destination, ratio):
+        calls.append(ratio)
+        shutil.copy(source, destination)
+
+    conn = duckdb.connect(str(synthetic_db_path), read_only=True)
+    designation = conn.execute("SELECT designation FROM uavs LIMIT 1").fetchone()[0]
+    conn.close()
+    source = _glb(tmp_path / f"{designation.lower()}.glb", _airframe())
+    assets = tmp_path / "public"
+
+    entries, report = build_models(
+        {designation: source}, assets_root=assets, transform=copy_transform
+    )
+    assert report["built"] == [designation] and sorted(calls) == [0.15, 0.5, 1.0]
+    lods = entries[designation]["lods"]
+    assert set(lods) == {"high_poly", "medium_poly", "low_poly"}
+    slug = designation.lower()
+    assert lods["low_poly"]["url"].startswith(f"/assets/models/{slug}/{slug}-low.")
+    assert lods["high_poly"]["bytes"] == source.stat().st_size
+
+    calls.clear()
+    _, report = build_models(
+        {designation: source}, previous=entries, assets_root=assets, transform=copy_transform
+    )
+    assert report["skipped"] == [designation] and calls == []
+
+    db_path = tmp_path / "catalog.duckdb"
+    shutil.copy(synthetic_db_path, db_path)
+    save_manifest(manifest_path(assets), entries)
+    conn = duckdb.connect(str(db_path))
+    try:
+        assert apply_model_manifest(conn, manifest_path(assets)) == 1
+        model_urls = conn.execute(
+            "SELECT model_urls FROM uavs WHERE designation = ?", [designation]
+        ).fetchone()[0]
+        assert model_urls["low_poly"] == lods["low_poly"]["url"]
+    finally:
+        conn.close()
+
+
+def test_build_script_leaves_live_catalog_alone(tmp_path, monkeypatch, synthetic_db_path):
+    """
+    Test the build script while a server holds its read-only handle.
+
+    Expected: The build succeeds and writes the manifest without touching the database
+    """
+    def copy_transform(source, destination, ratio):
+        shutil.copy(source, destination)
+
+    monkeypatch.setattr(build_script, "cli_transformer", lambda *options: copy_transform)
+    db_path = tmp_path / "catalog.duckdb"
+    shutil.copy(synthetic_db_path, db_path)
+    database = Database(db_path)
+    database.open()
+    try:
+        designation = database.get_all_uavs()[0]["designation"]
+        sources = tmp_path / "models-src"
+        sources.mkdir()
+        _glb(sources / f"{designation.lower()}.glb", _airframe())
+        assets = tmp_path / "public"
+        before = database.file_fingerprint()
+
+        argv = ["--db", str(db_path), "--sources", str(sources), "--assets", str(assets)]
+        assert build_script.main([*argv, "--designation", designation, "--workers", "1"]) == 0
+
+        assert database.file_fingerprint() == before
+        assert designation in load_manifest(manifest_path(assets.resolve()))
+    finally:
+        database.close()
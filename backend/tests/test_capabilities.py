@@ -0,0 +1,128 @@
+"""
+Tests for the cross-entity capability search.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import db
+from app.main import app
+from app.predicates import PredicateError, compile_predicates
+
+client = TestClient(app)
+
+
+def _expected(snapshot, min_endurance, guidance, min_range, status):
+    """UAV -> matching weapon designations, stitched together from the per-UAV lookups."""
+    armaments = snapshot.armaments_by_designation
+    expected = {}
+    for uav in snapshot.uavs:
+        if not uav["endurance_hours"] or uav["endurance_hours"] <= min_endurance:
+            continue
+        weapons = [
+            link["designation"]
+            for link in db.get_armaments_for_uav(uav["designation"])
+            if link["integration_status"] == status
+            and guidance.lower() in (armaments[link["designation"]]["guidance_type"] or "").lower()
+            and (armaments[link["designation"]]["range_km"] or 0) > min_range
+        ]
+        if weapons:
+            expected[uav["designation"]] = sorted(weapons)
+    return expected
+
+
+def test_capability_search_matches_stitched_calls(synthetic_catalog):
+    """
+    Test one capability search against per-UAV armament lookups.
+
+    Expected: The same airframes, each with exactly the weapons that matched
+    """
+    response = client.post(
+        "/api/capabilities/search",
+        json={
+            "uav": [{"field": "endurance_hours", "op": "gt", "value": 10}],
+            "armament": [
+                {"field": "guidance_type", "op": "contains", "value": "laser"},
+                {"field": "range_km", "op": "gt", "value": 8},
+            ],
+            "integration_status": ["Operational"],
+        },
+    )
+    assert response.status_code == 200
+    body = response.json()
+    expected = _expected(synthetic_catalog, 10, "laser", 8, "Operational")
+    assert expected
+    found = {u["designation"]: [a["designation"] for a in u["armaments"]] for u in body["uavs"]}
+    assert found == expected
+    assert body["total"] == len(expected)
+    uav = body["uavs"][0]
+    assert uav["endurance_hours"] > 10
+    columns = {"range_km", "guidance_type", "max_quantity", "integration_status"}
+    assert columns <= set(uav["armaments"][0])
+
+
+def test_uav_only_search_lists_all_weapons(synthetic_catalog):
+    """
+    Test a search without weapon conditions.
+
+    Expected: Every UAV matching the list/text conditions, unarmed ones included
+    """
+    body = client.post(
+        "/api/capabilities/search",
+        json={"uav": [
+            {"field": "mission_types", "op": "contains", "value": "ISR"},
+            {"field": "type", "op": "in", "value": ["HALE ISR", "MALE UCAV"]},
+        ]},
+    ).json()
+    expected = [
+        u["designation"] for u in synthetic_catalog.uavs
+        if "ISR" in (u["mission_types"] or []) and u["type"] in ("HALE ISR", "MALE UCAV")
+    ]
+    assert [u["designation"] for u in body["uavs"]] == expected
+    for uav in body["uavs"][:10]:
+        linked = db.get_armaments_for_uav(uav["designation"])
+        names = sorted(a["designation"] for a in linked)
+        assert [a["designation"] for a in uav["armaments"]] == names
+
+
+def test_compile_predicates_rejects_bad_input():
+    """
+    Test the whitelist, operator kinds and value types.
+
+    Expected: Parameterized clauses for valid input, PredicateError otherwise
+    """
+    fields = {"range_km": "number", "name": "text", "operators": "list"}
+    clauses, params = compile_predicates(
+        "u",
+        [("range_km", "gte", 5), ("name", "contains", "Reaper"), ("operators", "in", ["Poland"])],
+        fields,
+    )
+    assert clauses == [
+        "u.range_km >= ?", "u.name ILIKE ?", "list_has_any(u.operators, ?::VARCHAR[])"
+    ]
+    assert params == [5, "%Reaper%", ["Poland"]]
+
+    for predicate in (
+        ("designation; DROP TABLE uavs", "eq", "x"),
+        ("range_km", "contains", "5"),
+        ("range_km", "gt", "5"),
+        ("range_km", "gt", True),
+        ("name", "lt", "M"),
+        ("operators", "in", []),
+    ):
+        with pytest.raises(PredicateError):
+            compile_predicates("u", [predicate], fields)
+
+
+def test_capability_search_errors(synthetic_catalog):
+    """
+    Test rejected requests.
+
+    Expected: 400 for unknown fields or mismatched operators, 422 for unknown operators
+    """
+    bad_field = {"armament": [{"field": "secret", "op": "eq", "value": 1}]}
+    assert client.post("/api/capabilities/search", json=bad_field).status_code == 400
+    bad_op = {"uav": [{"field": "name", "op": "gt", "value": "M"}]}
+    assert client.post("/api/capabilities/search", json=bad_op).status_code == 400
+    unknown_op = {"uav": [{"field": "name", "op": "like", "value": "M"}]}
+    assert client.post("/api/capabilities/search", json=unknown_op).status_code == 422
@@ -0,0 +1,199 @@
+"""
+Tests for catalog generations, the change feed and its event stream.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.changes import generation_events
+from app.config import settings
+from app.database import Database, db
+from app.main import app
+from app.snapshot import snapshots
+from init_db import init_database
+
+SCHEMA_PATH = Path(__file__).parent.parent / "db" / "schema.sql"
+
+client = TestClient(app)
+
+UAVS = [
+    {"id": 1, "designation": "A-1", "name": "Alpha", "type": "MALE", "range_km": 1000},
+    {"id": 2, "designation": "B-2", "name": "Bravo", "type": "HALE", "range_km": 2000},
+    {"id": 3, "designation": "C-3", "name": "Charlie", "type": "Tactical", "range_km": 300},
+]
+ARMAMENTS = [
+    {"id": 1, "designation": "M-1", "name": "Missile", "weapon_type": "Missile"},
+    {"id": 2, "designation": "B-1", "name": "Bomb", "weapon_type": "Bomb"},
+]
+LINKS = [
+    {"id": 1, "uav_designation": "A-1", "armament_designation": "M-1", "max_quantity": 2},
+    {"id": 2, "uav_designation": "B-2", "armament_designation": "B-1", "max_quantity": 4},
+]
+
+
+def _load(tmp_path, uavs, armaments, links):
+    """Run the loader on the given records into tmp_path/catalog.duckdb."""
+    paths = []
+    for name, records in (("uavs", uavs), ("armaments", armaments), ("links", links)):
+        path = tmp_path / f"{name}.json"
+        path.write_text(json.dumps(records))
+        paths.append(path)
+    db_path = tmp_path / "catalog.duckdb"
+    init_database(db_path, SCHEMA_PATH, *paths)
+    return db_path
+
+
+@pytest.fixture
+def reloaded_catalog(tmp_path, monkeypatch):
+    """A catalog loaded twice: generation 1, then one edit, one delete, one insert."""
+    _load(tmp_path, UAVS, ARMAMENTS, LINKS)
+    edited = [
+        dict(UAVS[0], range_km=1100),
+        UAVS[2],
+        {"id": 4, "designation": "D-4", "name": "Delta", "type": "MALE"},
+    ]
+    db_path = _load(tmp_path, edited, ARMAMENTS, LINKS[:1])
+    monkeypatch.setattr(db, "db_path", db_path)
+    snapshots.invalidate()
+    yield snapshots.current()
+    snapshots.invalidate()
+
+
+def test_loader_records_generations(reloaded_catalog):
+    """
+    Test that each load is a generation and unchanged rows keep their timestamps.
+
+    Expected: Generation 2, with the edit, insert and both deletions counted
+    """
+    assert reloaded_catalog.catalog_generation == 2
+    with db.get_connection() as conn:
+        generations = conn.execute(
+            "SELECT generation, inserted, updated, deleted FROM catalog_generations "
+            "ORDER BY generation"
+        ).fetchall()
+        assert generations == [(1, 7, 0, 0), (2, 1, 1, 2)]
+        unchanged = conn.execute(
+            "SELECT created_at = updated_at, updated_at < "
+            "(SELECT loaded_at FROM catalog_generations WHERE generation = 2) "
+            "FROM uavs WHERE designation = 'C-3'"
+        ).fetchone()
+        assert unchanged == (True, True)
+
+
+def test_changes_since_generation(reloaded_catalog):
+    """
+    Test the delta between generations.
+
+    Expected: Only the inserted, updated and deleted rows; everything for since=0
+    """
+    response = client.get("/api/changes", params={"since": 1})
+    assert response.status_code == 200
+    changes = response.json()
+    assert (changes["since"], changes["generation"]) == (1, 2)
+    uavs = changes["uavs"]
+    assert [u["designation"] for u in uavs["inserted"]] == ["D-4"]
+    assert [(u["designation"], u["range_km"]) for u in uavs["updated"]] == [("A-1", 1100)]
+    assert uavs["deleted"] == ["B-2"]
+    assert changes["armaments"] == {"inserted": [], "updated": [], "deleted": []}
+    assert changes["uav_armaments"]["deleted"] == ["B-2|B-1"]
+
+    assert client.get("/api/changes", params={"since": 2}).json()["uavs"] == {
+        "inserted": [], "updated": [], "deleted": []
+    }
+    everything = client.get("/api/changes").json()
+    assert [u["designation"] for u in everything["uavs"]["inserted"]] == ["A-1", "C-3", "D-4"]
+    assert client.get("/api/changes", params={"since": 9}).status_code == 410
+
+
+def test_reload_with_open_handle(tmp_path):
+    """
+    Test reloading while a server process holds its read-only handle.
+
+    Expected: The load succeeds; the handle serves the old file until reopened,
+    then the new generation; no temporary build file is left behind
+    """
+    db_path = _load(tmp_path, UAVS, ARMAMENTS, LINKS)
+    handle = Database(db_path)
+    handle.open()
+    try:
+        _load(tmp_path, UAVS[:2], ARMAMENTS, LINKS)
+        assert handle.get_catalog_generation() == 1
+        handle.reopen()
+        assert handle.get_catalog_generation() == 2
+        assert handle.get_stats()["total"] == 2
+    finally:
+        handle.close()
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".")] == []
+
+
+def test_generation_events():
+    """
+    Test the SSE generator: the current generation first, then each bump.
+
+    Expected: One event per distinct generation, keepalives while idle
+    """
+    generations = iter([3, 3, 3, 4, 4])
+    polls = []
+
+    async def disconnected():
+        polls.append(1)
+        return len(polls) > 5
+
+    async def collect():
+        return [
+            event async for event in generation_events(
+                lambda: next(generations), disconnected, poll_interval=0.001, keepalive=0.002
+            )
+        ]
+
+    events = asyncio.run(collect())
+    data = [e for e in events if e.startswith("id:")]
+    assert data == [
+        'id: 3\nevent: generation\ndata: {"generation": 3}\n\n',
+        'id: 4\nevent: generation\ndata: {"generation": 4}\n\n',
+    ]
+    assert ": keepalive\n\n" in events
+
+
+def test_stream_announces_reload(tmp_path, monkeypatch):
+    """
+    Test that a reload under a running server reaches the SSE stream.
+
+    Expected: The stream sends generation 1, then 2 once the loader has swapped
+    in a new database while the server holds its handle and snapshot
+    """
+    db_path = _load(tmp_path, UAVS, ARMAMENTS, LINKS)
+    monkeypatch.setattr(db, "db_path", db_path)
+    monkeypatch.setattr(settings, "SNAPSHOT_CACHE_ENABLED", True)
+    monkeypatch.setattr(snapshots, "check_interval", 0.0)
+    snapshots.invalidate()
+    db.open()
+    polls = []
+
+    async def disconnected():
+        polls.append(1)
+        if len(polls) == 3:
+            _load(tmp_path, UAVS[:2], ARMAMENTS, LINKS)
+        return len(polls) > 5
+
+    async def collect():
+        return [
+            event async for event in generation_events(
+                main._catalog_generation, disconnected, poll_interval=0.001, keepalive=60
+            )
+        ]
+
+    try:
+        events = asyncio.run(collect())
+    finally:
+        db.close()
+        snapshots.invalidate()
+    assert events == [
+        'id: 1\nevent: generation\ndata: {"generation": 1}\n\n',
+        'id: 2\nevent: generation\ndata: {"generation": 2}\n\n',
+    ]
@@ -0,0 +1,153 @@
+"""
+Tests for the columnar UAV store.
+"""
+
+import json
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.columnar import CategoricalColumn, ColumnarTable, NumericColumn
+from app.database import Database
+from app.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def database(synthetic_db_path):
+    return Database(db_path=synthetic_db_path)
+
+
+@pytest.fixture(scope="module")
+def table(database):
+    arrays, types = database.get_uav_columns()
+    return ColumnarTable.from_numpy(arrays, types, key="designation")
+
+
+def _normalize(value):
+    """Compare DECIMAL results from DuckDB with the table's floats."""
+    if value is None or isinstance(value, (bool, int, str, list, dict)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def test_rows_match_database(database, table):
+    """
+    Test that row views return what get_all_uavs returns.
+
+    Expected: Same rows, order, keys and values (JSON fields parsed)
+    """
+    records = database.get_all_uavs()
+    assert len(table) == len(records)
+    for view, record in zip(table, records):
+        assert list(view) == list(record)
+        assert {k: _normalize(v) for k, v in view.items()} == {
+            k: _normalize(v) for k, v in record.items()
+        }
+    assert table.by_key[records[7]["designation"]]["id"] == records[7]["id"]
+
+
+def test_column_encoding(table):
+    """
+    Test how columns are stored.
+
+    Expected: Low-cardinality strings are dictionary-encoded, measurements are NumPy
+    """
+    country = table.columns["country_of_origin"]
+    assert isinstance(country, CategoricalColumn)
+    assert len(country.categories) < len(table) and country.codes.dtype == np.int16
+    assert isinstance(table.columns["wingspan_meters"], NumericColumn)
+    assert not hasattr(table[0], "__dict__")
+
+
+def test_to_json_matches_records(database, table):
+    """
+    Test serializing straight from the columns.
+
+    Expected: Parses to the same objects as the dict records, minus excluded fields
+    """
+    records = database.get_all_uavs()
+    rows = np.array([0, 5, 3])
+    parsed = json.loads(table.to_json(rows, frozenset({"wingspan_feet"})))
+    assert [u["designation"] for u in parsed] == [records[i]["designation"] for i in rows]
+    for obj, i in zip(parsed, rows):
+        assert "wingspan_feet" not in obj
+        assert obj["wingspan_meters"] == _normalize(records[i]["wingspan_meters"])
+        assert obj["mission_types"] == records[i]["mission_types"]
+        assert obj["internal_weapons_bays"] == records[i]["internal_weapons_bays"]
+    assert json.loads(table.to_json(np.array([], dtype=np.int64))) == []
+
+
+def test_search_matches_database(synthetic_catalog, database):
+    """
+    Test snapshot search and compare against the SQL queries.
+
+    Expected: Same designations in the same order
+    """
+    sample = synthetic_catalog.uavs[3]
+    mission = next(u["mission_types"][0] for u in synthetic_catalog.uavs if u["mission_types"])
+    filters = [
+        {"country": sample["country_of_origin"]},
+        {"uav_type": sample["type"][:3], "status": sample["operational_status"]},
+        {"nato_class": sample["nato_class"]},
+        {"country": "Atlantis"},
+        {"mission_type": mission},
+        {"mission_type": mission, "country": sample["country_of_origin"]},
+        {"mission_type": "Nope"},
+    ]
+    for kwargs in filters:
+        rows = synthetic_catalog.search_uavs(**kwargs)
+        expected = [u["designation"] for u in database.search_uavs(**kwargs)]
+        assert [synthetic_catalog.uavs[i]["designation"] for i in rows] == expected
+
+    uavs = synthetic_catalog.uavs
+    wanted = [uavs[9]["designation"], uavs[2]["designation"], "NOPE"]
+    rows = synthetic_catalog.compare_uavs(wanted)
+    assert [synthetic_catalog.uavs[i]["designation"] for i in rows] == [
+        u["designation"] for u in database.compare_uavs(wanted)
+    ]
+
+
+def test_rank(table):
+    """
+    Test ranking by a numeric column.
+
+    Expected: NULLs skipped, sorted best first, limit applied; non-numeric rejected
+    """
+    rows = table.rank("max_speed_kmh", descending=True, limit=5)
+    speeds = [table[i]["max_speed_kmh"] for i in rows]
+    assert len(speeds) == 5 and None not in speeds
+    assert speeds == sorted(speeds, reverse=True)
+
+    ascending = table.rank("max_speed_kmh", descending=False)
+    assert table[ascending[0]]["max_speed_kmh"] == min(
+        u["max_speed_kmh"] for u in table if u["max_speed_kmh"] is not None
+    )
+    with pytest.raises(ValueError):
+        table.rank("country_of_origin")
+
+
+def test_list_endpoints_use_snapshot(synthetic_catalog):
+    """
+    Test the list, search and rank endpoints served from the columnar snapshot.
+
+    Expected: UAVList shape; unit exclusions applied; bad rank field is 400
+    """
+    body = client.get("/api/uavs", params={"units": "metric"}).json()
+    assert body["total"] == len(synthetic_catalog.uavs) == len(body["uavs"])
+    assert "wingspan_feet" not in body["uavs"][0]
+
+    country = synthetic_catalog.uavs[0]["country_of_origin"]
+    found = client.post("/api/uavs/search", json={"country": country}).json()
+    assert found["total"] > 0
+    assert all(u["country_of_origin"] == country for u in found["uavs"])
+
+    ranked = client.get("/api/uavs/rank", params={"by": "endurance_hours", "limit": 3}).json()
+    hours = [u["endurance_hours"] for u in ranked["uavs"]]
+    assert ranked["total"] == 3 and hours == sorted(hours, reverse=True)
+    assert client.get("/api/uavs/rank", params={"by": "name"}).status_code == 400
@@ -0,0 +1,71 @@
+"""
+Tests for the Database query layer against a synthetic catalog.
+"""
+
+import pytest
+
+from app.database import Database
+
+
+@pytest.fixture
+def database(synthetic_db_path) -> Database:
+    """Database pointed at the synthetic catalog."""
+    return Database(synthetic_db_path)
+
+
+def test_compare_reuses_one_statement(database):
+    """
+    Test comparing different numbers of UAVs.
+
+    Expected: Correct rows each time, from a single cached statement
+    """
+    all_designations = [u["designation"] for u in database.get_all_uavs()]
+    for n in (1, 3, 7):
+        wanted = all_designations[:n] + ["NOT-A-UAV"]
+        result = database.compare_uavs(wanted)
+        assert [u["designation"] for u in result] == sorted(all_designations[:n])
+
+    compare_keys = [key for key in database.statements._entries if key[0] == "compare_uavs"]
+    assert len(compare_keys) == 1
+
+
+def test_search_statements_keyed_by_filter_shape(database):
+    """
+    Test repeated searches with the same filter combination.
+
+    Expected: One cache entry per shape; later calls are cache hits
+    """
+    uav = database.get_all_uavs()[0]
+    first = database.search_uavs(country=uav["country_of_origin"])
+    misses = database.statements.misses
+    second = database.search_uavs(country="No Such Country")
+    assert database.statements.misses == misses
+    assert second == []
+    assert all(u["country_of_origin"] == uav["country_of_origin"] for u in first)
+
+    database.search_uavs(country=uav["country_of_origin"], status="Active")
+    assert database.statements.misses == misses + 1
+    shapes = {key[1] for key in database.statements._entries if key[0] == "search_uavs"}
+    assert ("country_of_origin = ?",) in shapes
+    assert ("country_of_origin = ?", "operational_status = ?") in shapes
+
+
+def test_nested_columns_are_native(database):
+    """
+    Test that list, map and struct columns come back as Python objects.
+
+    Expected: Lists and dicts without parsing; mission_type filters with list_contains
+    """
+    uav = next(u for u in database.get_all_uavs() if u["mission_types"] and u["variants"])
+    assert all(isinstance(m, str) for m in uav["mission_types"])
+    assert isinstance(uav["imagery_urls"], dict) and "side" in uav["imagery_urls"]
+    assert {"designation", "name", "description", "range_km"} <= set(uav["variants"][0])
+
+    mission = uav["mission_types"][0]
+    matches = database.search_uavs(mission_type=mission)
+    assert uav["designation"] in [u["designation"] for u in matches]
+    assert all(mission in u["mission_types"] for u in matches)
+    assert database.search_uavs(mission_type="Nope") == []
+
+    armament = next(a for a in database.get_all_armaments() if a["launch_platform_types"])
+    assert isinstance(armament["launch_platform_types"], list)
@@ -0,0 +1,81 @@
+"""
+Tests for the synthetic catalog generator.
+"""
+
+import duckdb
+
+from generate_catalog import CatalogGenerator, CatalogSpec
+
+
+def _catalog(spec: CatalogSpec):
+    generator = CatalogGenerator(spec)
+    armaments = list(generator.armaments())
+    pairs = list(generator.uavs(armaments))
+    return armaments, [uav for uav, _ in pairs], [link for _, links in pairs for link in links]
+
+
+def test_generator_is_deterministic():
+    """
+    Test generating the same spec twice.
+
+    Expected: Identical records; a different seed changes them
+    """
+    spec = CatalogSpec(n_uavs=50, n_armaments=20, seed=3)
+    assert _catalog(spec) == _catalog(spec)
+    assert _catalog(spec) != _catalog(CatalogSpec(n_uavs=50, n_armaments=20, seed=4))
+
+
+def test_generator_cardinalities_and_unit_pairs():
+    """
+    Test configured cardinalities and unit consistency.
+
+    Expected: Distinct values match the spec; imperial twins match SI values
+    """
+    spec = CatalogSpec(n_uavs=500, n_armaments=30, countries=5, types=3, statuses=2)
+    _, uavs, links = _catalog(spec)
+
+    assert len({u["country_of_origin"] for u in uavs}) == 5
+    assert len({u["type"] for u in uavs}) == 3
+    assert len({u["operational_status"] for u in uavs}) == 2
+    for uav in uavs:
+        if uav["range_km"] is None:
+            assert uav["range_miles"] is None and uav["range_nm"] is None
+        else:
+            assert abs(uav["range_miles"] - uav["range_km"] * 0.621371) < 0.1
+
+    designations = {u["designation"] for u in uavs}
+    pairs = [(link["uav_designation"], link["armament_designation"]) for link in links]
+    assert len(pairs) == len(set(pairs))
+    assert all(uav in designations for uav, _ in pairs)
+
+
+def test_null_density():
+    """
+    Test null density setting.
+
+    Expected: Optional fields are sparser at a higher density
+    """
+    def nulls(density: float) -> int:
+        _, uavs, _ = _catalog(CatalogSpec(n_uavs=200, null_density=density))
+        return sum(value is None for uav in uavs for value in uav.values())
+
+    assert nulls(0.0) < nulls(0.3)
+
+
+def test_populate_database(synthetic_db_path):
+    """
+    Test bulk-loading a catalog into DuckDB.
+
+    Expected: All three tables are populated and JSON columns are preserved
+    """
+    conn = duckdb.connect(str(synthetic_db_path), read_only=True)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM uavs").fetchone()[0] == 200
+        assert conn.execute("SELECT COUNT(*) FROM armaments").fetchone()[0] == 40
+        assert conn.execute("SELECT COUNT(*) FROM uav_armaments").fetchone()[0] > 0
+        sensors = conn.execute(
+            "SELECT sensor_suite FROM uavs WHERE sensor_suite IS NOT NULL LIMIT 1"
+        ).fetchone()[0]
+        assert isinstance(sensors, list) and all(isinstance(s, str) for s in sensors)
+    finally:
+        conn.close()
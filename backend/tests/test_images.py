@@ -0,0 +1,185 @@
+"""
+Tests for the image derivative pipeline.
+"""
+
+import shutil
+import threading
+import time
+
+import duckdb
+import pytest
+
+pytest.importorskip("PIL")
+from PIL import Image  # noqa: E402
+
+import build_images  # noqa: E402
+from app import images  # noqa: E402
+from app.database import Database  # noqa: E402
+from app.images import (  # noqa: E402
+    OnDemandDerivatives,
+    build_derivatives,
+    load_manifest,
+    manifest_path,
+    save_manifest,
+    select_variant,
+)
+from init_db import apply_image_manifest  # noqa: E402
+
+
+def _source(assets_root, name, color, size=(900, 600)):
+    folder = assets_root / "assets" / "images" / "uavs" / name
+    folder.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", size, color).save(folder / f"{name}-side.png")
+    return f"/assets/images/uavs/{name}/{name}-side.png"
+
+
+def test_build_and_skip_unchanged(tmp_path):
+    """
+    Test building derivatives twice, then after changing one source.
+
+    Expected: Widths never exceed the source; names are content-hashed;
+    unchanged sources are skipped; a changed source is rebuilt
+    """
+    a = _source(tmp_path, "a", "red")
+    b = _source(tmp_path, "b", "blue", size=(300, 200))
+    kwargs = dict(
+        widths=(320, 640, 1280), thumbnail_width=160, formats=("webp",), assets_root=tmp_path
+    )
+
+    entries, report = build_derivatives([a, b, "/assets/images/none.png"], workers=2, **kwargs)
+    assert sorted(report["built"]) == [a, b]
+    assert report["missing"] == ["/assets/images/none.png"]
+
+    widths_a = sorted({v["width"] for v in entries[a]["variants"]})
+    assert widths_a == [160, 320, 640, 900]
+    assert sorted({v["width"] for v in entries[b]["variants"]}) == [160, 300]
+    assert {v["format"] for v in entries[a]["variants"]} == {"webp", "jpeg"}
+    for variant in entries[a]["variants"]:
+        name = variant["url"].rsplit("/", 1)[-1]
+        assert len(name.split(".")[-2]) == 12
+        assert (tmp_path / variant["url"].lstrip("/")).is_file()
+    assert set(entries[a]["thumbnail"]) == {"webp", "jpeg"}
+
+    _, report = build_derivatives([a, b], previous=entries, **kwargs)
+    assert sorted(report["skipped"]) == [a, b]
+
+    _source(tmp_path, "b", "green", size=(300, 200))
+    _, report = build_derivatives([a, b], previous=entries, **kwargs)
+    assert report["built"] == [b] and report["skipped"] == [a]
+
+
+def test_select_variant_by_accept_and_width():
+    """
+    Test variant selection.
+
+    Expected: Smallest wide-enough variant in the best accepted format
+    """
+    entry = {
+        "variants": [
+            {"width": w, "format": f, "url": f"/{w}.{f}"}
+            for w in (160, 320, 640)
+            for f in ("avif", "webp", "jpeg")
+        ]
+    }
+    assert select_variant(entry, 300, "image/avif,image/webp,*/*")["url"] == "/320.avif"
+    assert select_variant(entry, 300, "image/webp,*/*")["url"] == "/320.webp"
+    assert select_variant(entry, 2000, None)["url"] == "/640.jpeg"
+
+
+def test_apply_manifest_records_derivatives(tmp_path, synthetic_db_path):
+    """
+    Test recording manifest entries on the catalog.
+
+    Expected: Matching UAVs get image_derivatives keyed by view
+    """
+    db_path = tmp_path / "catalog.duckdb"
+    shutil.copy(synthetic_db_path, db_path)
+    conn = duckdb.connect(str(db_path))
+    try:
+        designation, urls = conn.execute(
+            "SELECT designation, imagery_urls FROM uavs WHERE imagery_urls IS NOT NULL LIMIT 1"
+        ).fetchone()
+        side = urls["side"]
+        manifest = tmp_path / "derivatives.json"
+        save_manifest(manifest, {side: {"source": side, "variants": []}})
+
+        assert apply_image_manifest(conn, manifest) == 1
+        recorded = conn.execute(
+            "SELECT image_derivatives FROM uavs WHERE designation = ?", [designation]
+        ).fetchone()[0]
+        assert recorded["side"]["source"] == side
+        assert recorded["side"]["variants"] == []
+    finally:
+        conn.close()
+
+
+def test_build_script_leaves_live_catalog_alone(tmp_path, synthetic_db_path):
+    """
+    Test the build script while a server holds its read-only handle.
+
+    Expected: The build succeeds and writes the manifest without touching the database
+    """
+    db_path = tmp_path / "catalog.duckdb"
+    shutil.copy(synthetic_db_path, db_path)
+    database = Database(db_path)
+    database.open()
+    try:
+        with database.get_connection() as conn:
+            designation, urls = conn.execute(
+                "SELECT designation, imagery_urls FROM uavs WHERE imagery_urls IS NOT NULL LIMIT 1"
+            ).fetchone()
+        source = tmp_path / urls["side"].lstrip("/")
+        source.parent.mkdir(parents=True, exist_ok=True)
+        Image.new("RGB", (400, 300), "red").save(source)
+        before = database.file_fingerprint()
+
+        argv = ["--db", str(db_path), "--assets", str(tmp_path), "--designation", designation]
+        assert build_images.main([*argv, "--formats", "webp", "--workers", "1"]) == 0
+
+        assert database.file_fingerprint() == before
+        assert urls["side"] in load_manifest(manifest_path(tmp_path))
+    finally:
+        database.close()
+
+
+def test_on_demand_reuses_builds_and_coalesces(tmp_path, monkeypatch):
+    """
+    Test on-demand builds against the offline manifest and concurrent requests.
+
+    Expected: Manifest entries are reused without rendering; concurrent
+    first requests render once; a new generation reuses the earlier build
+    """
+    renders = []
+    render = images.render_derivatives
+
+    def counting_render(job):
+        renders.append(job["source_url"])
+        time.sleep(0.05)
+        return render(job)
+
+    monkeypatch.setattr(images, "render_derivatives", counting_render)
+    kwargs = dict(widths=(320,), thumbnail_width=160, formats=("webp",), assets_root=tmp_path)
+    monkeypatch.setattr(images.settings, "IMAGE_WIDTHS", "320")
+    monkeypatch.setattr(images.settings, "IMAGE_FORMATS", "webp")
+
+    offline = _source(tmp_path, "a", "red")
+    entries, _ = build_derivatives([offline], **kwargs)
+    save_manifest(images.manifest_path(tmp_path), entries)
+    renders.clear()
+    builder = OnDemandDerivatives(assets_root=tmp_path)
+
+    uav = {"designation": "A", "imagery_urls": {"side": offline}}
+    assert builder.for_uav(uav, 1)["side"] == entries[offline]
+    assert renders == []
+
+    fresh = _source(tmp_path, "b", "blue")
+    uav = {"designation": "B", "imagery_urls": {"side": fresh}}
+    threads = [threading.Thread(target=builder.for_uav, args=(uav, 1)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert renders == [fresh]
+
+    assert builder.for_uav(uav, 2)["side"]["source"] == fresh
+    assert renders == [fresh]
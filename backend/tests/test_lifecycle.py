@@ -0,0 +1,106 @@
+"""
+Tests for worker lifecycle: warm-up, readiness probes and snapshot reloads.
+"""
+
+import shutil
+
+import duckdb
+import pytest
+from fastapi.testclient import TestClient
+
+from app import lifecycle
+from app.config import settings
+from app.database import Database, db
+from app.main import app
+from app.snapshot import SnapshotCache
+
+
+@pytest.fixture
+def fresh_state(monkeypatch):
+    """Run each test against a reset, not-yet-ready process state."""
+    monkeypatch.setattr(lifecycle, "state", lifecycle.ServiceState())
+    yield lifecycle.state
+    db.close()
+
+
+def test_liveness_without_database(fresh_state, monkeypatch, tmp_path):
+    """
+    Test probes while the database is missing.
+
+    Expected: Live is 200; ready is 503 with the warm-up error
+    """
+    monkeypatch.setattr(db, "db_path", tmp_path / "missing.duckdb")
+    lifecycle.warm_up(open_handle=True, load_snapshot=False)
+    client = TestClient(app)
+
+    assert client.get("/api/health/live").status_code == 200
+    response = client.get("/api/health/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == lifecycle.PHASE_FAILED
+    assert response.json()["error"]
+
+
+def test_warm_up_makes_ready(fresh_state, monkeypatch, synthetic_db_path):
+    """
+    Test warming up against a real catalog.
+
+    Expected: Ready is 200, the handle is open and timings are reported
+    """
+    monkeypatch.setattr(db, "db_path", synthetic_db_path)
+    lifecycle.warm_up(open_handle=True, load_snapshot=False)
+    client = TestClient(app)
+
+    ready = client.get("/api/health/ready")
+    assert ready.status_code == 200
+    assert ready.json()["db_handle_open"] is True
+    report = client.get("/api/health/startup").json()
+    assert report["phase"] == lifecycle.PHASE_READY
+    assert report["db_open_seconds"] is not None
+
+
+def test_ready_without_warm_up(fresh_state, monkeypatch, synthetic_db_path):
+    """
+    Test a forked worker starting with WARMUP_ON_STARTUP off.
+
+    Expected: Ready is 200 after startup and the first request loads the catalog lazily
+    """
+    monkeypatch.setattr(db, "db_path", synthetic_db_path)
+    monkeypatch.setattr(settings, "WARMUP_ON_STARTUP", False)
+    lifecycle.after_fork()
+    assert lifecycle.state.phase == lifecycle.PHASE_STARTING
+
+    with TestClient(app) as client:
+        ready = client.get("/api/health/ready")
+        assert ready.status_code == 200
+        assert ready.json()["status"] == "ready"
+        assert client.get("/api/uavs").json()["total"] > 0
+
+
+def test_snapshot_reloads_when_file_replaced(synthetic_db_path, tmp_path):
+    """
+    Test replacing the database file under a warm snapshot.
+
+    Expected: A new generation is loaded from the new file
+    """
+    path = tmp_path / "catalog.duckdb"
+    shutil.copy(synthetic_db_path, path)
+    database = Database(path)
+    database.open()
+    snapshots = SnapshotCache(database, check_interval=0.0)
+    try:
+        first = snapshots.current()
+        assert snapshots.current() is first
+
+        replacement = tmp_path / "replacement.duckdb"
+        shutil.copy(synthetic_db_path, replacement)
+        conn = duckdb.connect(str(replacement))
+        conn.execute("DELETE FROM uav_armaments")
+        conn.execute("DELETE FROM uavs WHERE designation = ?", [first.uavs[0]["designation"]])
+        conn.close()
+        replacement.replace(path)
+
+        second = snapshots.current()
+        assert second.generation == first.generation + 1
+        assert len(second.uavs) == len(first.uavs) - 1
+    finally:
+        database.close()
@@ -0,0 +1,128 @@
+"""
+Tests for the payload loadout optimizer.
+"""
+
+import itertools
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import database, loadouts
+from app.database import db
+from app.loadouts import best_loadouts, planner
+from app.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def synthetic_catalog(synthetic_catalog):
+    """Shared synthetic catalog, starting with an empty planner cache."""
+    planner.cache.clear()
+    return synthetic_catalog
+
+
+def _brute_force(weights, bounds, values, capacity, hardpoints):
+    best = []
+    for quantities in itertools.product(*(range(b + 1) for b in bounds)):
+        weight = sum(q * w for q, w in zip(quantities, weights))
+        if any(quantities) and weight <= capacity and sum(quantities) <= hardpoints:
+            best.append((sum(q * v for q, v in zip(quantities, values)), weight))
+    return sorted(best, key=lambda c: (-c[0], c[1]))
+
+
+def test_best_loadouts_matches_brute_force():
+    """
+    Test the memoized solver against exhaustive enumeration.
+
+    Expected: Same top scores and weights, all within both capacities
+    """
+    weights = [4500, 22600, 1300, 11300]
+    bounds = [4, 2, 8, 3]
+    values = [9.0, 87.0, 3.5, 40.0]
+    solutions = best_loadouts(
+        weights, bounds, [0, 0, 0, 0], values, capacity=50000, hardpoints=6, limit=10
+    )
+
+    expected = _brute_force(weights, bounds, values, 50000, 6)[:10]
+    assert [(round(v, 6), w) for v, w, _ in solutions] == [(round(v, 6), w) for v, w in expected]
+    for _, weight, quantities in solutions:
+        assert sum(quantities) <= 6 and weight <= 50000
+        assert all(q <= b for q, b in zip(quantities, bounds))
+
+
+def test_best_loadouts_required_items():
+    """
+    Test minimum quantities for required items.
+
+    Expected: Every solution carries the required item; nothing fits if it can't
+    """
+    solutions = best_loadouts([10, 1], [2, 5], [1, 0], [1.0, 5.0], capacity=12, hardpoints=3)
+    assert solutions and all(q[0] >= 1 for _, _, q in solutions)
+    assert best_loadouts([10, 1], [2, 5], [1, 0], [1.0, 5.0], capacity=5, hardpoints=3) == []
+
+
+def test_best_loadouts_skips_empty_before_limit():
+    """
+    Test that carrying nothing never takes one of the kept places.
+
+    Expected: With zero-value items the lightest real loadouts are returned, not the empty one
+    """
+    solutions = best_loadouts(
+        [300, 200], [2, 1], [0, 0], [0.0, 0.0], capacity=1000, hardpoints=3, limit=2
+    )
+    assert [(w, q) for _, w, q in solutions] == [(200, (0, 1)), (300, (1, 0))]
+
+
+def test_loadouts_endpoint(synthetic_catalog, monkeypatch):
+    """
+    Test planning loadouts for an armed UAV.
+
+    Expected: Ranked loadouts within the UAV's limits, served from cache on repeat
+    """
+    with db.get_connection() as conn:
+        designation = conn.execute(
+            "SELECT uav_designation FROM uav_armaments ORDER BY uav_designation LIMIT 1"
+        ).fetchone()[0]
+    url = f"/api/uavs/{designation}/loadouts"
+    response = client.get(url, params={"objective": "count", "limit": 3})
+    assert response.status_code == 200
+    plan = response.json()
+    assert plan["snapshot_generation"] == synthetic_catalog.generation
+    assert 0 < plan["total"] <= 3
+    scores = [loadout["score"] for loadout in plan["loadouts"]]
+    assert scores == sorted(scores, reverse=True)
+
+    limits = plan["limits"]
+    bounds = {c["designation"]: c["max_quantity"] for c in plan["candidates"]}
+    for loadout in plan["loadouts"]:
+        assert loadout["munitions"] == loadout["score"] <= limits["hardpoints"]
+        assert loadout["total_weight_kg"] <= limits["max_weapons_load_kg"]
+        assert all(item["quantity"] <= bounds[item["designation"]] for item in loadout["items"])
+
+    # A repeat query is answered from the plan cache without touching the database
+    opened = []
+    monkeypatch.setattr(database, "_connect", lambda path: opened.append(path))
+    assert client.get(url, params={"objective": "count", "limit": 3}).json() == plan
+    assert planner.cache.hits >= 1
+
+
+def test_loadouts_errors(synthetic_catalog, monkeypatch):
+    """
+    Test loadout error handling.
+
+    Expected: 404 for unknown UAVs, 400 for incompatible required armaments or too
+    many candidates, 422 for bad objectives
+    """
+    with db.get_connection() as conn:
+        designation = conn.execute(
+            "SELECT uav_designation FROM uav_armaments ORDER BY uav_designation LIMIT 1"
+        ).fetchone()[0]
+    url = f"/api/uavs/{designation}/loadouts"
+    assert client.get("/api/uavs/NOPE/loadouts").status_code == 404
+    assert client.get(url, params={"require": "NOPE-1"}).status_code == 400
+    assert client.get(url, params={"objective": "range"}).status_code == 422
+
+    monkeypatch.setattr(loadouts, "MAX_CANDIDATES", 0)
+    response = client.get(url)
+    assert response.status_code == 400 and "exclude" in response.json()["detail"]
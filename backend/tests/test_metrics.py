@@ -0,0 +1,151 @@
+"""
+Tests for X-UAV metrics registry and /metrics endpoint.
+"""
+
+import os
+import subprocess
+import sys
+import threading
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.metrics import MetricsRegistry, MultiprocessCollector
+
+client = TestClient(app)
+
+
+def test_counter_sums_across_threads():
+    """
+    Test counter increments from many threads.
+
+    Expected: Scraped total equals the number of increments
+    """
+    registry = MetricsRegistry()
+    counter = registry.counter("test_total", "Test counter", ("kind",))
+
+    def worker():
+        for _ in range(1000):
+            counter.labels("a").inc()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert counter.labels("a").value() == 8000
+    assert 'test_total{kind="a"} 8000' in registry.render()
+
+
+def test_histogram_buckets_are_cumulative():
+    """
+    Test histogram exposition.
+
+    Expected: Bucket counts are cumulative and +Inf equals count
+    """
+    registry = MetricsRegistry()
+    histogram = registry.histogram("test_seconds", "Test histogram", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(value)
+
+    text = registry.render()
+    assert 'test_seconds_bucket{le="0.1"} 1' in text
+    assert 'test_seconds_bucket{le="1"} 3' in text
+    assert 'test_seconds_bucket{le="+Inf"} 4' in text
+    assert "test_seconds_count 4" in text
+    assert "test_seconds_sum 6.05" in text
+
+
+def test_gauge_function():
+    """
+    Test gauge computed at scrape time.
+
+    Expected: Callback value is rendered
+    """
+    registry = MetricsRegistry()
+    registry.gauge("test_ratio", "Test gauge").set_function(lambda: 0.25)
+    assert "test_ratio 0.25" in registry.render()
+
+
+def _worker_registry():
+    """Registry with the same families as every worker."""
+    registry = MetricsRegistry()
+    registry.counter("test_total", "Test counter", ("kind",))
+    registry.histogram("test_seconds", "Test histogram", buckets=(0.1, 1.0))
+    registry.gauge("test_in_flight", "Summed gauge")
+    registry.gauge("test_generation", "Per-worker gauge", merge_mode="all")
+    return registry
+
+
+def test_reset_drops_inherited_samples():
+    """
+    Test resetting a registry, as a forked worker does.
+
+    Expected: Counts are zero again; callback gauges keep working
+    """
+    registry = MetricsRegistry()
+    counter = registry.counter("test_total", "Test counter")
+    counter.inc(5)
+    registry.gauge("test_ratio", "Test gauge").set_function(lambda: 0.25)
+
+    registry.reset()
+    counter.inc()
+    text = registry.render()
+    assert "test_total 1" in text
+    assert "test_ratio 0.25" in text
+
+
+def test_multiprocess_render_merges_workers(tmp_path):
+    """
+    Test a scrape merging the files of a live and an exited worker.
+
+    Expected: Counters and histograms sum over all workers; gauges only over live
+    ones, per worker (pid label) for merge_mode="all"
+    """
+    exited = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited.wait()
+    others = {os.getppid(): 2, exited.pid: 3}
+    for pid, count in others.items():
+        other = _worker_registry()
+        other.get("test_total").labels("a").inc(count)
+        other.get("test_seconds").observe(0.5)
+        other.get("test_in_flight").inc(count)
+        other.get("test_generation").inc(7)
+        MultiprocessCollector(other, tmp_path).write(pid)
+
+    registry = _worker_registry()
+    registry.get("test_total").labels("a").inc()
+    registry.get("test_seconds").observe(0.05)
+    registry.get("test_in_flight").inc()
+    registry.get("test_generation").inc(8)
+    text = MultiprocessCollector(registry, tmp_path).render()
+
+    assert 'test_total{kind="a"} 6' in text
+    assert 'test_seconds_bucket{le="0.1"} 1' in text
+    assert 'test_seconds_bucket{le="1"} 3' in text
+    assert "test_seconds_count 3" in text
+    assert "test_in_flight 3" in text
+    assert f'test_generation{{pid="{os.getpid()}"}} 8' in text
+    assert f'test_generation{{pid="{os.getppid()}"}} 7' in text
+    assert f'pid="{exited.pid}"' not in text
+
+
+def test_metrics_endpoint_records_route_templates():
+    """
+    Test /metrics after serving requests.
+
+    Expected: Request counter uses the route template, not the raw path
+    """
+    client.get("/")
+    client.get("/api/uavs/MQ-9")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    text = response.text
+    assert 'xuav_http_requests_total{method="GET",route="/",status="200"}' in text
+    assert 'route="/api/uavs/{designation}"' in text
+    assert "/api/uavs/MQ-9" not in text
+    assert 'xuav_db_query_duration_seconds_count{method="get_uav_by_designation"}' in text
+    assert "xuav_http_requests_in_flight" in text
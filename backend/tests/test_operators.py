@@ -0,0 +1,104 @@
+"""
+Tests for the operator index and the country fleet summary.
+"""
+
+import duckdb
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app
+
+client = TestClient(app)
+
+
+def _fleets(uavs):
+    """Country -> designations fielded (operators or export_countries), from the raw lists."""
+    fleets = {}
+    for uav in uavs:
+        for country in (uav["operators"] or []) + (uav["export_countries"] or []):
+            fleets.setdefault(country, set()).add(uav["designation"])
+    return fleets
+
+
+def test_index_matches_lists(synthetic_db_path):
+    """
+    Test that uav_operators and country_fleets agree with the UAVs' lists.
+
+    Expected: Every fleet, split and supplier list recomputed from the lists
+    """
+    conn = duckdb.connect(str(synthetic_db_path), read_only=True)
+    try:
+        uavs = [
+            dict(zip(("designation", "country_of_origin", "operators", "export_countries"), row))
+            for row in conn.execute(
+                "SELECT designation, country_of_origin, operators, export_countries FROM uavs"
+            ).fetchall()
+        ]
+        rows = conn.execute("SELECT * FROM country_fleets").fetchall()
+        columns = [desc[0] for desc in conn.description]
+    finally:
+        conn.close()
+
+    origin = {u["designation"]: u["country_of_origin"] for u in uavs}
+    fleets = _fleets(uavs)
+    summary = {row[0]: dict(zip(columns, row)) for row in rows}
+    assert set(fleets) <= set(summary)
+    for country, designations in fleets.items():
+        fleet = summary[country]
+        assert fleet["designations"] == sorted(designations)
+        assert fleet["domestic"] == sum(origin[d] == country for d in designations)
+        assert fleet["domestic"] + fleet["imported"] == fleet["uav_count"] == len(designations)
+        assert fleet["suppliers"] == sorted({origin[d] for d in designations} - {country})
+        abroad = {
+            (c, d) for c, ds in fleets.items() if c != country for d in ds if origin[d] == country
+        }
+        assert fleet["exported"] == len({d for _, d in abroad})
+        assert fleet["customers"] == sorted({c for c, _ in abroad})
+
+
+def test_operator_endpoints(synthetic_catalog):
+    """
+    Test /api/operators and /api/operators/{country}.
+
+    Expected: Summary per country, the country's UAVs with their relations, 404 for unknown
+    """
+    body = client.get("/api/operators").json()
+    countries = body["countries"]
+    assert body["total"] == len(countries) > 0
+    counts = [c["uav_count"] for c in countries]
+    assert counts == sorted(counts, reverse=True)
+    assert "designations" not in countries[0]
+
+    country = countries[0]["country"]
+    fleet = client.get(f"/api/operators/{country}").json()
+    assert fleet["uav_count"] == len(fleet["uavs"]) == countries[0]["uav_count"]
+    by_designation = synthetic_catalog.uavs.by_key
+    for uav in fleet["uavs"]:
+        record = by_designation[uav["designation"]]
+        assert ("operator" in uav["relations"]) == (country in (record["operators"] or []))
+        assert ("export" in uav["relations"]) == (country in (record["export_countries"] or []))
+
+    assert client.get("/api/operators/Atlantis").status_code == 404
+
+
+@pytest.mark.parametrize("snapshot_enabled", [True, False])
+def test_uavs_filtered_by_operator(synthetic_catalog, monkeypatch, snapshot_enabled):
+    """
+    Test /api/uavs?operator= and the operator search filter.
+
+    Expected: Exactly the UAVs listing the country as operator, from either path
+    """
+    monkeypatch.setattr(settings, "SNAPSHOT_CACHE_ENABLED", snapshot_enabled)
+    country = synthetic_catalog.uavs[0]["operators"][0]
+    expected = [
+        u["designation"] for u in synthetic_catalog.uavs if country in (u["operators"] or [])
+    ]
+
+    listed = client.get("/api/uavs", params={"operator": country, "units": "metric"}).json()
+    assert [u["designation"] for u in listed["uavs"]] == expected
+    assert listed["total"] == len(expected)
+
+    searched = client.post("/api/uavs/search", json={"operator": country}).json()
+    assert [u["designation"] for u in searched["uavs"]] == expected
+    assert client.get("/api/uavs", params={"operator": "Atlantis"}).json()["total"] == 0
@@ -0,0 +1,89 @@
+"""
+Tests for the skyline algorithm and the Pareto-frontier endpoint.
+"""
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app import pareto
+from app.main import app
+from app.pareto import skyline
+
+client = TestClient(app)
+
+
+def _brute_force(values):
+    """Non-dominated rows by comparing every pair."""
+    return [
+        i for i in range(len(values))
+        if not ((values <= values[i]).all(axis=1) & (values < values[i]).any(axis=1)).any()
+    ]
+
+
+@pytest.mark.parametrize("columns", [1, 2, 3, 5])
+def test_skyline_matches_pairwise(monkeypatch, columns):
+    """
+    Test the skyline against pairwise comparison, with ties and duplicates.
+
+    Expected: Same rows for every dimensionality, across block boundaries
+    """
+    monkeypatch.setattr(pareto, "SKYLINE_BLOCK", 8)
+    rng = np.random.default_rng(columns)
+    for _ in range(25):
+        values = rng.integers(0, 5, size=(rng.integers(0, 70), columns)).astype(float)
+        assert skyline(values).tolist() == _brute_force(values)
+
+
+def test_pareto_endpoint(synthetic_catalog):
+    """
+    Test /api/analysis/pareto against pairwise comparison on the snapshot.
+
+    Expected: Exactly the non-dominated UAVs with all metrics, best endurance first
+    """
+    response = client.get(
+        "/api/analysis/pareto",
+        params={"maximize": "endurance_hours,payload_capacity_kg", "minimize": "unit_cost_usd"},
+    )
+    assert response.status_code == 200
+    body = response.json()
+
+    fields = ("endurance_hours", "payload_capacity_kg", "unit_cost_usd")
+    matrix = np.column_stack([synthetic_catalog.numeric_array(f) for f in fields])
+    complete = np.flatnonzero(~np.isnan(matrix).any(axis=1))
+    signed = matrix[complete] * np.array([-1.0, -1.0, 1.0])
+    uavs = synthetic_catalog.uavs
+    expected = {uavs[int(complete[i])]["designation"] for i in _brute_force(signed)}
+
+    assert {u["designation"] for u in body["uavs"]} == expected
+    assert body["total"] == len(expected)
+    assert body["considered"] == len(synthetic_catalog.uavs)
+    assert body["incomplete"] == len(synthetic_catalog.uavs) - len(complete)
+    endurance = [u["endurance_hours"] for u in body["uavs"]]
+    assert endurance == sorted(endurance, reverse=True)
+
+
+def test_pareto_filters_and_errors(synthetic_catalog):
+    """
+    Test search filters and rejected objectives.
+
+    Expected: Only UAVs of the filtered type; 400 for no, repeated or non-numeric fields
+    """
+    uav_type = synthetic_catalog.uavs[0]["type"]
+    body = client.get(
+        "/api/analysis/pareto",
+        params={"maximize": "range_km", "minimize": "max_takeoff_weight_kg", "type": uav_type},
+    ).json()
+    assert body["considered"] == int(synthetic_catalog.uavs.contains("type", uav_type).sum())
+    by_designation = synthetic_catalog.uavs_by_designation
+    assert body["uavs"] and all(
+        uav_type in by_designation[u["designation"]]["type"] for u in body["uavs"]
+    )
+
+    for params in (
+        {},
+        {"maximize": "range_km", "minimize": "range_km"},
+        {"maximize": "name"},
+        {"maximize": "no_such_field"},
+    ):
+        assert client.get("/api/analysis/pareto", params=params).status_code == 400
@@ -0,0 +1,93 @@
+"""
+Tests for the fleet reach analysis.
+"""
+
+import math
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.reach import great_circle_km, reach_matrix
+
+client = TestClient(app)
+
+
+def _expected(uav, distance, loiter_hours):
+    """Scalar version of the reach model for one UAV."""
+    radius = uav["combat_radius_km"]
+    if radius is None and uav["range_km"] is not None:
+        radius = uav["range_km"] / 2
+    if radius is None or distance > radius:
+        return False
+    if uav["endurance_hours"] is None or not uav["cruise_speed_kmh"]:
+        return loiter_hours <= 0
+    return uav["endurance_hours"] - 2 * distance / uav["cruise_speed_kmh"] >= loiter_hours
+
+
+def test_great_circle_km():
+    """
+    Test haversine distances, including broadcasting over targets.
+
+    Expected: Known distances within 0.5%, zero for the same point
+    """
+    # London -> New York is about 5570 km
+    assert great_circle_km(51.5074, -0.1278, 40.7128, -74.0060) == pytest.approx(5570, rel=0.005)
+    distances = great_circle_km(0.0, 0.0, [0.0, 0.0, 90.0], [0.0, 180.0, 0.0])
+    assert distances.tolist() == pytest.approx([0.0, math.pi * 6371.0088, math.pi / 2 * 6371.0088])
+
+
+def test_reach_matrix_matches_scalar_model(synthetic_catalog):
+    """
+    Test the vectorized matrix against the per-UAV model.
+
+    Expected: Same feasibility for every UAV and target
+    """
+    distances = [0.0, 150.0, 600.0, 2500.0]
+    _, feasible, _ = reach_matrix(synthetic_catalog, np.asarray(distances), loiter_hours=2.0)
+    assert feasible.shape == (len(synthetic_catalog.uavs), len(distances))
+    for row, uav in enumerate(synthetic_catalog.uavs):
+        assert feasible[row].tolist() == [_expected(uav, d, 2.0) for d in distances]
+
+
+def test_reach_endpoints(synthetic_catalog):
+    """
+    Test the single-target and batch reach endpoints.
+
+    Expected: Coordinates and explicit distances agree, counts match the matrix
+    """
+    single = client.get("/api/analysis/reach", params={"distance_km": 300, "loiter_hours": 1})
+    assert single.status_code == 200
+    body = single.json()
+    assert body["total"] == len(body["designations"]) == body["targets"][0]["feasible_count"]
+    assert all(row == [True] for row in body["feasible"])
+
+    base = {"latitude": 36.0, "longitude": -115.0}
+    target = {"latitude": 36.0, "longitude": -112.0}
+    distance = float(great_circle_km(36.0, -115.0, 36.0, -112.0))
+    response = client.post("/api/analysis/reach", json={
+        "base": base,
+        "targets": [{"id": "geo", **target}, {"id": "flat", "distance_km": distance}],
+        "loiter_hours": 1,
+        "only_feasible": False,
+    })
+    assert response.status_code == 200
+    batch = response.json()
+    assert batch["total"] == len(synthetic_catalog.uavs)
+    assert [t["id"] for t in batch["targets"]] == ["geo", "flat"]
+    assert batch["targets"][0]["distance_km"] == pytest.approx(distance, abs=0.01)
+    assert all(a == b for a, b in batch["feasible"])
+    assert batch["targets"][0]["feasible_count"] == sum(a for a, _ in batch["feasible"])
+
+
+def test_reach_rejects_bad_requests(synthetic_catalog):
+    """
+    Test reach request validation.
+
+    Expected: 400 for coordinates without a base or targets without a location
+    """
+    no_base = {"targets": [{"latitude": 1.0, "longitude": 2.0}]}
+    assert client.post("/api/analysis/reach", json=no_base).status_code == 400
+    assert client.post("/api/analysis/reach", json={"targets": [{"id": "x"}]}).status_code == 400
+    assert client.post("/api/analysis/reach", json={"targets": []}).status_code == 422
@@ -0,0 +1,123 @@
+"""
+Tests for the database result cache and its admin endpoint.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import cache as cache_module
+from app import database
+from app.cache import LRUCache
+from app.config import settings
+from app.database import Database, db
+from app.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def synthetic_catalog(synthetic_catalog):
+    """Shared synthetic catalog, starting with an empty result cache."""
+    db.results.clear()
+    return synthetic_catalog
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """Count new DuckDB connections."""
+    opened = []
+    connect = database._connect
+
+    def counting(path):
+        opened.append(path)
+        return connect(path)
+
+    monkeypatch.setattr(database, "_connect", counting)
+    return opened
+
+
+def test_lru_cache_ttl(monkeypatch):
+    """
+    Test that entries older than the TTL are dropped on lookup.
+
+    Expected: Hit before the TTL, miss and one expiration after it
+    """
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = LRUCache("test", max_size=2, ttl=10)
+    cache.put("a", 1)
+    now[0] += 5
+    assert cache.get("a") == 1
+    now[0] += 6
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["expirations"], stats["size"]) == (1, 1, 1, 0)
+
+
+def test_results_keyed_by_normalized_params_and_generation(synthetic_db_path, connections):
+    """
+    Test that equivalent calls share a cache entry until the generation changes.
+
+    Expected: One query for positional/keyword/empty-string variants, another after a new generation
+    """
+    local = Database(synthetic_db_path)
+    generation = [1]
+    local.result_generation = lambda: generation[0]
+
+    first = local.search_armaments("Missile")
+    assert local.search_armaments(weapon_type="Missile", country="") is first
+    assert local.search_armaments("Missile", None, None, None) is first
+    assert len(connections) == 1
+
+    local.search_armaments(weapon_type="Bomb")
+    assert len(connections) == 2
+
+    generation[0] = 2
+    assert local.search_armaments("Missile") == first
+    assert len(connections) == 3
+
+    stats = local.results.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 3)
+
+
+def test_results_evict_least_recently_used(synthetic_db_path):
+    """
+    Test eviction at the configured size.
+
+    Expected: Oldest entry evicted and counted
+    """
+    local = Database(synthetic_db_path)
+    local.results = LRUCache("db_results", max_size=2)
+    local.result_generation = lambda: 1
+    for weapon_type in ("Missile", "Bomb", "Rocket"):
+        local.search_armaments(weapon_type=weapon_type)
+    assert local.results.stats()["evictions"] == 1
+    assert [key[1][0][1] for key, _ in local.results.entries()] == ["Rocket", "Bomb"]
+
+
+def test_admin_inspect_and_flush(synthetic_catalog, monkeypatch):
+    """
+    Test the admin endpoint for the result cache.
+
+    Expected: Cached calls listed with params and generation, flush empties the
+    cache, token enforced
+    """
+    armament = synthetic_catalog.armaments[0]["designation"]
+    client.get(f"/api/armaments/{armament}/uavs")
+    client.get(f"/api/armaments/{armament}/uavs")
+
+    body = client.get("/api/admin/cache/results").json()
+    assert body["enabled"] and body["hits"] >= 1 and body["max_size"] == settings.RESULT_CACHE_SIZE
+    entry = body["entries"][0]
+    assert entry["method"] == "get_uavs_for_armament"
+    assert entry["params"] == {"armament_designation": armament}
+    assert entry["generation"] == synthetic_catalog.generation
+
+    assert client.delete("/api/admin/cache/results").json()["flushed"] >= 1
+    assert client.get("/api/admin/cache/results").json()["size"] == 0
+
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "s3cret")
+    assert client.delete("/api/admin/cache/results").status_code == 403
+    for token, status in (("wrong", 403), ("s3cret", 200)):
+        response = client.delete("/api/admin/cache/results", headers={"X-Admin-Token": token})
+        assert response.status_code == status
@@ -0,0 +1,106 @@
+"""
+Tests for scaled silhouette compositing.
+"""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.silhouettes import SVG_NS, compose_svg, nice_length, renderer
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def synthetic_catalog(synthetic_catalog):
+    """Shared synthetic catalog, starting with an empty renderer cache."""
+    renderer.cache.clear()
+    return synthetic_catalog
+
+
+def _cells(svg: str):
+    root = ET.fromstring(svg)
+    scale = float(root.get("data-pixels-per-meter"))
+    cells = {
+        group.get("data-designation"): float(group.find(f"{{{SVG_NS}}}svg").get("width"))
+        for group in root.iter(f"{{{SVG_NS}}}g")
+        if group.get("data-designation")
+    }
+    return scale, cells
+
+
+def test_compose_at_true_relative_scale(tmp_path):
+    """
+    Test compositing a real silhouette file next to a placeholder.
+
+    Expected: Widths are wingspan x one shared scale; the file's paths are embedded
+    """
+    art = tmp_path / "assets" / "silhouettes" / "big"
+    art.mkdir(parents=True)
+    (art / "big-overhead.svg").write_text(
+        f'<svg xmlns="{SVG_NS}" viewBox="0 0 200 100">'
+        '<path id="artwork" d="M0 50 L200 50"/><script>alert(1)</script></svg>'
+    )
+    uavs = [
+        {"designation": "SMALL", "wingspan_meters": 5.0, "length_meters": 3.0},
+        {
+            "designation": "BIG",
+            "wingspan_meters": 20.0,
+            "silhouette_url": "/assets/silhouettes/big/big-overhead.svg",
+        },
+    ]
+    svg = compose_svg(uavs, assets_root=tmp_path, max_width=800)
+    scale, cells = _cells(svg)
+
+    assert cells["BIG"] == pytest.approx(20.0 * scale, abs=0.01)
+    assert cells["SMALL"] == pytest.approx(5.0 * scale, abs=0.01)
+    assert 'id="artwork"' in svg and "<script" not in svg
+    assert svg.index('data-designation="BIG"') < svg.index('data-designation="SMALL"')
+
+
+def test_nice_length():
+    """
+    Test scale bar lengths.
+
+    Expected: Largest 1/2/5 x 10^n not above the limit
+    """
+    assert nice_length(12.0) == 10.0
+    assert nice_length(4.9) == 2.0
+    assert nice_length(0.7) == 0.5
+
+
+def test_compare_endpoint_caches_by_designation_set(synthetic_catalog):
+    """
+    Test requesting the same set in a different order, then revalidating.
+
+    Expected: One render, served from cache the second time; 304 on a matching ETag
+    """
+    a, b = [u["designation"] for u in synthetic_catalog.uavs if u["wingspan_meters"]][:2]
+    first = client.get(f"/api/silhouettes/compare?designations={a},{b}")
+    assert first.status_code == 200
+    assert first.headers["content-type"].startswith("image/svg+xml")
+    hits = renderer.cache.hits
+
+    second = client.get(f"/api/silhouettes/compare?designations={b},{a}")
+    assert second.content == first.content
+    assert renderer.cache.hits == hits + 1
+
+    cached = client.get(
+        f"/api/silhouettes/compare?designations={a},{b}",
+        headers={"If-None-Match": first.headers["etag"]},
+    )
+    assert cached.status_code == 304
+
+
+def test_compare_endpoint_errors(synthetic_catalog):
+    """
+    Test unknown designations and empty sets.
+
+    Expected: 404 for an unknown designation; 400 for an empty list
+    """
+    known = synthetic_catalog.uavs[0]["designation"]
+    response = client.get(f"/api/silhouettes/compare?designations={known},NOPE-1")
+    assert response.status_code == 404
+    assert client.get("/api/silhouettes/compare?designations=,").status_code == 400
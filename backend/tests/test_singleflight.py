@@ -0,0 +1,120 @@
+"""
+Tests for single-flight coalescing of identical concurrent calls.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app import database
+from app.database import Database
+from app.singleflight import SingleFlight, freeze
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise TimeoutError("condition not reached")
+        time.sleep(0.001)
+
+
+def test_concurrent_calls_share_one_execution():
+    """
+    Test that callers arriving while a call is in flight get its result.
+
+    Expected: One execution, every caller gets the same object, next call runs again
+    """
+    flights = SingleFlight()
+    release = threading.Event()
+    runs = []
+
+    def slow():
+        runs.append(1)
+        release.wait(5)
+        return {"answer": 42}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(flights.do, ("q", 1), slow) for _ in range(8)]
+        _wait_for(lambda: flights.shared == 7)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(runs) == 1
+    assert all(result is results[0][0] for result, _ in results)
+    assert sorted(shared for _, shared in results) == [False] + [True] * 7
+    assert flights.in_flight() == 0
+
+    flights.do(("q", 1), slow)
+    assert len(runs) == 2
+
+
+def test_errors_reach_every_caller():
+    """
+    Test that an exception from the shared call is raised in all callers.
+
+    Expected: Every caller raises; the key is free afterwards
+    """
+    flights = SingleFlight()
+    release = threading.Event()
+
+    def failing():
+        release.wait(5)
+        raise RuntimeError("boom")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(flights.do, "k", failing) for _ in range(4)]
+        _wait_for(lambda: flights.shared == 3)
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError, match="boom"):
+                future.result()
+    assert flights.do("k", lambda: "ok") == ("ok", False)
+
+
+def test_freeze_normalizes_arguments():
+    """
+    Test key normalization of list and dict arguments.
+
+    Expected: Equal arguments give equal, hashable keys
+    """
+    assert freeze((["MQ-9", "RQ-4"],)) == freeze((("MQ-9", "RQ-4"),))
+    assert freeze({"b": [1], "a": 2}) == freeze({"a": 2, "b": [1]})
+    hash(freeze({"country": "USA", "designations": ["MQ-9"]}))
+
+
+def test_database_herd_runs_one_query(monkeypatch, synthetic_db_path):
+    """
+    Test a thundering herd of identical Database calls.
+
+    Expected: One connection and one query for the whole herd, identical results
+    """
+    local = Database(synthetic_db_path)
+    release = threading.Event()
+    opened = []
+    connect = database._connect
+
+    def gated(path):
+        opened.append(path)
+        release.wait(5)
+        return connect(path)
+
+    monkeypatch.setattr(database, "_connect", gated)
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        futures = [pool.submit(local.get_stats) for _ in range(10)]
+        _wait_for(lambda: local.flights.shared == 9)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(opened) == 1
+    assert all(r == results[0] for r in results) and results[0]["total"] == 200
+
+    # Different arguments are different calls; disabled coalescing runs every call
+    local.get_countries()
+    local.search_uavs(country=results[0]["by_country"][0]["country"])
+    assert local.flights.executions == 3
+    local.coalesce = False
+    local.get_stats()
+    assert local.flights.executions == 3 and len(opened) == 4
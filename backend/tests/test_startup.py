@@ -0,0 +1,92 @@
+"""
+Tests for the fast startup path.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI
+
+from app.openapi_cache import OpenAPICache, app_signature, source_fingerprint
+
+BACKEND_ROOT = Path(__file__).parent.parent
+
+
+def test_heavy_modules_not_imported_with_app():
+    """
+    Test that importing the app defers DuckDB and NumPy.
+
+    Expected: Neither is in sys.modules after `import app.main`
+    """
+    script = (
+        "import sys, json, app.main; "
+        "print(json.dumps(['duckdb' in sys.modules, 'numpy' in sys.modules]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=BACKEND_ROOT, capture_output=True, text=True, check=True
+    )
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == [False, False]
+
+
+def test_openapi_cache_round_trip(tmp_path):
+    """
+    Test that the OpenAPI document is generated once and then read from disk.
+
+    Expected: A second cache instance loads the file without calling the generator
+    """
+    calls = []
+
+    def generate():
+        calls.append(1)
+        return {"openapi": "3.1.0", "paths": {"/x": {}}}
+
+    first = OpenAPICache(generate, tmp_path, "1.0")
+    assert first() == {"openapi": "3.1.0", "paths": {"/x": {}}}
+    assert first() is first()
+    assert first.path.exists() and len(calls) == 1
+
+    second = OpenAPICache(generate, tmp_path, "1.0")
+    assert second()["paths"] == {"/x": {}}
+    assert len(calls) == 1
+
+    # A different version is a different fingerprint: regenerated, old file replaced
+    third = OpenAPICache(generate, tmp_path, "2.0")
+    third()
+    assert len(calls) == 2
+    assert [p.name for p in tmp_path.glob("openapi-*.json")] == [third.path.name]
+    assert source_fingerprint("1.0") != source_fingerprint("2.0")
+
+
+def test_openapi_cache_keys_on_routes_and_title(tmp_path):
+    """
+    Test that settings shaping the document change the cache file.
+
+    Expected: A different prefix or title regenerates instead of serving the old paths
+    """
+    def build(prefix, title):
+        app = FastAPI(title=title, version="1.0")
+        app.get(f"{prefix}/uavs")(lambda: [])
+        return OpenAPICache(app.openapi, tmp_path, "1.0", lambda: app_signature(app))
+
+    first = build("/api", "X-UAV API")
+    assert "/api/uavs" in first()["paths"]
+    assert "/api/uavs" in build("/api", "X-UAV API")()["paths"]
+
+    moved = build("/api/v2", "X-UAV API")
+    assert list(moved()["paths"]) == ["/api/v2/uavs"]
+    assert moved.path != first.path
+    assert build("/api/v2", "Renamed").path != moved.path
+
+
+def test_openapi_cache_read_only_directory(tmp_path):
+    """
+    Test that an unwritable cache directory still serves the document.
+
+    Expected: The generated document is returned
+    """
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory")
+    cache = OpenAPICache(lambda: {"openapi": "3.1.0"}, blocker / "cache", "1.0")
+    assert cache() == {"openapi": "3.1.0"}
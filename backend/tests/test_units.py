@@ -0,0 +1,120 @@
+"""
+Tests for canonical-SI storage and the units query parameter.
+"""
+
+import duckdb
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Database
+from app.main import app
+from app.units import EXCLUDED_FIELDS, UAV_DERIVED_UNITS, apply_units
+from generate_catalog import CatalogSpec, populate_database
+
+client = TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def canonical_db_path(tmp_path_factory):
+    """Synthetic catalog stored with SI fields only."""
+    db_path = tmp_path_factory.mktemp("canonical") / "canonical.duckdb"
+    return populate_database(
+        db_path, CatalogSpec(n_uavs=50, n_armaments=10, seed=1), canonical_units=True
+    )
+
+
+def test_canonical_storage_derives_units(canonical_db_path):
+    """
+    Test reading a database that stores SI fields only.
+
+    Expected: Derived columns are NULL on disk but computed on read
+    """
+    conn = duckdb.connect(str(canonical_db_path), read_only=True)
+    try:
+        stored = conn.execute(
+            "SELECT count(*) FROM uavs WHERE wingspan_feet IS NOT NULL OR range_nm IS NOT NULL"
+        ).fetchone()[0]
+    finally:
+        conn.close()
+    assert stored == 0
+
+    uavs = Database(db_path=canonical_db_path).get_all_uavs()
+    assert any(uav["max_speed_mach"] is not None for uav in uavs)
+    for uav in uavs:
+        for field, (si_field, factor, _) in UAV_DERIVED_UNITS.items():
+            if uav[si_field] is None:
+                assert uav[field] is None
+            else:
+                assert uav[field] == pytest.approx(float(uav[si_field]) * factor, abs=0.01)
+
+
+def test_legacy_storage_keeps_stored_values(synthetic_db_path):
+    """
+    Test that databases storing derived fields return them unchanged.
+
+    Expected: Stored wingspan_feet wins over the computed value
+    """
+    conn = duckdb.connect(str(synthetic_db_path), read_only=True)
+    try:
+        stored = dict(
+            conn.execute("SELECT designation, CAST(wingspan_feet AS DOUBLE) FROM uavs").fetchall()
+        )
+    finally:
+        conn.close()
+
+    uavs = Database(db_path=synthetic_db_path).get_all_uavs()
+    assert {u["designation"]: u["wingspan_feet"] for u in uavs} == stored
+
+
+def test_apply_units_drops_fields():
+    """
+    Test the fields each unit system keeps.
+
+    Expected: metric keeps SI and Mach; nautical keeps knots/nm and feet ceiling
+    """
+    record = {
+        "designation": "X", "wingspan_meters": 10.0, "max_speed_kmh": 500.0, "max_speed_mach": 0.6
+    }
+    record.update({field: 1.0 for field in UAV_DERIVED_UNITS})
+    assert "max_speed_mach" not in UAV_DERIVED_UNITS
+
+    metric = apply_units([record], "metric")[0]
+    assert "wingspan_feet" not in metric and "range_nm" not in metric
+    assert metric["wingspan_meters"] == 10.0
+    # Stored Mach is passed through, not recomputed from km/h
+    for system in ("metric", "imperial", "nautical"):
+        assert apply_units([record], system)[0]["max_speed_mach"] == 0.6
+
+    nautical = apply_units([record], "nautical")[0]
+    nautical_fields = {"cruise_speed_knots", "range_nm", "combat_radius_nm", "service_ceiling_feet"}
+    assert nautical_fields <= set(nautical)
+    assert "range_miles" not in nautical
+
+    imperial = apply_units([record], "imperial")[0]
+    assert set(record) - set(imperial) == EXCLUDED_FIELDS["imperial"]
+    assert apply_units([record], "all")[0] is record
+
+
+def test_units_parameter(synthetic_catalog):
+    """
+    Test the units query parameter on the UAV endpoints.
+
+    Expected: metric omits imperial fields; default output is unchanged
+    """
+    default = client.get("/api/uavs").json()["uavs"][0]
+    assert "wingspan_feet" in default and "range_nm" in default
+
+    metric = client.get("/api/uavs", params={"units": "metric"}).json()["uavs"][0]
+    assert "wingspan_feet" not in metric and "range_nm" not in metric
+    assert "max_speed_mach" in metric and "wingspan_meters" in metric
+
+    designation = default["designation"]
+    single = client.get(f"/api/uavs/{designation}", params={"units": "nautical"}).json()
+    assert "range_nm" in single and "range_miles" not in single
+
+    compared = client.post(
+        "/api/uavs/compare", params={"units": "imperial"}, json={"designations": [designation]}
+    ).json()["uavs"][0]
+    assert "range_miles" in compared and "range_nm" not in compared
+
+    assert client.get("/api/uavs", params={"units": "furlongs"}).status_code == 422
@@ -0,0 +1,148 @@
+"""
+Tests for pre-load validation of source data.
+"""
+
+import json
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from app import validation
+from app.validation import DataValidationError, check_record, validate_catalog
+from generate_catalog import CatalogGenerator, CatalogSpec
+from init_db import init_database
+
+SCHEMA_PATH = Path(__file__).parent.parent / "db" / "schema.sql"
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    """A clean synthetic catalog: (uavs, armaments, links)."""
+    generator = CatalogGenerator(CatalogSpec(n_uavs=300, n_armaments=40, seed=5))
+    armaments = list(generator.armaments())
+    uavs, links = [], []
+    for uav, uav_links in generator.uavs(armaments):
+        uavs.append(uav)
+        links.extend(uav_links)
+    return uavs, armaments, links
+
+
+def test_generated_catalog_is_valid(catalog):
+    """
+    Test that generator output passes every check.
+
+    Expected: No errors or warnings, every record counted
+    """
+    report = validate_catalog(*catalog)
+    assert report.ok
+    assert report.errors == report.warnings == []
+    assert report.checked == {
+        "uavs": len(catalog[0]), "armaments": len(catalog[1]), "uav_armaments": len(catalog[2])
+    }
+
+
+def test_record_checks():
+    """
+    Test schema, unknown-field and unit-pair checks on single records.
+
+    Expected: Missing/mistyped fields and unit mismatches are errors, unknown fields warnings
+    """
+    issues = check_record("uavs", {"designation": "X-1", "name": "X", "range_km": "far"})
+    assert {(i["field"], i["severity"]) for i in issues} == {("id", "error"), ("range_km", "error")}
+
+    issues = check_record("uavs", {"id": 1, "designation": "X-1", "name": "X", "colour": "grey"})
+    assert [(i["field"], i["severity"]) for i in issues] == [("colour", "warning")]
+
+    issues = check_record(
+        "uavs", {"id": 1, "designation": "X-1", "name": "X", "range_km": 1000, "range_miles": 1000}
+    )
+    assert [(i["record"], i["field"]) for i in issues] == [("X-1", "range_miles")]
+    # Rounded on both sides: 1.6 kg is 3.53 lbs, 3.4 lbs is within rounding
+    assert check_record(
+        "uavs", {"id": 1, "designation": "X-1", "name": "X", "payload_capacity_kg": 1.6,
+                 "payload_capacity_lbs": 3.4}
+    ) == []
+
+    issues = check_record(
+        "armaments", {"id": 1, "designation": "M-1", "weapon_type": "Missile", "weight_kg": 50,
+                      "weight_lbs": 50}
+    )
+    assert [i["field"] for i in issues] == ["weight_lbs"]
+    assert check_record("uav_armaments", "nope", 7)[0]["record"] == "#7"
+
+
+def test_reference_checks(catalog):
+    """
+    Test duplicate keys and links to unknown designations.
+
+    Expected: One error per duplicate and per dangling reference
+    """
+    uavs, armaments, links = catalog
+    uavs = uavs + [dict(uavs[0], id=10_000)]
+    links = links + [
+        dict(links[0], id=10_000),
+        dict(links[0], id=10_001, uav_designation="NOPE-1"),
+        dict(links[0], id=10_002, armament_designation="NOPE-2"),
+    ]
+    report = validate_catalog(uavs, armaments, links)
+    found = {(i["entity"], i["field"], i["message"].split(" ")[0]) for i in report.errors}
+    assert found == {
+        ("uavs", "designation", "duplicate"),
+        ("uav_armaments", None, "duplicate"),
+        ("uav_armaments", "uav_designation", "unknown"),
+        ("uav_armaments", "armament_designation", "unknown"),
+    }
+    assert len(report.errors) == 4
+
+
+def test_parallel_matches_sequential(catalog, monkeypatch):
+    """
+    Test that the process pool finds the same issues in the same order.
+
+    Expected: Identical reports from 1 and 2 workers
+    """
+    monkeypatch.setattr(validation, "CHUNK_SIZE", 64)
+    monkeypatch.setattr(validation, "PARALLEL_MIN_RECORDS", 0)
+    uavs, armaments, links = catalog
+    uavs = [
+        dict(u, range_km=100, range_miles=1, range_nm=None) if i % 50 == 0 else u
+        for i, u in enumerate(uavs)
+    ]
+    sequential = validate_catalog(uavs, armaments, links)
+    parallel = validate_catalog(uavs, armaments, links, workers=2)
+    assert len(sequential.errors) == 6
+    assert parallel.errors == sequential.errors
+    assert parallel.warnings == sequential.warnings
+
+
+def test_invalid_data_is_not_loaded(tmp_path, catalog):
+    """
+    Test that the loader fails before touching the database.
+
+    Expected: DataValidationError with the report, no database file created
+    """
+    uavs, armaments, links = catalog
+    paths = []
+    for name, records in (
+        ("uavs", [dict(uavs[0], id=None)] + uavs[1:]), ("armaments", armaments), ("links", links)
+    ):
+        path = tmp_path / f"{name}.json"
+        path.write_text(json.dumps(records))
+        paths.append(path)
+    db_path = tmp_path / "catalog.duckdb"
+
+    with pytest.raises(DataValidationError) as excinfo:
+        init_database(db_path, SCHEMA_PATH, *paths)
+    assert [(e["record"], e["field"]) for e in excinfo.value.report.errors] == [
+        (uavs[0]["designation"], "id")
+    ]
+    assert not db_path.exists()
+
+    paths[0].write_text(json.dumps(uavs))
+    init_database(db_path, SCHEMA_PATH, *paths)
+    conn = duckdb.connect(str(db_path), read_only=True)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM uavs").fetchone()[0] == len(uavs)
+    finally:
+        conn.close()
@@ -0,0 +1,64 @@
+"""
+Tests for the uav_variants table and its endpoints.
+"""
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from init_db import VARIANT_PERFORMANCE_FIELDS
+
+client = TestClient(app)
+
+
+def _number(value):
+    return None if value is None else float(value)
+
+
+def test_variants_exploded_with_inherited_performance(synthetic_catalog):
+    """
+    Test that each entry of uavs.variants is a row with its airframe's fields filled in.
+
+    Expected: One row per variant; own values where given (listed in overrides), else the airframe's
+    """
+    expected = [
+        (uav, variant) for uav in synthetic_catalog.uavs for variant in (uav["variants"] or [])
+    ]
+    variants = client.get("/api/variants").json()["variants"]
+    assert [(v["uav_designation"], v["designation"]) for v in variants] == [
+        (uav["designation"], variant["designation"]) for uav, variant in expected
+    ]
+    for row, (uav, variant) in zip(variants, expected):
+        assert row["uav_name"] == uav["name"]
+        assert row["country_of_origin"] == uav["country_of_origin"]
+        for field in VARIANT_PERFORMANCE_FIELDS:
+            own = variant[field]
+            assert _number(row[field]) == _number(uav[field] if own is None else own)
+            assert (field in row["overrides"]) == (own is not None)
+
+
+def test_variant_search_and_compare(synthetic_catalog):
+    """
+    Test the filters, the per-UAV listing and comparison.
+
+    Expected: Filters narrow the list; compare keeps the requested order
+    """
+    variants = client.get("/api/variants").json()["variants"]
+    sample = variants[len(variants) // 2]
+
+    by_uav = client.get(f"/api/uavs/{sample['uav_designation']}/variants").json()
+    designation = sample["uav_designation"]
+    assert by_uav["total"] == sum(v["uav_designation"] == designation for v in variants)
+    assert all(v["uav_designation"] == designation for v in by_uav["variants"])
+
+    by_country = client.get("/api/variants", params={"country": sample["country_of_origin"]}).json()
+    country = sample["country_of_origin"]
+    assert by_country["total"] == sum(v["country_of_origin"] == country for v in variants)
+
+    found = client.get("/api/variants", params={"q": sample["designation"].lower()}).json()
+    assert [v["designation"] for v in found["variants"]] == [sample["designation"]]
+    assert client.get("/api/variants", params={"q": "no-such-variant"}).json()["total"] == 0
+
+    wanted = [variants[3]["designation"], variants[0]["designation"], "NOPE"]
+    compared = client.post("/api/variants/compare", json={"designations": wanted}).json()
+    assert [v["designation"] for v in compared["variants"]] == wanted[:2]
+    assert client.post("/api/variants/compare", json={"designations": []}).status_code == 422